@@ -0,0 +1,132 @@
+"""
+Copyright (c) Cutleast
+
+Micro-benchmark for the operations of `core.string.string_utils.StringUtils` on a large
+synthetic translation. Run this script from the project's root folder.
+
+Usage: python scripts/benchmark_string_utils.py [--count 500000]
+"""
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Callable
+from copy import copy
+from typing import Any
+
+sys.path.append(os.path.join(os.getcwd(), "src"))
+
+from core.file_types.plugin.string import PluginString
+from core.string.string_record import StringRecord, StringRecordList
+from core.string.string_status import StringStatus
+from core.string.string_utils import StringUtils
+from core.string.types import StringList
+
+DELETED_STRINGS: int = 10
+"""Number of strings that are removed from the original strings."""
+
+
+def create_strings(count: int) -> tuple[StringList, StringList]:
+    """
+    Creates a list of original strings and a list of translated strings where every
+    100th string has a changed original text.
+
+    Args:
+        count (int): Number of strings.
+
+    Returns:
+        tuple[StringList, StringList]: Original strings and translated strings.
+    """
+
+    original_strings: StringList = [
+        PluginString(
+            form_id=f"{i:08X}|Skyrim.esm",
+            editor_id=f"EditorId{i}" if i % 3 else None,
+            type="BOOK FULL" if i % 2 else "INFO NAM1",
+            index=i % 4 if i % 2 == 0 else None,
+            original=f"Original text {i}",
+            status=StringStatus.TranslationRequired,
+        )
+        for i in range(count)
+    ]
+    translation_strings: StringList = []
+    for i, original_string in enumerate(original_strings):
+        translation_string: PluginString = copy(original_string)
+        translation_string.string = f"Translated text {i}"
+        translation_string.status = StringStatus.TranslationComplete
+        if i % 100 == 0:
+            translation_string.original = f"Old original text {i}"
+        translation_strings.append(translation_string)
+
+    return original_strings, translation_strings
+
+
+def measure(name: str, function: Callable[[], Any]) -> None:
+    """
+    Measures and prints the duration of a function call.
+
+    Args:
+        name (str): Name of the measured operation.
+        function (Callable[[], Any]): Function to measure.
+    """
+
+    start: float = time.perf_counter()
+    function()
+    print(f"{name:<40} {time.perf_counter() - start:8.3f}s")
+
+
+def run(count: int) -> None:
+    """
+    Runs the benchmark.
+
+    Args:
+        count (int): Number of strings.
+    """
+
+    print(f"Creating {count} strings...")
+    original_strings, translation_strings = create_strings(count)
+
+    measure(
+        "String.id (3 accesses per string)",
+        lambda: [(s.id, s.id, s.id) for s in original_strings],
+    )
+    measure("hash(String)", lambda: [hash(s) for s in translation_strings])
+    measure(
+        "StringUtils.unique()",
+        lambda: StringUtils.unique(original_strings + translation_strings),
+    )
+    measure(
+        "StringUtils.map_strings()",
+        lambda: StringUtils.map_strings(original_strings, translation_strings),
+    )
+    original_records: StringRecordList = StringRecord.from_strings(original_strings)
+    translation_records: StringRecordList = StringRecord.from_strings(
+        translation_strings
+    )
+    measure(
+        "StringUtils.map_string_records()",
+        lambda: StringUtils.map_string_records(original_records, translation_records),
+    )
+    measure(
+        "StringRecord.to_strings()",
+        lambda: StringRecord.to_strings(original_records),
+    )
+    measure(
+        "StringUtils.match_strings()",
+        lambda: StringUtils.match_strings(
+            [copy(s) for s in original_strings], translation_strings
+        ),
+    )
+    measure(
+        "StringUtils.update_string_list()",
+        lambda: StringUtils.update_string_list(
+            translation_strings, original_strings[DELETED_STRINGS:]
+        ),
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=500_000)
+    run(parser.parse_args().count)
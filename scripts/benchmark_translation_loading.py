@@ -0,0 +1,107 @@
+"""
+Copyright (c) Cutleast
+
+Benchmark for loading the translations of a large synthetic user database one after
+another and in parallel with `DatabaseService.preload_translations()`. Run this script
+from the project's root folder.
+
+Usage: python scripts/benchmark_translation_loading.py [--translations 300] [--threads 4]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.append(os.path.join(os.getcwd(), "src"))
+
+from core.database.database_service import DatabaseService
+from core.database.translation import Translation
+from core.database.translation_service import TranslationService
+from core.file_types.plugin.string import PluginString
+from core.string.string_status import StringStatus
+from core.string.types import StringList
+
+MODFILES_PER_TRANSLATION: int = 3
+"""Number of mod files per translation."""
+
+STRINGS_PER_MODFILE: int = 500
+"""Number of strings per mod file."""
+
+
+def create_database(database_path: Path, translation_count: int) -> list[str]:
+    """
+    Creates a database folder with synthetic translations.
+
+    Args:
+        database_path (Path): Path to the database folder.
+        translation_count (int): Number of translations.
+
+    Returns:
+        list[str]: Names of the created translations.
+    """
+
+    names: list[str] = []
+    for t in range(translation_count):
+        name: str = f"Translation {t}"
+        strings: dict[Path, StringList] = {
+            Path(f"Plugin {t}-{m}.esp"): [
+                PluginString(
+                    form_id=f"{i:08X}|Plugin {t}-{m}.esp",
+                    editor_id=f"EditorId{i}",
+                    type="BOOK FULL",
+                    original=f"Original text {i}",
+                    string=f"Translated text {i}",
+                    status=StringStatus.TranslationComplete,
+                )
+                for i in range(STRINGS_PER_MODFILE)
+            ]
+            for m in range(MODFILES_PER_TRANSLATION)
+        }
+        TranslationService.save_translation_strings(database_path / name, strings)
+        names.append(name)
+
+    return names
+
+
+def run(translation_count: int, threads: int) -> None:
+    """
+    Runs the benchmark.
+
+    Args:
+        translation_count (int): Number of translations.
+        threads (int): Number of threads for the parallel loading.
+    """
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        database_path = Path(tmp_dir)
+        print(f"Creating {translation_count} translations...")
+        names: list[str] = create_database(database_path, translation_count)
+
+        translations: list[Translation] = [
+            Translation(name=name, path=database_path / name) for name in names
+        ]
+        start: float = time.perf_counter()
+        for translation in translations:
+            translation.strings  # noqa: B018
+        print(f"{'Serial loading':<40} {time.perf_counter() - start:8.3f}s")
+
+        translations = [
+            Translation(name=name, path=database_path / name) for name in names
+        ]
+        start = time.perf_counter()
+        DatabaseService.preload_translations(translations, thread_num=threads)
+        print(
+            f"{f'Parallel loading ({threads} threads)':<40} "
+            f"{time.perf_counter() - start:8.3f}s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--translations", type=int, default=300)
+    parser.add_argument("--threads", type=int, default=4)
+    args = parser.parse_args()
+    run(args.translations, args.threads)
@@ -0,0 +1,133 @@
+"""
+Copyright (c) Cutleast
+
+Benchmark for translating many texts with `DeepLTranslator` against a local stub server
+that emulates the DeepL API with a fixed latency per request. Run this script from the
+project's root folder.
+
+Usage: python scripts/benchmark_translator.py [--count 1000] [--latency 0.05]
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs
+
+sys.path.append(os.path.join(os.getcwd(), "src"))
+
+import deepl
+
+from core.config.translator_config import TranslatorConfig
+from core.translator.apis import TranslatorApi
+from core.translator.deepl import DeepLTranslator
+from core.utilities.game_language import GameLanguage
+
+
+class StubDeepLHandler(BaseHTTPRequestHandler):
+    """
+    Request handler that emulates the `/v2/translate` endpoint of the DeepL API.
+    """
+
+    latency: float = 0.05
+    """Simulated latency per request in seconds."""
+
+    requests: int = 0
+    """Number of handled requests."""
+
+    def do_POST(self) -> None:  # noqa: D102
+        body: bytes = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Type", "").startswith("application/json"):
+            texts: list[str] = json.loads(body)["text"]
+        else:
+            texts = parse_qs(body.decode())["text"]
+
+        time.sleep(StubDeepLHandler.latency)
+        StubDeepLHandler.requests += 1
+
+        response: bytes = json.dumps(
+            {
+                "translations": [
+                    {
+                        "detected_source_language": "EN",
+                        "text": text.upper(),
+                        "billed_characters": len(text),
+                    }
+                    for text in texts
+                ]
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: D102
+        pass
+
+
+def run(count: int, latency: float) -> None:
+    """
+    Runs the benchmark.
+
+    Args:
+        count (int): Number of texts to translate.
+        latency (float): Simulated latency per request in seconds.
+    """
+
+    StubDeepLHandler.latency = latency
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubDeepLHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    server_url: str = f"http://127.0.0.1:{server.server_address[1]}"
+
+    translator = DeepLTranslator(
+        TranslatorConfig(translator=TranslatorApi.DeepL, api_key="stub:fx")
+    )
+    # redirect the translator to the stub server
+    translator._DeepLTranslator__translator = deepl.Translator(  # type: ignore[attr-defined]
+        "stub:fx", server_url=server_url
+    )
+
+    # every run uses new texts so that no cached translations are used
+    def create_texts() -> list[str]:
+        prefix: str = uuid.uuid4().hex
+        # every 10th text is a duplicate
+        return [
+            f"{prefix} Text number {i - i % 10 if i % 10 == 9 else i}"
+            for i in range(count)
+        ]
+
+    texts: list[str] = create_texts()
+    StubDeepLHandler.requests = 0
+    start: float = time.perf_counter()
+    for text in texts:
+        translator.translate_uncached(text, GameLanguage.German)
+    print(
+        f"{'One request per text':<40} {time.perf_counter() - start:8.3f}s "
+        f"({StubDeepLHandler.requests} requests)"
+    )
+
+    texts = create_texts()
+    StubDeepLHandler.requests = 0
+    start = time.perf_counter()
+    translator.mass_translate(texts, GameLanguage.German)
+    print(
+        f"{'Translator.mass_translate()':<40} {time.perf_counter() - start:8.3f}s "
+        f"({StubDeepLHandler.requests} requests)"
+    )
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+    run(args.count, args.latency)
@@ -171,7 +171,10 @@ class App(BaseApp, Singleton):
 
         self.__user_data = ProgressDialog(
             lambda pdisplay: self.__user_data_service.load(
-                app_config.worker_thread_num, pdisplay
+                app_config.worker_thread_num,
+                pdisplay,
+                app_config.use_packed_translation_format,
+                app_config.lazy_database_loading,
             ),
             QApplication.activeModalWidget(),
         ).run()
@@ -278,6 +281,7 @@ class App(BaseApp, Singleton):
 
         if self.__component_provider is not None:
             self.__component_provider.get_download_manager().stop()
+            self.__component_provider.get_translation_preloader().stop()
 
             try:
                 self.__component_provider.get_temp_folder_provider().clean_temp_folder()
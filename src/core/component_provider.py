@@ -11,6 +11,7 @@ from cutleast_core_lib.core.utilities.exe_info import get_execution_info
 from cutleast_core_lib.core.utilities.singleton import Singleton
 
 from core.config.app_config import AppConfig
+from core.database.translation_preloader import TranslationPreloader
 from core.downloader.download_manager import DownloadManager
 from core.mod_instance.state_service import StateService
 from core.scanner.scanner import Scanner
@@ -35,6 +36,7 @@ class ComponentProvider(Singleton):
     __scanner: Optional[Scanner] = None
     __download_manager: Optional[DownloadManager] = None
     __temp_folder_provider: Optional[TempFolderProvider] = None
+    __translation_preloader: Optional[TranslationPreloader] = None
 
     log: logging.Logger = logging.getLogger("ComponentProvider")
 
@@ -90,6 +92,12 @@ class ComponentProvider(Singleton):
             base_path=self.__app_config.temp_path,
         )
 
+        self.__translation_preloader = TranslationPreloader(
+            database=self.__user_data.database,
+            thread_num=self.__app_config.worker_thread_num,
+        )
+        self.__translation_preloader.start()
+
         self.log.info("Initialization complete.")
 
     def get_provider(self) -> TranslationProvider:
@@ -175,3 +183,17 @@ class ComponentProvider(Singleton):
             raise ValueError("Temp folder provider is not yet initialized.")
 
         return self.__temp_folder_provider
+
+    def get_translation_preloader(self) -> TranslationPreloader:
+        """
+        Returns:
+            TranslationPreloader: Translation preloader.
+
+        Raises:
+            ValueError: When the translation preloader is not yet initialized.
+        """
+
+        if self.__translation_preloader is None:
+            raise ValueError("Translation preloader is not yet initialized.")
+
+        return self.__translation_preloader
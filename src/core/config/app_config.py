@@ -82,6 +82,25 @@ class AppConfig(BaseAppConfig):
     updating the database.
     """
 
+    use_packed_translation_format: bool = False
+    """
+    Whether to store the strings of the user translations in a single compact binary
+    file per translation instead of a JSON file per mod file. Existing translations are
+    converted when the database is loaded.
+    """
+
+    lazy_database_loading: bool = True
+    """
+    Whether to load the strings of the user translations in the background after the
+    startup instead of loading all of them before the main window is shown.
+    """
+
+    incremental_basic_scan: bool = True
+    """
+    Whether the basic scan reuses the results of previous scans for mod files that
+    haven't changed since, as long as the database hasn't changed either.
+    """
+
     @override
     @staticmethod
     def get_config_name() -> str:
@@ -3,20 +3,24 @@ Copyright (c) Cutleast
 """
 
 import logging
+from collections.abc import Generator
 from pathlib import Path
-from typing import Optional
+from threading import RLock
+from typing import Optional, TypeVar
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, Signal
 
 from core.mod_instance.mod import Mod
 from core.string.search_filter import SearchFilter, matches_filter
 from core.string.string_status import StringStatus
-from core.string.types import StringList
+from core.string.types import String, StringList
 from core.translation_provider.mod_id import ModId
 from core.utilities.game_language import GameLanguage
 
 from .translation import Translation
 
+K = TypeVar("K")
+
 
 class TranslationDatabase(QObject):
     """
@@ -70,9 +74,46 @@ class TranslationDatabase(QObject):
     language: GameLanguage
     """The language of the database."""
 
+    use_packed_format: bool
+    """
+    Whether the user translations are saved in the packed format instead of a JSON file
+    per mod file (see `TranslationService.save_translation_strings()`).
+    """
+
     __vanilla_translation: Translation
     __user_translations: list[Translation]
 
+    __translations_by_id: dict[str, list[Translation]]
+    """
+    Map of translation ids to the translations with that id. The first translation takes
+    precedence.
+    """
+
+    __translations_by_modfile: dict[Path, list[Translation]]
+    """
+    Map of mod file paths to the translations covering them, in the order they were
+    added to the database. The last translation takes precedence.
+    """
+
+    __translations_by_mod_id: dict[ModId, list[Translation]]
+    """
+    Map of mod ids to the translations with that id, in the order they were added to
+    the database. The last translation takes precedence.
+    """
+
+    __indexed_keys: dict[int, tuple[str, list[Path], Optional[ModId]]]
+    """
+    Map of object ids of indexed translations to the keys they are indexed with. The
+    object id is used since the keys of a translation may change (e.g. when it is
+    renamed).
+    """
+
+    __index_lock: RLock
+
+    __version: int
+    __strings_cache: Optional[tuple[int, StringList]]
+    """Cached list of all strings and the database version it was created for."""
+
     log: logging.Logger = logging.getLogger("TranslationDatabase")
 
     def __init__(
@@ -82,6 +123,7 @@ class TranslationDatabase(QObject):
         language: GameLanguage,
         vanilla_translation: Translation,
         user_translations: list[Translation],
+        use_packed_format: bool = False,
     ) -> None:
         """
         Args:
@@ -90,6 +132,9 @@ class TranslationDatabase(QObject):
             language (GameLanguage): Language of the database.
             vanilla_translation (Translation): Translation for base game + AE CC Content.
             user_translations (list[Translation]): List of user installed translations.
+            use_packed_format (bool, optional):
+                Whether the user translations are saved in the packed format. Defaults
+                to False.
         """
 
         super().__init__()
@@ -97,10 +142,37 @@ class TranslationDatabase(QObject):
         self.userdb_path = userdb_path
         self.appdb_path = appdb_path
         self.language = language
+        self.use_packed_format = use_packed_format
 
         self.__vanilla_translation = vanilla_translation
         self.__user_translations = user_translations
 
+        self.__translations_by_id = {}
+        self.__translations_by_modfile = {}
+        self.__translations_by_mod_id = {}
+        self.__indexed_keys = {}
+        self.__index_lock = RLock()
+        self.__version = 0
+        self.__strings_cache = None
+
+        for translation in self.__user_translations:
+            self.__index_translation(translation)
+
+        # the index has to be updated immediately, even if a signal is emitted from
+        # another thread
+        self.add_signal.connect(
+            self.__on_translations_added, Qt.ConnectionType.DirectConnection
+        )
+        self.remove_signal.connect(
+            self.__on_translations_removed, Qt.ConnectionType.DirectConnection
+        )
+        self.rename_signal.connect(
+            self.__reindex_translation, Qt.ConnectionType.DirectConnection
+        )
+        self.changed_signal.connect(
+            self.__reindex_translation, Qt.ConnectionType.DirectConnection
+        )
+
     @property
     def vanilla_translation(self) -> Translation:
         """
@@ -117,29 +189,60 @@ class TranslationDatabase(QObject):
 
         return self.__user_translations
 
+    @property
+    def version(self) -> int:
+        """
+        Version of the database's content. It is incremented every time a translation is
+        added, removed or changed.
+        """
+
+        return self.__version
+
     @property
     def strings(self) -> StringList:
         """
         A list of all strings in the database.
+
+        The list is cached until the database changes and is shared between all callers,
+        so it must not be modified. Use `iter_strings()` to iterate the strings without
+        creating the list.
         """
 
-        result: StringList = []
+        with self.__index_lock:
+            if self.__strings_cache is None or self.__strings_cache[0] != self.__version:
+                self.__strings_cache = (self.__version, list(self.iter_strings()))
 
-        result += [
-            string
-            for modfile_strings in self.__vanilla_translation.strings.values()
-            for string in modfile_strings
-        ]
+            return self.__strings_cache[1]
 
-        result += [
-            string
-            for translation in self.__user_translations
-            for modfile_strings in (translation.strings or {}).values()
-            for string in modfile_strings
-            if string.status != StringStatus.TranslationRequired
-        ]
+    @property
+    def string_count(self) -> int:
+        """
+        Total number of strings in the database. Unlike `strings`, this does not load
+        the strings of user translations that have a summary in the database index.
+        """
 
-        return result
+        return self.__vanilla_translation.string_count + sum(
+            translation.string_count for translation in self.__user_translations
+        )
+
+    def iter_strings(self) -> Generator[String]:
+        """
+        Iterates over all strings in the database without creating a list of them.
+        Translations that are not loaded yet are loaded only when they are reached.
+
+        Yields:
+            String: The strings of the database.
+        """
+
+        for modfile_strings in self.__vanilla_translation.strings.values():
+            yield from modfile_strings
+
+        # copy the list as it could be modified by another thread while iterating
+        for translation in self.__user_translations.copy():
+            for modfile_strings in translation.strings.values():
+                for string in modfile_strings:
+                    if string.status != StringStatus.TranslationRequired:
+                        yield string
 
     def get_translation_by_modfile_path(
         self, modfile_path: Path
@@ -156,13 +259,11 @@ class TranslationDatabase(QObject):
             Optional[Translation]: Translation that covers the mod file or None.
         """
 
-        translations = {
-            _modfile: translation
-            for translation in self.user_translations
-            for _modfile in translation.strings
-        }
+        translations: Optional[list[Translation]] = self.__translations_by_modfile.get(
+            Path(modfile_path)
+        )
 
-        return translations.get(Path(modfile_path))
+        return translations[-1] if translations else None
 
     def get_translation_by_mod(self, mod: Mod) -> Optional[Translation]:
         """
@@ -175,22 +276,11 @@ class TranslationDatabase(QObject):
             Optional[Translation]: Translation that covers the mod or None.
         """
 
-        installed_translations = {
-            translation.id: translation
-            for translation in self.user_translations
-            if translation.mod_id
-        }
-
         translation: Optional[Translation] = None
-        if (
-            mod.mod_id is not None
-            and f"{mod.mod_id.mod_id}###{mod.mod_id.file_id}" in installed_translations
-        ):
-            translation = installed_translations[
-                f"{mod.mod_id.mod_id}###{mod.mod_id.file_id}"
-            ]
-
-        elif mod.modfiles:
+        if mod.mod_id is not None:
+            translation = self.get_translation_by_mod_id(mod.mod_id)
+
+        if translation is None:
             for modfile in mod.modfiles:
                 translation = self.get_translation_by_modfile_path(modfile.path)
                 if translation is not None:
@@ -209,13 +299,11 @@ class TranslationDatabase(QObject):
             Optional[Translation]: Translation or None.
         """
 
-        translations: dict[ModId, Translation] = {
-            translation.mod_id: translation
-            for translation in self.user_translations
-            if translation.mod_id is not None
-        }
+        translations: Optional[list[Translation]] = self.__translations_by_mod_id.get(
+            mod_id
+        )
 
-        return translations.get(mod_id)
+        return translations[-1] if translations else None
 
     def get_translation_for_id(self, id: str) -> Translation:
         """
@@ -232,11 +320,12 @@ class TranslationDatabase(QObject):
             Translation: The translation with the specified ID.
         """
 
-        for translation in self.user_translations:
-            if translation.id == id:
-                return translation
+        translations: Optional[list[Translation]] = self.__translations_by_id.get(id)
 
-        raise KeyError(f"Translation with ID '{id}' not found in database.")
+        if not translations:
+            raise KeyError(f"Translation with ID '{id}' not found in database.")
+
+        return translations[0]
 
     def is_translation_in_database(self, translation: Translation) -> bool:
         """
@@ -249,7 +338,83 @@ class TranslationDatabase(QObject):
             bool: `True` if the translation is in the database, `False` otherwise.
         """
 
-        return any(t.id == translation.id for t in self.user_translations)
+        return translation.id in self.__translations_by_id
+
+    def __index_translation(self, translation: Translation) -> None:
+        with self.__index_lock:
+            self.__unindex_translation(translation)
+
+            modfile_paths: list[Path] = translation.modfile_paths
+            self.__translations_by_id.setdefault(translation.id, []).append(translation)
+            for modfile_path in modfile_paths:
+                self.__translations_by_modfile.setdefault(modfile_path, []).append(
+                    translation
+                )
+            if translation.mod_id is not None:
+                self.__translations_by_mod_id.setdefault(translation.mod_id, []).append(
+                    translation
+                )
+
+            self.__indexed_keys[id(translation)] = (
+                translation.id,
+                modfile_paths,
+                translation.mod_id,
+            )
+
+    def __unindex_translation(self, translation: Translation) -> None:
+        with self.__index_lock:
+            keys: Optional[tuple[str, list[Path], Optional[ModId]]] = (
+                self.__indexed_keys.pop(id(translation), None)
+            )
+            if keys is None:
+                return
+
+            translation_id, modfile_paths, mod_id = keys
+            TranslationDatabase.__remove_from_list_map(
+                self.__translations_by_id, translation_id, translation
+            )
+
+            for modfile_path in modfile_paths:
+                TranslationDatabase.__remove_from_list_map(
+                    self.__translations_by_modfile, modfile_path, translation
+                )
+
+            if mod_id is not None:
+                TranslationDatabase.__remove_from_list_map(
+                    self.__translations_by_mod_id, mod_id, translation
+                )
+
+    @staticmethod
+    def __remove_from_list_map(
+        list_map: dict[K, list[Translation]], key: K, translation: Translation
+    ) -> None:
+        translations: list[Translation] = list_map.get(key, [])
+        # compare by identity as the equality check of pydantic models is expensive
+        list_map[key] = [t for t in translations if t is not translation]
+
+        if not list_map[key]:
+            list_map.pop(key)
+
+    def __on_translations_added(self, translations: list[Translation]) -> None:
+        with self.__index_lock:
+            for translation in translations:
+                self.__index_translation(translation)
+
+            self.__version += 1
+
+    def __on_translations_removed(self, translations: list[Translation]) -> None:
+        with self.__index_lock:
+            for translation in translations:
+                self.__unindex_translation(translation)
+
+            self.__version += 1
+
+    def __reindex_translation(self, translation: Translation) -> None:
+        with self.__index_lock:
+            if id(translation) in self.__indexed_keys:
+                self.__index_translation(translation)
+
+            self.__version += 1
 
     def search_database(self, filter: SearchFilter) -> dict[Path, StringList]:
         """
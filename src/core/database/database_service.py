@@ -5,16 +5,25 @@ Copyright (c) Cutleast
 import logging
 import os
 import shutil
+from collections.abc import Iterable
+from concurrent.futures import Future, as_completed
 from pathlib import Path
-from typing import Any, Optional
+from threading import Lock
+from typing import Any, ClassVar, Optional
 
 import jstyleson as json
+from cutleast_core_lib.core.multithreading.progress_executor import ProgressExecutor
+from cutleast_core_lib.core.utilities.hash import sha256_hash
 from cutleast_core_lib.core.utilities.unique import unique
+from cutleast_core_lib.ui.progress.display import ProgressDisplay
+from PySide6.QtWidgets import QApplication
 
 from core.database.translation import Translation
+from core.database.translation_service import TranslationService
 from core.mod_file.mod_file import ModFile
 from core.mod_file.translation_status import TranslationStatus
 from core.mod_instance.mod import Mod
+from core.string.string_record import StringRecord
 from core.string.string_status import StringStatus
 from core.string.string_utils import StringUtils
 from core.string.types import StringList
@@ -31,9 +40,17 @@ class DatabaseService:
 
     log: logging.Logger = logging.getLogger("DatabaseService")
 
+    __save_lock: ClassVar[Lock] = Lock()
+    """Lock for saving the database index from multiple threads."""
+
     @classmethod
     def load_database(
-        cls, appdb_path: Path, userdb_path: Path, language: GameLanguage
+        cls,
+        appdb_path: Path,
+        userdb_path: Path,
+        language: GameLanguage,
+        use_packed_format: bool = False,
+        lazy: bool = False,
     ) -> TranslationDatabase:
         """
         Loads the translation database for the specified language from the specified
@@ -43,6 +60,15 @@ class DatabaseService:
             appdb_path (Path): Path to the application database directory.
             userdb_path (Path): Path to the user database directory.
             language (GameLanguage): Language to load the database for.
+            use_packed_format (bool, optional):
+                Whether to save the user translations in the packed format. User
+                translations in the other format are loaded and converted. Defaults to
+                False.
+            lazy (bool, optional):
+                Whether to load the strings of user translations only when they are
+                needed (see `TranslationPreloader`). Translations without a summary in
+                the database index or in the other format are loaded anyway. Defaults to
+                False.
 
         Returns:
             TranslationDatabase: The loaded translation database.
@@ -66,11 +92,21 @@ class DatabaseService:
             appdb_path=appdb_path,
             language=language,
             vanilla_translation=cls.__load_vanilla_translation(appdb_path, language),
-            user_translations=cls.__load_user_database(userdb_path, language),
+            user_translations=cls.__load_user_database(
+                userdb_path, language, lazy, use_packed_format
+            ),
+            use_packed_format=use_packed_format,
         )
 
+        if any(
+            translation.string_counts is None
+            for translation in database.user_translations
+        ):
+            # store the summaries of the translations in the index
+            cls.save_database(database)
+
         cls.log.info(
-            f"Loaded database with {len(database.strings)} strings(s) from "
+            f"Loaded database with {database.string_count} strings(s) from "
             f"{len(database.user_translations) + 1} translation(s)."
         )
 
@@ -102,7 +138,7 @@ class DatabaseService:
 
     @classmethod
     def __load_user_database(
-        cls, userdb_path: Path, language: GameLanguage
+        cls, userdb_path: Path, language: GameLanguage, lazy: bool, packed: bool
     ) -> list[Translation]:
         """
         Loads user installed translation database.
@@ -110,6 +146,10 @@ class DatabaseService:
         Args:
             userdb_path (Path): Path to the user database directory.
             language (GameLanguage): Language to load the database for.
+            lazy (bool): Whether to skip loading translations with a summary.
+            packed (bool):
+                Whether the translations are expected in the packed format. Translations
+                in the other format are loaded and converted.
 
         Returns:
             list[Translation]: List of loaded user translations.
@@ -132,7 +172,21 @@ class DatabaseService:
             name: str = translation_data["name"]
             try:
                 translation = Translation.from_index_data(translation_data, db_path)
-                translation.strings  # build cache of strings by "calling" the strings property  # noqa: B018
+
+                requires_conversion: bool = TranslationService.requires_conversion(
+                    translation.path, packed
+                )
+                if not lazy or translation.string_counts is None or requires_conversion:
+                    cls.load_translation(translation)
+
+                # migrate translations that are not in the configured format
+                if requires_conversion:
+                    translation.save(packed)
+                    cls.log.info(
+                        f"Converted translation '{translation.name}' to the configured "
+                        "format."
+                    )
+
                 translations.append(translation)
             except Exception as ex:
                 cls.log.error(f"Failed to load translation '{name}': {ex}", exc_info=ex)
@@ -141,6 +195,135 @@ class DatabaseService:
 
         return translations
 
+    @classmethod
+    def load_translation(cls, translation: Translation) -> None:
+        """
+        Loads the strings of the specified translation if they aren't loaded yet.
+
+        Args:
+            translation (Translation): The translation to load.
+        """
+
+        translation.strings  # build cache of strings by "calling" the strings property  # noqa: B018
+
+    @classmethod
+    def save_translation(
+        cls,
+        translation: Translation,
+        database: TranslationDatabase,
+        modfiles: Optional[Iterable[Path]] = None,
+        save: bool = True,
+    ) -> None:
+        """
+        Saves the strings of a translation in the format of the specified database.
+        If the translation is in the database, it is reindexed and its summary in the
+        database index is refreshed.
+
+        ## Emitted Signals:
+            `TranslationDatabase.changed_signal(translation)`:
+                If the translation is in the database.
+
+        Args:
+            translation (Translation): The translation to save.
+            database (TranslationDatabase): The database of the translation.
+            modfiles (Optional[Iterable[Path]], optional):
+                Mod files whose strings have changed. Defaults to None (all mod files).
+            save (bool, optional):
+                Whether to save the database index. Defaults to True.
+        """
+
+        translation.save(database.use_packed_format, modfiles)
+
+        if database.is_translation_in_database(translation):
+            database.changed_signal.emit(translation)
+
+            if save:
+                cls.save_database(database)
+
+    @classmethod
+    def preload_translations(
+        cls,
+        translations: list[Translation],
+        thread_num: Optional[int] = None,
+        pdisplay: Optional[ProgressDisplay] = None,
+    ) -> None:
+        """
+        Loads the strings of the specified translations in parallel. Translations that
+        are already loaded are skipped. Use this before accessing the strings of many
+        translations at once as the `Translation.strings` property loads them one after
+        another.
+
+        Args:
+            translations (list[Translation]): The translations to load.
+            thread_num (Optional[int], optional):
+                Maximum number of threads to use. Defaults to None (auto-detect).
+            pdisplay (Optional[ProgressDisplay], optional):
+                Optional progress display. Defaults to None.
+        """
+
+        unloaded_translations: list[Translation] = [
+            translation for translation in translations if not translation.is_loaded
+        ]
+        if not unloaded_translations:
+            return
+
+        cls.log.info(f"Loading {len(unloaded_translations)} translation(s)...")
+
+        with ProgressExecutor(pdisplay, max_workers=thread_num) as executor:
+            executor.set_main_progress_text(
+                QApplication.translate("DatabaseService", "Loading translations...")
+            )
+
+            futures: dict[Future[None], Translation] = {}
+            for translation in unloaded_translations:
+                future: Future[None] = executor.submit(
+                    # this lambda is necessary as it gets an update callable as first
+                    # positional argument
+                    lambda ucb, t=translation: cls.load_translation(t)
+                )
+                futures[future] = translation
+
+            for future in as_completed(futures):
+                translation: Translation = futures[future]
+                try:
+                    future.result()
+                except Exception as ex:
+                    cls.log.error(
+                        f"Failed to load translation '{translation.name}': {ex}",
+                        exc_info=ex,
+                    )
+
+        cls.log.info(f"Loaded {len(unloaded_translations)} translation(s).")
+
+    @staticmethod
+    def get_database_stamp(database: TranslationDatabase) -> str:
+        """
+        Generates a stamp of the saved content of a database. The stamp changes when a
+        translation is added, removed, renamed or saved. It is generated from the
+        entries of the database index (the names and save timestamps of the
+        translations), so neither the translations nor their files have to be read.
+        The vanilla translation is only changed by app updates and is covered by its
+        number of strings.
+
+        Args:
+            database (TranslationDatabase): The database to generate the stamp for.
+
+        Returns:
+            str: The database stamp.
+        """
+
+        entries: list[str] = [
+            database.language.id,
+            str(database.vanilla_translation.string_count),
+        ]
+        for translation in database.user_translations:
+            entries.append(
+                f"{translation.name}|{translation.timestamp}|"
+                f"{translation.save_timestamp}"
+            )
+
+        return sha256_hash("\n".join(entries).encode())
+
     @classmethod
     def save_database(cls, database: TranslationDatabase) -> None:
         """
@@ -153,13 +336,14 @@ class DatabaseService:
         cls.log.info(f"Saving database index for '{database.language}'...")
 
         index_path: Path = database.userdb_path / database.language.id / "index.json"
-        index_data: list[dict[str, Any]] = [
-            translation.to_index_data()
-            for translation in unique(database.user_translations, key=lambda t: t.id)
-        ]
+        with cls.__save_lock:
+            index_data: list[dict[str, Any]] = [
+                translation.to_index_data()
+                for translation in unique(database.user_translations, key=lambda t: t.id)
+            ]
 
-        with index_path.open("w", encoding="utf8") as index_file:
-            json.dump(index_data, index_file, indent=4, ensure_ascii=False)
+            with index_path.open("w", encoding="utf8") as index_file:
+                json.dump(index_data, index_file, indent=4, ensure_ascii=False)
 
         cls.log.info("Database index saved.")
 
@@ -182,6 +366,8 @@ class DatabaseService:
         ## Emitted Signals:
             `TranslationDatabase.add_signal([translation])`:
                 If the translation wasn't in the database before.
+            `TranslationDatabase.changed_signal(translation)`:
+                If the translation was merged into an existing one.
             `TranslationDatabase.update_signal()`: Always.
         """
 
@@ -209,24 +395,37 @@ class DatabaseService:
         ## Emitted Signals:
             `TranslationDatabase.add_signal(translations)`:
                 With the translation that weren't in the database before.
+            `TranslationDatabase.changed_signal(translation)`:
+                For every existing translation the strings were merged into.
             `TranslationDatabase.update_signal()`: Always.
         """
 
-        added_translations: list[Translation] = []
+        # the database index is only updated when the add signal is emitted
+        added_translations: dict[str, Translation] = {}
+        merged_translations: list[Translation] = []
         for translation in translations:
-            if not database.is_translation_in_database(translation):
+            existing_translation: Optional[Translation] = added_translations.get(
+                translation.id
+            )
+            if existing_translation is None and database.is_translation_in_database(
+                translation
+            ):
+                existing_translation = database.get_translation_for_id(translation.id)
+
+            if existing_translation is None:
                 database.user_translations.append(translation)
                 cls.log.info(f"Added translation '{translation.name}' to database.")
-                added_translations.append(translation)
+                added_translations[translation.id] = translation
             else:
-                existing_translation: Translation = database.get_translation_for_id(
-                    translation.id
-                )
                 cls.merge_translations(existing_translation, translation)
                 cls.log.info(f"Updated translation '{translation.name}' in database.")
+                merged_translations.append(existing_translation)
 
         if added_translations:
-            database.add_signal.emit(added_translations)
+            database.add_signal.emit(list(added_translations.values()))
+
+        for merged_translation in merged_translations:
+            database.changed_signal.emit(merged_translation)
 
         database.update_signal.emit()
 
@@ -258,6 +457,8 @@ class DatabaseService:
         # Merge metadata
         existing_translation.mod_id = new_translation.mod_id
         existing_translation.version = new_translation.version
+        if new_translation.save_timestamp is not None:
+            existing_translation.save_timestamp = new_translation.save_timestamp
 
         return existing_translation
 
@@ -371,6 +572,7 @@ class DatabaseService:
         """
 
         old_name: str = translation.name
+        in_database: bool = database.is_translation_in_database(translation)
         new_path: Path = database.userdb_path / database.language.id / new_name
         os.rename(translation.path, new_path)
         translation.name = new_name
@@ -378,7 +580,7 @@ class DatabaseService:
 
         cls.log.info(f"Renamed translation '{old_name}' to '{new_name}'.")
 
-        if database.is_translation_in_database(translation):
+        if in_database:
             if save:
                 cls.save_database(database)
 
@@ -471,11 +673,7 @@ class DatabaseService:
 
         translation_strings: dict[Path, StringList] = translation.strings
         for modfile in relevant_modfiles:
-            modfile_strings: StringList = modfile.get_strings()
-
-            for string in modfile_strings:
-                string.string = string.original
-                string.status = StringStatus.TranslationRequired
+            modfile_strings: StringList = cls.__get_untranslated_strings(modfile)
 
             if apply_db:
                 StringUtils.match_strings(
@@ -485,11 +683,10 @@ class DatabaseService:
             translation_strings.setdefault(modfile.path, []).extend(modfile_strings)
 
         translation.strings = translation_strings
-        translation.remove_duplicates(save=False)
+        translation.remove_duplicates()
 
         if add_and_save:
-            translation.save()
-            cls.add_translation(translation, database)
+            cls.__save_and_add_translation(translation, database)
 
         cls.log.info(
             f"Created translation with strings for {len(translation.strings)} "
@@ -533,10 +730,7 @@ class DatabaseService:
                 database=database,
             )
 
-        modfile_strings: StringList = modfile.get_strings()
-        for string in modfile_strings:
-            string.string = string.original
-            string.status = StringStatus.TranslationRequired
+        modfile_strings: StringList = cls.__get_untranslated_strings(modfile)
 
         if apply_db:
             StringUtils.match_strings(
@@ -544,16 +738,58 @@ class DatabaseService:
             )
 
         translation.strings.setdefault(modfile.path, []).extend(modfile_strings)
-        translation.remove_duplicates(save=False)
+        translation.remove_duplicates()
 
         if add_and_save:
-            translation.save()
-            cls.add_translation(translation, database)
+            cls.__save_and_add_translation(translation, database)
 
         cls.log.info(f"Created translation with {len(modfile_strings)} string(s).")
 
         return translation
 
+    @classmethod
+    def __save_and_add_translation(
+        cls, translation: Translation, database: TranslationDatabase
+    ) -> None:
+        """
+        Saves a created translation and adds it to the database if it isn't already in
+        it. Existing translations are only saved since `save_translation()` already
+        reindexes them and saves the database index.
+
+        Args:
+            translation (Translation): The translation to save and add.
+            database (TranslationDatabase): The database of the translation.
+        """
+
+        if database.is_translation_in_database(translation):
+            cls.save_translation(translation, database)
+        else:
+            cls.save_translation(translation, database, save=False)
+            cls.add_translation(translation, database)
+
+    @staticmethod
+    def __get_untranslated_strings(modfile: ModFile) -> StringList:
+        """
+        Gets the strings of a mod file with their translations reset to their original
+        texts and their status set to "translation required".
+
+        The strings are created from the lightweight string records of the mod file so
+        that no intermediate string models have to be loaded and modified.
+
+        Args:
+            modfile (ModFile): Mod file to get the strings of.
+
+        Returns:
+            StringList: List of untranslated strings.
+        """
+
+        return StringRecord.to_strings(
+            record._replace(
+                string=record.original, status=StringStatus.TranslationRequired
+            )
+            for record in modfile.get_string_records()
+        )
+
     @classmethod
     def create_translation_from_mod(
         cls,
@@ -594,7 +830,6 @@ class DatabaseService:
         translation.strings = cls.merge_translation_strings(translation.strings, strings)
 
         if add_and_save:
-            translation.save()
-            cls.add_translation(translation, database)
+            cls.__save_and_add_translation(translation, database)
 
         return translation
@@ -4,6 +4,7 @@ Copyright (c) Cutleast
 
 import logging
 from concurrent.futures import Future, as_completed
+from pathlib import Path
 from typing import Optional
 
 from cutleast_core_lib.core.multithreading.progress import (
@@ -19,8 +20,9 @@ from core.database.database_service import DatabaseService
 from core.mod_file.mod_file import ModFile
 from core.mod_file.translation_status import TranslationStatus
 from core.mod_instance.mod_instance import ModInstance
+from core.string.string_change_set import StringChangeSet
+from core.string.string_record import StringRecordList
 from core.string.string_utils import StringUtils
-from core.string.types import StringList
 
 from .database import TranslationDatabase
 from .translation import Translation
@@ -100,6 +102,7 @@ class DatabaseUpdater(QObject):
                         translation=t,
                         keep_deleted=keep_deleted,
                         update_callback=uc,
+                        save=False,
                     )
                 )
                 futures[future] = existing_translation
@@ -124,6 +127,10 @@ class DatabaseUpdater(QObject):
                 }
             )
 
+        if updated_modfile_states:
+            # the translations were saved without the database index to save it once
+            DatabaseService.save_database(self.__database)
+
         self.log.info("Finished updating database translations.")
 
         return updated_modfile_states
@@ -133,6 +140,7 @@ class DatabaseUpdater(QObject):
         translation: Translation,
         keep_deleted: bool = False,
         update_callback: Optional[UpdateCallback] = None,
+        save: bool = True,
     ) -> dict[ModFile, TranslationStatus]:
         """
         Updates the strings of a translation based on the original mod files in the
@@ -146,6 +154,9 @@ class DatabaseUpdater(QObject):
                 file. Defaults to False.
             update_callback (Optional[UpdateCallback], optional):
                 Optional update callback. Defaults to None.
+            save (bool, optional):
+                Whether to save the database index if the translation has changed.
+                Defaults to True.
 
         Returns:
             dict[ModFile, TranslationStatus]:
@@ -156,6 +167,7 @@ class DatabaseUpdater(QObject):
         self.log.debug(f"Updating translation '{translation.name}'...")
 
         updated_modfile_states: dict[ModFile, TranslationStatus] = {}
+        changed_modfile_paths: list[Path] = []
         for m, (modfile_path, strings) in enumerate(translation.strings.items()):
             modfile: Optional[ModFile] = self.__mod_instance.get_modfile(
                 modfile_path, ignore_states=[TranslationStatus.IsTranslated]
@@ -177,17 +189,26 @@ class DatabaseUpdater(QObject):
                 ),
             )
 
-            modfile_strings: StringList = modfile.get_strings()
-            updated: bool = StringUtils.update_string_list(
+            modfile_records: StringRecordList = modfile.get_string_records()
+            changes: StringChangeSet = StringUtils.update_string_list(
                 translation_strings=strings,
-                original_strings=modfile_strings,
+                original_strings=modfile_records,
                 keep_deleted=keep_deleted,
             )
-            if updated:
+            if changes:
+                self.log.debug(
+                    f"Updated strings of '{modfile_path}': {len(changes.added)} "
+                    f"added, {len(changes.changed)} changed, {len(changes.removed)} "
+                    "removed."
+                )
                 updated_modfile_states[modfile] = TranslationStatus.TranslationIncomplete
+                changed_modfile_paths.append(modfile_path)
 
         if updated_modfile_states:
-            translation.save()
+            # only the mod files with changed strings have to be saved
+            DatabaseService.save_translation(
+                translation, self.__database, modfiles=changed_modfile_paths, save=save
+            )
 
         self.log.debug(
             f"Update of '{translation.name}' complete. Changes made: "
@@ -238,8 +259,9 @@ class DatabaseUpdater(QObject):
                 )
 
             if missing_modfiles:
-                existing_translation.save()
-                self.__database.changed_signal.emit(existing_translation)
+                DatabaseService.save_translation(
+                    existing_translation, self.__database, save=False
+                )
 
             modfiles_added.extend(missing_modfiles)
 
@@ -3,20 +3,31 @@ Copyright (c) Cutleast
 """
 
 import logging
+import time
+from concurrent.futures import Future, as_completed
 from pathlib import Path
 from typing import Optional
 
-from cutleast_core_lib.core.multithreading.progress import ProgressUpdate
+from cutleast_core_lib.core.multithreading.progress import (
+    ProgressUpdate,
+    UpdateCallback,
+    update,
+)
+from cutleast_core_lib.core.multithreading.progress_executor import ProgressExecutor
 from cutleast_core_lib.ui.progress.display import ProgressDisplay
 from PySide6.QtCore import QObject
 
 from core.config.user_config import UserConfig
+from core.database.database_service import DatabaseService
 from core.database.translation import Translation
 from core.mod_file.mod_file import ModFile
 from core.mod_file.translation_status import TranslationStatus
 from core.mod_instance.mod_instance import ModInstance
+from core.string.types import StringList
 from core.utilities.constants import OUTPUT_MOD_MARKER_FILENAME
 
+from .output_manifest import OutputManifest, OutputManifestEntry
+
 
 class Exporter(QObject):
     """
@@ -56,25 +67,17 @@ class Exporter(QObject):
         cls.log.debug(f"Output mod: {output_mod}")
         cls.log.debug(f"Use DSD format: {use_dsd_format}")
 
-        for modfile_path, strings in translation.strings.items():
-            original_modfile: Optional[ModFile] = mod_instance.get_modfile(
-                modfile_path, ignore_states=[TranslationStatus.IsTranslated]
-            )
-
-            if original_modfile is None:
-                cls.log.info(
-                    f"Skipping '{modfile_path}' due to missing original mod file..."
-                )
-                continue
-
+        for modfile_path, (original_modfile, strings) in cls.resolve_modfiles(
+            [translation], mod_instance
+        ).items():
             try:
-                original_modfile.dump_strings(
-                    strings=strings,
-                    output_folder=output_path,
+                cls.dump_modfile(
+                    original_modfile,
+                    strings,
+                    output_path,
                     use_dsd_format=use_dsd_format,
                     output_mod=output_mod,
                 )
-                cls.log.debug(f"Dumped strings for '{modfile_path}' to '{output_path}'.")
 
             except Exception as ex:
                 cls.log.error(
@@ -85,6 +88,95 @@ class Exporter(QObject):
 
         cls.log.info(f"Export of translation '{translation.name}' complete.")
 
+    @classmethod
+    def resolve_modfiles(
+        cls, translations: list[Translation], mod_instance: ModInstance
+    ) -> dict[Path, tuple[ModFile, StringList]]:
+        """
+        Resolves the original mod files of the specified translations. If multiple
+        translations contain strings for the same mod file, the strings of the last
+        translation are used as they would overwrite the others in the output folder.
+
+        Args:
+            translations (list[Translation]): Translations to resolve.
+            mod_instance (ModInstance): Mod instance with original mod files to use.
+
+        Returns:
+            dict[Path, tuple[ModFile, StringList]]:
+                Map of mod file paths to their original mod file and strings.
+        """
+
+        original_modfiles: dict[Path, Optional[ModFile]] = {}
+        result: dict[Path, tuple[ModFile, StringList]] = {}
+
+        for translation in translations:
+            for modfile_path, strings in translation.strings.items():
+                if modfile_path not in original_modfiles:
+                    original_modfiles[modfile_path] = mod_instance.get_modfile(
+                        modfile_path, ignore_states=[TranslationStatus.IsTranslated]
+                    )
+
+                original_modfile: Optional[ModFile] = original_modfiles[modfile_path]
+                if original_modfile is None:
+                    cls.log.info(
+                        f"Skipping '{modfile_path}' of translation "
+                        f"'{translation.name}' due to missing original mod file..."
+                    )
+                    continue
+
+                # keep the order of the latest translation for the output
+                result.pop(modfile_path, None)
+                result[modfile_path] = (original_modfile, strings)
+
+        return result
+
+    @classmethod
+    def dump_modfile(
+        cls,
+        modfile: ModFile,
+        strings: StringList,
+        output_path: Path,
+        use_dsd_format: bool = True,
+        output_mod: bool = False,
+        update_callback: Optional[UpdateCallback] = None,
+    ) -> float:
+        """
+        Dumps the strings of a single mod file to an output folder.
+
+        Args:
+            modfile (ModFile): Original mod file to dump the strings with.
+            strings (StringList): Strings to dump.
+            output_path (Path): Path to export to.
+            use_dsd_format (bool, optional):
+                Whether to use the Dynamic String Distributor format. Defaults to True.
+            output_mod (bool, optional):
+                Whether the export is used in the output mod. This affects DSD file
+                names. Defaults to False.
+            update_callback (Optional[UpdateCallback], optional):
+                Optional update callback. Defaults to None.
+
+        Returns:
+            float: The time it took to dump the strings in seconds.
+        """
+
+        update(update_callback, ProgressUpdate(status_text=str(modfile.path)))
+
+        start: float = time.perf_counter()
+        modfile.dump_strings(
+            strings=strings,
+            output_folder=output_path,
+            use_dsd_format=use_dsd_format,
+            output_mod=output_mod,
+        )
+        duration: float = time.perf_counter() - start
+
+        cls.log.debug(
+            f"Dumped strings for '{modfile.path}' to '{output_path}' in "
+            f"{duration:.2f} second(s)."
+        )
+
+        return duration
+
     def build_output_mod(
         self,
         output_path: Path,
@@ -92,9 +184,15 @@ class Exporter(QObject):
         translations: list[Translation],
         user_config: UserConfig,
         pdisplay: Optional[ProgressDisplay] = None,
+        thread_num: Optional[int] = None,
     ) -> Path:
         """
-        Builds the output mod for DSD at the configured location.
+        Builds the output mod for DSD at the configured location. The mod files are
+        dumped in parallel.
+
+        The generated files are recorded in a manifest in the output mod. On later
+        builds, only files whose strings or original mod file have changed or that are
+        missing are dumped again and files that are no longer generated are removed.
 
         Args:
             output_path (Path): Path to build the output mod at.
@@ -103,6 +201,8 @@ class Exporter(QObject):
             user_config (UserConfig): User configuration.
             pdisplay (Optional[ProgressDisplay], optional):
                 Optional loading dialog. Defaults to None.
+            thread_num (Optional[int], optional):
+                Maximum number of threads to use. Defaults to None (auto-detect).
 
         Returns:
             Path: The path to the output mod.
@@ -120,27 +220,180 @@ class Exporter(QObject):
                 ProgressUpdate(status_text=self.tr("Building output mod..."))
             )
 
-        for t, translation in enumerate(translations):
-            if pdisplay is not None:
-                pdisplay.updateMainProgress(
-                    ProgressUpdate(
-                        status_text=self.tr("Building output mod...")
-                        + f" ({t}/{len(translations)})",
-                        value=t,
-                        maximum=len(translations),
+        DatabaseService.preload_translations(translations, thread_num, pdisplay)
+        modfiles: dict[Path, tuple[ModFile, StringList]] = self.resolve_modfiles(
+            translations, mod_instance
+        )
+
+        use_dsd_format: bool = user_config.use_dynamic_string_distributor
+        old_manifest: OutputManifest = OutputManifest.load(output_path)
+        manifest = OutputManifest(use_dsd_format=use_dsd_format)
+
+        # entries of a build with a different format cannot be reused
+        reusable_entries: dict[Path, OutputManifestEntry] = (
+            old_manifest.files if old_manifest.use_dsd_format == use_dsd_format else {}
+        )
+
+        start: float = time.perf_counter()
+        rebuilt: int = 0
+        with ProgressExecutor(pdisplay, max_workers=thread_num) as executor:
+            executor.set_main_progress_text(self.tr("Building output mod..."))
+
+            futures: dict[Future[tuple[OutputManifestEntry, Optional[float]]], Path] = {}
+            for modfile_path, (modfile, strings) in modfiles.items():
+                future: Future[tuple[OutputManifestEntry, Optional[float]]] = (
+                    executor.submit(
+                        # necessary as this lambda gets an update callable as first
+                        # positional argument
+                        lambda ucb, mf, s, e: self.__build_modfile(
+                            mf, s, output_path, use_dsd_format, e, update_callback=ucb
+                        ),
+                        modfile,
+                        strings,
+                        reusable_entries.get(modfile_path),
                     )
                 )
+                futures[future] = modfile_path
 
-            self.export_translation(
-                translation=translation,
-                mod_instance=mod_instance,
-                output_path=output_path,
-                use_dsd_format=user_config.use_dynamic_string_distributor,
-                output_mod=True,
-            )
+            for f, future in enumerate(as_completed(futures)):
+                modfile_path: Path = futures[future]
+
+                try:
+                    entry, duration = future.result()
+                except Exception as ex:
+                    self.log.error(
+                        f"Failed to dump strings for '{modfile_path}' to "
+                        f"'{output_path}': {ex}",
+                        exc_info=ex,
+                    )
+
+                    # keep track of the output file without hashes to retry the dump
+                    # on the next build
+                    failed_modfile: ModFile = modfiles[modfile_path][0]
+                    manifest.files[modfile_path] = OutputManifestEntry(
+                        output_file=failed_modfile.get_output_file_path(
+                            Path(), use_dsd_format, output_mod=True
+                        ),
+                        strings_hash="",
+                        modfile_hash="",
+                    )
+                    continue
+
+                manifest.files[modfile_path] = entry
+                status_text: str
+                if duration is not None:
+                    rebuilt += 1
+                    status_text = f"{modfile_path} ({duration:.2f} s)"
+                else:
+                    status_text = f"{modfile_path} ({self.tr('unchanged')})"
 
+                executor.set_main_progress_text(
+                    self.tr("Building output mod...")
+                    + f" ({f + 1}/{len(futures)}) - {status_text}"
+                )
+
+        self.__remove_stale_files(output_path, old_manifest, manifest)
+        manifest.save(output_path)
         (output_path / OUTPUT_MOD_MARKER_FILENAME).touch()  # Create marker file
 
-        self.log.info("Built output mod.")
+        self.log.info(
+            f"Built output mod with {len(modfiles)} mod file(s) ({rebuilt} rebuilt, "
+            f"{len(modfiles) - rebuilt} unchanged or failed) in "
+            f"{time.perf_counter() - start:.2f} second(s)."
+        )
 
         return output_path
+
+    @classmethod
+    def __build_modfile(
+        cls,
+        modfile: ModFile,
+        strings: StringList,
+        output_path: Path,
+        use_dsd_format: bool,
+        old_entry: Optional[OutputManifestEntry],
+        update_callback: Optional[UpdateCallback] = None,
+    ) -> tuple[OutputManifestEntry, Optional[float]]:
+        """
+        Dumps the strings of a single mod file to the output mod if its manifest entry
+        has changed or if its output file is missing.
+
+        Args:
+            modfile (ModFile): Original mod file to dump the strings with.
+            strings (StringList): Strings to dump.
+            output_path (Path): Path to the output mod.
+            use_dsd_format (bool): Whether to use the Dynamic String Distributor format.
+            old_entry (Optional[OutputManifestEntry]):
+                Manifest entry of the previous build, if any.
+            update_callback (Optional[UpdateCallback], optional):
+                Optional update callback. Defaults to None.
+
+        Returns:
+            tuple[OutputManifestEntry, Optional[float]]:
+                The new manifest entry and the time it took to dump the strings in
+                seconds or None if the output file is up to date.
+        """
+
+        entry = OutputManifestEntry(
+            output_file=modfile.get_output_file_path(
+                Path(), use_dsd_format, output_mod=True
+            ),
+            strings_hash=OutputManifestEntry.hash_strings(strings),
+            modfile_hash=OutputManifestEntry.hash_modfile(modfile),
+        )
+
+        if entry == old_entry and (output_path / entry.output_file).is_file():
+            cls.log.debug(f"Output file for '{modfile.path}' is up to date.")
+            return entry, None
+
+        duration: float = cls.dump_modfile(
+            modfile,
+            strings,
+            output_path,
+            use_dsd_format=use_dsd_format,
+            output_mod=True,
+            update_callback=update_callback,
+        )
+
+        return entry, duration
+
+    @classmethod
+    def __remove_stale_files(
+        cls,
+        output_path: Path,
+        old_manifest: OutputManifest,
+        new_manifest: OutputManifest,
+    ) -> None:
+        """
+        Removes files of a previous build that are no longer part of the output mod
+        and any folders that became empty by that.
+
+        Args:
+            output_path (Path): Path to the output mod.
+            old_manifest (OutputManifest): Manifest of the previous build.
+            new_manifest (OutputManifest): Manifest of the current build.
+        """
+
+        current_files: set[Path] = {
+            entry.output_file for entry in new_manifest.files.values()
+        }
+        stale_files: set[Path] = {
+            entry.output_file
+            for entry in old_manifest.files.values()
+            if entry.output_file not in current_files
+        }
+
+        for stale_file in sorted(stale_files):
+            file_path: Path = output_path / stale_file
+            file_path.unlink(missing_ok=True)
+            cls.log.debug(f"Removed stale output file '{file_path}'.")
+
+            folder: Path = file_path.parent
+            while (
+                folder != output_path and folder.is_dir() and not any(folder.iterdir())
+            ):
+                folder.rmdir()
+                folder = folder.parent
+
+        if stale_files:
+            cls.log.info(f"Removed {len(stale_files)} stale file(s) from output mod.")
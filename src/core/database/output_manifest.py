@@ -0,0 +1,113 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+from pathlib import Path
+from typing import Self
+
+from cutleast_core_lib.core.utilities.hash import sha256_hash
+from pydantic import BaseModel, Field, ValidationError
+
+from core.mod_file.mod_file import ModFile
+from core.string.types import StringList, StringListModel
+from core.utilities.constants import OUTPUT_MOD_MANIFEST_FILENAME
+
+log: logging.Logger = logging.getLogger("OutputManifest")
+
+
+class OutputManifestEntry(BaseModel):
+    """
+    Class for the manifest entry of a single file in an output mod.
+    """
+
+    output_file: Path
+    """Path of the generated file, relative to the output mod."""
+
+    strings_hash: str
+    """Hash of the strings the file was generated from."""
+
+    modfile_hash: str
+    """Hash of the identifier of the original mod file the file was generated with."""
+
+    @staticmethod
+    def hash_strings(strings: StringList) -> str:
+        """
+        Generates a hash of a list of strings.
+
+        Args:
+            strings (StringList): The strings to hash.
+
+        Returns:
+            str: The hash of the strings.
+        """
+
+        return sha256_hash(StringListModel.dump_json(strings))
+
+    @staticmethod
+    def hash_modfile(modfile: ModFile) -> str:
+        """
+        Generates a hash of the current state of an original mod file.
+
+        Args:
+            modfile (ModFile): The mod file to hash.
+
+        Returns:
+            str: The hash of the mod file.
+        """
+
+        return sha256_hash(
+            f"{modfile.full_path}|{modfile.get_file_identifier()}".encode()
+        )
+
+
+class OutputManifest(BaseModel):
+    """
+    Class for the manifest of an output mod. It records the generated files and the
+    inputs they were generated from so that later builds only have to regenerate files
+    whose inputs have changed.
+    """
+
+    use_dsd_format: bool = True
+    """Whether the output mod was built using the Dynamic String Distributor format."""
+
+    files: dict[Path, OutputManifestEntry] = Field(default_factory=dict)
+    """Map of original mod file paths to their manifest entries."""
+
+    @classmethod
+    def load(cls, output_path: Path) -> Self:
+        """
+        Loads the manifest of an output mod. Returns an empty manifest if the output mod
+        has no manifest or if it is invalid.
+
+        Args:
+            output_path (Path): Path to the output mod.
+
+        Returns:
+            Self: The loaded manifest.
+        """
+
+        manifest_file: Path = output_path / OUTPUT_MOD_MANIFEST_FILENAME
+
+        if manifest_file.is_file():
+            try:
+                return cls.model_validate_json(manifest_file.read_bytes())
+            except ValidationError as ex:
+                log.warning(
+                    f"Failed to load output mod manifest from '{manifest_file}': {ex}"
+                )
+
+        return cls()
+
+    def save(self, output_path: Path) -> None:
+        """
+        Saves this manifest to an output mod.
+
+        Args:
+            output_path (Path): Path to the output mod.
+        """
+
+        manifest_file: Path = output_path / OUTPUT_MOD_MANIFEST_FILENAME
+        manifest_file.write_text(self.model_dump_json(indent=4), encoding="utf8")
+
+        log.debug(f"Saved output mod manifest to '{manifest_file}'.")
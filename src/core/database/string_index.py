@@ -0,0 +1,236 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+from collections import Counter
+from collections.abc import Iterable
+from threading import RLock
+from typing import Optional, TypeAlias, TypeVar
+
+from PySide6.QtCore import QObject, Qt
+
+from core.string.string_record import StringRecord
+from core.string.string_status import StringStatus
+from core.string.types import String
+
+from .database import TranslationDatabase
+from .translation import Translation
+
+StringKey: TypeAlias = tuple[str, StringStatus, Optional[str]]
+"""
+Type alias for the key of a string in the index. It consists of the fields that are
+compared by `BaseString.__eq__()` (`id`, `status` and `string`).
+"""
+
+K = TypeVar("K")
+
+
+class DatabaseStringIndex(QObject):
+    """
+    Class for a hash-based index of the strings in a translation database.
+
+    The index is built once on demand and is then kept up to date incrementally when
+    translations are added to, removed from or changed in the database. Strings with the
+    status `StringStatus.TranslationRequired` are not indexed.
+    """
+
+    __database: TranslationDatabase
+
+    __originals: Counter[str]
+    """Reference counts of the original texts of the indexed strings."""
+
+    __string_keys: Counter[StringKey]
+    """Reference counts of the keys of the indexed strings."""
+
+    __indexed_translations: dict[int, tuple[Translation, list[str], list[StringKey]]]
+    """
+    Map of object ids of indexed translations to the translation, its indexed originals
+    and its indexed string keys. The object id is used since the translation id changes
+    when a translation is renamed.
+    """
+
+    __built: bool
+    __lock: RLock
+
+    log: logging.Logger = logging.getLogger("DatabaseStringIndex")
+
+    def __init__(self, database: TranslationDatabase) -> None:
+        """
+        Args:
+            database (TranslationDatabase): The translation database to index.
+        """
+
+        super().__init__()
+
+        self.__database = database
+        self.__originals = Counter()
+        self.__string_keys = Counter()
+        self.__indexed_translations = {}
+        self.__built = False
+        self.__lock = RLock()
+
+        # the index has to be updated immediately, even if a signal is emitted from
+        # another thread
+        self.__database.add_signal.connect(
+            self.__on_translations_added, Qt.ConnectionType.DirectConnection
+        )
+        self.__database.remove_signal.connect(
+            self.__on_translations_removed, Qt.ConnectionType.DirectConnection
+        )
+        self.__database.changed_signal.connect(
+            self.__on_translation_changed, Qt.ConnectionType.DirectConnection
+        )
+
+    @property
+    def is_built(self) -> bool:
+        """
+        Whether the index has been built.
+        """
+
+        return self.__built
+
+    def build(self, force: bool = False) -> None:
+        """
+        Builds the index from all translations in the database. Does nothing if the
+        index is already built, unless `force` is set.
+
+        Args:
+            force (bool, optional):
+                Whether to rebuild the index even if it is already built. Defaults to
+                False.
+        """
+
+        with self.__lock:
+            if self.__built and not force:
+                return
+
+            self.log.info("Building database string index...")
+
+            self.__originals.clear()
+            self.__string_keys.clear()
+            self.__indexed_translations.clear()
+
+            self.__add_translation(self.__database.vanilla_translation)
+            for translation in self.__database.user_translations:
+                self.__add_translation(translation)
+
+            self.__built = True
+
+            self.log.info(
+                f"Indexed {sum(self.__string_keys.values())} string(s) from "
+                f"{len(self.__indexed_translations)} translation(s)."
+            )
+
+    def covers(self, string: String | StringRecord) -> bool:
+        """
+        Checks if the specified string is covered by the database, either by an
+        existing string with the same original text or by an equal string.
+
+        Args:
+            string (String | StringRecord): The string to check.
+
+        Returns:
+            bool: `True` if the string is covered, `False` otherwise.
+        """
+
+        return (
+            string.original in self.__originals
+            or DatabaseStringIndex.get_string_key(string) in self.__string_keys
+        )
+
+    def covers_all(self, strings: Iterable[String | StringRecord]) -> bool:
+        """
+        Checks if all of the specified strings are covered by the database.
+
+        Args:
+            strings (Iterable[String | StringRecord]): The strings to check.
+
+        Returns:
+            bool: `True` if all strings are covered, `False` otherwise.
+        """
+
+        return all(self.covers(string) for string in strings)
+
+    @staticmethod
+    def get_string_key(string: String | StringRecord) -> StringKey:
+        """
+        Args:
+            string (String | StringRecord): The string to get the key for.
+
+        Returns:
+            StringKey: The key of the string in the index.
+        """
+
+        return (string.id, string.status, string.string)
+
+    def __add_translation(self, translation: Translation) -> None:
+        originals: list[str] = []
+        string_keys: list[StringKey] = []
+
+        for modfile_strings in translation.strings.values():
+            for string in modfile_strings:
+                if string.status == StringStatus.TranslationRequired:
+                    continue
+
+                originals.append(string.original)
+                string_keys.append(DatabaseStringIndex.get_string_key(string))
+
+        self.__originals.update(originals)
+        self.__string_keys.update(string_keys)
+        self.__indexed_translations[id(translation)] = (
+            translation,
+            originals,
+            string_keys,
+        )
+
+    def __remove_translation(self, translation: Translation) -> None:
+        indexed: Optional[tuple[Translation, list[str], list[StringKey]]] = (
+            self.__indexed_translations.pop(id(translation), None)
+        )
+        if indexed is None:
+            return
+
+        _, originals, string_keys = indexed
+        DatabaseStringIndex.__decrement(self.__originals, originals)
+        DatabaseStringIndex.__decrement(self.__string_keys, string_keys)
+
+    @staticmethod
+    def __decrement(counter: Counter[K], keys: list[K]) -> None:
+        for key in keys:
+            count: int = counter[key] - 1
+            if count > 0:
+                counter[key] = count
+            else:
+                counter.pop(key, None)
+
+    def __on_translations_added(self, translations: list[Translation]) -> None:
+        with self.__lock:
+            if not self.__built:
+                return
+
+            for translation in translations:
+                self.__remove_translation(translation)
+                self.__add_translation(translation)
+
+            self.log.debug(f"Added {len(translations)} translation(s) to the index.")
+
+    def __on_translations_removed(self, translations: list[Translation]) -> None:
+        with self.__lock:
+            if not self.__built:
+                return
+
+            for translation in translations:
+                self.__remove_translation(translation)
+
+            self.log.debug(f"Removed {len(translations)} translation(s) from the index.")
+
+    def __on_translation_changed(self, translation: Translation) -> None:
+        with self.__lock:
+            if not self.__built:
+                return
+
+            self.__remove_translation(translation)
+            self.__add_translation(translation)
+
+            self.log.debug(f"Reindexed translation '{translation.name}'.")
@@ -5,9 +5,11 @@ Copyright (c) Cutleast
 from __future__ import annotations
 
 import time
+from collections.abc import Iterable
 from functools import lru_cache
 from pathlib import Path
-from typing import Any, Optional, Self, override
+from threading import Lock
+from typing import Any, ClassVar, Optional, Self, override
 
 from cutleast_core_lib.core.filesystem.scanner import DirectoryScanner
 from pydantic import BaseModel, Field, ValidationError
@@ -48,6 +50,23 @@ class Translation(BaseModel):
     timestamp: int = Field(default_factory=lambda: int(time.time()))
     """The creation timestamp of the translation."""
 
+    save_timestamp: Optional[int] = None
+    """
+    The time the strings of the translation were last saved in nanoseconds. It is
+    stored in the database index so that changes are detected without reading the
+    translation files (see `DatabaseService.get_database_stamp()`).
+    """
+
+    string_counts: Optional[dict[Path, int]] = None
+    """
+    Summary of the translation's strings: the number of strings for each mod file name.
+    It is stored in the database index so that the mod files and the number of strings
+    are known without loading the strings. Only up-to-date if the strings are not
+    loaded, use `modfile_paths` and `string_count` instead.
+    """
+
+    __load_lock: ClassVar[Lock] = Lock()
+
     def to_index_data(self) -> dict[str, Any]:
         """
         Generates index data for the index.json file in the database.
@@ -56,6 +75,12 @@ class Translation(BaseModel):
             dict[str, Any]: Index data.
         """
 
+        if self.strings_ is not None:
+            self.string_counts = {
+                modfile_path: len(modfile_strings)
+                for modfile_path, modfile_strings in self.strings_.items()
+            }
+
         return self.model_dump(mode="json", exclude_defaults=True)
 
     @classmethod
@@ -149,7 +174,16 @@ class Translation(BaseModel):
         """
 
         if self.strings_ is None:
-            self.strings_ = TranslationService.load_translation_strings(self.path)
+            # the strings may be loaded by multiple threads at the same time (for eg.
+            # by the preloader and on demand) but only the first result is kept so
+            # that no changes to the strings are lost
+            strings: dict[Path, StringList] = (
+                TranslationService.load_translation_strings(self.path)
+            )
+
+            with Translation.__load_lock:
+                if self.strings_ is None:
+                    self.strings_ = strings
 
         return self.strings_
 
@@ -157,6 +191,38 @@ class Translation(BaseModel):
     def strings(self, strings: dict[Path, StringList]) -> None:
         self.strings_ = strings
 
+    @property
+    def is_loaded(self) -> bool:
+        """
+        Whether the strings of the translation are already loaded.
+        """
+
+        return self.strings_ is not None
+
+    @property
+    def modfile_paths(self) -> list[Path]:
+        """
+        List of the mod file names of the translation. The strings are not loaded if the
+        translation has a summary in the database index.
+        """
+
+        if self.strings_ is None and self.string_counts is not None:
+            return list(self.string_counts)
+
+        return list(self.strings)
+
+    @property
+    def string_count(self) -> int:
+        """
+        Total number of strings of the translation. The strings are not loaded if the
+        translation has a summary in the database index.
+        """
+
+        if self.strings_ is None and self.string_counts is not None:
+            return sum(self.string_counts.values())
+
+        return sum(len(modfile_strings) for modfile_strings in self.strings.values())
+
     @lru_cache  # noqa: B019
     def get_size(self) -> int:
         """
@@ -179,23 +245,26 @@ class Translation(BaseModel):
 
         return self.get_size()
 
-    def remove_duplicates(self, save: bool = True) -> None:
+    def remove_duplicates(self) -> None:
         """
-        Removes duplicate strings from the translation.
-
-        Args:
-            save (bool, optional): Whether to save the translation. Defaults to True.
+        Removes duplicate strings from the translation. The translation is not saved.
         """
 
         for modfile_name, modfile_strings in self.strings.items():
             self.strings[modfile_name] = StringUtils.unique(modfile_strings)
 
-        if save:
-            self.save()
-
-    def save(self) -> None:
+    def save(self, packed: bool, modfiles: Optional[Iterable[Path]] = None) -> None:
         """
-        Saves the translation.
+        Saves the strings of the translation. Use `DatabaseService.save_translation()`
+        to save a translation in the format of its database.
+
+        Args:
+            packed (bool): Whether to save the strings in the packed format.
+            modfiles (Optional[Iterable[Path]], optional):
+                Mod files whose strings have changed. Defaults to None (all mod files).
         """
 
-        TranslationService.save_translation_strings(self.path, self.strings)
+        TranslationService.save_translation_strings(
+            self.path, self.strings, packed, modfiles=modfiles
+        )
+        self.save_timestamp = time.time_ns()
@@ -0,0 +1,128 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from .database import TranslationDatabase
+from .database_service import DatabaseService
+from .translation import Translation
+
+
+class TranslationPreloader:
+    """
+    Class for loading the strings of lazily loaded user translations in the background.
+
+    The translations are loaded by a thread pool in the order of the database. A
+    translation that is accessed before it is preloaded is loaded immediately by the
+    accessing thread and is then only checked by the preloader. Translations whose
+    summary in the database index does not match their loaded strings (e.g. because
+    they were changed by an older version) are reindexed and the database index is
+    saved once all translations are preloaded.
+    """
+
+    LOG_INTERVAL: int = 25
+    """Number of preloaded translations after which the progress is logged."""
+
+    __database: TranslationDatabase
+    __thread_num: int
+
+    __executor: Optional[ThreadPoolExecutor] = None
+    __lock: Lock
+    __loaded: int = 0
+    __total: int = 0
+    __outdated: int = 0
+
+    log: logging.Logger = logging.getLogger("TranslationPreloader")
+
+    def __init__(self, database: TranslationDatabase, thread_num: int = 4) -> None:
+        """
+        Args:
+            database (TranslationDatabase): The database to preload.
+            thread_num (int, optional):
+                The maximum number of threads to use. Defaults to 4.
+        """
+
+        self.__database = database
+        self.__thread_num = thread_num
+        self.__lock = Lock()
+
+    def start(self) -> None:
+        """
+        Starts preloading all user translations that are not loaded yet. This method
+        does not block.
+        """
+
+        translations: list[Translation] = [
+            translation
+            for translation in self.__database.user_translations
+            if not translation.is_loaded
+        ]
+
+        self.__loaded = 0
+        self.__total = len(translations)
+        self.__outdated = 0
+
+        if not translations:
+            return
+
+        self.log.info(f"Preloading {len(translations)} translation(s)...")
+
+        self.__executor = ThreadPoolExecutor(
+            max_workers=self.__thread_num, thread_name_prefix="TranslationPreloader"
+        )
+        for translation in translations:
+            self.__executor.submit(self.__preload, translation)
+
+    def stop(self) -> None:
+        """
+        Cancels the preloading of all pending translations and blocks until the
+        currently loading translations are done.
+        """
+
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=True, cancel_futures=True)
+            self.__executor = None
+
+            self.log.info(
+                f"Stopped preloading after {self.__loaded}/{self.__total} "
+                "translation(s)."
+            )
+
+    def __preload(self, translation: Translation) -> None:
+        outdated: bool = False
+        try:
+            summary: Optional[dict[Path, int]] = translation.string_counts
+            DatabaseService.load_translation(translation)
+
+            outdated = summary is not None and summary != {
+                modfile_path: len(modfile_strings)
+                for modfile_path, modfile_strings in translation.strings.items()
+            }
+            if outdated:
+                self.log.warning(
+                    f"Summary of translation '{translation.name}' in the database "
+                    "index is outdated. Reindexing..."
+                )
+                self.__database.changed_signal.emit(translation)
+        except Exception as ex:
+            self.log.error(
+                f"Failed to preload translation '{translation.name}': {ex}", exc_info=ex
+            )
+
+        with self.__lock:
+            self.__loaded += 1
+            if outdated:
+                self.__outdated += 1
+            loaded: int = self.__loaded
+
+        if loaded % TranslationPreloader.LOG_INTERVAL == 0 or loaded == self.__total:
+            self.log.info(f"Preloaded {loaded}/{self.__total} translation(s).")
+
+        if loaded == self.__total and self.__outdated:
+            # refresh the outdated summaries in the database index
+            DatabaseService.save_database(self.__database)
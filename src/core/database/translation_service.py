@@ -4,11 +4,13 @@ Copyright (c) Cutleast
 
 import logging
 import os
+from collections.abc import Iterable
 from pathlib import Path
 from typing import Optional
 
 from cutleast_core_lib.core.filesystem.utils import add_suffix, rem_last_suffix
 
+from core.string.packed_string_store import PackedStringStore
 from core.string.string_loader import StringLoader
 from core.string.types import StringList, StringListModel
 
@@ -18,6 +20,9 @@ class TranslationService:
     Class for loading and saving translations.
     """
 
+    PACKED_FILE_NAME: str = "strings.pack"
+    """Name of the file containing the strings of a translation in the packed format."""
+
     log: logging.Logger = logging.getLogger("TranslationService")
 
     @classmethod
@@ -25,7 +30,9 @@ class TranslationService:
         cls, translation_folder: Path
     ) -> dict[Path, StringList]:
         """
-        Loads the strings for a translation from the specified folder.
+        Loads the strings for a translation from the specified folder. JSON files next
+        to a packed file (for eg. imported ones) take precedence over the packed strings
+        of the same mod file.
 
         Args:
             translation_folder (Path): Path to the folder with the translation's files.
@@ -45,8 +52,14 @@ class TranslationService:
                 )
 
         # then load the entire translation at once
-        json_files: list[Path] = list(translation_folder.rglob("*.json"))
         strings: dict[Path, StringList] = {}
+        packed_file: Path = translation_folder / cls.PACKED_FILE_NAME
+        if packed_file.is_file():
+            # errors are not caught here as the packed file contains all strings of the
+            # translation and resaving a partially loaded translation would lose them
+            strings.update(PackedStringStore.load(packed_file))
+
+        json_files: list[Path] = cls.__get_json_files(translation_folder)
         for json_file in json_files:
             modfile_path: Path = rem_last_suffix(json_file).relative_to(
                 translation_folder
@@ -85,21 +98,74 @@ class TranslationService:
 
     @classmethod
     def save_translation_strings(
-        cls, translation_folder: Path, strings: dict[Path, StringList]
+        cls,
+        translation_folder: Path,
+        strings: dict[Path, StringList],
+        packed: bool,
+        modfiles: Optional[Iterable[Path]] = None,
     ) -> None:
         """
-        Saves the strings for a translation to the specified folder.
+        Saves the strings for a translation to the specified folder. Files of the other
+        format are removed from the folder.
 
         Args:
             translation_folder (Path): Path to the folder to save the strings to.
             strings (dict[Path, StringList]): Map of mod file names to their list of strings.
+            packed (bool):
+                Whether to save the strings in the packed format (see
+                `PackedStringStore`) instead of a JSON file per mod file.
+            modfiles (Optional[Iterable[Path]], optional):
+                Mod files whose strings have changed and have to be saved. Defaults to
+                None (all mod files). All strings are saved if the strings are or were
+                in the packed format as the packed file always contains all of them.
         """
 
+        translation_folder.mkdir(parents=True, exist_ok=True)
+        packed_file: Path = translation_folder / cls.PACKED_FILE_NAME
+
+        if modfiles is not None and not packed and not packed_file.is_file():
+            for modfile_name in modfiles:
+                json_file_path: Path = translation_folder / add_suffix(
+                    modfile_name, ".json"
+                )
+                json_file_path.parent.mkdir(parents=True, exist_ok=True)
+                cls.save_strings_to_json_file(json_file_path, strings[modfile_name])
+            return
+
+        if packed:
+            PackedStringStore.dump(strings, packed_file)
+
+            for json_file in cls.__get_json_files(translation_folder):
+                os.unlink(json_file)
+            return
+
         for modfile_name, modfile_strings in strings.items():
             json_file_path: Path = translation_folder / add_suffix(modfile_name, ".json")
             json_file_path.parent.mkdir(parents=True, exist_ok=True)
             cls.save_strings_to_json_file(json_file_path, modfile_strings)
 
+        packed_file.unlink(missing_ok=True)
+
+    @classmethod
+    def requires_conversion(cls, translation_folder: Path, packed: bool) -> bool:
+        """
+        Checks if the files in the specified translation folder are not (entirely) in
+        the specified format.
+
+        Args:
+            translation_folder (Path): Path to the translation's folder.
+            packed (bool): Whether the packed format is expected.
+
+        Returns:
+            bool: Whether the translation has to be resaved to be in the format.
+        """
+
+        has_packed_file: bool = (translation_folder / cls.PACKED_FILE_NAME).is_file()
+        if packed:
+            return not has_packed_file or any(cls.__get_json_files(translation_folder))
+
+        return has_packed_file
+
     @classmethod
     def save_strings_to_json_file(
         cls, json_file_path: Path, strings: StringList, indent: Optional[int] = None
@@ -114,3 +180,7 @@ class TranslationService:
         """
 
         json_file_path.write_bytes(StringListModel.dump_json(strings, indent=indent))
+
+    @staticmethod
+    def __get_json_files(translation_folder: Path) -> list[Path]:
+        return list(translation_folder.rglob("*.json"))
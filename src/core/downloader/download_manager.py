@@ -28,6 +28,7 @@ from core.mod_instance.mod_instance import ModInstance
 from core.translation_provider.mod_id import ModId
 from core.translation_provider.provider import ModDetails, TranslationProvider
 from core.translation_provider.source import Source
+from core.translation_provider.translation_discovery import TranslationDiscovery
 
 from .file_download import FileDownload
 from .mod_info import ModInfo
@@ -360,6 +361,14 @@ class DownloadManager(QObject):
         }
         items = {mod: modfiles for mod, modfiles in items.items() if modfiles}
 
+        # shares the translations of an original mod between all of its mod files
+        discovery = TranslationDiscovery(
+            self.__provider,
+            language=self.__user_config.language.id,
+            masterlist=self.__masterlist,
+            author_blacklist=self.__user_config.author_blacklist,
+        )
+
         translation_downloads: DownloadListEntries = {}
         with ProgressExecutor(
             pdisplay, max_workers=self.__app_config.worker_thread_num
@@ -372,7 +381,7 @@ class DownloadManager(QObject):
                     # this lambda is necessary as it gets an update callable as first
                     # positional argument
                     lambda ucb, m=mod, mfs=modfiles: self.__collect_downloads_for_mod(
-                        m, mfs, ucb
+                        m, mfs, discovery, ucb
                     )
                 )
                 tasks[future] = mod
@@ -404,6 +413,7 @@ class DownloadManager(QObject):
                     continue
 
         self.log.info("Download collection complete.")
+        self.__provider.log_request_metrics()
 
         return translation_downloads
 
@@ -411,6 +421,7 @@ class DownloadManager(QObject):
         self,
         mod: Mod,
         modfiles: list[ModFile],
+        discovery: TranslationDiscovery,
         update_callback: Optional[UpdateCallback] = None,
     ) -> dict[Path, list[TranslationDownload]]:
         download_units: dict[Path, list[TranslationDownload]] = {}
@@ -426,7 +437,7 @@ class DownloadManager(QObject):
 
             try:
                 modfile_downloads: list[TranslationDownload] = (
-                    self.__collect_downloads_for_modfile(mod, modfile)
+                    self.__collect_downloads_for_modfile(mod, modfile, discovery)
                 )
                 if modfile_downloads:
                     download_units[modfile.path] = modfile_downloads
@@ -440,19 +451,13 @@ class DownloadManager(QObject):
         return download_units
 
     def __collect_downloads_for_modfile(
-        self, mod: Mod, modfile: ModFile
+        self, mod: Mod, modfile: ModFile, discovery: TranslationDiscovery
     ) -> list[TranslationDownload]:
         if mod.mod_id is None:
             return []
 
-        available_translations: dict[Source, list[ModId]] = (
-            self.__provider.get_translations(
-                mod_id=mod.mod_id,
-                file_name=modfile.name,
-                language=self.__user_config.language.id,
-                masterlist=self.__masterlist,
-                author_blacklist=self.__user_config.author_blacklist,
-            )
+        available_translations: dict[Source, list[ModId]] = discovery.get_translations(
+            mod_id=mod.mod_id, file_name=modfile.name
         )
 
         # Use a dict to group translation files from the same mod and source together
@@ -460,7 +465,7 @@ class DownloadManager(QObject):
         for source, translation_ids in available_translations.items():
             for translation_id in translation_ids:
                 try:
-                    file_details: ModDetails = self.__provider.get_details(
+                    file_details: ModDetails = discovery.get_details(
                         translation_id, source
                     )
                 except Exception as ex:
@@ -239,7 +239,7 @@ class Worker(QThread):
             timestamp=download.mod_details.timestamp,
         )
         translation.strings = strings
-        translation.save()
+        DatabaseService.save_translation(translation, self.__database)
         DatabaseService.add_translation(translation, self.__database)
 
     @override
@@ -14,6 +14,7 @@ from cutleast_core_lib.ui.progress.display import ProgressDisplay
 from PySide6.QtCore import QObject, Signal
 
 from core.database.database import TranslationDatabase
+from core.database.database_service import DatabaseService
 from core.database.translation import Translation
 from core.file_types.plugin.string import PluginString
 from core.string.string_status import StringStatus
@@ -83,7 +84,7 @@ class Editor(QObject):
         """
 
         self.__translation.strings = self.__strings_cache
-        self.__translation.save()
+        DatabaseService.save_translation(self.__translation, self.__database)
 
         self.log.info(f"Saved translation '{self.__translation.name}'.")
         self.__changes_pending = False
@@ -224,12 +225,17 @@ class Editor(QObject):
 
         return modified_strings
 
-    def apply_database(self, strings: StringList) -> int:
+    def apply_database(
+        self, strings: StringList, thread_num: Optional[int] = None
+    ) -> int:
         """
         Applies database to a list of strings.
 
         Args:
             strings (StringList): List of strings
+            thread_num (Optional[int], optional):
+                Maximum number of threads to use for loading the database. Defaults to
+                None (auto-detect).
 
         Returns:
             int: Number of strings modified
@@ -237,12 +243,15 @@ class Editor(QObject):
 
         self.log.info(f"Applying database to {len(strings)} string(s)...")
 
-        database_originals: dict[str, String] = {
-            string.original: string for string in self.__database.strings
-        }
-        database_strings: dict[str, String] = {
-            string.id: string for string in self.__database.strings
-        }
+        DatabaseService.preload_translations(
+            self.__database.user_translations, thread_num=thread_num
+        )
+
+        database_originals: dict[str, String] = {}
+        database_strings: dict[str, String] = {}
+        for database_string in self.__database.iter_strings():
+            database_originals[database_string.original] = database_string
+            database_strings[database_string.id] = database_string
 
         modified_strings: int = 0
         for string in strings:
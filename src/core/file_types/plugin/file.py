@@ -12,6 +12,7 @@ from sse_plugin_interface.utilities import is_valid_string
 from core.database.translation_service import TranslationService
 from core.file_source.file_source_factory import FileSourceFactory
 from core.mod_file.mod_file import ModFile
+from core.string.string_record import StringRecord, StringRecordList
 from core.string.string_status import StringStatus
 from core.string.types import StringList
 
@@ -44,13 +45,17 @@ class PluginFile(ModFile):
 
     @override
     def _extract_strings(self) -> StringList:
+        return StringRecord.to_strings(self._extract_string_records())
+
+    @override
+    def _extract_string_records(self) -> StringRecordList:
         plugin = SSEPlugin.from_stream(
             FileSourceFactory.for_file_path(self.full_path).get_file_stream(), self.name
         )
 
         raw_strings: list[SSEPluginString] = plugin.extract_strings()
 
-        return PluginFile.convert_sse_plugin_strings(raw_strings)
+        return PluginFile.convert_sse_plugin_strings_to_records(raw_strings)
 
     @staticmethod
     def convert_sse_plugin_strings(raw_strings: list[SSEPluginString]) -> StringList:
@@ -86,6 +91,75 @@ class PluginFile(ModFile):
 
         return strings
 
+    @staticmethod
+    def convert_sse_plugin_strings_to_records(
+        raw_strings: list[SSEPluginString],
+    ) -> StringRecordList:
+        """
+        Converts a list of raw extracted plugin strings to string records without
+        creating the string models. Also filters out blank strings.
+
+        Args:
+            raw_strings (list[SSEPluginString]): List of raw strings.
+
+        Returns:
+            StringRecordList: List of string records.
+        """
+
+        records: StringRecordList = []
+        for raw_string in raw_strings:
+            if not raw_string.string.strip():
+                continue
+
+            record = StringRecord(
+                kind=PluginString,
+                id=PluginString.generate_id(
+                    raw_string.form_id,
+                    raw_string.editor_id,
+                    raw_string.type,
+                    raw_string.index,
+                ),
+                original=raw_string.string,
+                string=None,
+                status=(
+                    StringStatus.TranslationRequired
+                    if is_valid_string(raw_string.string)
+                    else StringStatus.NoTranslationRequired
+                ),
+                # in the order of the fields of `PluginString`
+                fields=(
+                    raw_string.form_id,
+                    raw_string.type,
+                    raw_string.index,
+                    raw_string.editor_id,
+                ),
+            )
+            records.append(record)
+
+        return records
+
+    @override
+    def get_output_file_path(
+        self, output_folder: Path, use_dsd_format: bool, output_mod: bool = False
+    ) -> Path:
+        if not use_dsd_format:
+            return super().get_output_file_path(output_folder, use_dsd_format)
+
+        # the output mod uses a different naming scheme to prevent it from being
+        # imported again by SSE-AT
+        json_filename: str = (
+            "SSE-AT_output.json" if output_mod else "SSE-AT_exported.json"
+        )
+
+        return (
+            output_folder
+            / "SKSE"
+            / "Plugins"
+            / "DynamicStringDistributor"
+            / self.path
+            / json_filename
+        )
+
     @override
     def dump_strings(
         self,
@@ -120,7 +194,7 @@ class PluginFile(ModFile):
 
             plugin.replace_strings(replacement_strings)
 
-            output_file: Path = output_folder / self.path
+            output_file: Path = self.get_output_file_path(output_folder, use_dsd_format)
             output_file.parent.mkdir(parents=True, exist_ok=True)
             output_file.write_bytes(plugin.dump())
 
@@ -141,18 +215,12 @@ class PluginFile(ModFile):
             Path: Path to the exported DSD file.
         """
 
-        plugin_folder: Path = (
-            path / "SKSE" / "Plugins" / "DynamicStringDistributor" / self.path
+        dsd_path: Path = self.get_output_file_path(
+            path, use_dsd_format=True, output_mod=output_mod
         )
+        dsd_path.parent.mkdir(parents=True, exist_ok=True)
 
-        plugin_folder.mkdir(parents=True, exist_ok=True)
-
-        json_filename: str
         if output_mod:
-            # the output mod uses a different naming scheme to prevent it from being
-            # imported again by SSE-AT
-            json_filename = "SSE-AT_output.json"
-
             # only dump strings that have been translated for the output mod
             strings = list(
                 filter(
@@ -160,10 +228,7 @@ class PluginFile(ModFile):
                     strings,
                 )
             )
-        else:
-            json_filename = "SSE-AT_exported.json"
 
-        dsd_path: Path = plugin_folder / json_filename
         TranslationService.save_strings_to_json_file(dsd_path, strings, indent=4)
 
         return dsd_path
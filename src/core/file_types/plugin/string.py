@@ -2,7 +2,8 @@
 Copyright (c) Cutleast
 """
 
-from typing import Optional, override
+from functools import cached_property
+from typing import ClassVar, Optional, override
 
 from PySide6.QtWidgets import QApplication
 
@@ -35,11 +36,16 @@ class PluginString(BaseString):
     but not all strings do have one.
     """
 
-    @property
+    ID_FIELDS: ClassVar[frozenset[str]] = frozenset(
+        {"form_id", "editor_id", "type", "index"}
+    )
+
+    @cached_property
     @override
     def id(self) -> str:
         """
         Generates a unique ID for the string. Intended only for internal use.
+        The ID is cached until one of the included attributes changes.
 
         Included attributes:
         - lowered `form_id` without master index (first two digits)
@@ -48,7 +54,29 @@ class PluginString(BaseString):
         - `index`
         """
 
-        return f"{self.form_id[2:].lower()}###{self.editor_id}###{self.type}###{self.index}"
+        return PluginString.generate_id(
+            self.form_id, self.editor_id, self.type, self.index
+        )
+
+    @staticmethod
+    def generate_id(
+        form_id: str, editor_id: Optional[str], type: str, index: Optional[int]
+    ) -> str:
+        """
+        Generates the ID of a plugin string from its attributes without requiring an
+        instance (see `PluginString.id`).
+
+        Args:
+            form_id (str): Form ID of the string.
+            editor_id (Optional[str]): Editor ID of the string.
+            type (str): Type of the string.
+            index (Optional[int]): Index of the string.
+
+        Returns:
+            str: The generated ID.
+        """
+
+        return f"{form_id[2:].lower()}###{editor_id}###{type}###{index}"
 
     @property
     @override
@@ -0,0 +1,82 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import re
+from collections.abc import Iterable
+from fnmatch import translate
+from typing import Optional
+
+
+class IgnoreMatcher:
+    """
+    Class for matching file names against a precompiled ignore list.
+
+    File names and patterns are compared case-insensitively. All patterns are looked
+    up in a set and patterns with wildcards (`*` and `?`) are additionally compiled
+    into a single regular expression. Square brackets are always matched literally
+    since they are common in mod file names, like "[Patch] Mod.esp".
+    """
+
+    WILDCARD_CHARS: str = "*?"
+    """Characters that mark a pattern as a wildcard pattern."""
+
+    __names: frozenset[str]
+    """Lowercase file names and patterns."""
+
+    __pattern: Optional[re.Pattern[str]]
+    """Compiled wildcard patterns or None if there are none."""
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        """
+        Args:
+            patterns (Iterable[str]): File names or wildcard patterns to ignore.
+        """
+
+        names: set[str] = set()
+        wildcard_patterns: list[str] = []
+
+        for pattern in patterns:
+            pattern = pattern.lower()
+            names.add(pattern)
+
+            if any(char in pattern for char in IgnoreMatcher.WILDCARD_CHARS):
+                # "[[]" is the escaped form of "[" in fnmatch patterns
+                wildcard_patterns.append(translate(pattern.replace("[", "[[]")))
+
+        self.__names = frozenset(names)
+        self.__pattern = (
+            re.compile("|".join(f"(?:{p})" for p in wildcard_patterns))
+            if wildcard_patterns
+            else None
+        )
+
+    def matches(self, file_name: str) -> bool:
+        """
+        Checks if a file name is matched by the ignore list.
+
+        Args:
+            file_name (str): Name of the file.
+
+        Returns:
+            bool: Whether the file name is matched.
+        """
+
+        file_name = file_name.lower()
+
+        return file_name in self.__names or (
+            self.__pattern is not None and self.__pattern.match(file_name) is not None
+        )
+
+    def filter(self, file_names: Iterable[str]) -> list[str]:
+        """
+        Removes all file names that are matched by the ignore list.
+
+        Args:
+            file_names (Iterable[str]): File names to filter.
+
+        Returns:
+            list[str]: File names that are not matched, in their original order.
+        """
+
+        return [file_name for file_name in file_names if not self.matches(file_name)]
@@ -3,6 +3,7 @@ Copyright (c) Cutleast
 """
 
 import logging
+from collections.abc import Iterable
 from typing import Any, Optional, Self
 
 import jstyleson as json
@@ -13,6 +14,7 @@ from core.config.user_config import UserConfig
 from core.utilities.constants import AE_CC_PLUGINS, BASE_GAME_PLUGINS
 from core.utilities.game_language import GameLanguage
 
+from .ignore_matcher import IgnoreMatcher
 from .masterlist_entry import MasterlistEntry
 
 REPOSITORY_URL: str = "https://raw.githubusercontent.com/Cutleast/SSE-Auto-Translator/master/masterlists/index.json"
@@ -33,6 +35,12 @@ class Masterlist(BaseModel):
 
     __user_config: Optional[UserConfig] = PrivateAttr(default=None)
 
+    __ignore_matcher: Optional[IgnoreMatcher] = PrivateAttr(default=None)
+    """
+    Matcher for the ignored file names that is built on first use and reset when the
+    user ignore list is changed.
+    """
+
     @classmethod
     def from_data(cls, data: dict[str, dict[str, Any]]) -> Self:
         """
@@ -101,6 +109,7 @@ class Masterlist(BaseModel):
         """
 
         self.__user_config = user_config
+        self.__ignore_matcher = None
 
     def is_ignored(self, file_name: str) -> bool:
         """
@@ -113,16 +122,37 @@ class Masterlist(BaseModel):
             bool: Whether the file is ignored.
         """
 
-        masterlist_entry: Optional[MasterlistEntry] = self.entries.get(file_name.lower())
+        return self.__get_ignore_matcher().matches(file_name)
 
-        ignore_list: list[str] = self.user_ignore_list.copy()
-        ignore_list.extend(BASE_GAME_PLUGINS)
-        ignore_list.extend(AE_CC_PLUGINS)
+    def filter_ignored(self, file_names: Iterable[str]) -> list[str]:
+        """
+        Removes all file names that are on the ignore list (masterlist or user).
 
-        return file_name.lower() in ignore_list or (
-            masterlist_entry is not None
-            and masterlist_entry.type == MasterlistEntry.Type.Ignore
-        )
+        Args:
+            file_names (Iterable[str]): Names of the files.
+
+        Returns:
+            list[str]: Names of the files that are not ignored, in their original order.
+        """
+
+        return self.__get_ignore_matcher().filter(file_names)
+
+    def __get_ignore_matcher(self) -> IgnoreMatcher:
+        if self.__ignore_matcher is None:
+            self.__ignore_matcher = IgnoreMatcher(
+                [
+                    *self.user_ignore_list,
+                    *BASE_GAME_PLUGINS,
+                    *AE_CC_PLUGINS,
+                    *(
+                        file_name
+                        for file_name, entry in self.entries.items()
+                        if entry.type == MasterlistEntry.Type.Ignore
+                    ),
+                ]
+            )
+
+        return self.__ignore_matcher
 
     def add_to_ignore_list(self, file_name: str) -> None:
         """
@@ -134,6 +164,7 @@ class Masterlist(BaseModel):
 
         if file_name.lower() not in self.user_ignore_list:
             self.user_ignore_list.append(file_name.lower())
+            self.__ignore_matcher = None
 
     def remove_from_ignore_list(self, file_name: str) -> None:
         """
@@ -145,3 +176,4 @@ class Masterlist(BaseModel):
 
         if file_name.lower() in self.user_ignore_list:
             self.user_ignore_list.remove(file_name.lower())
+            self.__ignore_matcher = None
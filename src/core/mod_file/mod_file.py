@@ -12,6 +12,7 @@ from cutleast_core_lib.core.cache.cache import Cache
 from pydantic import BaseModel
 
 from core.file_source.file_source_factory import FileSourceFactory
+from core.string.string_record import StringRecord, StringRecordList
 from core.string.types import StringList
 from core.utilities.filesystem import relative_data_path
 
@@ -74,12 +75,34 @@ class ModFile(BaseModel, metaclass=ABCMeta):
             bool: Whether this file type can occur in BSA archives.
         """
 
+    def get_file_identifier(self) -> str:
+        """
+        Generates a unique identifier for the current state of this file.
+
+        Returns:
+            str: Unique identifier.
+        """
+
+        return FileSourceFactory.for_file_path(self.full_path).get_file_identifier()
+
     @Cache.persistent_cache(
-        cache_subfolder=Path("modfile_strings"),
-        id_generator=lambda self: FileSourceFactory.for_file_path(
-            self.full_path
-        ).get_file_identifier(),
+        cache_subfolder=Path("modfile_string_records"),
+        id_generator=lambda self: self.get_file_identifier(),
     )
+    def get_string_records(self) -> StringRecordList:
+        """
+        Extracts and returns all strings from this file as lightweight records. Uses the
+        current app's cache, if available.
+
+        This should be preferred over `get_strings()` when processing the strings in
+        bulk without displaying, editing or saving them.
+
+        Returns:
+            StringRecordList: List of records of all strings from this file.
+        """
+
+        return self._extract_string_records()
+
     def get_strings(self) -> StringList:
         """
         Extracts and returns all strings from this file. Uses the current app's cache, if
@@ -89,7 +112,7 @@ class ModFile(BaseModel, metaclass=ABCMeta):
             StringList: List of all strings from this file.
         """
 
-        return self._extract_strings()
+        return StringRecord.to_strings(self.get_string_records())
 
     @abstractmethod
     def _extract_strings(self) -> StringList:
@@ -100,6 +123,37 @@ class ModFile(BaseModel, metaclass=ABCMeta):
             StringList: List of all strings from this file.
         """
 
+    def _extract_string_records(self) -> StringRecordList:
+        """
+        Extracts and returns all strings from this file as records. Subclasses can
+        override this to create the records directly without creating the string models
+        first.
+
+        Returns:
+            StringRecordList: List of records of all strings from this file.
+        """
+
+        return StringRecord.from_strings(self._extract_strings())
+
+    def get_output_file_path(
+        self, output_folder: Path, use_dsd_format: bool, output_mod: bool = False
+    ) -> Path:
+        """
+        Gets the path of the file that `dump_strings()` creates in an output folder.
+
+        Args:
+            output_folder (Path): Folder to output the file to.
+            use_dsd_format (bool): Whether to use the Dynamic String Distributor format.
+            output_mod (bool, optional):
+                Whether the export is used in the output mod. May affect filenames.
+                Defaults to False.
+
+        Returns:
+            Path: The path of the output file.
+        """
+
+        return output_folder / self.path
+
     @abstractmethod
     def dump_strings(
         self,
@@ -3,10 +3,9 @@ Copyright (c) Cutleast
 """
 
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
 from cutleast_core_lib.core.utilities.typing_utils import not_none
-from cutleast_core_lib.core.utilities.unique import unique
 
 from core.mod_file.mod_file import ModFile
 from core.mod_file.translation_status import TranslationStatus
@@ -31,6 +30,16 @@ class ModInstance:
     """
 
     __modfiles_by_path: Optional[dict[Path, list[ModFile]]] = None
+    """Mod files by their path in the order of the modlist."""
+
+    __mods_by_modfile: dict[int, Mod]
+    """Mods by the ids of their mod files (`id(modfile)`)."""
+
+    __mods_by_mod_id: dict[tuple[Any, Any, Any], Mod]
+    """
+    Mods by their mod id, file id and game id. If there are multiple mods with the same
+    ids, the mod with the highest modlist index is stored.
+    """
 
     def __init__(self, display_name: str, mods: list[Mod]) -> None:
         """
@@ -58,12 +67,44 @@ class ModInstance:
         """
 
         if self.__modfiles_by_path is None:
-            self.__modfiles_by_path = {}
-            for mod in self.mods:
-                for modfile in mod.modfiles:
-                    self.__modfiles_by_path.setdefault(modfile.path, []).append(modfile)
+            self.__build_indexes()
+
+        return not_none(self.__modfiles_by_path)
+
+    def __build_indexes(self) -> None:
+        """
+        Builds the lookup tables of the modlist. The modlist and the mod files of its
+        mods are not expected to change afterwards.
+        """
+
+        self.__modfiles_by_path = {}
+        self.__mods_by_modfile = {}
+        self.__mods_by_mod_id = {}
+
+        for mod in self.mods:
+            self.__mods_by_mod_id[
+                (mod.metadata.mod_id, mod.metadata.file_id, mod.metadata.game_id)
+            ] = mod
+
+            for modfile in mod.modfiles:
+                self.__modfiles_by_path.setdefault(modfile.path, []).append(modfile)
+                self.__mods_by_modfile[id(modfile)] = mod
+
+    def get_mod_of_modfile(self, modfile: ModFile) -> Optional[Mod]:
+        """
+        Gets the mod that contains a mod file.
+
+        Args:
+            modfile (ModFile): The mod file.
+
+        Returns:
+            Optional[Mod]: The mod or None if the mod file is not in the modlist.
+        """
+
+        if self.__modfiles_by_path is None:
+            self.__build_indexes()
 
-        return self.__modfiles_by_path
+        return self.__mods_by_modfile.get(id(modfile))
 
     def get_modfile(
         self,
@@ -111,18 +152,15 @@ class ModInstance:
             list[ModFile]: List of mod files
         """
 
-        if ignore_mods is None:
-            ignore_mods = []
-
-        if ignore_states is None:
-            ignore_states = []
+        ignored_mods: set[int] = {id(mod) for mod in ignore_mods or []}
+        ignored_states: list[TranslationStatus] = ignore_states or []
 
         return [
             mf
             for mf in self.modfiles_by_path.get(modfile, [])
             if (
-                not any(mf in mod.modfiles for mod in ignore_mods)
-                and mf.status not in ignore_states
+                id(self.__mods_by_modfile[id(mf)]) not in ignored_mods
+                and mf.status not in ignored_states
             )
         ]
 
@@ -139,20 +177,12 @@ class ModInstance:
             Optional[Mod]: Mod or None
         """
 
-        mods: list[Mod] = unique(
-            mod
-            for mod in filter(
-                lambda m: (
-                    m.metadata.mod_id == mod_id.mod_id
-                    and m.metadata.file_id == mod_id.file_id
-                    and m.metadata.game_id == mod_id.nm_game_id
-                ),
-                self.mods,
-            )
-        )
+        if self.__modfiles_by_path is None:
+            self.__build_indexes()
 
-        # Get the mod with the highest modlist index
-        return max(mods, key=lambda m: self.mods.index(m), default=None)
+        return self.__mods_by_mod_id.get(
+            (mod_id.mod_id, mod_id.file_id, mod_id.nm_game_id)
+        )
 
     def get_mod_with_modfile(
         self,
@@ -177,20 +207,7 @@ class ModInstance:
             Optional[Mod]: Mod or None
         """
 
-        if ignore_mods is None:
-            ignore_mods = []
-
-        if ignore_states is None:
-            ignore_states = []
-
-        mods: list[Mod] = unique(
-            mod
-            for mod in filter(lambda m: m not in ignore_mods, self.mods)
-            for mf in filter(
-                lambda mf: mf.status not in not_none(ignore_states), mod.modfiles
-            )
-            if mf.path == modfile
-        )
+        modfiles: list[ModFile] = self.get_modfiles(modfile, ignore_mods, ignore_states)
 
-        # Get the mod with the highest modlist index
-        return max(mods, key=lambda m: self.mods.index(m), default=None)
+        # The mod files are in the order of the modlist
+        return self.__mods_by_modfile[id(modfiles[-1])] if modfiles else None
@@ -28,6 +28,15 @@ class StateService(QObject):
     update_signal = Signal()
     """Signal emitted everytime when the mod file states are updated."""
 
+    modfile_states_changed = Signal(list)
+    """
+    Signal emitted when the states of specific mod files have been changed, before
+    `update_signal` is emitted.
+
+    Args:
+        list[ModFile]: The mod files whose states have been changed.
+    """
+
     __mod_instance: ModInstance
     """The mod instance with the mod files to update."""
 
@@ -194,7 +203,7 @@ class StateService(QObject):
 
     def set_modfile_states(self, states: dict[ModFile, TranslationStatus]) -> None:
         """
-        Applies the given mod file states to the modlist and emits the update signal.
+        Applies the given mod file states to the modlist and emits the update signals.
 
         Args:
             states (dict[ModFile, TranslationStatus]):
@@ -206,6 +215,7 @@ class StateService(QObject):
 
         self.log.debug(f"Updated states for {len(states)} mod file(s).")
 
+        self.modfile_states_changed.emit(list(states))
         self.update_signal.emit()
 
     def export_states_to_json_file(
@@ -3,11 +3,14 @@ Copyright (c) Cutleast
 """
 
 import logging
+from collections.abc import Mapping, Sequence
+from threading import Lock
 from typing import Optional
 
 from lingua import Language, LanguageDetector, LanguageDetectorBuilder
 
-from core.string.types import StringList
+from core.string.string_record import StringRecord
+from core.string.types import String
 
 
 class LangDetector:
@@ -19,6 +22,11 @@ class LangDetector:
     __confidence: float
     __desired_lang: Language
 
+    __cache: dict[str, bool]
+    """Cached detection results by mod file identifier."""
+
+    __cache_lock: Lock
+
     log: logging.Logger = logging.getLogger("Utilities.LangDetector")
 
     def __init__(self, confidence: float, desired_lang: Language) -> None:
@@ -37,6 +45,9 @@ class LangDetector:
         builder.with_minimum_relative_distance(self.__confidence)
         self.__detector = builder.build()
 
+        self.__cache = {}
+        self.__cache_lock = Lock()
+
     @staticmethod
     def get_available_langs() -> list[Language]:
         """
@@ -51,47 +62,145 @@ class LangDetector:
 
         return langs
 
-    def requires_translation(
-        self, strings: StringList, max_string_count: int = 40
-    ) -> bool:
+    @staticmethod
+    def get_detection_sample(
+        strings: Sequence[String | StringRecord], max_string_count: int = 40
+    ) -> str:
         """
-        Checks if a mod file requires a translation.
+        Combines the original texts of different strings to a sample text for a more
+        precise detection.
 
         Args:
-            strings (StringList): List of strings to check.
+            strings (Sequence[String | StringRecord]): Strings to sample.
             max_string_count (int, optional):
-                Maximum number of strings to check. Defaults to 40.
+                Maximum number of strings to combine. Defaults to 40.
 
         Returns:
-            bool: True if a translation is required, False otherwise.
+            str: The sample text.
         """
 
-        if not len(strings):
-            return False
-
         # Number of strings to combine for more precise detection
         treshold: int = max_string_count - 1
 
-        detection_string: str = ""
-        c: int = 0
+        originals: set[str] = set()
+        sample: list[str] = []
         for string_data in strings:
-            if string_data.original not in detection_string:
-                detection_string += string_data.original + "\n"
-                c += 1
-                if c == treshold:
+            if string_data.original not in originals:
+                originals.add(string_data.original)
+                sample.append(string_data.original)
+                if len(sample) == treshold:
                     break
         else:
-            self.log.debug(
-                f"Detection threshold not reached: mod file has only {c} "
+            LangDetector.log.debug(
+                f"Detection threshold not reached: mod file has only {len(sample)} "
                 "different string(s)."
             )
 
-        detected_lang: Optional[Language] = self.detect_lang(detection_string)
+        return "\n".join(sample)
+
+    def requires_translation(
+        self, strings: Sequence[String | StringRecord], max_string_count: int = 40
+    ) -> bool:
+        """
+        Checks if a mod file requires a translation.
+
+        Args:
+            strings (Sequence[String | StringRecord]): Strings to check.
+            max_string_count (int, optional):
+                Maximum number of strings to check. Defaults to 40.
+
+        Returns:
+            bool: True if a translation is required, False otherwise.
+        """
+
+        if not len(strings):
+            return False
+
+        detected_lang: Optional[Language] = self.detect_lang(
+            LangDetector.get_detection_sample(strings, max_string_count)
+        )
         translation_required: bool = detected_lang != self.__desired_lang
         self.log.debug(f"Translation required: {translation_required}")
 
         return translation_required
 
+    def get_cached_result(self, modfile_id: str) -> Optional[bool]:
+        """
+        Gets the cached detection result of a mod file.
+
+        Args:
+            modfile_id (str): The identifier of the mod file.
+
+        Returns:
+            Optional[bool]:
+                Whether the mod file requires a translation or None if it wasn't
+                detected yet.
+        """
+
+        with self.__cache_lock:
+            return self.__cache.get(modfile_id)
+
+    def add_cached_results(self, results: Mapping[str, bool]) -> None:
+        """
+        Adds known detection results to the cache, for eg. from a previous scan.
+
+        Args:
+            results (Mapping[str, bool]):
+                Mapping of mod file identifiers to whether a translation is required.
+        """
+
+        with self.__cache_lock:
+            self.__cache.update(results)
+
+    def requires_translation_batch(self, samples: Mapping[str, str]) -> dict[str, bool]:
+        """
+        Checks which of multiple mod files require a translation. The languages of all
+        samples are detected in parallel and the results are cached by the mod file
+        identifiers so that unchanged mod files are not detected again.
+
+        Args:
+            samples (Mapping[str, str]):
+                Mapping of mod file identifiers to their detection samples, see
+                `get_detection_sample()`.
+
+        Returns:
+            dict[str, bool]:
+                Mapping of mod file identifiers to whether a translation is required.
+        """
+
+        result: dict[str, bool] = {}
+        uncached_samples: dict[str, str] = {}
+        with self.__cache_lock:
+            for modfile_id, sample in samples.items():
+                if modfile_id in self.__cache:
+                    result[modfile_id] = self.__cache[modfile_id]
+                else:
+                    uncached_samples[modfile_id] = sample
+
+        self.log.debug(
+            f"Detecting languages of {len(uncached_samples)} mod file(s) "
+            f"({len(samples) - len(uncached_samples)} cached)..."
+        )
+
+        detected_langs: list[Optional[Language]] = (
+            self.__detector.detect_languages_in_parallel_of(
+                list(uncached_samples.values())
+            )
+        )
+        detected: dict[str, bool] = {
+            modfile_id: detected_lang != self.__desired_lang
+            for modfile_id, detected_lang in zip(
+                uncached_samples, detected_langs, strict=True
+            )
+        }
+
+        with self.__cache_lock:
+            self.__cache.update(detected)
+
+        result.update(detected)
+
+        return result
+
     def detect_lang(self, string: str) -> Optional[Language]:
         """
         Attempts to detect the language of a string.
@@ -5,8 +5,9 @@ Copyright (c) Cutleast
 import logging
 from concurrent.futures import Future, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import Optional, TypeAlias
 
+from cutleast_core_lib.core.cache.cache import Cache
 from cutleast_core_lib.core.multithreading.progress import (
     ProgressUpdate,
     UpdateCallback,
@@ -21,6 +22,7 @@ from core.config.app_config import AppConfig
 from core.config.user_config import UserConfig
 from core.database.database import TranslationDatabase
 from core.database.database_service import DatabaseService
+from core.database.string_index import DatabaseStringIndex
 from core.database.translation import Translation
 from core.masterlist.masterlist import Masterlist
 from core.masterlist.masterlist_entry import MasterlistEntry
@@ -30,21 +32,31 @@ from core.mod_instance.mod import Mod
 from core.mod_instance.mod_instance import ModInstance
 from core.string.search_filter import SearchFilter, matches_filter
 from core.string.string_extractor import StringExtractor
+from core.string.string_record import StringRecordList
 from core.string.string_status import StringStatus
-from core.string.string_utils import StringUtils
 from core.string.types import StringList
 from core.translation_provider.mod_id import ModId
 from core.translation_provider.provider import TranslationProvider
 from core.translation_provider.source import Source
+from core.translation_provider.translation_discovery import TranslationDiscovery
 
 from .detector import LangDetector, Language
 
+ScanCache: TypeAlias = dict[Path, tuple[str, str, str, TranslationStatus]]
+"""
+Map of mod file paths to their file identifier, the detection stamp, the database stamp
+and the status of their last basic scan.
+"""
+
 
 class Scanner(QObject):
     """
     Class for various scanning actions on the loaded modlist.
     """
 
+    SCAN_CACHE_FILE_NAME = Path("basic_scan_results.cache")
+    """The name of the cache file for the results of the basic scans."""
+
     log: logging.Logger = logging.getLogger("Scanner")
 
     __mod_instance: ModInstance
@@ -54,6 +66,8 @@ class Scanner(QObject):
     __provider: TranslationProvider
     __masterlist: Masterlist
     __detector: LangDetector
+    __detection_stamp: str
+    __string_index: DatabaseStringIndex
 
     def __init__(
         self,
@@ -86,9 +100,17 @@ class Scanner(QObject):
             self.__app_config.detector_confidence,
             getattr(Language, self.__user_config.language.id.upper()),
         )
+        # the results of the language detection depend on the language and confidence
+        self.__detection_stamp = (
+            f"{self.__user_config.language.id}|{self.__app_config.detector_confidence}"
+        )
+        self.__string_index = DatabaseStringIndex(self.__database)
 
     def run_basic_scan(
-        self, items: dict[Mod, list[ModFile]], pdisplay: Optional[ProgressDisplay] = None
+        self,
+        items: dict[Mod, list[ModFile]],
+        pdisplay: Optional[ProgressDisplay] = None,
+        incremental: Optional[bool] = None,
     ) -> dict[Mod, dict[ModFile, TranslationStatus]]:
         """
         Scans mods for required and installed translations.
@@ -98,12 +120,18 @@ class Scanner(QObject):
             items (dict[Mod, list[ModFile]]): The items to scan.
             pdisplay (Optional[ProgressDisplay], optional):
                 Optional progress display. Defaults to None.
+            incremental (Optional[bool], optional):
+                Whether to reuse the results of previous scans for mod files that
+                haven't changed since. Defaults to the app configuration.
 
         Returns:
             dict[Mod, dict[ModFile, TranslationStatus]]:
                 A dictionary of mods, their mod files and their status.
         """
 
+        if incremental is None:
+            incremental = self.__app_config.incremental_basic_scan
+
         total_modfiles: int = sum(len(modfiles) for modfiles in items.values())
         self.log.info(
             f"Scanning {len(items)} mod(s) with {total_modfiles} mod file(s)..."
@@ -116,34 +144,128 @@ class Scanner(QObject):
                 )
             )
 
-        database_strings: StringList = StringUtils.unique(
-            string
-            for string in self.__database.strings
-            if string.status != StringStatus.TranslationRequired
-        )
-        database_originals: list[str] = unique(
-            string.original for string in database_strings
+        scan_result: dict[Mod, dict[ModFile, TranslationStatus]] = {
+            mod: {} for mod in items
+        }
+        database_stamp: str = DatabaseService.get_database_stamp(self.__database)
+        scan_cache: ScanCache = Cache.get_from_cache(
+            Scanner.SCAN_CACHE_FILE_NAME, default={}
         )
 
-        scan_result: dict[Mod, dict[ModFile, TranslationStatus]] = {}
+        changed_items: dict[Mod, list[ModFile]] = {}
+        for mod, modfiles in items.items():
+            for modfile in modfiles:
+                cached_status: Optional[TranslationStatus] = None
+                if incremental:
+                    cached_status = self.__get_cached_status(
+                        modfile, scan_cache, database_stamp
+                    )
+
+                if cached_status is not None:
+                    scan_result[mod][modfile] = cached_status
+                else:
+                    changed_items.setdefault(mod, []).append(modfile)
+
+        changed_modfiles: int = sum(len(modfiles) for modfiles in changed_items.values())
+        if incremental:
+            self.log.info(
+                f"Reusing previous results for {total_modfiles - changed_modfiles} "
+                f"unchanged mod file(s)."
+            )
+
+        if changed_items:
+            scan_cache.update(
+                self.__basic_scan(changed_items, scan_result, database_stamp, pdisplay)
+            )
+            Cache.save_to_cache(Scanner.SCAN_CACHE_FILE_NAME, scan_cache)
+
+        self.log.info("Modlist scan complete.")
+        self.log.info(f"Status summary: {self.__create_status_summary(scan_result)}")
+
+        return scan_result
+
+    def __get_cached_status(
+        self, modfile: ModFile, scan_cache: ScanCache, database_stamp: str
+    ) -> Optional[TranslationStatus]:
+        """
+        Gets the status of a mod file from a previous scan if neither the mod file, the
+        language detection settings nor the database have changed since.
+
+        Returns:
+            Optional[TranslationStatus]: The cached status or None if it is outdated.
+        """
+
+        if modfile.full_path not in scan_cache:
+            return None
+
+        modfile_id, detection_stamp, stamp, status = scan_cache[modfile.full_path]
+        try:
+            if modfile_id != modfile.get_file_identifier():
+                return None
+        except OSError:
+            # the mod file is scanned again to report the error
+            return None
+
+        if detection_stamp != self.__detection_stamp:
+            return None
+
+        # the results of the language detection don't depend on the database
+        if status in (TranslationStatus.NoStrings, TranslationStatus.IsTranslated):
+            return status
+
+        if stamp != database_stamp:
+            self.__detector.add_cached_results({modfile_id: True})
+            return None
+
+        return status
+
+    def __basic_scan(
+        self,
+        items: dict[Mod, list[ModFile]],
+        scan_result: dict[Mod, dict[ModFile, TranslationStatus]],
+        database_stamp: str,
+        pdisplay: Optional[ProgressDisplay] = None,
+    ) -> ScanCache:
+        """
+        Scans the specified mod files and adds their status to the scan result.
+
+        Returns:
+            ScanCache: The scan results of the successfully scanned mod files.
+        """
+
+        # the index is only built once and then updated incrementally
+        if not self.__string_index.is_built:
+            DatabaseService.preload_translations(
+                self.__database.user_translations,
+                thread_num=self.__app_config.worker_thread_num,
+                pdisplay=pdisplay,
+            )
+        self.__string_index.build()
+
+        # the languages of all mod files are detected at once after the strings of
+        # all mod files have been scanned
+        samples: dict[str, str] = {}
+        pending_modfiles: dict[tuple[Mod, ModFile], tuple[str, TranslationStatus]] = {}
+        scanned_modfiles: dict[ModFile, str] = {}
         failed_modfiles: int = 0
         with ProgressExecutor(
             pdisplay, max_workers=self.__app_config.worker_thread_num
         ) as executor:
             executor.set_main_progress_text(self.tr("Scanning modlist..."))
 
-            tasks: dict[Future[TranslationStatus], tuple[Mod, ModFile]] = {}
+            tasks: dict[
+                Future[tuple[str, Optional[str], TranslationStatus]],
+                tuple[Mod, ModFile],
+            ] = {}
             for mod, modfiles in items.items():
-                scan_result[mod] = {}
-
                 for modfile in modfiles:
-                    future: Future[TranslationStatus] = executor.submit(
-                        lambda ucb, m=mod, mf=modfile: self.__basic_scan_modfile(
-                            mod=m,
-                            modfile=mf,
-                            database_strings=database_strings,
-                            database_originals=database_originals,
-                            update_callback=ucb,
+                    future: Future[tuple[str, Optional[str], TranslationStatus]] = (
+                        executor.submit(
+                            lambda ucb, m=mod, mf=modfile: self.__basic_scan_modfile(
+                                mod=m,
+                                modfile=mf,
+                                update_callback=ucb,
+                            )
                         )
                     )
                     tasks[future] = (mod, modfile)
@@ -151,27 +273,66 @@ class Scanner(QObject):
             for future in as_completed(tasks):
                 mod, modfile = tasks[future]
                 try:
-                    scan_result[mod][modfile] = future.result()
+                    modfile_id, sample, status = future.result()
                 except Exception as ex:
                     failed_modfiles += 1
                     self.log.error(
                         f"Failed to scan '{mod.name}' > '{modfile.name}': {ex}",
                         exc_info=ex,
                     )
+                    continue
 
-        self.log.info("Modlist scan complete.")
-        self.log.info(f"Status summary: {self.__create_status_summary(scan_result)}")
+                scanned_modfiles[modfile] = modfile_id
+                if sample is None:
+                    scan_result[mod][modfile] = status
+                else:
+                    samples[modfile_id] = sample
+                    pending_modfiles[mod, modfile] = (modfile_id, status)
 
-        return scan_result
+        if pdisplay is not None:
+            pdisplay.updateMainProgress(
+                ProgressUpdate(
+                    status_text=self.tr("Detecting languages..."), value=0, maximum=0
+                )
+            )
+
+        requires_translation: dict[str, bool] = (
+            self.__detector.requires_translation_batch(samples)
+        )
+        for (mod, modfile), (modfile_id, status) in pending_modfiles.items():
+            if requires_translation[modfile_id]:
+                scan_result[mod][modfile] = status
+            else:
+                scan_result[mod][modfile] = TranslationStatus.IsTranslated
+
+        return {
+            modfile.full_path: (
+                modfile_id,
+                self.__detection_stamp,
+                database_stamp,
+                scan_result[mod][modfile],
+            )
+            for mod, modfiles in items.items()
+            for modfile in modfiles
+            if (modfile_id := scanned_modfiles.get(modfile)) is not None
+        }
 
     def __basic_scan_modfile(
         self,
         mod: Mod,
         modfile: ModFile,
-        database_strings: StringList,
-        database_originals: list[str],
         update_callback: Optional[UpdateCallback] = None,
-    ) -> TranslationStatus:
+    ) -> tuple[str, Optional[str], TranslationStatus]:
+        """
+        Scans the strings of a mod file.
+
+        Returns:
+            tuple[str, Optional[str], TranslationStatus]:
+                The identifier of the mod file, its sample for the language detection
+                and the status it has if it requires a translation. The sample is None
+                if the status is final (e.g. if the mod file has no strings).
+        """
+
         modfile_path_text: str = f"{mod.name} > {modfile.name}"
         self.log.debug(f"Scanning {modfile_path_text}...")
 
@@ -186,46 +347,39 @@ class Scanner(QObject):
             ),
         )
 
+        modfile_id: str = modfile.get_file_identifier()
+
         self.log.debug("Extracting strings...")
-        modfile_strings: StringList = list(
-            filter(
-                lambda s: s.status != StringStatus.NoTranslationRequired,
-                modfile.get_strings(),
-            )
-        )
+        modfile_strings: StringRecordList = [
+            record
+            for record in modfile.get_string_records()
+            if record.status != StringStatus.NoTranslationRequired
+        ]
         if not len(modfile_strings):
-            return TranslationStatus.NoStrings
+            return modfile_id, None, TranslationStatus.NoStrings
 
-        update(
-            update_callback,
-            ProgressUpdate(
-                status_text=self.tr("{item_name}: Detecting language...").format(
-                    item_name=modfile_path_text
-                ),
-            ),
+        requires_translation: Optional[bool] = self.__detector.get_cached_result(
+            modfile_id
         )
+        if requires_translation is False:
+            self.log.debug("Mod file is already translated.")
+            return modfile_id, None, TranslationStatus.IsTranslated
 
-        self.log.debug("Detecting language...")
+        # the sample is not needed if the detection result is already cached
+        sample: str = ""
+        if requires_translation is None:
+            sample = LangDetector.get_detection_sample(modfile_strings)
 
         status: TranslationStatus
-        if self.__detector.requires_translation(modfile_strings):
-            if self.__database.get_translation_by_modfile_path(modfile.path) is not None:
-                status = TranslationStatus.TranslationInstalled
-
-            elif any(
-                string.original not in database_originals
-                and string not in database_strings
-                for string in modfile_strings
-            ):
-                status = TranslationStatus.RequiresTranslation
-            else:
-                status = TranslationStatus.TranslationAvailableInDatabase
+        if self.__database.get_translation_by_modfile_path(modfile.path) is not None:
+            status = TranslationStatus.TranslationInstalled
 
+        elif not self.__string_index.covers_all(modfile_strings):
+            status = TranslationStatus.RequiresTranslation
         else:
-            status = TranslationStatus.IsTranslated
-            self.log.debug("Mod file is already translated.")
+            status = TranslationStatus.TranslationAvailableInDatabase
 
-        return status
+        return modfile_id, sample, status
 
     def run_online_scan(
         self,
@@ -287,6 +441,14 @@ class Scanner(QObject):
             f"for {len(relevant_items)} mod(s)..."
         )
 
+        # shares the translations of an original mod between all of its mod files
+        discovery = TranslationDiscovery(
+            self.__provider,
+            language=self.__user_config.language.id,
+            masterlist=self.__masterlist,
+            author_blacklist=self.__user_config.author_blacklist,
+        )
+
         with ProgressExecutor(
             pdisplay, max_workers=self.__app_config.worker_thread_num
         ) as executor:
@@ -299,7 +461,9 @@ class Scanner(QObject):
                 future: Future[dict[ModFile, TranslationStatus]] = executor.submit(
                     # this lambda is necessary as it gets an update callable as first
                     # positional argument
-                    lambda ucb, m=mod, mfs=modfiles: self.__online_scan_mod(m, mfs, ucb)
+                    lambda ucb, m=mod, mfs=modfiles: self.__online_scan_mod(
+                        m, mfs, discovery, ucb
+                    )
                 )
                 tasks[future] = mod
 
@@ -312,6 +476,7 @@ class Scanner(QObject):
                     self.log.error(f"Failed to scan for '{mod.name}': {ex}", exc_info=ex)
 
         self.log.info("Online scan complete.")
+        self.__provider.log_request_metrics()
         self.log.info(f"Status summary: {self.__create_status_summary(scan_result)}")
 
         return scan_result
@@ -320,6 +485,7 @@ class Scanner(QObject):
         self,
         mod: Mod,
         modfiles: list[ModFile],
+        discovery: TranslationDiscovery,
         update_callback: Optional[UpdateCallback] = None,
     ) -> dict[ModFile, TranslationStatus]:
         if mod.mod_id is None:
@@ -338,7 +504,9 @@ class Scanner(QObject):
 
             self.log.debug(f"Scanning for '{mod.name}' > '{modfile.name}'...")
             try:
-                result[modfile] = self.__online_scan_modfile(mod.mod_id, modfile)
+                result[modfile] = self.__online_scan_modfile(
+                    mod.mod_id, modfile, discovery
+                )
             except Exception as ex:
                 self.log.error(
                     f"Failed to scan for '{mod.name}' > '{modfile.name}': {ex}",
@@ -349,16 +517,10 @@ class Scanner(QObject):
         return result
 
     def __online_scan_modfile(
-        self, mod_id: ModId, modfile: ModFile
+        self, mod_id: ModId, modfile: ModFile, discovery: TranslationDiscovery
     ) -> TranslationStatus:
-        available_translations: dict[Source, list[ModId]] = (
-            self.__provider.get_translations(
-                mod_id=mod_id,
-                file_name=modfile.name,
-                language=self.__user_config.language.id,
-                masterlist=self.__masterlist,
-                author_blacklist=self.__user_config.author_blacklist,
-            )
+        available_translations: dict[Source, list[ModId]] = discovery.get_translations(
+            mod_id=mod_id, file_name=modfile.name
         )
 
         masterlist_entry: Optional[MasterlistEntry] = self.__masterlist.entries.get(
@@ -594,6 +756,7 @@ class Scanner(QObject):
         for new_translation in new_translations:
             # remove duplicate strings and save the translation
             new_translation.remove_duplicates()
+            DatabaseService.save_translation(new_translation, self.__database)
 
         if new_translations:
             DatabaseService.add_translations(new_translations, self.__database)
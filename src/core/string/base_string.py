@@ -5,7 +5,8 @@ Copyright (c) Cutleast
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import Annotated, Optional, TypeVar, override
+from collections.abc import Mapping
+from typing import Annotated, Any, ClassVar, Optional, Self, TypeVar, override
 
 from pydantic import BaseModel, BeforeValidator, PlainSerializer, model_validator
 
@@ -40,12 +41,21 @@ class BaseString(BaseModel, ABC):
     Status visible in Editor Tab.
     """
 
+    ID_FIELDS: ClassVar[frozenset[str]] = frozenset()
+    """
+    Names of the fields a cached `id` is generated from. Changing one of them
+    invalidates the cached id.
+    """
+
     @property
     @abstractmethod
     def id(self) -> str:
         """
         Generates an ID for the string. It is used to uniquely identify a string within
         its mod file.
+
+        Subclasses with an expensive id can implement this as `cached_property` and
+        list the fields it depends on in `ID_FIELDS`.
         """
 
     @property
@@ -81,6 +91,31 @@ class BaseString(BaseModel, ABC):
 
         return data
 
+    @override
+    def model_post_init(self, context: Any) -> None:
+        if self.ID_FIELDS:
+            # compute the cached id once at construction
+            self.id  # noqa: B018
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        super().__setattr__(name, value)
+
+        if name in self.ID_FIELDS:
+            self.__dict__.pop("id", None)
+
+    @override
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> Self:
+        copied: Self = super().model_copy(update=update, deep=deep)
+
+        # the updated fields are written directly to the copy's __dict__
+        if update is not None and not self.ID_FIELDS.isdisjoint(update):
+            copied.__dict__.pop("id", None)
+
+        return copied
+
     @override
     def __hash__(self) -> int:
         return hash((self.id, self.original, self.string, self.status))
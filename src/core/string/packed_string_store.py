@@ -0,0 +1,326 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+import os
+import struct
+import sys
+from array import array
+from collections.abc import Sequence
+from pathlib import Path
+from typing import Any, BinaryIO, Optional
+
+from pydantic import TypeAdapter
+
+from core.file_types.bestiary.string import BestiaryString
+from core.file_types.interface.string import InterfaceString
+from core.file_types.plugin.string import PluginString
+
+from .string_status import StringStatus
+from .types import String, StringList
+
+
+class PackedStringStore:
+    """
+    Class for reading and writing strings in a compact binary format.
+
+    A packed file contains all strings of a translation in a single file: a pool of
+    unique texts and columnar arrays with the fields of every string. Repeated texts
+    (like record types or untranslated originals) are stored and decoded only once and
+    loading a packed file does not require any JSON parsing.
+
+    File layout (little-endian):
+        - Header: magic, format version, number of mod files, strings,
+          pool entries and pool data size
+        - Pool offsets: `uint32[pool_size + 1]`, character offsets into the pool text
+        - Pool data: UTF-8 encoded concatenation of all texts
+        - Mod file table: `int32[modfile_count * 3]` (path pool index, first string,
+          string count)
+        - String columns: kind (`uint8`), status (`uint8`), original, string, id, type,
+          editor id (`int32` pool indices) and index (`int32`)
+    """
+
+    MAGIC: bytes = b"SATP"
+    """The magic bytes at the beginning of a packed file."""
+
+    VERSION: int = 1
+    """The version of the packed format."""
+
+    HEADER: struct.Struct = struct.Struct("<4sHHIIII")
+    """
+    Header struct (magic, version, reserved, modfile count, string count, pool size,
+    pool data size in bytes).
+    """
+
+    NONE_INDEX: int = -1
+    """Pool index used for fields that are `None`."""
+
+    NONE_NUMBER: int = -(2**31)
+    """Value used for numeric fields that are `None`."""
+
+    KIND_PLUGIN: int = 0
+    KIND_INTERFACE: int = 1
+    KIND_BESTIARY: int = 2
+
+    __PLUGIN_STRINGS = TypeAdapter(list[PluginString])
+    __INTERFACE_STRINGS = TypeAdapter(list[InterfaceString])
+    __BESTIARY_STRINGS = TypeAdapter(list[BestiaryString])
+
+    log: logging.Logger = logging.getLogger("PackedStringStore")
+
+    @classmethod
+    def dump(cls, strings: dict[Path, StringList], file_path: Path) -> None:
+        """
+        Writes strings to a packed file. The file is replaced atomically.
+
+        Args:
+            strings (dict[Path, StringList]): Map of mod file paths to their strings.
+            file_path (Path): Path to the packed file.
+        """
+
+        pool: dict[str, int] = {}
+
+        def pool_index(text: Optional[str]) -> int:
+            if text is None:
+                return cls.NONE_INDEX
+
+            index: Optional[int] = pool.get(text)
+            if index is None:
+                index = len(pool)
+                pool[text] = index
+
+            return index
+
+        modfile_table: array[int] = array("i")
+        kinds: array[int] = array("B")
+        statuses: array[int] = array("B")
+        originals: array[int] = array("i")
+        translations: array[int] = array("i")
+        ids: array[int] = array("i")
+        types: array[int] = array("i")
+        editor_ids: array[int] = array("i")
+        indices: array[int] = array("i")
+
+        for modfile_path, modfile_strings in strings.items():
+            modfile_table.extend(
+                (
+                    pool_index(modfile_path.as_posix()),
+                    len(kinds),
+                    len(modfile_strings),
+                )
+            )
+
+            for string in modfile_strings:
+                statuses.append(string.status.value)
+                originals.append(pool_index(string.original))
+                translations.append(pool_index(string.string))
+
+                if isinstance(string, PluginString):
+                    kinds.append(cls.KIND_PLUGIN)
+                    ids.append(pool_index(string.form_id))
+                    types.append(pool_index(string.type))
+                    editor_ids.append(pool_index(string.editor_id))
+                    indices.append(
+                        string.index if string.index is not None else cls.NONE_NUMBER
+                    )
+                    continue
+
+                if isinstance(string, InterfaceString):
+                    kinds.append(cls.KIND_INTERFACE)
+                    ids.append(pool_index(string.mcm_id))
+                else:
+                    kinds.append(cls.KIND_BESTIARY)
+                    ids.append(pool_index(string.bestiary_id))
+
+                types.append(cls.NONE_INDEX)
+                editor_ids.append(cls.NONE_INDEX)
+                indices.append(cls.NONE_NUMBER)
+
+        # the offsets are character offsets so that the pool can be decoded at once
+        pool_offsets: array[int] = array("I", [0])
+        length: int = 0
+        for text in pool:
+            length += len(text)
+            pool_offsets.append(length)
+        pool_data: bytes = "".join(pool).encode("utf8", errors="surrogatepass")
+
+        header: bytes = cls.HEADER.pack(
+            cls.MAGIC,
+            cls.VERSION,
+            0,
+            len(strings),
+            len(kinds),
+            len(pool),
+            len(pool_data),
+        )
+
+        tmp_path: Path = file_path.with_name(file_path.name + ".tmp")
+        with tmp_path.open("wb") as file:
+            file.write(header)
+            cls.__write_array(file, pool_offsets)
+            file.write(pool_data)
+            for column in (
+                modfile_table,
+                kinds,
+                statuses,
+                originals,
+                translations,
+                ids,
+                types,
+                editor_ids,
+                indices,
+            ):
+                cls.__write_array(file, column)
+
+        os.replace(tmp_path, file_path)
+
+    @classmethod
+    def load(cls, file_path: Path) -> dict[Path, StringList]:
+        """
+        Loads strings from a packed file.
+
+        Args:
+            file_path (Path): Path to the packed file.
+
+        Raises:
+            ValueError: When the file is not a valid packed file.
+
+        Returns:
+            dict[Path, StringList]: Map of mod file paths to their strings.
+        """
+
+        # the file is read at once as all of its strings are loaded anyway
+        data: bytes = file_path.read_bytes()
+        if len(data) < cls.HEADER.size:
+            raise ValueError(f"File '{file_path}' is too small for a packed file!")
+
+        magic, version, _, modfile_count, string_count, pool_size, pool_bytes = (
+            cls.HEADER.unpack_from(data)
+        )
+        if magic != cls.MAGIC:
+            raise ValueError(f"File '{file_path}' is not a packed file!")
+        if version != cls.VERSION:
+            raise ValueError(
+                f"Unsupported version {version} of packed file '{file_path}'!"
+            )
+
+        offset: int = cls.HEADER.size
+        pool_offsets, offset = cls.__read_array(data, offset, "I", pool_size + 1)
+        if offset + pool_bytes > len(data):
+            raise ValueError("Packed file is truncated!")
+        pool_text: str = data[offset : offset + pool_bytes].decode(
+            "utf8", errors="surrogatepass"
+        )
+        offset += pool_bytes
+
+        modfile_table, offset = cls.__read_array(data, offset, "i", modfile_count * 3)
+        kinds, offset = cls.__read_array(data, offset, "B", string_count)
+        statuses, offset = cls.__read_array(data, offset, "B", string_count)
+        originals, offset = cls.__read_array(data, offset, "i", string_count)
+        translations, offset = cls.__read_array(data, offset, "i", string_count)
+        ids, offset = cls.__read_array(data, offset, "i", string_count)
+        types, offset = cls.__read_array(data, offset, "i", string_count)
+        editor_ids, offset = cls.__read_array(data, offset, "i", string_count)
+        indices, offset = cls.__read_array(data, offset, "i", string_count)
+
+        # every text is sliced only once and then shared by all strings using it,
+        # the trailing None is addressed by NONE_INDEX (-1)
+        texts: list[Optional[str]] = [
+            pool_text[pool_offsets[i] : pool_offsets[i + 1]] for i in range(pool_size)
+        ]
+        texts.append(None)
+
+        status_by_value: dict[int, StringStatus] = {
+            status.value: status for status in StringStatus
+        }
+        column_rows = zip(
+            kinds.tolist(),
+            statuses.tolist(),
+            originals.tolist(),
+            translations.tolist(),
+            ids.tolist(),
+            types.tolist(),
+            editor_ids.tolist(),
+            indices.tolist(),
+        )
+
+        strings: dict[Path, StringList] = {}
+        for m in range(modfile_count):
+            path_index, _, count = modfile_table[m * 3 : m * 3 + 3]
+            modfile_strings: StringList = []
+
+            # consecutive strings of the same kind are validated at once which is
+            # a lot faster than calling model_construct() for every single string
+            run_kind: Optional[int] = None
+            run: list[dict[str, Any]] = []
+            for _ in range(count):
+                kind, status, original, translation, id, type, editor_id, index = next(
+                    column_rows
+                )
+                if kind != run_kind and run:
+                    modfile_strings.extend(cls.__validate(run_kind, run))
+                    run = []
+                run_kind = kind
+
+                data: dict[str, Any] = {
+                    "original": texts[original],
+                    "string": texts[translation],
+                    "status": status_by_value[status],
+                }
+                if kind == cls.KIND_PLUGIN:
+                    data["form_id"] = texts[id]
+                    data["type"] = texts[type]
+                    data["index"] = index if index != cls.NONE_NUMBER else None
+                    data["editor_id"] = texts[editor_id]
+                elif kind == cls.KIND_INTERFACE:
+                    data["mcm_id"] = texts[id]
+                else:
+                    data["bestiary_id"] = texts[id]
+                run.append(data)
+
+            if run:
+                modfile_strings.extend(cls.__validate(run_kind, run))
+
+            strings[Path(texts[path_index] or "")] = modfile_strings
+
+        cls.log.debug(
+            f"Loaded {string_count} string(s) for {modfile_count} mod file(s) from "
+            f"'{file_path}'."
+        )
+
+        return strings
+
+    @classmethod
+    def __validate(
+        cls, kind: Optional[int], data: list[dict[str, Any]]
+    ) -> Sequence[String]:
+        if kind == cls.KIND_PLUGIN:
+            return cls.__PLUGIN_STRINGS.validate_python(data)
+        elif kind == cls.KIND_INTERFACE:
+            return cls.__INTERFACE_STRINGS.validate_python(data)
+        else:
+            return cls.__BESTIARY_STRINGS.validate_python(data)
+
+    @staticmethod
+    def __write_array(file: BinaryIO, values: array[int]) -> None:
+        if sys.byteorder != "little":
+            values = array(values.typecode, values)
+            values.byteswap()
+
+        values.tofile(file)
+
+    @staticmethod
+    def __read_array(
+        data: bytes, offset: int, typecode: str, count: int
+    ) -> tuple[array[int], int]:
+        values: array[int] = array(typecode)
+        end: int = offset + values.itemsize * count
+        if end > len(data):
+            raise ValueError("Packed file is truncated!")
+
+        values.frombytes(data[offset:end])
+        if sys.byteorder != "little":
+            values.byteswap()
+
+        return values, end
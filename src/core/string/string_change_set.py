@@ -0,0 +1,27 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pydantic import BaseModel, Field
+
+
+class StringChangeSet(BaseModel):
+    """
+    Class for the changes made to a list of strings by an update. The changes are
+    identified by the ids of the affected strings.
+    """
+
+    added: list[str] = Field(default_factory=list)
+    """Ids of the strings that were added."""
+
+    changed: list[str] = Field(default_factory=list)
+    """Ids of the strings whose original text has changed."""
+
+    removed: list[str] = Field(default_factory=list)
+    """Ids of the strings that were removed."""
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.changed) + len(self.removed)
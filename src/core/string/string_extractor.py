@@ -31,6 +31,7 @@ from core.utilities.game_language import GameLanguage
 from core.utilities.temp_folder_provider import TempFolderProvider
 
 from .string_loader import StringLoader
+from .string_record import StringRecord, StringRecordList
 from .string_utils import StringUtils
 from .types import StringList
 
@@ -480,10 +481,12 @@ class StringExtractor(QObject):
             StringList: List of mapped strings
         """
 
-        translation_strings: StringList = translation_modfile.get_strings()
-        original_strings: StringList = original_modfile.get_strings()
+        translation_records: StringRecordList = translation_modfile.get_string_records()
+        original_records: StringRecordList = original_modfile.get_string_records()
 
-        if not translation_strings and not original_strings:
+        if not translation_records and not original_records:
             return []
 
-        return StringUtils.map_strings(original_strings, translation_strings)
+        return StringRecord.to_strings(
+            StringUtils.map_string_records(original_records, translation_records)
+        )
@@ -0,0 +1,135 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+from functools import cache
+from typing import Any, NamedTuple, Optional, TypeAlias
+
+from .base_string import BaseString
+from .string_status import StringStatus
+from .types import String, StringList
+
+
+class StringRecord(NamedTuple):
+    """
+    Lightweight and immutable representation of a translation string.
+
+    Records are plain tuples and therefore a lot cheaper to create, copy, pickle and
+    keep in memory than the string models. They are used to process all strings of a
+    mod file at once (for eg. when scanning or mapping translations) and are converted
+    to the string models only where the strings are displayed, edited or saved.
+    """
+
+    kind: type[String]
+    """The string model that is represented by this record."""
+
+    id: str
+    """The id of the string, see `BaseString.id`."""
+
+    original: str
+    """String from original file."""
+
+    string: Optional[str]
+    """Translated string if any."""
+
+    status: StringStatus
+    """Status of the string."""
+
+    fields: tuple[Any, ...]
+    """Values of the kind-specific fields in the order of `get_fields()`."""
+
+    @staticmethod
+    @cache
+    def get_fields(kind: type[String]) -> tuple[str, ...]:
+        """
+        Gets the names of the fields that are specific to a string model.
+
+        Args:
+            kind (type[String]): String model.
+
+        Returns:
+            tuple[str, ...]: Names of the kind-specific fields.
+        """
+
+        return tuple(
+            name for name in kind.model_fields if name not in BaseString.model_fields
+        )
+
+    @staticmethod
+    def from_string(string: String) -> StringRecord:
+        """
+        Creates a record from a string.
+
+        Args:
+            string (String): String to convert.
+
+        Returns:
+            StringRecord: Record of the string.
+        """
+
+        kind: type[String] = type(string)
+
+        return StringRecord(
+            kind=kind,
+            id=string.id,
+            original=string.original,
+            string=string.string,
+            status=string.status,
+            fields=tuple(
+                getattr(string, name) for name in StringRecord.get_fields(kind)
+            ),
+        )
+
+    @staticmethod
+    def from_strings(strings: Iterable[String]) -> StringRecordList:
+        """
+        Creates records from strings.
+
+        Args:
+            strings (Iterable[String]): Strings to convert.
+
+        Returns:
+            StringRecordList: Records of the strings.
+        """
+
+        return list(map(StringRecord.from_string, strings))
+
+    def to_string(self) -> String:
+        """
+        Creates a new string model from this record.
+
+        Returns:
+            String: The string model.
+        """
+
+        kind: type[String] = self.kind
+        data: dict[str, Any] = dict(
+            zip(StringRecord.get_fields(kind), self.fields, strict=True)
+        )
+        data["original"] = self.original
+        data["string"] = self.string
+        data["status"] = self.status
+
+        # the values of a record are taken from already validated strings
+        return kind.model_construct(**data)
+
+    @staticmethod
+    def to_strings(records: Iterable[StringRecord]) -> StringList:
+        """
+        Creates new string models from records.
+
+        Args:
+            records (Iterable[StringRecord]): Records to convert.
+
+        Returns:
+            StringList: The string models.
+        """
+
+        return [record.to_string() for record in records]
+
+
+StringRecordList: TypeAlias = list[StringRecord]
+"""Type alias for a list of string records."""
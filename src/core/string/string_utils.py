@@ -3,12 +3,14 @@ Copyright (c) Cutleast
 """
 
 import logging
-from collections.abc import Iterable
+from collections.abc import Iterable, Sequence
 from copy import copy
 from typing import Optional
 
 from cutleast_core_lib.core.utilities.unique import unique
 
+from .string_change_set import StringChangeSet
+from .string_record import StringRecord, StringRecordList
 from .string_status import StringStatus
 from .types import String, StringList, StringType
 
@@ -99,6 +101,75 @@ class StringUtils:
 
         return merged_strings
 
+    @classmethod
+    def map_string_records(
+        cls,
+        original_records: StringRecordList,
+        translation_records: StringRecordList,
+    ) -> StringRecordList:
+        """
+        Maps translated string records to the original string records. This behaves
+        exactly like `map_strings()` but is a lot faster for large mod files as the
+        records don't have to be copied.
+
+        Args:
+            original_records (StringRecordList): List of original string records.
+            translation_records (StringRecordList): List of translated string records.
+
+        Returns:
+            StringRecordList: List of mapped string records.
+        """
+
+        cls.log.debug(
+            f"Mapping {len(translation_records)} translated string record(s) to "
+            f"{len(original_records)} original string record(s)..."
+        )
+
+        translation_originals_by_id: dict[str, str] = {
+            record.id: record.original for record in translation_records
+        }
+
+        merged_records: StringRecordList = []
+        for original_record in original_records:
+            translated_original: Optional[str] = translation_originals_by_id.get(
+                original_record.id
+            )
+
+            if original_record.status == StringStatus.NoTranslationRequired:
+                merged_records.append(
+                    original_record._replace(string=original_record.original)
+                )
+
+            # Set status to translation required if no translation available
+            elif translated_original is None:
+                merged_records.append(
+                    original_record._replace(status=StringStatus.TranslationRequired)
+                )
+
+            # Check if translation differs from the original and set status accordingly
+            elif translated_original == original_record.original:
+                merged_records.append(
+                    original_record._replace(
+                        string=original_record.original,
+                        status=StringStatus.NoTranslationRequired,
+                    )
+                )
+
+            else:
+                merged_records.append(
+                    original_record._replace(
+                        string=translated_original,
+                        status=StringStatus.TranslationComplete,
+                    )
+                )
+
+        if merged_records:
+            cls.log.debug(f"Mapped {len(merged_records)} string record(s).")
+        else:
+            cls.log.error("Mapping failed!")
+
+        return merged_records
+
     @classmethod
     def match_strings(
         cls, strings_to_update: StringList, database_strings: StringList
@@ -176,43 +247,52 @@ class StringUtils:
     def update_string_list(
         cls,
         translation_strings: StringList,
-        original_strings: StringList,
+        original_strings: Sequence[String | StringRecord],
         keep_deleted: bool = False,
-    ) -> bool:
+    ) -> StringChangeSet:
         """
         Updates a list of strings based on a list of original strings. This method fills
         in missing strings and resets translations where the original text has changed.
         If `keep_deleted` is set to `False`, strings that are no longer present in the
         original list will be removed from the translation list.
 
+        The list is updated in a single pass over both lists and is rebuilt at once if
+        strings have to be removed.
+
         Args:
             translation_strings (StringList): List of translated strings.
-            original_strings (StringList): List of original strings.
+            original_strings (Sequence[String | StringRecord]):
+                List of original strings or string records.
             keep_deleted (bool):
                 Whether to keep strings that are no longer present in the original list.
                 Defaults to `False`.
 
         Returns:
-            bool:
-                `True` if any strings were updated, added or removed, `False` otherwise.
+            StringChangeSet:
+                The ids of the strings that were added, updated or removed. The change
+                set is truthy if there are any changes.
         """
 
         translation_map: dict[str, String] = {
             string.id: string for string in translation_strings
         }
+        changes = StringChangeSet()
 
-        changed: bool = False
         for original_string in original_strings:
             translated_string: Optional[String] = translation_map.get(original_string.id)
 
             if translated_string is None:
                 # string is missing -> add it and mark as "translation required"
-                new_string: String = copy(original_string)
+                new_string: String = (
+                    original_string.to_string()
+                    if isinstance(original_string, StringRecord)
+                    else copy(original_string)
+                )
                 new_string.status = StringStatus.TranslationRequired
                 new_string.string = new_string.original
                 translation_map[new_string.id] = new_string
                 translation_strings.append(new_string)
-                changed = True
+                changes.added.append(new_string.id)
 
             elif translated_string.original != original_string.original:
                 # original string has changed -> reset translation to original and mark
@@ -220,15 +300,22 @@ class StringUtils:
                 translated_string.original = original_string.original
                 translated_string.status = StringStatus.TranslationRequired
                 translated_string.string = translated_string.original
-                changed = True
+                changes.changed.append(translated_string.id)
 
         if not keep_deleted:
             # remove strings that are no longer present in the original list
             original_ids: set[str] = {string.id for string in original_strings}
 
-            for translated_string in translation_strings.copy():
-                if translated_string.id not in original_ids:
-                    translation_strings.remove(translated_string)
-                    changed = True
+            # all original ids are in the translation map at this point, so it only
+            # contains more ids if there are strings to remove
+            if len(translation_map) > len(original_ids):
+                kept_strings: StringList = []
+                for translated_string in translation_strings:
+                    if translated_string.id in original_ids:
+                        kept_strings.append(translated_string)
+                    else:
+                        changes.removed.append(translated_string.id)
+
+                translation_strings[:] = kept_strings
 
-        return changed
+        return changes
@@ -0,0 +1,186 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import mmap
+import operator
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+from collections.abc import Iterator
+from itertools import islice
+from pathlib import Path
+from typing import Optional, Self
+
+from .datatypes import String
+
+
+class BufferedStringTable:
+    """
+    Buffer-based string table that decodes its strings lazily on first access.
+
+    Unlike `StringTable`, this does not create an object for every directory entry and
+    does not read the string data byte by byte. Instead the entire table is kept in a
+    single buffer (or a memory-mapped file) and the directory is kept as two packed
+    arrays of string ids and offsets, sorted by string id. Strings are looked up with a
+    binary search and only the requested ones are decoded.
+    """
+
+    HEADER: struct.Struct = struct.Struct("<II")
+    """Header struct (number of entries, string data size)."""
+
+    DIRECTORY_ENTRY: struct.Struct = struct.Struct("<II")
+    """Directory entry struct (string id, offset)."""
+
+    num_of_entries: int
+    string_data_size: int
+    raw_data_offset: int
+
+    __data: bytes | mmap.mmap
+    __lstring: bool
+    __string_ids: array[int]
+    """Sorted and unique string ids."""
+
+    __offsets: array[int]
+    """Offsets of the string data (relative to `raw_data_offset`) by string id index."""
+
+    __decoded: dict[int, str]
+    """Cache for already decoded strings."""
+
+    def __init__(self, data: bytes | mmap.mmap, lstring: bool) -> None:
+        """
+        Args:
+            data (bytes | mmap.mmap): Raw data of the entire string table file.
+            lstring (bool): Whether the string table contains LStrings or not.
+        """
+
+        self.__data = data
+        self.__lstring = lstring
+        self.__decoded = {}
+
+        self.__parse()
+
+    @classmethod
+    def from_file(cls, file_path: Path, lstring: bool) -> Self:
+        """
+        Creates a string table from a memory-mapped string table file. Only the
+        directory and the requested strings are read from the file.
+
+        Args:
+            file_path (Path): Path to the string table file.
+            lstring (bool): Whether the string table contains LStrings or not.
+
+        Returns:
+            Self: Memory-mapped string table.
+        """
+
+        with file_path.open("rb") as file:
+            # the mapping stays valid after the file is closed
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        return cls(data, lstring)
+
+    def __parse(self) -> None:
+        self.num_of_entries, self.string_data_size = self.HEADER.unpack_from(self.__data)
+        self.raw_data_offset = len(self.__data) - self.string_data_size
+
+        directory_start: int = self.HEADER.size
+        directory_end: int = (
+            directory_start + self.num_of_entries * self.DIRECTORY_ENTRY.size
+        )
+
+        directory: array[int] = array("I")
+        directory.frombytes(self.__data[directory_start:directory_end])
+        if sys.byteorder != "little":
+            directory.byteswap()
+
+        string_ids: array[int] = directory[0::2]
+        offsets: array[int] = directory[1::2]
+
+        if not all(map(operator.lt, string_ids, islice(string_ids, 1, None))):
+            # later entries with the same id overwrite earlier ones like in
+            # `StringTable`
+            entries: dict[int, int] = dict(zip(string_ids, offsets, strict=True))
+            string_ids = array("I", sorted(entries))
+            offsets = array("I", map(entries.__getitem__, string_ids))
+
+        self.__string_ids = string_ids
+        self.__offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.__string_ids)
+
+    def __contains__(self, string_id: object) -> bool:
+        return isinstance(string_id, int) and self.__find(string_id) is not None
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self.__string_ids)
+
+    def __find(self, string_id: int) -> Optional[int]:
+        index: int = bisect_left(self.__string_ids, string_id)
+
+        if index < len(self.__string_ids) and self.__string_ids[index] == string_id:
+            return index
+
+        return None
+
+    def get_string(self, string_id: int) -> Optional[str]:
+        """
+        Gets the string with the specified id. The string is decoded on first access.
+
+        Args:
+            string_id (int): String id.
+
+        Returns:
+            Optional[str]: The string or None if there is no string with the id.
+        """
+
+        string: Optional[str] = self.__decoded.get(string_id)
+
+        if string is None:
+            index: Optional[int] = self.__find(string_id)
+            if index is None:
+                return None
+
+            string = String.decode(
+                self.__read_raw_string(self.raw_data_offset + self.__offsets[index])
+            )
+            self.__decoded[string_id] = string
+
+        return string
+
+    def __read_raw_string(self, offset: int) -> bytes:
+        data: bytes | mmap.mmap = self.__data
+
+        if self.__lstring:
+            # the length is followed by the string including its null-terminator
+            length: int = int.from_bytes(data[offset : offset + 4], "little")
+            offset += 4
+            return data[offset : offset + length].removesuffix(b"\x00")
+
+        end: int = data.find(b"\x00", offset)
+        if end == -1:
+            end = len(data)
+
+        return data[offset:end]
+
+    def extract_strings(self) -> dict[int, str]:
+        """
+        Extracts string ids and strings from the string table.
+
+        Returns:
+            dict[int, str]: Dictionary with string ids and strings
+        """
+
+        strings: dict[int, str] = {}
+        for index, string_id in enumerate(self.__string_ids):
+            # decoded directly to not fill the cache with the entire table
+            string: str = self.__decoded.get(string_id) or String.decode(
+                self.__read_raw_string(self.raw_data_offset + self.__offsets[index])
+            )
+
+            if string.strip():
+                strings[string_id] = string
+
+        return strings
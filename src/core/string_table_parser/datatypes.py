@@ -11,24 +11,29 @@ class String:
     Class for all types of chars and strings.
     """
 
+    BLOCK_SIZE: int = 256
+    """Number of bytes read at once when searching the end of a zstring."""
+
     @staticmethod
     def zstring(stream: Stream) -> str:
         """
         Null-terminated string.
         """
 
-        string = b""
+        blocks: list[bytes] = []
 
-        while (char := stream.read(1)) != b"\x00":
-            string += char
+        while block := stream.read(String.BLOCK_SIZE):
+            end: int = block.find(b"\x00")
 
-        for encoding in RawString.SUPPORTED_ENCODINGS:
-            try:
-                return string.decode(encoding)
-            except UnicodeDecodeError:
-                pass
+            if end != -1:
+                blocks.append(block[:end])
+                # move the stream to the first byte after the terminator
+                stream.seek(end + 1 - len(block), 1)
+                break
+
+            blocks.append(block)
 
-        return string.decode("utf8", errors="ignore")
+        return String.decode(b"".join(blocks))
 
     @staticmethod
     def lstring(stream: Stream) -> str:
@@ -39,10 +44,28 @@ class String:
         length: int = Integer.parse(stream, Integer.IntType.UInt32)
         string: bytes = stream.read(length).removesuffix(b"\x00")
 
+        return String.decode(string)
+
+    @staticmethod
+    def decode(data: bytes) -> str:
+        """
+        Decodes raw string data with the first matching supported encoding.
+
+        Args:
+            data (bytes): Raw string data without terminator.
+
+        Returns:
+            str: Decoded string.
+        """
+
+        # most strings are pure ASCII and therefore valid in every supported encoding
+        if data.isascii():
+            return data.decode("ascii")
+
         for encoding in RawString.SUPPORTED_ENCODINGS:
             try:
-                return string.decode(encoding)
+                return data.decode(encoding)
             except UnicodeDecodeError:
                 pass
 
-        return string.decode("utf8", errors="ignore")
+        return data.decode("utf8", errors="ignore")
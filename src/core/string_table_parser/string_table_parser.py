@@ -6,6 +6,7 @@ from pathlib import Path
 
 from sse_plugin_interface.utilities import Stream
 
+from .buffered_string_table import BufferedStringTable
 from .string_table import StringTable
 
 
@@ -51,7 +52,39 @@ class StringTableParser:
             StringTable: Parsed string table.
         """
 
-        lstring: bool = self.file_path.suffix.lower() in [".ilstrings", ".dlstrings"]
-        self.parsed_data = StringTable(stream, lstring)
+        self.parsed_data = StringTable(stream, self.is_lstring_table())
 
         return self.parsed_data
+
+    def parse_buffered(self, stream: Stream) -> BufferedStringTable:
+        """
+        Reads the entire string table from the specified stream into a buffer. The
+        strings are decoded lazily on first access.
+
+        Args:
+            stream (Stream): Stream to read.
+
+        Returns:
+            BufferedStringTable: Buffered string table.
+        """
+
+        return BufferedStringTable(stream.read(), self.is_lstring_table())
+
+    def parse_file(self) -> BufferedStringTable:
+        """
+        Memory-maps the string table file. Only the directory and the requested strings
+        are read from the file.
+
+        Returns:
+            BufferedStringTable: Memory-mapped string table.
+        """
+
+        return BufferedStringTable.from_file(self.file_path, self.is_lstring_table())
+
+    def is_lstring_table(self) -> bool:
+        """
+        Returns:
+            bool: Whether the string table file contains length-prefixed strings.
+        """
+
+        return self.file_path.suffix.lower() in [".ilstrings", ".dlstrings"]
@@ -14,6 +14,7 @@ from ..mod_details import ModDetails
 from ..mod_id import ModId
 from ..provider_api import ProviderApi
 from ..source import Source
+from ..translation_candidate import TranslationCandidate
 from .cdt_id import CdtModId
 from .models.cdt_translation import CdtTranslation
 
@@ -102,9 +103,9 @@ class CDTApi(ProviderApi):
         return self.get_mod_details(mod_id).modpage_url
 
     @override
-    def get_translations(
-        self, mod_id: ModId, file_name: str, language: str
-    ) -> list[ModId]:
+    def get_translation_candidates(
+        self, mod_id: ModId, language: str
+    ) -> list[TranslationCandidate]:
         nm_mod_id: int = (
             mod_id.mod_id if not isinstance(mod_id, CdtModId) else mod_id.nm_mod_id
         )
@@ -117,7 +118,8 @@ class CDTApi(ProviderApi):
                 nm_mod_id=nm_mod_id,
             )
 
-            return [translation_id]
+            # the contents of the translation are unknown
+            return [TranslationCandidate(mod_id=translation_id, details=mod_details)]
 
         except FileNotFoundError:
             return []
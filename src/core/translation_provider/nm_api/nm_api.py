@@ -5,8 +5,7 @@ Copyright (c) Cutleast
 import re
 import urllib.parse
 import webbrowser
-from concurrent.futures import Future, ThreadPoolExecutor, as_completed
-from pathlib import Path
+from concurrent.futures import Future, ThreadPoolExecutor
 from queue import Empty, Queue
 from typing import Any, Optional, TypeVar, override
 from uuid import uuid4
@@ -16,12 +15,10 @@ import jstyleson as json
 import requests as req
 import websocket as ws
 from curl_cffi import requests as curl_requests
-from cutleast_core_lib.core.cache.cache import Cache
 from pydantic import BaseModel, ValidationError
 
 from core.translation_provider.nm_api.nxm_id import NxmModId
 from core.utilities.filesystem import extract_file_paths
-from core.utilities.web_utils import get_url_identifier
 
 from ..exceptions import (
     ApiInvalidServerError,
@@ -32,6 +29,8 @@ from ..mod_details import ModDetails
 from ..mod_id import ModId
 from ..provider_api import ProviderApi
 from ..source import Source
+from ..translation_candidate import TranslationCandidate
+from ..web_cache import CachedResponse
 from .models.nm_file import NmFile
 from .models.nm_files import NmFiles
 from .models.nm_mod import NmMod
@@ -62,6 +61,18 @@ class NexusModsApi(ProviderApi):
     NXM_REQUEST_TIMEOUT: float = 300.0
     """Maximum time to wait for a non-premium NXM download request in seconds."""
 
+    API_URL: str = "https://api.nexusmods.com/v1/"
+    """Base URL of the Nexus Mods API."""
+
+    LOW_REQUEST_QUOTA: int = 250
+    """
+    Remaining hourly or daily API quota below which the request rate is reduced. Only
+    requests to the API itself are counted against it.
+    """
+
+    CONTENT_PREVIEW_WORKERS: int = 8
+    """Maximum number of content previews that are requested at the same time."""
+
     MODPAGE_URL_PATTERN: re.Pattern[str] = re.compile(
         r"https://www\.nexusmods\.com/([a-z]+)/mods/([0-9]+)(?:\?tab=files&file_id=([0-9]+))?"
     )
@@ -102,6 +113,18 @@ class NexusModsApi(ProviderApi):
     modpage for translations.
     """
 
+    __content_preview_executor: ThreadPoolExecutor
+    """Executor for requesting content previews, shared by all threads."""
+
+    @override
+    def __init__(self) -> None:
+        super().__init__()
+
+        self.__content_preview_executor = ThreadPoolExecutor(
+            max_workers=NexusModsApi.CONTENT_PREVIEW_WORKERS,
+            thread_name_prefix="NexusModsApiThread",
+        )
+
     def set_api_key(self, key: str) -> None:
         """
         Sets API key and checks it.
@@ -177,8 +200,17 @@ class NexusModsApi(ProviderApi):
         if rem_dreq is not None and rem_dreq.isnumeric():
             self.__rem_dreq = int(rem_dreq)
 
+        if rem_hreq is not None or rem_dreq is not None:
+            # the hourly quota is only used up when the daily quota is exhausted
+            self.request_limiter.update_quota(max(self.__rem_hreq, self.__rem_dreq))
+
         return res
 
+    @override
+    def _counts_quota(self, url: str) -> bool:
+        # the content previews and the mod pages are not part of the API
+        return url.startswith(NexusModsApi.API_URL)
+
     def __request(self, path: str, cache_result: bool = True) -> req.Response:
         """
         Sends request to `path` and returns response.
@@ -186,7 +218,7 @@ class NexusModsApi(ProviderApi):
         Caches result for avoiding redundant requests if `cache_result` is `True`.
         """
 
-        url: str = "https://api.nexusmods.com/v1/" + path
+        url: str = NexusModsApi.API_URL + path
 
         if self.__api_key is None:
             raise ValueError("API Key not set!")
@@ -242,11 +274,28 @@ class NexusModsApi(ProviderApi):
             ProviderApi.raise_mod_not_found_error(mod_id)
 
         mod: NmMod = self.__request_mod_details(mod_id)
+        file: Optional[NmFile] = self.__request_file(mod_id) if mod_id.file_id else None
 
-        mod_details: ModDetails
-        if mod_id.file_id:
-            file: NmFile = self.__request_file(mod_id)
+        return NexusModsApi.__create_mod_details(mod_id, mod, file)
+
+    @staticmethod
+    def __create_mod_details(
+        mod_id: NxmModId, mod: NmMod, file: Optional[NmFile]
+    ) -> ModDetails:
+        """
+        Creates the details for a mod or one of its files from already requested data.
 
+        Args:
+            mod_id (NxmModId): Mod identifier
+            mod (NmMod): Requested mod info
+            file (Optional[NmFile]): Requested file info, if the mod id has a file id
+
+        Returns:
+            ModDetails: Mod details
+        """
+
+        mod_details: ModDetails
+        if file is not None:
             mod_details = ModDetails(
                 display_name=file.name,
                 mod_display_name=mod.name,
@@ -323,9 +372,9 @@ class NexusModsApi(ProviderApi):
         )
 
     @override
-    def get_translations(
-        self, mod_id: ModId, file_name: str, language: str
-    ) -> list[ModId]:
+    def get_translation_candidates(
+        self, mod_id: ModId, language: str
+    ) -> list[TranslationCandidate]:
         if not isinstance(mod_id, NxmModId):
             ProviderApi.raise_mod_not_found_error(mod_id)
 
@@ -333,32 +382,23 @@ class NexusModsApi(ProviderApi):
             game_id=mod_id.nm_game_id, mod_id=mod_id.mod_id, language=language
         )
 
-        translations: list[ModId] = []
+        candidates: list[TranslationCandidate] = []
         for translation_mod_id in translation_mod_ids:
-            translation_files: list[int] = self.__scan_mod_for_filename(
-                game_id=mod_id.nm_game_id,
-                mod_id=translation_mod_id,
-                file_name=file_name,
+            candidates += self.__get_translation_candidates_of_mod(
+                game_id=mod_id.nm_game_id, mod_id=translation_mod_id
             )
 
-            translations += [
-                NxmModId(
-                    mod_id=translation_mod_id,
-                    file_id=file_id,
-                    nm_game_id=mod_id.nm_game_id,
-                )
-                for file_id in translation_files
-            ]
-
         try:
-            self.__sort_available_translations(translations, mod_id)
+            self.__sort_available_translations(candidates, mod_id)
         except Exception as ex:
             self.log.error(f"Failed to sort translations: {ex}", exc_info=ex)
 
-        return translations
+        return candidates
 
     def __sort_available_translations(
-        self, available_translations: list[ModId], original_mod_id: ModId
+        self,
+        available_translations: list[TranslationCandidate],
+        original_mod_id: ModId,
     ) -> None:
         """
         Sorts the available translations after their relevance (and potential
@@ -371,7 +411,8 @@ class NexusModsApi(ProviderApi):
         3. File upload timestamp (newer first).
 
         Args:
-            available_translations (list[ModId]): List of available translations.
+            available_translations (list[TranslationCandidate]):
+                List of available translations.
             original_mod_id (ModId): Mod identifier of the installed original mod.
         """
 
@@ -390,8 +431,8 @@ class NexusModsApi(ProviderApi):
 
         # sort translations ascending after their timestamp difference to the original
         # mod timestamp or their upload timestamp if they're older than the original mod
-        def get_sort_key(mod_id: ModId) -> tuple[bool, bool, int]:
-            translation_details: ModDetails = self.get_mod_details(mod_id)
+        def get_sort_key(candidate: TranslationCandidate) -> tuple[bool, bool, int]:
+            translation_details: ModDetails = candidate.details
 
             return self.__get_sort_key(
                 translation_timestamp=translation_details.timestamp,
@@ -482,62 +523,68 @@ class NexusModsApi(ProviderApi):
             self.log.debug(f"Request URL: {url}")
             return None
 
-    def __scan_mod_for_filename(
-        self, game_id: str, mod_id: int, file_name: str
-    ) -> list[int]:
+    def __get_translation_candidates_of_mod(
+        self, game_id: str, mod_id: int
+    ) -> list[TranslationCandidate]:
         """
-        Scans modpage for Files that contain `file_name` and returns their file ids.
+        Requests the files of a translation mod and their content previews. Files
+        without category or without content preview are skipped.
+
+        Args:
+            game_id (str): Nexus Mods game id, eg. skyrimspecialedition
+            mod_id (int): Nexus Mods mod id of the translation
+
+        Returns:
+            list[TranslationCandidate]:
+                Translation candidates for the files of the mod in reverse order of
+                its files list.
         """
 
-        self.log.debug(f"Scanning mod {mod_id} for file '{file_name}'...")
+        self.log.debug(f"Scanning contents of translation mod {mod_id}...")
 
         mod_files: NmFiles = self.__request_mod_files(game_id, mod_id)
+        mod: NmMod = self.__request_mod_details(
+            NxmModId(mod_id=mod_id, nm_game_id=game_id)
+        )
 
-        file_contents: dict[NmFile, list[str]] = {}
-        with ThreadPoolExecutor(thread_name_prefix="NexusModsApiThread") as executor:
-            futures: dict[Future[Optional[list[str]]], NmFile] = {}
-            for mod_file in mod_files.files:
-                if mod_file.category_name is None:
-                    self.log.debug(
-                        f"Skipped file without category: '{mod_file.file_name}'"
-                    )
-                    continue
+        futures: dict[NmFile, Future[Optional[list[str]]]] = {}
+        for mod_file in mod_files.files:
+            if mod_file.category_name is None:
+                self.log.debug(f"Skipped file without category: '{mod_file.file_name}'")
+                continue
 
-                futures[
-                    executor.submit(
-                        self.__get_file_contents, game_id, mod_id, mod_file.file_name
-                    )
-                ] = mod_file
-
-            for future in as_completed(futures):
-                mod_file: NmFile = futures[future]
-                result: Optional[list[str]] = future.result()
-                if result is not None:
-                    file_contents[mod_file] = result
-                else:
-                    self.log.debug(
-                        f"Failed to get file contents of '{mod_file.file_name}'!"
-                    )
+            futures[mod_file] = self.__content_preview_executor.submit(
+                self.__get_file_contents, game_id, mod_id, mod_file.file_name
+            )
 
-        matches: list[int] = []
-        for mod_file, content in file_contents.items():
-            if any(
-                file.lower().strip().endswith(file_name.lower().strip())
-                or (
-                    f"skse/plugins/dynamicstringdistributor/{file_name.lower().strip()}"
-                    in file.lower()
+        # keep the order of the files list
+        file_contents: dict[NmFile, list[str]] = {}
+        for mod_file, future in futures.items():
+            result: Optional[list[str]] = future.result()
+            if result is not None:
+                file_contents[mod_file] = result
+            else:
+                self.log.debug(f"Failed to get file contents of '{mod_file.file_name}'!")
+
+        candidates: list[TranslationCandidate] = []
+        for mod_file, content in reversed(file_contents.items()):
+            translation_id = NxmModId(
+                mod_id=mod_id, file_id=mod_file.file_id, nm_game_id=game_id
+            )
+            candidates.append(
+                TranslationCandidate(
+                    mod_id=translation_id,
+                    details=NexusModsApi.__create_mod_details(
+                        translation_id, mod, mod_file
+                    ),
+                    file_paths=tuple(file.lower() for file in content),
                 )
-                for file in content
-            ):
-                self.log.debug(f"Found '{file_name}' in file '{mod_file.file_name}'.")
-                matches.append(mod_file.file_id)
-
-        matches.reverse()
+            )
 
-        if not matches:
-            self.log.error(f"File '{file_name}' not found in mod {mod_id}!")
+        if not candidates:
+            self.log.warning(f"No file contents found in translation mod {mod_id}!")
 
-        return matches
+        return candidates
 
     def __scrape_mod_translations(
         self, game_id: str, mod_id: int, language: str
@@ -567,29 +614,23 @@ class NexusModsApi(ProviderApi):
             raise ProviderApi.raise_mod_not_found_error(NxmModId(mod_id=mod_id))
 
         url: str = f"https://www.nexusmods.com/{game_id}/mods/{mod_id}"
-        cache_file_path: Path = ProviderApi.CACHE_FOLDER / (
-            get_url_identifier(url) + ".cache"
-        )
 
-        cached: Optional[req.Response | curl_requests.Response] = Cache.get_from_cache(
-            cache_file_path, default=None
-        )
-
-        res: req.Response | curl_requests.Response
-        if cached is None:
+        def send(validation_headers: dict[str, str]) -> CachedResponse:
             if self.__scraper is None:
                 self.__scraper = curl_requests.Session(impersonate="chrome")
 
             headers: dict[str, str] = {
                 "User-Agent": self.user_agent,
-            }
+            } | validation_headers
 
-            res = self.__scraper.get(url, headers=headers)
-            self.handle_status_code(url, res.status_code)
-            Cache.save_to_cache(cache_file_path, res)
-        else:
-            res = cached
-            self.log.debug(f"Got cached Web response for '{url}'")
+            self._throttle(counts_quota=False)
+            res: curl_requests.Response = self.__scraper.get(url, headers=headers)
+
+            return CachedResponse.from_response(
+                url, res.status_code, res.headers, res.content
+            )
+
+        res: CachedResponse = self._get_cached_response(url, send)
 
         html: str = res.content.decode(errors="replace")
         parsed = bs4.BeautifulSoup(html, features="html.parser")
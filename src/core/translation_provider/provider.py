@@ -16,6 +16,7 @@ from .nm_api.nxm_id import NxmModId
 from .provider_api import ProviderApi
 from .provider_manager import ProviderManager
 from .source import Source
+from .translation_candidate import TranslationCandidate
 
 T = TypeVar("T", bound=ProviderApi)
 
@@ -93,6 +94,17 @@ class TranslationProvider:
                 source
             ).is_direct_download_possible()
 
+    def log_request_metrics(self) -> None:
+        """
+        Logs the request metrics of all available providers.
+        """
+
+        for provider in self.__provider_manager.providers:
+            self.log.info(
+                f"Request metrics of '{provider.get_source()}': "
+                f"{provider.request_metrics}"
+            )
+
     def get_remaining_requests(self) -> tuple[int, int]:
         """
         Returns remaining API requests for Nexus Mods and -1 for Confrérie.
@@ -172,13 +184,37 @@ class TranslationProvider:
             dict[Source, list[ModId]]: Map of sources and available translations
         """
 
-        available_translations: dict[Source, list[ModId]] = {}
+        return TranslationProvider.filter_translation_candidates(
+            self.get_translation_candidates(mod_id, language, author_blacklist),
+            file_name,
+            masterlist,
+        )
+
+    def get_translation_candidates(
+        self, mod_id: ModId, language: str, author_blacklist: list[str]
+    ) -> dict[Source, list[TranslationCandidate]]:
+        """
+        Gets all translation files that are available for the specified mod from all
+        available providers, independent of the mod files they contain translations
+        for.
+
+        Args:
+            mod_id (ModId): Mod identifier
+            language (str): Language to filter for
+            author_blacklist (list[str]): List of authors to ignore
+
+        Returns:
+            dict[Source, list[TranslationCandidate]]:
+                Map of sources and available translation candidates
+        """
+
+        available_candidates: dict[Source, list[TranslationCandidate]] = {}
         author_blacklist = [author.lower().strip() for author in author_blacklist]
 
         for provider in self.__provider_manager.providers:
             try:
-                translation_ids: list[ModId] = provider.get_translations(
-                    mod_id, file_name, language
+                candidates: list[TranslationCandidate] = (
+                    provider.get_translation_candidates(mod_id, language)
                 )
             except Exception as ex:
                 source: Source = provider.get_source()
@@ -187,10 +223,8 @@ class TranslationProvider:
                 )
                 continue
 
-            for translation_id in translation_ids:
-                translation_details: ModDetails = provider.get_mod_details(
-                    translation_id
-                )
+            for candidate in candidates:
+                translation_details: ModDetails = candidate.details
 
                 if (
                     translation_details.author
@@ -211,10 +245,41 @@ class TranslationProvider:
                     )
                     continue
 
-                available_translations.setdefault(provider.get_source(), []).append(
-                    translation_id
+                available_candidates.setdefault(provider.get_source(), []).append(
+                    candidate
                 )
 
+        return available_candidates
+
+    @staticmethod
+    def filter_translation_candidates(
+        candidates: dict[Source, list[TranslationCandidate]],
+        file_name: str,
+        masterlist: Masterlist,
+    ) -> dict[Source, list[ModId]]:
+        """
+        Gets the available translations for the specified file from the translation
+        candidates of its mod and the route entries of the masterlist.
+
+        Args:
+            candidates (dict[Source, list[TranslationCandidate]]):
+                Map of sources and translation candidates of the mod
+            file_name (str): Name of file that requires a translation.
+            masterlist (Masterlist): Masterlist to use
+
+        Returns:
+            dict[Source, list[ModId]]: Map of sources and available translations
+        """
+
+        available_translations: dict[Source, list[ModId]] = {}
+
+        for source, source_candidates in candidates.items():
+            for candidate in source_candidates:
+                if candidate.contains_file(file_name):
+                    available_translations.setdefault(source, []).append(
+                        candidate.mod_id
+                    )
+
         masterlist_entry: Optional[MasterlistEntry] = masterlist.entries.get(
             file_name.lower()
         )
@@ -5,16 +5,16 @@ Copyright (c) Cutleast
 import logging
 import platform
 from abc import abstractmethod
+from collections.abc import Callable
 from pathlib import Path
-from typing import NoReturn, Optional, override
+from threading import Lock
+from typing import ClassVar, NoReturn, Optional, override
 
 import requests as req
 from cutleast_core_lib.core.cache.cache import Cache
 from PySide6.QtCore import QObject
 from PySide6.QtWidgets import QApplication
 
-from core.utilities.web_utils import get_url_identifier
-
 from .exceptions import (
     ApiExpiredError,
     ApiKeyInvalidError,
@@ -26,7 +26,12 @@ from .exceptions import (
 )
 from .mod_details import ModDetails
 from .mod_id import ModId
+from .request_limiter import RequestLimiter
+from .request_metrics import RequestMetrics
+from .session_pool import SessionPool
 from .source import Source
+from .translation_candidate import TranslationCandidate
+from .web_cache import CachedResponse, WebCache
 
 
 class ProviderApi(QObject):
@@ -34,15 +39,53 @@ class ProviderApi(QObject):
     Base class for translation provider APIs.
     """
 
+    CACHE_FILE = Path("web_cache.db")
+    """The file within the cache folder to store cached web responses."""
+
     CACHE_FOLDER = Path("web_cache")
-    """The subfolder within the cache folder to store cached web requests."""
+    """
+    The subfolder within the cache folder where cached web responses were stored as
+    single files in older versions. It is removed when `CACHE_FILE` is opened.
+    """
+
+    CACHE_MAX_AGE: int = 60 * 60 * 72  # 72 hours
+    """Maximum age of cached web responses that are used without a request."""
+
+    CACHE_MAX_STALE_AGE: int = 60 * 60 * 24 * 14  # 14 days
+    """Maximum age of cached web responses that are kept for revalidation."""
+
+    CACHE_MAX_SIZE: int = 256 * 1024 * 1024  # 256 MiB
+    """Maximum total size of the cached web responses in bytes."""
 
     REQUEST_TIMEOUT: tuple[float, float] = (5.0, 30.0)
     """Connect and read timeout for provider HTTP requests in seconds."""
 
+    REQUEST_RATE: float = 10.0
+    """Maximum number of requests per second sent to the provider."""
+
+    REQUEST_BURST: int = 10
+    """Maximum number of requests that can be sent to the provider at once."""
+
+    LOW_REQUEST_QUOTA: int = 0
+    """
+    Remaining request quota below which the request rate is reduced. 0 disables the
+    reduction.
+    """
+
     __user_agent: str
     """Application user agent to use for API requests."""
 
+    __session_pool: SessionPool
+    """Pool of HTTP sessions shared by all threads using this provider."""
+
+    __request_limiter: RequestLimiter
+    """Limiter for all requests sent to this provider."""
+
+    __request_metrics: RequestMetrics
+
+    __web_cache: ClassVar[Optional[WebCache]] = None
+    __web_cache_lock: ClassVar[Lock] = Lock()
+
     log: logging.Logger
 
     @override
@@ -51,6 +94,14 @@ class ProviderApi(QObject):
 
         self.log = logging.getLogger(self.__class__.__name__)
 
+        self.__session_pool = SessionPool()
+        self.__request_limiter = RequestLimiter(
+            rate=self.REQUEST_RATE,
+            burst=self.REQUEST_BURST,
+            low_quota=self.LOW_REQUEST_QUOTA,
+        )
+        self.__request_metrics = RequestMetrics()
+
         self.__user_agent = (
             f"{QApplication.applicationName()}/"
             f"{QApplication.applicationVersion()} "
@@ -66,11 +117,65 @@ class ProviderApi(QObject):
 
         return self.__user_agent
 
-    @Cache.persistent_cache(
-        cache_subfolder=CACHE_FOLDER,
-        id_generator=lambda self, url, *_: get_url_identifier(url),
-        max_age=60 * 60 * 72,
-    )
+    @property
+    def request_limiter(self) -> RequestLimiter:
+        """
+        The limiter for all requests sent to this provider.
+        """
+
+        return self.__request_limiter
+
+    @property
+    def request_metrics(self) -> RequestMetrics:
+        """
+        The metrics of the requests to this provider.
+        """
+
+        return self.__request_metrics
+
+    @staticmethod
+    def get_web_cache() -> Optional[WebCache]:
+        """
+        Gets the store for cached web responses in the current cache folder. Cached
+        responses from older versions are removed and expired responses are evicted
+        when the store is opened for the first time.
+
+        Returns:
+            Optional[WebCache]: The web cache or None if there is no cache folder.
+        """
+
+        if not Cache.has_instance():
+            return None
+
+        cache_file_path: Path = Cache.get().path / ProviderApi.CACHE_FILE
+        with ProviderApi.__web_cache_lock:
+            if (
+                ProviderApi.__web_cache is None
+                or ProviderApi.__web_cache.path != cache_file_path
+            ):
+                cache = WebCache(
+                    cache_file_path,
+                    max_age=ProviderApi.CACHE_MAX_AGE,
+                    max_stale_age=ProviderApi.CACHE_MAX_STALE_AGE,
+                    max_size=ProviderApi.CACHE_MAX_SIZE,
+                )
+                cache.remove_legacy_folder(ProviderApi.CACHE_FOLDER)
+                cache.maintain()
+                ProviderApi.__web_cache = cache
+
+            return ProviderApi.__web_cache
+
+    @staticmethod
+    def close_web_cache() -> None:
+        """
+        Closes the store for cached web responses so that its file can be deleted
+        (e.g. when clearing the cache folder).
+        """
+
+        with ProviderApi.__web_cache_lock:
+            if ProviderApi.__web_cache is not None:
+                ProviderApi.__web_cache.close()
+
     def _cached_request(
         self,
         url: str,
@@ -78,7 +183,7 @@ class ProviderApi(QObject):
         handle_status_code: bool = True,
     ) -> req.Response:
         """
-        Like `_request` but uses a persistent cache with a maximum age of 72 hours.
+        Like `_request` but uses the web cache (see `_get_cached_response()`).
 
         Args:
             url (str): URL to request
@@ -97,7 +202,109 @@ class ProviderApi(QObject):
             req.Response: The response
         """
 
-        return self._request(url, headers, handle_status_code)
+        request_headers: dict[str, str] = (
+            headers if headers is not None else {"User-Agent": self.__user_agent}
+        )
+
+        def send(validation_headers: dict[str, str]) -> CachedResponse:
+            res: req.Response = self._request(
+                url, request_headers | validation_headers, handle_status_code=False
+            )
+
+            return CachedResponse.from_response(
+                url, res.status_code, res.headers, res.content
+            )
+
+        return self._get_cached_response(url, send, handle_status_code).to_response()
+
+    def _get_cached_response(
+        self,
+        url: str,
+        send: Callable[[dict[str, str]], CachedResponse],
+        handle_status_code: bool = True,
+    ) -> CachedResponse:
+        """
+        Gets a response from the web cache or sends a request if there is no fresh
+        response cached. Stale responses with an `ETag` or `Last-Modified` header are
+        revalidated with a conditional request and reused if the server answers with
+        `304 Not Modified`. Only responses with status code 200 are cached.
+
+        Args:
+            url (str): URL to request
+            send (Callable[[dict[str, str]], CachedResponse]):
+                Function that sends the request with the specified additional
+                validation headers and returns the received response.
+            handle_status_code (bool, optional):
+                Whether to handle the response status code and raise an Exception in case
+                of a non-200 status code. Defaults to True.
+
+        Raises:
+            RequestError:
+                when the request returned a non-200 HTTP status code
+                and the `handle_status_code` parameter is `True`
+
+        Returns:
+            CachedResponse: The response
+        """
+
+        cache: Optional[WebCache] = ProviderApi.get_web_cache()
+
+        cached: Optional[CachedResponse] = None
+        fresh: bool = False
+        if cache is not None:
+            cached, fresh = cache.get(url)
+
+        if cached is not None and fresh:
+            self.__request_metrics.add_cache_hit()
+            self.log.debug(f"Got cached web response for '{url}'.")
+            return cached
+
+        res: CachedResponse = send(
+            cached.get_validation_headers() if cached is not None else {}
+        )
+
+        if cache is not None and cached is not None and res.status_code == 304:
+            cache.refresh(url)
+            self.__request_metrics.add_cache_revalidation()
+            self.log.debug(f"Revalidated cached web response for '{url}'.")
+            return cached
+
+        if handle_status_code:
+            self.handle_status_code(url, res.status_code)
+
+        if cache is not None and res.status_code == 200:
+            cache.put(res)
+
+        return res
+
+    def _throttle(self, counts_quota: bool = True) -> None:
+        """
+        Waits until the request limiter allows another request to this provider and
+        records the request in the metrics. `_request()` calls this automatically, so it
+        only has to be called before requests that are sent otherwise.
+
+        Args:
+            counts_quota (bool, optional):
+                Whether the request is counted against the request quota of the
+                provider. Defaults to True.
+        """
+
+        wait_time: float = self.__request_limiter.acquire(counts_quota)
+        self.__request_metrics.add_request(wait_time)
+
+    def _counts_quota(self, url: str) -> bool:
+        """
+        Checks if a request to the specified URL is counted against the request quota
+        of this provider. All requests are counted by default.
+
+        Args:
+            url (str): The requested URL.
+
+        Returns:
+            bool: Whether the request is counted against the quota.
+        """
+
+        return True
 
     def _request(
         self,
@@ -108,7 +315,8 @@ class ProviderApi(QObject):
         """
         Sends an web request to a specified url and returns the response.
         Attaches the specified headers or a default one with the application's
-        user agent.
+        user agent. The request reuses a pooled connection if possible and waits for
+        the request limiter before it is sent.
 
         Args:
             url (str): URL to request
@@ -130,11 +338,14 @@ class ProviderApi(QObject):
         if headers is None:
             headers = {"User-Agent": self.__user_agent}
 
+        self._throttle(self._counts_quota(url))
+
         self.log.debug(f"Sending API request to '{url}'...")
         try:
-            res: req.Response = req.get(
-                url, headers=headers, timeout=ProviderApi.REQUEST_TIMEOUT
-            )
+            with self.__session_pool.session() as session:
+                res: req.Response = session.get(
+                    url, headers=headers, timeout=ProviderApi.REQUEST_TIMEOUT
+                )
         except req.RequestException as ex:
             raise NetworkRequestError(url) from ex
 
@@ -208,6 +419,22 @@ class ProviderApi(QObject):
         """
 
     @abstractmethod
+    def get_translation_candidates(
+        self, mod_id: ModId, language: str
+    ) -> list[TranslationCandidate]:
+        """
+        Gets all translation files that are available for the specified mod from the
+        provider's API, sorted after their relevance. The candidates can be used to
+        answer `get_translations()` for all files of the mod.
+
+        Args:
+            mod_id (ModId): Mod identifier
+            language (str): Language to filter for
+
+        Returns:
+            list[TranslationCandidate]: List of translation candidates
+        """
+
     def get_translations(
         self, mod_id: ModId, file_name: str, language: str
     ) -> list[ModId]:
@@ -223,6 +450,12 @@ class ProviderApi(QObject):
             list[ModId]: List of mod file identifiers
         """
 
+        return [
+            candidate.mod_id
+            for candidate in self.get_translation_candidates(mod_id, language)
+            if candidate.contains_file(file_name)
+        ]
+
     @abstractmethod
     def request_download(self, mod_id: ModId) -> str:
         """
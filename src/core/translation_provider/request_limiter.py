@@ -0,0 +1,136 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import time
+from threading import Lock
+from typing import Optional
+
+
+class RequestLimiter:
+    """
+    Thread-safe token bucket for limiting the rate of requests to a provider.
+
+    The bucket holds up to `burst` tokens and is refilled with `rate` tokens per second.
+    Every request takes one token and waits if there is none left. If the provider
+    reports its remaining request quota and it falls below `low_quota`, the refill rate
+    is reduced proportionally so that the remaining quota is spread over a longer time.
+    """
+
+    MIN_RATE: float = 0.2
+    """Minimum refill rate in tokens per second when the remaining quota is low."""
+
+    __rate: float
+    __burst: int
+    __low_quota: int
+
+    __current_rate: float
+    """Refill rate in tokens per second, adjusted to the remaining quota."""
+
+    __tokens: float
+    __last_refill: float
+
+    __remaining_quota: Optional[int] = None
+    """
+    Estimated remaining request quota or None if unknown. The estimate is decreased
+    with every request and replaced by the quota reported by the provider.
+    """
+
+    __lock: Lock
+
+    def __init__(self, rate: float, burst: int, low_quota: int = 0) -> None:
+        """
+        Args:
+            rate (float): Maximum number of requests per second.
+            burst (int): Maximum number of requests that can be sent at once.
+            low_quota (int, optional):
+                Remaining quota below which the rate is reduced. Defaults to 0
+                (disabled).
+        """
+
+        self.__rate = rate
+        self.__burst = burst
+        self.__low_quota = low_quota
+
+        self.__current_rate = rate
+        self.__tokens = float(burst)
+        self.__last_refill = time.perf_counter()
+        self.__lock = Lock()
+
+    @property
+    def remaining_quota(self) -> Optional[int]:
+        """
+        The estimated remaining request quota or None if unknown.
+        """
+
+        return self.__remaining_quota
+
+    @property
+    def current_rate(self) -> float:
+        """
+        The current maximum number of requests per second.
+        """
+
+        return self.__current_rate
+
+    def acquire(self, counts_quota: bool = True) -> float:
+        """
+        Takes a token from the bucket and waits until one is available if necessary.
+
+        Args:
+            counts_quota (bool, optional):
+                Whether the request is counted against the remaining quota. Defaults to
+                True.
+
+        Returns:
+            float: The time waited in seconds.
+        """
+
+        start: float = time.perf_counter()
+
+        while True:
+            with self.__lock:
+                self.__refill()
+
+                if self.__tokens >= 1:
+                    self.__tokens -= 1
+
+                    if counts_quota and self.__remaining_quota is not None:
+                        self.__remaining_quota = max(self.__remaining_quota - 1, 0)
+                        self.__update_rate()
+
+                    return time.perf_counter() - start
+
+                delay: float = (1 - self.__tokens) / self.__current_rate
+
+            time.sleep(delay)
+
+    def update_quota(self, remaining_quota: int) -> None:
+        """
+        Updates the remaining request quota as reported by the provider.
+
+        Args:
+            remaining_quota (int): The remaining request quota.
+        """
+
+        with self.__lock:
+            self.__refill()
+            self.__remaining_quota = remaining_quota
+            self.__update_rate()
+
+    def __refill(self) -> None:
+        now: float = time.perf_counter()
+        self.__tokens = min(
+            float(self.__burst),
+            self.__tokens + (now - self.__last_refill) * self.__current_rate,
+        )
+        self.__last_refill = now
+
+    def __update_rate(self) -> None:
+        if self.__remaining_quota is None or self.__remaining_quota >= self.__low_quota:
+            self.__current_rate = self.__rate
+        else:
+            self.__current_rate = max(
+                self.__rate * self.__remaining_quota / self.__low_quota,
+                RequestLimiter.MIN_RATE,
+            )
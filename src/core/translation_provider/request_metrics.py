@@ -0,0 +1,91 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from threading import Lock
+from typing import override
+
+
+class RequestMetrics:
+    """
+    Thread-safe counters for the requests of a provider.
+    """
+
+    __requests_sent: int = 0
+    __cache_hits: int = 0
+    __cache_revalidations: int = 0
+    __wait_time: float = 0.0
+    __lock: Lock
+
+    @override
+    def __init__(self) -> None:
+        self.__lock = Lock()
+
+    @property
+    def requests_sent(self) -> int:
+        """
+        The number of requests sent to the provider.
+        """
+
+        return self.__requests_sent
+
+    @property
+    def cache_hits(self) -> int:
+        """
+        The number of requests that were answered from the cache.
+        """
+
+        return self.__cache_hits
+
+    @property
+    def cache_revalidations(self) -> int:
+        """
+        The number of requests that were answered from the cache after the provider
+        confirmed that the cached response is still up to date.
+        """
+
+        return self.__cache_revalidations
+
+    @property
+    def wait_time(self) -> float:
+        """
+        The total time in seconds that requests waited for the request limiter.
+        """
+
+        return self.__wait_time
+
+    def add_request(self, wait_time: float) -> None:
+        """
+        Records a request sent to the provider.
+
+        Args:
+            wait_time (float): The time in seconds the request waited before sending.
+        """
+
+        with self.__lock:
+            self.__requests_sent += 1
+            self.__wait_time += wait_time
+
+    def add_cache_hit(self) -> None:
+        """
+        Records a request that was answered from the cache.
+        """
+
+        with self.__lock:
+            self.__cache_hits += 1
+
+    def add_cache_revalidation(self) -> None:
+        """
+        Records a request that was answered from the cache after revalidating it.
+        """
+
+        with self.__lock:
+            self.__cache_revalidations += 1
+
+    @override
+    def __str__(self) -> str:
+        return (
+            f"{self.__requests_sent} request(s) sent, {self.__cache_hits} cache "
+            f"hit(s), {self.__cache_revalidations} cache revalidation(s), "
+            f"{self.__wait_time:.2f} second(s) waited"
+        )
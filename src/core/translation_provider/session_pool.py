@@ -0,0 +1,71 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from collections.abc import Generator
+from contextlib import contextmanager
+from threading import Lock
+from typing import override
+
+import requests as req
+from requests.adapters import HTTPAdapter
+
+
+class SessionPool:
+    """
+    Thread-safe pool of HTTP sessions that keep their connections alive.
+
+    A session is only used by one thread at a time. Threads take an idle session from
+    the pool or create a new one and put it back when their request is done, so that
+    later requests can reuse its open connections.
+    """
+
+    MAX_IDLE_SESSIONS: int = 8
+    """Maximum number of idle sessions kept in the pool."""
+
+    MAX_CONNECTIONS_PER_HOST: int = 4
+    """Maximum number of connections per host kept alive by a single session."""
+
+    __idle_sessions: list[req.Session]
+    __lock: Lock
+
+    @override
+    def __init__(self) -> None:
+        self.__idle_sessions = []
+        self.__lock = Lock()
+
+    @contextmanager
+    def session(self) -> Generator[req.Session]:
+        """
+        Context manager that provides a session for exclusive use by the current
+        thread.
+
+        Yields:
+            req.Session: The session.
+        """
+
+        with self.__lock:
+            session: req.Session = (
+                self.__idle_sessions.pop()
+                if self.__idle_sessions
+                else SessionPool.__create_session()
+            )
+
+        try:
+            yield session
+
+        finally:
+            with self.__lock:
+                if len(self.__idle_sessions) < SessionPool.MAX_IDLE_SESSIONS:
+                    self.__idle_sessions.append(session)
+                else:
+                    session.close()
+
+    @staticmethod
+    def __create_session() -> req.Session:
+        session = req.Session()
+        adapter = HTTPAdapter(pool_maxsize=SessionPool.MAX_CONNECTIONS_PER_HOST)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+
+        return session
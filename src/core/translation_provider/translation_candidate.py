@@ -0,0 +1,51 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import Optional
+
+from pydantic import BaseModel
+
+from .mod_details import ModDetails
+from .mod_id import ModId
+
+
+class TranslationCandidate(BaseModel, frozen=True):
+    """
+    Model for a translation file that is available for an original mod, independent of
+    the mod files it contains translations for.
+    """
+
+    mod_id: ModId
+    """The identifier of the translation file."""
+
+    details: ModDetails
+    """The details of the translation file."""
+
+    file_paths: Optional[tuple[str, ...]] = None
+    """
+    The lowercase paths of the files in the translation file or None if its contents
+    are unknown. Translation files with unknown contents match every mod file.
+    """
+
+    def contains_file(self, file_name: str) -> bool:
+        """
+        Checks if this translation file contains a translation for a mod file.
+
+        Args:
+            file_name (str): The name of the mod file.
+
+        Returns:
+            bool: Whether the translation file contains a translation for the mod file.
+        """
+
+        if self.file_paths is None:
+            return True
+
+        file_name = file_name.lower().strip()
+        dsd_path: str = f"skse/plugins/dynamicstringdistributor/{file_name}"
+
+        return any(
+            file_path.strip().endswith(file_name) or dsd_path in file_path
+            for file_path in self.file_paths
+        )
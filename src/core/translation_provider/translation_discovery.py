@@ -0,0 +1,137 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+from threading import Lock
+from typing import Optional
+
+from core.masterlist.masterlist import Masterlist
+from core.utilities.single_flight import SingleFlight
+
+from .mod_details import ModDetails
+from .mod_id import ModId
+from .provider import TranslationProvider
+from .source import Source
+from .translation_candidate import TranslationCandidate
+
+
+class TranslationDiscovery:
+    """
+    Class for discovering available translations for many mod files at once, for eg.
+    during an online scan.
+
+    The translation candidates of an original mod are requested only once and are then
+    used to answer the requests for all of its mod files. Concurrent requests for the
+    same original mod from multiple threads wait for the first one instead of
+    requesting the candidates again. A discovery keeps its results for its whole
+    lifetime and should therefore only be used for one operation.
+    """
+
+    __provider: TranslationProvider
+    __language: str
+    __masterlist: Masterlist
+    __author_blacklist: list[str]
+
+    __candidates: SingleFlight[ModId, dict[Source, list[TranslationCandidate]]]
+    """Translation candidates of the already requested original mods."""
+
+    __details: dict[tuple[ModId, Source], ModDetails]
+    """Details of the translation candidates of the already requested original mods."""
+
+    __details_lock: Lock
+
+    log: logging.Logger = logging.getLogger("TranslationDiscovery")
+
+    def __init__(
+        self,
+        provider: TranslationProvider,
+        language: str,
+        masterlist: Masterlist,
+        author_blacklist: list[str],
+    ) -> None:
+        """
+        Args:
+            provider (TranslationProvider): Translation provider to use.
+            language (str): Language to filter for.
+            masterlist (Masterlist): Masterlist to use.
+            author_blacklist (list[str]): List of authors to ignore.
+        """
+
+        self.__provider = provider
+        self.__language = language
+        self.__masterlist = masterlist
+        self.__author_blacklist = author_blacklist
+
+        self.__candidates = SingleFlight()
+        self.__details = {}
+        self.__details_lock = Lock()
+
+    def get_translations(
+        self, mod_id: ModId, file_name: str
+    ) -> dict[Source, list[ModId]]:
+        """
+        Gets available translations for the specified file from all available providers.
+
+        Args:
+            mod_id (ModId): Mod identifier of the original mod.
+            file_name (str): Name of file that requires a translation.
+
+        Returns:
+            dict[Source, list[ModId]]: Map of sources and available translations
+        """
+
+        candidates: dict[Source, list[TranslationCandidate]] = self.__candidates.get(
+            mod_id, lambda: self.__request_candidates(mod_id)
+        )
+
+        return TranslationProvider.filter_translation_candidates(
+            candidates, file_name, self.__masterlist
+        )
+
+    def get_details(self, mod_id: ModId, source: Source) -> ModDetails:
+        """
+        Gets the details for a translation. Translations that were discovered by this
+        discovery are answered without requesting their details again.
+
+        Args:
+            mod_id (ModId): Mod identifier of the translation.
+            source (Source): Source of the translation.
+
+        Raises:
+            ModNotFoundError: when the requested mod could not be found
+
+        Returns:
+            ModDetails: Mod details
+        """
+
+        with self.__details_lock:
+            details: Optional[ModDetails] = self.__details.get((mod_id, source))
+
+        if details is None:
+            details = self.__provider.get_details(mod_id, source)
+
+        return details
+
+    def __request_candidates(
+        self, mod_id: ModId
+    ) -> dict[Source, list[TranslationCandidate]]:
+        self.log.debug(f"Requesting translation candidates for mod {mod_id}...")
+
+        candidates: dict[Source, list[TranslationCandidate]] = (
+            self.__provider.get_translation_candidates(
+                mod_id, self.__language, self.__author_blacklist
+            )
+        )
+
+        with self.__details_lock:
+            for source, source_candidates in candidates.items():
+                for candidate in source_candidates:
+                    self.__details[(candidate.mod_id, source)] = candidate.details
+
+        self.log.debug(
+            f"Found {sum(len(c) for c in candidates.values())} translation "
+            f"candidate(s) for mod {mod_id}."
+        )
+
+        return candidates
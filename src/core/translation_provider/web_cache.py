@@ -0,0 +1,403 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import json
+import logging
+import shutil
+import sqlite3
+import time
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import ClassVar, Optional, Self
+
+import requests as req
+from cutleast_core_lib.core.cache.cache import Cache
+from pydantic import BaseModel
+from requests.structures import CaseInsensitiveDict
+
+
+class CachedResponse(BaseModel, frozen=True):
+    """
+    Model for a web response stored in the `WebCache`.
+    """
+
+    KEPT_HEADERS: ClassVar[tuple[str, ...]] = ("Content-Type", "ETag", "Last-Modified")
+    """Headers of a response that are stored in the cache."""
+
+    url: str
+    """The requested URL."""
+
+    status_code: int
+    """The HTTP status code of the response."""
+
+    headers: dict[str, str]
+    """The stored headers of the response (see `KEPT_HEADERS`)."""
+
+    content: bytes
+    """The body of the response."""
+
+    timestamp: int
+    """The time the response was received or last revalidated."""
+
+    @classmethod
+    def from_response(
+        cls, url: str, status_code: int, headers: Mapping[str, str], content: bytes
+    ) -> Self:
+        """
+        Creates a cached response from the parts of a received response.
+
+        Args:
+            url (str): The requested URL.
+            status_code (int): The HTTP status code of the response.
+            headers (Mapping[str, str]): The headers of the response.
+            content (bytes): The body of the response.
+
+        Returns:
+            CachedResponse: The cached response.
+        """
+
+        kept_headers: dict[str, str] = {}
+        for header in CachedResponse.KEPT_HEADERS:
+            value: Optional[str] = headers.get(header)
+            if value is not None:
+                kept_headers[header] = value
+
+        return cls(
+            url=url,
+            status_code=status_code,
+            headers=kept_headers,
+            content=content,
+            timestamp=int(time.time()),
+        )
+
+    def get_validation_headers(self) -> dict[str, str]:
+        """
+        Gets the headers for revalidating this response with a conditional request.
+
+        Returns:
+            dict[str, str]:
+                The `If-None-Match` and `If-Modified-Since` headers, if available.
+        """
+
+        validation_headers: dict[str, str] = {}
+
+        etag: Optional[str] = self.headers.get("ETag")
+        if etag is not None:
+            validation_headers["If-None-Match"] = etag
+
+        last_modified: Optional[str] = self.headers.get("Last-Modified")
+        if last_modified is not None:
+            validation_headers["If-Modified-Since"] = last_modified
+
+        return validation_headers
+
+    def to_response(self) -> req.Response:
+        """
+        Converts this cached response to a `requests` response.
+
+        Returns:
+            req.Response: The response.
+        """
+
+        response = req.Response()
+        response.url = self.url
+        response.status_code = self.status_code
+        response.headers = CaseInsensitiveDict(self.headers)
+        response._content = self.content  # pyright: ignore[reportPrivateUsage]
+
+        return response
+
+
+class WebCache:
+    """
+    Single-file store for cached web responses, backed by an SQLite database.
+
+    The responses are indexed by their URL. Responses older than the maximum age are
+    not returned as cache hits but are kept for conditional revalidation if they have
+    an `ETag` or `Last-Modified` header, until they reach the maximum stale age. The
+    oldest responses are evicted when the total size of the stored bodies exceeds the
+    size cap. All threads share a single connection that is guarded by a lock. The
+    connection is reopened if the database file was deleted (e.g. by clearing the cache
+    folder) and can be closed with `close()` to release the file.
+    """
+
+    COMPACT_THRESHOLD: int = 1000
+    """Minimum number of evicted entries after which the database file is compacted."""
+
+    SIZE_CHECK_INTERVAL: int = 200
+    """Number of stored responses after which the size cap is enforced again."""
+
+    __path: Path
+    __max_age: int
+    __max_stale_age: int
+    __max_size: int
+
+    __puts_since_size_check: int = 0
+
+    __connection: Optional[sqlite3.Connection] = None
+    __lock: Lock
+
+    log: logging.Logger = logging.getLogger("WebCache")
+
+    def __init__(
+        self, path: Path, max_age: int, max_stale_age: int, max_size: int
+    ) -> None:
+        """
+        Args:
+            path (Path): Path to the database file.
+            max_age (int): Maximum age of cache hits in seconds.
+            max_stale_age (int):
+                Maximum age in seconds of responses that are kept for revalidation.
+            max_size (int): Maximum total size of the stored bodies in bytes.
+        """
+
+        self.__path = path
+        self.__max_age = max_age
+        self.__max_stale_age = max_stale_age
+        self.__max_size = max_size
+        self.__lock = Lock()
+
+    @property
+    def path(self) -> Path:
+        """
+        Path to the database file.
+        """
+
+        return self.__path
+
+    def get(self, url: str) -> tuple[Optional[CachedResponse], bool]:
+        """
+        Gets a cached response.
+
+        Args:
+            url (str): The requested URL.
+
+        Returns:
+            tuple[Optional[CachedResponse], bool]:
+                The cached response, if any, and whether it is fresh. Stale responses
+                are only returned if they can be revalidated.
+        """
+
+        with self.__connect() as connection:
+            row: Optional[tuple[int, str, bytes, int]] = connection.execute(
+                "SELECT status_code, headers, content, timestamp FROM responses "
+                "WHERE url = ?",
+                (url,),
+            ).fetchone()
+
+        response: Optional[CachedResponse] = None
+        if row is not None:
+            status_code, headers, content, timestamp = row
+            response = CachedResponse(
+                url=url,
+                status_code=status_code,
+                headers=json.loads(headers),
+                content=content,
+                timestamp=timestamp,
+            )
+
+        fresh: bool = (
+            response is not None
+            and response.timestamp >= int(time.time()) - self.__max_age
+        )
+        if response is not None and not fresh and not response.get_validation_headers():
+            response = None
+
+        return response, fresh
+
+    def put(self, response: CachedResponse) -> None:
+        """
+        Adds or replaces a cached response.
+
+        Args:
+            response (CachedResponse): The response to store.
+        """
+
+        with self.__connect() as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(url, status_code, headers, content, size, timestamp, validatable) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    response.url,
+                    response.status_code,
+                    json.dumps(response.headers),
+                    response.content,
+                    len(response.content),
+                    response.timestamp,
+                    bool(response.get_validation_headers()),
+                ),
+            )
+
+            self.__puts_since_size_check += 1
+            check_size: bool = (
+                self.__puts_since_size_check >= WebCache.SIZE_CHECK_INTERVAL
+            )
+            if check_size:
+                self.__puts_since_size_check = 0
+
+        if check_size:
+            self.enforce_size()
+
+    def refresh(self, url: str) -> None:
+        """
+        Marks a cached response as fresh after the server confirmed that it is still
+        up to date.
+
+        Args:
+            url (str): The requested URL.
+        """
+
+        with self.__connect() as connection:
+            connection.execute(
+                "UPDATE responses SET timestamp = ? WHERE url = ?",
+                (int(time.time()), url),
+            )
+
+    def evict_expired(self) -> int:
+        """
+        Removes all responses that are older than the maximum age and cannot be
+        revalidated and all responses that are older than the maximum stale age.
+
+        Returns:
+            int: The number of removed responses.
+        """
+
+        now: int = int(time.time())
+        with self.__connect() as connection:
+            evicted: int = connection.execute(
+                "DELETE FROM responses WHERE timestamp < ? "
+                "OR (timestamp < ? AND NOT validatable)",
+                (now - self.__max_stale_age, now - self.__max_age),
+            ).rowcount
+
+        if evicted:
+            self.log.debug(f"Evicted {evicted} expired response(s).")
+
+        return evicted
+
+    def enforce_size(self) -> int:
+        """
+        Removes the oldest responses until the total size of the stored bodies is
+        within the size cap.
+
+        Returns:
+            int: The number of removed responses.
+        """
+
+        with self.__connect() as connection:
+            total_size: int = connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()[0]
+            if total_size <= self.__max_size:
+                return 0
+
+            # find the newest timestamp that has to be evicted to get below the cap
+            excess: int = total_size - self.__max_size
+            rows: Iterator[tuple[int, int]] = connection.execute(
+                "SELECT timestamp, size FROM responses ORDER BY timestamp"
+            )
+            threshold: int = 0
+            for timestamp, size in rows:
+                excess -= size
+                threshold = timestamp
+                if excess <= 0:
+                    break
+
+            evicted: int = connection.execute(
+                "DELETE FROM responses WHERE timestamp <= ?", (threshold,)
+            ).rowcount
+
+        self.log.debug(
+            f"Evicted {evicted} response(s) to stay below the size cap of "
+            f"{self.__max_size} byte(s)."
+        )
+
+        return evicted
+
+    def compact(self) -> None:
+        """
+        Shrinks the database file.
+        """
+
+        with self.__lock:
+            self.__get_connection().execute("VACUUM")
+
+        self.log.debug("Compacted web cache.")
+
+    def maintain(self) -> None:
+        """
+        Removes all expired responses, enforces the size cap and compacts the database
+        file if many responses were removed.
+        """
+
+        if self.evict_expired() + self.enforce_size() >= WebCache.COMPACT_THRESHOLD:
+            self.compact()
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database file. It is reopened by the next
+        operation.
+        """
+
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    def remove_legacy_folder(self, cache_subfolder: Path) -> None:
+        """
+        Deletes the responses that were cached as single files by
+        `Cache.persistent_cache()` in older versions. They cannot be migrated since the
+        files are only identified by a hash of their URL.
+
+        Args:
+            cache_subfolder (Path): The subfolder within the cache folder.
+        """
+
+        folder_path: Path = Cache.get().path / cache_subfolder
+        if folder_path.is_dir():
+            shutil.rmtree(folder_path, ignore_errors=True)
+            self.log.info(f"Removed legacy web cache folder '{folder_path}'.")
+
+    def __get_connection(self) -> sqlite3.Connection:
+        """
+        Gets the shared connection and opens it if necessary. Must be called with the
+        lock held.
+        """
+
+        if self.__connection is not None and self.__path.is_file():
+            return self.__connection
+
+        if self.__connection is not None:
+            self.log.debug("Database file was deleted. Reopening...")
+            self.__connection.close()
+
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.__path, timeout=30, check_same_thread=False)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(url TEXT PRIMARY KEY, status_code INTEGER NOT NULL, "
+            "headers TEXT NOT NULL, content BLOB NOT NULL, size INTEGER NOT NULL, "
+            "timestamp INTEGER NOT NULL, validatable INTEGER NOT NULL)"
+        )
+        connection.execute(
+            "CREATE INDEX IF NOT EXISTS responses_timestamp ON responses (timestamp)"
+        )
+        self.__connection = connection
+
+        return connection
+
+    @contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Locks the shared connection and commits all changes on success.
+        """
+
+        with self.__lock:
+            connection: sqlite3.Connection = self.__get_connection()
+            with connection:
+                yield connection
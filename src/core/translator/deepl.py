@@ -2,7 +2,7 @@
 Copyright (c) Cutleast
 """
 
-from typing import final, override
+from typing import ClassVar, final, override
 
 import deepl
 from cutleast_core_lib.core.utilities.typing_utils import checked_cast
@@ -24,6 +24,21 @@ class DeepLTranslator(Translator):
         GameLanguage.Chinese: deepl.Language.CHINESE,
     }
 
+    BATCH_MAX_CHARS: ClassVar[int] = 30000
+    """
+    DeepL limits the total request size to 128 KiB, this leaves enough room for
+    multi-byte characters and the request overhead.
+    """
+
+    BATCH_MAX_TEXTS: ClassVar[int] = 50
+    """DeepL accepts up to 50 texts per request."""
+
+    RETRY_EXCEPTIONS: ClassVar[tuple[type[Exception], ...]] = (
+        deepl.TooManyRequestsException,
+        deepl.ConnectionException,
+    )
+    """Only rate limits and connection errors are retried."""
+
     __translator: deepl.Translator
 
     @override
@@ -47,6 +62,20 @@ class DeepLTranslator(Translator):
             ),
         ).text
 
+    @override
+    def translate_batch_uncached(self, texts: list[str], dst: GameLanguage) -> list[str]:
+        src_code: str = deepl.Language.ENGLISH
+        dst_code: str = self.get_lang_code(dst)
+
+        results: list[deepl.TextResult] = checked_cast(
+            list,
+            self.__translator.translate_text(
+                texts, source_lang=src_code, target_lang=dst_code
+            ),
+        )
+
+        return [result.text for result in results]
+
     @staticmethod
     def get_lang_code(language: GameLanguage) -> str:
         """
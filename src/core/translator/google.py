@@ -3,12 +3,12 @@ Copyright (c) Cutleast
 """
 
 import asyncio
-from typing import ClassVar, Optional, final, override
+from typing import ClassVar, final, override
 
 import googletrans
 import googletrans.models
+import httpx
 from cutleast_core_lib.core.utilities.typing_utils import checked_cast
-from cutleast_core_lib.core.utilities.unique import unique
 
 from core.utilities.game_language import GameLanguage
 
@@ -26,6 +26,12 @@ class GoogleTranslator(Translator):
         GameLanguage.Portuguese: "pt",
     }
 
+    RETRY_EXCEPTIONS: ClassVar[tuple[type[Exception], ...]] = (
+        *Translator.RETRY_EXCEPTIONS,
+        httpx.TransportError,
+    )
+    """The requests are sent with httpx that raises its own network errors."""
+
     @override
     def translate_uncached(self, text: str, dst: GameLanguage) -> str:
         """
@@ -52,42 +58,25 @@ class GoogleTranslator(Translator):
         return asyncio.run(_run())
 
     @override
-    def mass_translate(self, texts: list[str], dst: GameLanguage) -> dict[str, str]:
+    def translate_batch_uncached(self, texts: list[str], dst: GameLanguage) -> list[str]:
         """
-        Translates multiple texts in a single API call where possible.
+        Translates multiple texts in a single API call.
 
         Args:
             texts (list[str]): The texts to translate.
             dst (GameLanguage): The destination language.
 
         Returns:
-            dict[str, str]: Mapping of original text to its translation.
+            list[str]: The translated texts in the order of the specified texts.
         """
 
-        result: dict[str, str] = {}
         dst_code: str = self.get_lang_code(dst)
 
-        to_translate: list[str] = []
-        for text in unique(texts):
-            cached: Optional[str] = self._get_from_cache(text, dst)
-            if cached is not None:
-                result[text] = cached
-            else:
-                to_translate.append(text)
-
-        if not to_translate:
-            return result
-
         async def _run() -> list[googletrans.models.Translated]:
             async with googletrans.Translator() as translator:
-                return await translator.translate(to_translate, dest=dst_code, src="en")
-
-        translated_items: list[googletrans.models.Translated] = asyncio.run(_run())
-        for item in translated_items:
-            self._add_to_cache(item.origin, item.text, dst)
-            result[item.origin] = item.text
+                return await translator.translate(texts, dest=dst_code, src="en")
 
-        return result
+        return [item.text for item in asyncio.run(_run())]
 
     @staticmethod
     def get_lang_code(language: GameLanguage) -> str:
@@ -5,16 +5,22 @@ Copyright (c) Cutleast
 from __future__ import annotations
 
 import logging
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, cast, final
+from threading import Lock
+from typing import ClassVar, Optional, final
 
 from cutleast_core_lib.core.cache.cache import Cache
 from cutleast_core_lib.core.utilities.hash import sha256_hash
+from cutleast_core_lib.core.utilities.unique import unique
 
 from core.config.translator_config import TranslatorConfig
 from core.utilities.game_language import GameLanguage
 
+from .translator_cache import TranslatorCache
+
 
 class Translator(ABC):
     """
@@ -23,12 +29,49 @@ class Translator(ABC):
     **Note to implementers**: The instances should be stateless.
     """
 
+    CACHE_FILE = Path("translator_cache.db")
+    """The file within the cache folder to store cached API translations."""
+
     CACHE_FOLDER = Path("translator_cache")
-    """The subfolder within the cache folder to store cached API translations."""
+    """
+    The subfolder within the cache folder where cached API translations were stored
+    as single files in older versions. They are migrated to `CACHE_FILE`.
+    """
 
     CACHE_MAX_AGE: int = 60 * 60 * 72  # 72 hours
     """Maximum age of cached translations in seconds."""
 
+    BATCH_MAX_CHARS: ClassVar[int] = 5000
+    """
+    Maximum number of characters per batch request. Texts that are longer on their own
+    are sent in a batch of their own.
+    """
+
+    BATCH_MAX_TEXTS: ClassVar[int] = 50
+    """Maximum number of texts per batch request."""
+
+    MAX_CONCURRENT_REQUESTS: ClassVar[int] = 4
+    """Maximum number of batch requests that are sent at the same time."""
+
+    MAX_RETRIES: ClassVar[int] = 3
+    """Maximum number of retries for a failed batch request."""
+
+    RETRY_BACKOFF: ClassVar[float] = 1.0
+    """Delay in seconds before the first retry. Doubles with every further retry."""
+
+    RETRY_EXCEPTIONS: ClassVar[tuple[type[Exception], ...]] = (
+        ConnectionError,
+        TimeoutError,
+    )
+    """
+    Exceptions on which a failed batch request is retried. Only network errors and
+    timeouts are retried by default, translators that raise other exceptions for them
+    have to add those.
+    """
+
+    __cache: ClassVar[Optional[TranslatorCache]] = None
+    __cache_lock: ClassVar[Lock] = Lock()
+
     _config: TranslatorConfig
     """The app-wide translator configuration."""
 
@@ -45,13 +88,6 @@ class Translator(ABC):
         self.log = logging.getLogger(self.__class__.__name__)
 
     @final
-    @Cache.persistent_cache(
-        cache_subfolder=CACHE_FOLDER,
-        id_generator=lambda self, text, dst: cast(Translator, self).get_cache_id(
-            text, dst
-        ),
-        max_age=CACHE_MAX_AGE,
-    )
     def translate(self, text: str, dst: GameLanguage) -> str:
         """
         Translates a single text from a source language to a destination language.
@@ -64,7 +100,48 @@ class Translator(ABC):
             str: The translated text.
         """
 
-        return self.translate_uncached(text, dst)
+        translation: Optional[str] = self._get_from_cache(text, dst)
+        if translation is None:
+            translation = self.translate_uncached(text, dst)
+            self._add_to_cache(text, translation, dst)
+
+        return translation
+
+    @staticmethod
+    def get_cache() -> Optional[TranslatorCache]:
+        """
+        Gets the store for cached API translations in the current cache folder. Cached
+        translations from older versions are migrated and expired translations are
+        evicted when the store is opened for the first time.
+
+        Returns:
+            Optional[TranslatorCache]:
+                The translator cache or None if there is no cache folder.
+        """
+
+        if not Cache.has_instance():
+            return None
+
+        cache_file_path: Path = Cache.get().path / Translator.CACHE_FILE
+        with Translator.__cache_lock:
+            if Translator.__cache is None or Translator.__cache.path != cache_file_path:
+                cache = TranslatorCache(cache_file_path, Translator.CACHE_MAX_AGE)
+                cache.migrate_folder(Translator.CACHE_FOLDER)
+                cache.maintain()
+                Translator.__cache = cache
+
+            return Translator.__cache
+
+    @staticmethod
+    def close_cache() -> None:
+        """
+        Closes the store for cached API translations so that its file can be deleted
+        (e.g. when clearing the cache folder).
+        """
+
+        with Translator.__cache_lock:
+            if Translator.__cache is not None:
+                Translator.__cache.close()
 
     def _get_from_cache(self, text: str, dst: GameLanguage) -> Optional[str]:
         """
@@ -75,15 +152,10 @@ class Translator(ABC):
             dst (GameLanguage): The destination language.
 
         Returns:
-            str: The translated text.
+            Optional[str]: The translated text or None if it isn't cached.
         """
 
-        cache_file_path: Path = Translator.CACHE_FOLDER / (
-            Translator.get_cache_id(self, text, dst) + ".cache"
-        )
-        return Cache.get_from_cache(
-            cache_file_path, max_age=Translator.CACHE_MAX_AGE, default=None
-        )
+        return self._get_many_from_cache([text], dst).get(text)
 
     def _add_to_cache(self, text: str, translation: str, dst: GameLanguage) -> None:
         """
@@ -95,10 +167,54 @@ class Translator(ABC):
             dst (GameLanguage): The destination language.
         """
 
-        cache_file_path: Path = Translator.CACHE_FOLDER / (
-            Translator.get_cache_id(self, text, dst) + ".cache"
-        )
-        Cache.save_to_cache(cache_file_path, translation)
+        self._add_many_to_cache({text: translation}, dst)
+
+    def _get_many_from_cache(
+        self, texts: list[str], dst: GameLanguage
+    ) -> dict[str, str]:
+        """
+        Gets the cached translation results for multiple texts.
+
+        Args:
+            texts (list[str]): The texts to translate.
+            dst (GameLanguage): The destination language.
+
+        Returns:
+            dict[str, str]:
+                Mapping of original text to its cached translation. Texts without a
+                cached translation are not included.
+        """
+
+        cache: Optional[TranslatorCache] = Translator.get_cache()
+        if cache is None:
+            return {}
+
+        texts_by_id: dict[str, str] = {
+            self.get_cache_id(text, dst): text for text in texts
+        }
+        cached: dict[str, str] = cache.get_many(texts_by_id)
+
+        return {texts_by_id[cache_id]: value for cache_id, value in cached.items()}
+
+    def _add_many_to_cache(
+        self, translations: dict[str, str], dst: GameLanguage
+    ) -> None:
+        """
+        Adds multiple translation results to the cache.
+
+        Args:
+            translations (dict[str, str]): Mapping of original text to its translation.
+            dst (GameLanguage): The destination language.
+        """
+
+        cache: Optional[TranslatorCache] = Translator.get_cache()
+        if cache is not None:
+            cache.put_many(
+                {
+                    self.get_cache_id(text, dst): translation
+                    for text, translation in translations.items()
+                }
+            )
 
     @abstractmethod
     def translate_uncached(self, text: str, dst: GameLanguage) -> str:
@@ -113,19 +229,152 @@ class Translator(ABC):
             str: The translated text.
         """
 
+    def translate_batch_uncached(self, texts: list[str], dst: GameLanguage) -> list[str]:
+        """
+        Translates a batch of texts from a source language to a destination language.
+        Translators that support sending multiple texts in a single request should
+        override this method. By default, the texts are translated one by one.
+
+        Args:
+            texts (list[str]): The texts to translate.
+            dst (GameLanguage): The destination language.
+
+        Returns:
+            list[str]: The translated texts in the order of the specified texts.
+        """
+
+        return [self.translate_uncached(text, dst) for text in texts]
+
+    @final
     def mass_translate(self, texts: list[str], dst: GameLanguage) -> dict[str, str]:
         """
         Translates multiple texts from a source language to a destination language.
 
+        Duplicate texts are only translated once and cached translations are reused.
+        The remaining texts are split into batches limited by `BATCH_MAX_CHARS` and
+        `BATCH_MAX_TEXTS` which are sent concurrently and retried on failure.
+
         Args:
             texts (list[str]): The texts to translate.
             dst (GameLanguage): The destination language.
 
+        Raises:
+            Exception:
+                when a batch request still fails after `MAX_RETRIES` retries. The
+                translations of the successful batches are cached anyway.
+
         Returns:
             dict[str, str]: Mapping of original text to its translation.
         """
 
-        return {text: self.translate(text, dst) for text in texts}
+        unique_texts: list[str] = unique(texts)
+        result: dict[str, str] = self._get_many_from_cache(unique_texts, dst)
+        to_translate: list[str] = [text for text in unique_texts if text not in result]
+
+        self.log.debug(
+            f"Translating {len(to_translate)} text(s) ({len(texts)} requested, "
+            f"{len(result)} cached)..."
+        )
+
+        if not to_translate:
+            return result
+
+        batches: list[list[str]] = Translator.split_into_batches(
+            to_translate, self.BATCH_MAX_CHARS, self.BATCH_MAX_TEXTS
+        )
+        with ThreadPoolExecutor(
+            max_workers=min(self.MAX_CONCURRENT_REQUESTS, len(batches)),
+            thread_name_prefix=self.__class__.__name__,
+        ) as executor:
+            futures: list[Future[dict[str, str]]] = [
+                executor.submit(self.__translate_batch, batch, dst) for batch in batches
+            ]
+
+            # the translations of all successful batches are cached before a failure
+            # is raised so that they don't have to be requested again
+            error: Optional[Exception] = None
+            for future in as_completed(futures):
+                try:
+                    translations: dict[str, str] = future.result()
+                except Exception as ex:  # noqa: BLE001
+                    if error is None:
+                        error = ex
+                    continue
+
+                self._add_many_to_cache(translations, dst)
+                result.update(translations)
+
+        if error is not None:
+            raise error
+
+        self.log.debug(
+            f"Translated {len(to_translate)} text(s) in {len(batches)} batch(es)."
+        )
+
+        return result
+
+    def __translate_batch(self, batch: list[str], dst: GameLanguage) -> dict[str, str]:
+        retry: int = 0
+        while True:
+            try:
+                translations: list[str] = self.translate_batch_uncached(batch, dst)
+                break
+            except self.RETRY_EXCEPTIONS as ex:
+                if retry >= self.MAX_RETRIES:
+                    raise
+
+                delay: float = self.RETRY_BACKOFF * 2**retry
+                retry += 1
+                self.log.warning(
+                    f"Failed to translate batch of {len(batch)} text(s): {ex} "
+                    f"Retrying in {delay:.1f}s ({retry}/{self.MAX_RETRIES})..."
+                )
+                time.sleep(delay)
+
+        if len(translations) != len(batch):
+            raise ValueError(
+                f"Expected {len(batch)} translation(s) but got {len(translations)}!"
+            )
+
+        return dict(zip(batch, translations, strict=True))
+
+    @staticmethod
+    def split_into_batches(
+        texts: list[str], max_chars: int, max_texts: int
+    ) -> list[list[str]]:
+        """
+        Splits texts into batches with a limited number of characters and texts.
+        The order of the texts is preserved.
+
+        Args:
+            texts (list[str]): The texts to split.
+            max_chars (int):
+                The maximum number of characters per batch. A text that exceeds this
+                limit on its own is put into a batch of its own.
+            max_texts (int): The maximum number of texts per batch.
+
+        Returns:
+            list[list[str]]: The batches.
+        """
+
+        batches: list[list[str]] = []
+        current_batch: list[str] = []
+        current_chars: int = 0
+        for text in texts:
+            if current_batch and (
+                current_chars + len(text) > max_chars or len(current_batch) >= max_texts
+            ):
+                batches.append(current_batch)
+                current_batch = []
+                current_chars = 0
+
+            current_batch.append(text)
+            current_chars += len(text)
+
+        if current_batch:
+            batches.append(current_batch)
+
+        return batches
 
     def get_cache_id(self: Translator, text: str, dst: GameLanguage) -> str:
         """
@@ -0,0 +1,285 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+import sqlite3
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from threading import Lock
+from typing import Optional
+
+from cutleast_core_lib.core.cache.cache import Cache
+
+
+class TranslatorCache:
+    """
+    Single-file store for cached API translations, backed by an SQLite database.
+
+    The translations are indexed by their cache id (see `Translator.get_cache_id()`)
+    and can be read and written in bulk. All threads share a single connection that is
+    guarded by a lock. The connection is reopened if the database file was deleted
+    (e.g. by clearing the cache folder) and can be closed with `close()` to release the
+    file.
+    """
+
+    BULK_SIZE: int = 500
+    """Maximum number of keys per SQL query (SQLite limits the number of variables)."""
+
+    COMPACT_THRESHOLD: int = 10000
+    """Minimum number of evicted entries after which the database file is compacted."""
+
+    __path: Path
+    __max_age: Optional[int]
+
+    __connection: Optional[sqlite3.Connection] = None
+    __lock: Lock
+
+    log: logging.Logger = logging.getLogger("TranslatorCache")
+
+    def __init__(self, path: Path, max_age: Optional[int] = None) -> None:
+        """
+        Args:
+            path (Path): Path to the database file.
+            max_age (Optional[int], optional):
+                Maximum age of cached translations in seconds. Defaults to None.
+        """
+
+        self.__path = path
+        self.__max_age = max_age
+        self.__lock = Lock()
+
+    @property
+    def path(self) -> Path:
+        """
+        Path to the database file.
+        """
+
+        return self.__path
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Gets a cached translation.
+
+        Args:
+            key (str): The cache id of the translation.
+
+        Returns:
+            Optional[str]: The cached translation or None if there is none.
+        """
+
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[str]) -> dict[str, str]:
+        """
+        Gets multiple cached translations.
+
+        Args:
+            keys (Iterable[str]): The cache ids of the translations.
+
+        Returns:
+            dict[str, str]:
+                Mapping of cache id to cached translation. Keys without a cached
+                translation are not included.
+        """
+
+        keys = list(keys)
+        result: dict[str, str] = {}
+        if not keys:
+            return result
+
+        with self.__connect() as connection:
+            for i in range(0, len(keys), TranslatorCache.BULK_SIZE):
+                chunk: list[str] = keys[i : i + TranslatorCache.BULK_SIZE]
+                placeholders: str = ", ".join("?" * len(chunk))
+                rows: list[tuple[str, str]] = connection.execute(
+                    f"SELECT key, value FROM translations WHERE timestamp >= ? "
+                    f"AND key IN ({placeholders})",
+                    (self.__get_min_timestamp(), *chunk),
+                ).fetchall()
+                result.update(rows)
+
+        return result
+
+    def put(self, key: str, value: str) -> None:
+        """
+        Adds or replaces a cached translation.
+
+        Args:
+            key (str): The cache id of the translation.
+            value (str): The translation.
+        """
+
+        self.put_many({key: value})
+
+    def put_many(self, items: dict[str, str], timestamp: Optional[int] = None) -> None:
+        """
+        Adds or replaces multiple cached translations in a single transaction.
+
+        Args:
+            items (dict[str, str]): Mapping of cache id to translation.
+            timestamp (Optional[int], optional):
+                Creation timestamp of the translations. Defaults to the current time.
+        """
+
+        if not items:
+            return
+
+        if timestamp is None:
+            timestamp = int(time.time())
+
+        with self.__connect() as connection:
+            connection.executemany(
+                "INSERT OR REPLACE INTO translations (key, value, timestamp) "
+                "VALUES (?, ?, ?)",
+                ((key, value, timestamp) for key, value in items.items()),
+            )
+
+    def evict_expired(self) -> int:
+        """
+        Removes all translations that are older than the maximum age.
+
+        Returns:
+            int: The number of removed translations.
+        """
+
+        if self.__max_age is None:
+            return 0
+
+        with self.__connect() as connection:
+            evicted: int = connection.execute(
+                "DELETE FROM translations WHERE timestamp < ?",
+                (self.__get_min_timestamp(),),
+            ).rowcount
+
+        if evicted:
+            self.log.debug(f"Evicted {evicted} expired translation(s).")
+
+        return evicted
+
+    def compact(self) -> None:
+        """
+        Removes all expired translations and shrinks the database file.
+        """
+
+        self.evict_expired()
+
+        with self.__lock:
+            self.__get_connection().execute("VACUUM")
+
+        self.log.debug("Compacted translator cache.")
+
+    def maintain(self) -> None:
+        """
+        Removes all expired translations and compacts the database file if many
+        translations were removed.
+        """
+
+        if self.evict_expired() >= TranslatorCache.COMPACT_THRESHOLD:
+            self.compact()
+
+    def close(self) -> None:
+        """
+        Closes the connection to the database file. It is reopened by the next
+        operation.
+        """
+
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    def migrate_folder(self, cache_subfolder: Path) -> int:
+        """
+        Moves the translations that were cached as single files by
+        `Cache.persistent_cache()` into this store and deletes the cache files.
+
+        Args:
+            cache_subfolder (Path): The subfolder within the cache folder.
+
+        Returns:
+            int: The number of migrated translations.
+        """
+
+        folder_path: Path = Cache.get().path / cache_subfolder
+        if not folder_path.is_dir():
+            return 0
+
+        self.log.info(f"Migrating cached translations from '{folder_path}'...")
+
+        migrated: int = 0
+        cache_files: list[Path] = list(folder_path.glob("*.cache"))
+        for i in range(0, len(cache_files), TranslatorCache.BULK_SIZE):
+            # translations are grouped by their original timestamp so that they don't
+            # outlive their maximum age
+            items_by_timestamp: dict[int, dict[str, str]] = {}
+            for cache_file in cache_files[i : i + TranslatorCache.BULK_SIZE]:
+                translation: Optional[str] = Cache.get_from_cache(
+                    cache_subfolder / cache_file.name,
+                    max_age=self.__max_age,
+                    default=None,
+                )
+                if translation is None:
+                    continue
+
+                timestamp = int(cache_file.stat().st_mtime)
+                items_by_timestamp.setdefault(timestamp, {})[cache_file.stem] = (
+                    translation
+                )
+                migrated += 1
+
+            for timestamp, items in items_by_timestamp.items():
+                self.put_many(items, timestamp=timestamp)
+
+            for cache_file in cache_files[i : i + TranslatorCache.BULK_SIZE]:
+                cache_file.unlink(missing_ok=True)
+
+        if not any(folder_path.iterdir()):
+            folder_path.rmdir()
+
+        self.log.info(f"Migrated {migrated} cached translation(s).")
+
+        return migrated
+
+    def __get_min_timestamp(self) -> int:
+        if self.__max_age is None:
+            return 0
+
+        return int(time.time()) - self.__max_age
+
+    def __get_connection(self) -> sqlite3.Connection:
+        """
+        Gets the shared connection and opens it if necessary. Must be called with the
+        lock held.
+        """
+
+        if self.__connection is not None and self.__path.is_file():
+            return self.__connection
+
+        if self.__connection is not None:
+            self.log.debug("Database file was deleted. Reopening...")
+            self.__connection.close()
+
+        self.__path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.__path, timeout=30, check_same_thread=False)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS translations "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL, timestamp INTEGER NOT NULL) "
+            "WITHOUT ROWID"
+        )
+        self.__connection = connection
+
+        return connection
+
+    @contextmanager
+    def __connect(self) -> Iterator[sqlite3.Connection]:
+        """
+        Locks the shared connection and commits all changes on success.
+        """
+
+        with self.__lock:
+            connection: sqlite3.Connection = self.__get_connection()
+            with connection:
+                yield connection
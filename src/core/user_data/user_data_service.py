@@ -48,7 +48,11 @@ class UserDataService(SingletonQObject):
         self.__data_path = data_path
 
     def load(
-        self, thread_num: int = 4, pdisplay: Optional[ProgressDisplay] = None
+        self,
+        thread_num: int = 4,
+        pdisplay: Optional[ProgressDisplay] = None,
+        use_packed_format: bool = False,
+        lazy_database_loading: bool = False,
     ) -> UserData:
         """
         Loads the user data from the configured folder.
@@ -58,6 +62,12 @@ class UserDataService(SingletonQObject):
                 The maximum number of threads to use. Defaults to 4.
             pdisplay (Optional[ProgressDisplay], optional):
                 Optional progress display. Defaults to None.
+            use_packed_format (bool, optional):
+                Whether to store user translations in the packed format. Defaults to
+                False.
+            lazy_database_loading (bool, optional):
+                Whether to load the strings of user translations only when they are
+                needed. Defaults to False.
 
         Returns:
             UserData: The loaded user data.
@@ -86,7 +96,9 @@ class UserDataService(SingletonQObject):
                 ProgressUpdate(status_text=self.tr("Loading translation database..."))
             )
 
-        database = self.__load_database(user_config.language, pdisplay)
+        database = self.__load_database(
+            user_config.language, use_packed_format, lazy_database_loading, pdisplay
+        )
 
         if pdisplay is not None:
             pdisplay.updateMainProgress(
@@ -125,14 +137,20 @@ class UserDataService(SingletonQObject):
         return TranslatorConfig.load(self.__data_path)
 
     def __load_database(
-        self, language: GameLanguage, pdisplay: Optional[ProgressDisplay] = None
+        self,
+        language: GameLanguage,
+        use_packed_format: bool,
+        lazy: bool,
+        pdisplay: Optional[ProgressDisplay] = None,
     ) -> TranslationDatabase:
         self.log.info(f"Loading translation database for language '{language}'...")
 
         appdb_path: Path = self.__res_path / "app" / "database"
         userdb_path: Path = self.__data_path / "user" / "database"
 
-        return DatabaseService.load_database(appdb_path, userdb_path, language)
+        return DatabaseService.load_database(
+            appdb_path, userdb_path, language, use_packed_format, lazy
+        )
 
     def __load_modinstance(
         self,
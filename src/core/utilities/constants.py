@@ -114,6 +114,12 @@ The name of the dummy file that marks a generated output mod that is to be ignor
 SSE-AT.
 """
 
+OUTPUT_MOD_MANIFEST_FILENAME: str = "sse-at_manifest.json"
+"""
+The name of the file that records the generated files of an output mod. It is used to
+only rebuild changed files on later builds.
+"""
+
 SUPPORTED_ARCHIVE_TYPES = [".7z", ".rar", ".zip"]
 """
 The list of supported archive types for importing translations into SSE-AT.
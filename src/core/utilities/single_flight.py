@@ -0,0 +1,77 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future
+from threading import Lock
+from typing import Generic, Optional, TypeVar, override
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Class for deduplicating identical calls across threads.
+
+    The first call for a key runs the specified function while concurrent calls for the
+    same key wait for its result instead of running the function again. Successful
+    results are kept so that later calls for the same key are answered immediately.
+    Failures are passed to all waiting callers but are not kept, so a later call runs the
+    function again.
+    """
+
+    __results: dict[K, V]
+    __in_flight: dict[K, Future[V]]
+    __lock: Lock
+
+    @override
+    def __init__(self) -> None:
+        self.__results = {}
+        self.__in_flight = {}
+        self.__lock = Lock()
+
+    def get(self, key: K, func: Callable[[], V]) -> V:
+        """
+        Gets the result for a key, running the specified function only if there is
+        neither a kept result nor a call in flight for the key.
+
+        Args:
+            key (K): The key identifying the call.
+            func (Callable[[], V]): The function to run for the key.
+
+        Raises:
+            Exception: when the function raises an exception.
+
+        Returns:
+            V: The result for the key.
+        """
+
+        with self.__lock:
+            if key in self.__results:
+                return self.__results[key]
+
+            future: Optional[Future[V]] = self.__in_flight.get(key)
+            owner: bool = future is None
+            if future is None:
+                future = Future()
+                self.__in_flight[key] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            result: V = func()
+        except Exception as ex:
+            with self.__lock:
+                del self.__in_flight[key]
+            future.set_exception(ex)
+            raise
+
+        with self.__lock:
+            self.__results[key] = result
+            del self.__in_flight[key]
+        future.set_result(result)
+
+        return result
@@ -2,6 +2,7 @@
 Copyright (c) Cutleast
 """
 
+import multiprocessing
 import sys
 from argparse import ArgumentParser, Namespace, _SubParsersAction  # type: ignore
 
@@ -91,6 +92,9 @@ def __init_utils(parser: ArgumentParser) -> list[Utility]:
 
 
 if __name__ == "__main__":
+    # required for worker processes (eg. of the dbgen utility) in a frozen executable
+    multiprocessing.freeze_support()
+
     parser: ArgumentParser = __init_argparser()
     utils: list[Utility] = __init_utils(parser)
     arg_namespace: Namespace = parser.parse_args()
@@ -248,7 +248,7 @@ class TranslationsTab(QWidget):
                     translation = DatabaseService.create_blank_translation(
                         file.stem, strings, self.__database
                     )
-                    translation.save()
+                    DatabaseService.save_translation(translation, self.__database)
                     DatabaseService.add_translation(translation, self.__database)
 
             else:
@@ -277,7 +277,7 @@ class TranslationsTab(QWidget):
                             strings,
                             self.__database,
                         )
-                        translation.save()
+                        DatabaseService.save_translation(translation, self.__database)
                         DatabaseService.add_translation(translation, self.__database)
 
                 else:
@@ -298,9 +298,7 @@ class TranslationsWidget(QTreeWidget):
             ]
         )
         item.addChildren(
-            self._create_translation_file_items(
-                translation, list(translation.strings.keys())
-            )
+            self._create_translation_file_items(translation, translation.modfile_paths)
         )
 
         item.setToolTip(3, fmt_timestamp(translation.timestamp))
@@ -446,6 +446,7 @@ class MainPageWidget(QWidget):
                 translations=self.__user_data.database.user_translations,
                 user_config=self.__user_data.user_config,
                 pdisplay=pdisplay,
+                thread_num=self.__app_config.worker_thread_num,
             ),
             parent=QApplication.activeModalWidget(),
         ).run()
@@ -10,28 +10,16 @@ from typing import Optional, override
 
 from cutleast_core_lib.core.filesystem.utils import open_in_explorer
 from cutleast_core_lib.core.multithreading.progress import ProgressUpdate
-from cutleast_core_lib.core.utilities.filter import matches_filter
-from cutleast_core_lib.core.utilities.reverse_dict import reverse_dict
 from cutleast_core_lib.core.utilities.typing_utils import not_none
 from cutleast_core_lib.ui.progress.dialog import ProgressDialog
 from cutleast_core_lib.ui.progress.display import ProgressDisplay
-from cutleast_core_lib.ui.utilities.tree_widget import are_children_visible
-from PySide6.QtCore import Qt, Signal
-from PySide6.QtGui import QFont
-from PySide6.QtWidgets import (
-    QApplication,
-    QHeaderView,
-    QMessageBox,
-    QTreeWidget,
-    QTreeWidgetItem,
-)
+from PySide6.QtCore import QModelIndex, Qt, Signal
+from PySide6.QtWidgets import QApplication, QHeaderView, QMessageBox, QTreeView
 
 from core.config.app_config import AppConfig
 from core.database.database import TranslationDatabase
 from core.database.database_service import DatabaseService
 from core.database.translation import Translation
-from core.file_source.bsa_file_source import BsaFileSource
-from core.file_source.file_source import FileSource
 from core.file_source.file_source_factory import FileSourceFactory
 from core.file_types.file_type import FileType
 from core.mod_file.mod_file import ModFile
@@ -49,10 +37,11 @@ from core.user_data.user_data import UserData
 from ui.widgets.string_list.string_list_dialog import StringListWindow
 
 from .help_dialog import ModInstanceHelpDialog
+from .mod_instance_model import ModInstanceModel
 from .modinstance_menu import ModInstanceMenu
 
 
-class ModInstanceWidget(QTreeWidget):
+class ModInstanceWidget(QTreeView):
     """
     Widget for displaying the loaded modlist.
     """
@@ -91,8 +80,10 @@ class ModInstanceWidget(QTreeWidget):
     __provider: TranslationProvider
     __mod_instance: ModInstance
     __state_service: StateService
-    __mod_items: dict[Mod, QTreeWidgetItem]
-    __modfile_items: dict[Mod, dict[ModFile, QTreeWidgetItem]]
+    __model: ModInstanceModel
+
+    __expanded_mods: dict[int, Mod]
+    """Mods and separators that have been expanded by the user by their id."""
 
     __menu: ModInstanceMenu
     __name_filter: Optional[tuple[str, bool]] = None
@@ -152,32 +143,27 @@ class ModInstanceWidget(QTreeWidget):
         self.__menu.open_modpage_requested.connect(self.__open_modpage)
         self.__menu.open_in_explorer_requested.connect(self.__open_in_explorer)
 
-        self.__state_service.update_signal.connect(self.update)
-
         self.__load_mod_instance()
 
+        self.__state_service.modfile_states_changed.connect(self.__model.update_modfiles)
+
     def __init_ui(self) -> None:
         self.setUniformRowHeights(True)
         self.setAlternatingRowColors(True)
-        self.resizeColumnToContents(2)
-        self.setSelectionMode(QTreeWidget.SelectionMode.ExtendedSelection)
-        self.itemDoubleClicked.connect(self.__item_double_clicked)
+        self.setSelectionMode(QTreeView.SelectionMode.ExtendedSelection)
+        self.doubleClicked.connect(self.__item_double_clicked)
+        self.expanded.connect(self.__on_expanded)
+        self.collapsed.connect(self.__on_collapsed)
         self.setExpandsOnDoubleClick(False)
 
-        self.__config_header()
         self.__init_context_menu()
 
     def __config_header(self) -> None:
-        self.setHeaderLabels(
-            [
-                self.tr("Name"),
-                self.tr("Version"),
-                self.tr("Priority"),
-            ]
-        )
         self.header().setDefaultAlignment(Qt.AlignmentFlag.AlignCenter)
         self.header().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
         self.header().setStretchLastSection(False)
+        self.resizeColumnToContents(ModInstanceModel.VERSION_COLUMN)
+        self.resizeColumnToContents(ModInstanceModel.PRIORITY_COLUMN)
 
     def __init_context_menu(self) -> None:
         self.__menu = ModInstanceMenu()
@@ -194,99 +180,20 @@ class ModInstanceWidget(QTreeWidget):
         Displays the loaded modlist.
         """
 
-        self.__mod_items = {}
-        self.__modfile_items = {}
-        self.clear()
-
         checkstates: dict[ModFile, bool] = self.__state_service.load_states_from_cache()
 
-        cur_separator: Optional[QTreeWidgetItem] = None
-        for i, mod in enumerate(self.__mod_instance.mods):
-            if mod.mod_type == Mod.Type.Separator:
-                cur_separator = ModInstanceWidget._create_separator_item(mod, i)
-                self.__mod_items[mod] = cur_separator
-                self.addTopLevelItem(cur_separator)
-            elif mod.mod_type == Mod.Type.Regular:
-                mod_item: QTreeWidgetItem = ModInstanceWidget._create_mod_item(mod, i)
-
-                self.__mod_items[mod] = mod_item
-                self.__modfile_items[mod] = {
-                    modfile: ModInstanceWidget._create_modfile_item(
-                        modfile, checkstates[modfile]
-                    )
-                    for modfile in mod.modfiles
-                }
-                mod_item.addChildren(list(self.__modfile_items[mod].values()))
-
-                if cur_separator is not None:
-                    cur_separator.addChild(mod_item)
-                else:
-                    self.addTopLevelItem(mod_item)
-
-        self.resizeColumnToContents(1)
-        self.update()
-
-    @staticmethod
-    def _create_separator_item(separator: Mod, index: int) -> QTreeWidgetItem:
-        separator_item = QTreeWidgetItem(
-            [
-                separator.name,
-                "",
-                str(index + 1),  # Mod Priority
-            ]
-        )
-        separator_item.setTextAlignment(0, Qt.AlignmentFlag.AlignCenter)
-        separator_item.setTextAlignment(2, Qt.AlignmentFlag.AlignCenter)
-        font = QFont()
-        font.setBold(True)
-        font.setItalic(True)
-        separator_item.setFont(0, font)
-        separator_item.setFlags(Qt.ItemFlag.ItemIsSelectable)
-        separator_item.setToolTip(0, separator_item.text(0))
-        separator_item.setDisabled(False)
-
-        return separator_item
-
-    @staticmethod
-    def _create_mod_item(mod: Mod, index: int) -> QTreeWidgetItem:
-        mod_item = QTreeWidgetItem(
-            [
-                mod.name,
-                mod.version,
-                str(index + 1),  # Mod Priority
-            ]
-        )
-        mod_item.setToolTip(0, mod_item.text(0))
-        mod_item.setDisabled(False)
-        mod_item.setTextAlignment(1, Qt.AlignmentFlag.AlignCenter)
-        mod_item.setTextAlignment(2, Qt.AlignmentFlag.AlignCenter)
-
-        return mod_item
-
-    @staticmethod
-    def _create_modfile_item(modfile: ModFile, checked: bool = True) -> QTreeWidgetItem:
-        display_name: str = str(modfile.path).replace("\\", "/")
-        file_source: FileSource = FileSourceFactory.for_file_path(modfile.full_path)
-        if isinstance(file_source, BsaFileSource):
-            display_name = f"{file_source.get_archive_path().name}/{display_name}"
-
-        modfile_item = QTreeWidgetItem(
-            [
-                display_name,
-                "",  # Version
-                "",  # Priority
-            ]
-        )
-        modfile_item.setToolTip(0, str(modfile.full_path))
-        modfile_item.setFlags(
-            Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsSelectable
-        )
-        modfile_item.setDisabled(False)
-        modfile_item.setCheckState(
-            0, Qt.CheckState.Checked if checked else Qt.CheckState.Unchecked
+        self.__expanded_mods = {}
+        self.__model = ModInstanceModel(
+            self.__mod_instance,
+            self.__user_data.masterlist,
+            checkstates,
+            self.__app_config.debug_mode,
+            parent=self,
         )
+        self.__model.layoutChanged.connect(self.__restore_expanded_mods)
+        self.setModel(self.__model)
 
-        return modfile_item
+        self.__config_header()
 
     @override
     def update(self) -> None:  # type: ignore
@@ -294,76 +201,28 @@ class ModInstanceWidget(QTreeWidget):
         Updates the displayed modlist.
         """
 
-        name_filter: Optional[str] = (
-            self.__name_filter[0] if self.__name_filter else None
-        )
-        case_sensitive: Optional[bool] = (
-            self.__name_filter[1] if self.__name_filter else None
-        )
-
-        for mod, mod_item in self.__mod_items.items():
-            modfile_items: dict[ModFile, QTreeWidgetItem] = self.__modfile_items.get(
-                mod, {}
-            )
-
-            for modfile, item in modfile_items.items():
-                ignored: bool = self.__user_data.masterlist.is_ignored(modfile.name)
-                item.setDisabled(ignored)
-                if ignored:
-                    item.setCheckState(0, Qt.CheckState.Unchecked)
+        self.__model.refresh()
+        self.viewport().update()
 
-                if self.__app_config.debug_mode:
-                    item.setToolTip(1, modfile.status.name)
+    def __on_expanded(self, index: QModelIndex) -> None:
+        item: Optional[Mod | ModFile] = self.__model.get_item(index)
+        if isinstance(item, Mod):
+            self.__expanded_mods[id(item)] = item
 
-                item.setHidden(
-                    (
-                        self.__state_filter is not None
-                        and modfile.status not in self.__state_filter
-                    )
-                    or (
-                        self.__type_filter is not None
-                        and not any(
-                            isinstance(modfile, file_type.get_file_type_cls())
-                            for file_type in self.__type_filter
-                        )
-                    )
-                    or not matches_filter(
-                        modfile.name, name_filter, case_sensitive or False
-                    )
-                )
-                item.setForeground(
-                    0,
-                    TranslationStatus.get_color(modfile.status) or Qt.GlobalColor.white,
-                )
+    def __on_collapsed(self, index: QModelIndex) -> None:
+        item: Optional[Mod | ModFile] = self.__model.get_item(index)
+        if isinstance(item, Mod):
+            self.__expanded_mods.pop(id(item), None)
 
-            if self.__app_config.debug_mode:
-                mod_item.setToolTip(1, str(mod))
+    def __restore_expanded_mods(self) -> None:
+        """
+        Expands the mods that were expanded before they got hidden by a filter.
+        """
 
-            mod_item.setHidden(
-                (
-                    self.__state_filter is not None
-                    and TranslationStatus.NoneStatus not in self.__state_filter
-                    and not are_children_visible(mod_item)
-                )
-                or (
-                    not matches_filter(mod.name, name_filter, case_sensitive or False)
-                    and not are_children_visible(mod_item)
-                )
-            )
-            mod_item.setForeground(
-                0,
-                TranslationStatus.get_color(
-                    max(
-                        [
-                            modfile.status
-                            for modfile in mod.modfiles
-                            if not self.__user_data.masterlist.is_ignored(modfile.name)
-                        ],
-                        default=TranslationStatus.NoneStatus,
-                    )
-                )
-                or Qt.GlobalColor.white,
-            )
+        for mod in self.__expanded_mods.values():
+            index: QModelIndex = self.__model.index_of(mod)
+            if index.isValid() and not self.isExpanded(index):
+                self.setExpanded(index, True)
 
     def __show_strings(self) -> None:
         """
@@ -389,14 +248,12 @@ class ModInstanceWidget(QTreeWidget):
             dialog.show()
 
     def __check_selected(self) -> None:
-        for item in self.selectedItems():
-            if Qt.ItemFlag.ItemIsUserCheckable in item.flags() and not item.text(2):
-                item.setCheckState(0, Qt.CheckState.Checked)
+        for modfile in self.get_selected_items()[1]:
+            self.__model.set_checked(modfile, True)
 
     def __uncheck_selected(self) -> None:
-        for item in self.selectedItems():
-            if Qt.ItemFlag.ItemIsUserCheckable in item.flags() and not item.text(2):
-                item.setCheckState(0, Qt.CheckState.Unchecked)
+        for modfile in self.get_selected_items()[1]:
+            self.__model.set_checked(modfile, False)
 
     def __add_to_ignore_list(self) -> None:
         _, selected_modfiles = self.get_selected_items()
@@ -506,15 +363,7 @@ class ModInstanceWidget(QTreeWidget):
         if current_item is None:
             return
 
-        selected_mods: list[Mod] = [
-            mod for mod, item in self.__mod_items.items() if item.isSelected()
-        ]
-        selected_modfiles: list[ModFile] = [
-            modfile
-            for modfile_items in self.__modfile_items.values()
-            for modfile, item in modfile_items.items()
-            if item.isSelected()
-        ]
+        selected_mods, selected_modfiles = self.get_selected_items()
 
         def process(pdisplay: ProgressDisplay) -> None:
             pdisplay.updateMainProgress(
@@ -669,14 +518,23 @@ class ModInstanceWidget(QTreeWidget):
             tuple[list[Mod], list[ModFile]]: Selected mods and mod files
         """
 
+        selected_ids: set[int] = {
+            id(item)
+            for index in self.selectionModel().selectedRows()
+            if (item := self.__model.get_item(index)) is not None
+        }
+
+        if not selected_ids:
+            return [], []
+
         selected_mods: list[Mod] = [
-            mod for mod, item in self.__mod_items.items() if item.isSelected()
+            mod for mod in self.__mod_instance.mods if id(mod) in selected_ids
         ]
         selected_modfiles: list[ModFile] = [
             modfile
-            for modfile_items in self.__modfile_items.values()
-            for modfile, item in modfile_items.items()
-            if item.isSelected()
+            for mod in self.__mod_instance.mods
+            for modfile in mod.modfiles
+            if id(modfile) in selected_ids
         ]
 
         return selected_mods, selected_modfiles
@@ -689,13 +547,13 @@ class ModInstanceWidget(QTreeWidget):
             dict[Mod, list[ModFile]]: Mods with selected mod files
         """
 
-        return {
-            mod: [
-                modfile for modfile, item in modfile_items.items() if item.isSelected()
-            ]
-            for mod, modfile_items in self.__modfile_items.items()
-            if any(item.isSelected() for item in modfile_items.values())
-        }
+        selected_modfiles: dict[Mod, list[ModFile]] = {}
+        for modfile in self.get_selected_items()[1]:
+            mod: Optional[Mod] = self.__mod_instance.get_mod_of_modfile(modfile)
+            if mod is not None:
+                selected_modfiles.setdefault(mod, []).append(modfile)
+
+        return selected_modfiles
 
     def get_checked_items(self, filtered: bool = True) -> dict[Mod, list[ModFile]]:
         """
@@ -707,14 +565,19 @@ class ModInstanceWidget(QTreeWidget):
             dict[Mod, list[ModFile]]: All mod files whose items are checked.
         """
 
+        visible_modfiles: set[int] = {
+            id(modfile) for modfile in self.__model.get_visible_modfiles()
+        }
+
         return {
             mod: [
                 modfile
-                for modfile, item in modfile_items.items()
-                if item.checkState(0) == Qt.CheckState.Checked
-                and (not filtered or not item.isHidden())
+                for modfile in mod.modfiles
+                if self.__model.is_checked(modfile)
+                and (not filtered or id(modfile) in visible_modfiles)
             ]
-            for mod, modfile_items in self.__modfile_items.items()
+            for mod in self.__mod_instance.mods
+            if mod.mod_type == Mod.Type.Regular
         }
 
     def __get_current_item(self) -> Optional[Mod | ModFile]:
@@ -725,15 +588,10 @@ class ModInstanceWidget(QTreeWidget):
             Optional[Mod | ModFile]: Current item or None
         """
 
-        items: dict[QTreeWidgetItem, Mod | ModFile] = {}
-        items.update(reverse_dict(self.__mod_items))
-        for modfile_items in self.__modfile_items.values():
-            items.update(reverse_dict(modfile_items))
+        return self.__model.get_item(self.currentIndex())
 
-        return items.get(self.currentItem(), None)
-
-    def __item_double_clicked(self, item: QTreeWidgetItem, column: int) -> None:
-        current_item: Optional[Mod | ModFile] = self.__get_current_item()
+    def __item_double_clicked(self, index: QModelIndex) -> None:
+        current_item: Optional[Mod | ModFile] = self.__model.get_item(index)
 
         if (
             current_item is not None
@@ -751,7 +609,8 @@ class ModInstanceWidget(QTreeWidget):
         ) and self.__app_config.show_strings_on_double_click:
             self.__show_strings()
         else:
-            item.setExpanded(not item.isExpanded())
+            index = index.siblingAtColumn(ModInstanceModel.NAME_COLUMN)
+            self.setExpanded(index, not self.isExpanded(index))
 
     def show_help(self) -> None:
         """
@@ -773,7 +632,7 @@ class ModInstanceWidget(QTreeWidget):
             self.__name_filter = (name_filter, case_sensitive)
         else:
             self.__name_filter = None
-        self.update()
+        self.__model.set_name_filter(self.__name_filter)
 
     def set_state_filter(self, state_filter: list[TranslationStatus]) -> None:
         """
@@ -784,7 +643,7 @@ class ModInstanceWidget(QTreeWidget):
         """
 
         self.__state_filter = state_filter if state_filter else None
-        self.update()
+        self.__model.set_state_filter(self.__state_filter)
 
     def set_type_filter(self, type_filter: list[FileType]) -> None:
         """
@@ -795,7 +654,7 @@ class ModInstanceWidget(QTreeWidget):
         """
 
         self.__type_filter = type_filter if type_filter else None
-        self.update()
+        self.__model.set_type_filter(self.__type_filter)
 
     def get_visible_modfiles(self, only_checked: bool = True) -> list[ModFile]:
         """
@@ -809,15 +668,8 @@ class ModInstanceWidget(QTreeWidget):
 
         return [
             modfile
-            for modfile_items in self.__modfile_items.values()
-            for modfile, modfile_item in modfile_items.items()
-            if (
-                not modfile_item.isHidden()
-                and (
-                    not only_checked
-                    or modfile_item.checkState(0) == Qt.CheckState.Checked
-                )
-            )
+            for modfile in self.__model.get_visible_modfiles()
+            if not only_checked or self.__model.is_checked(modfile)
         ]
 
     def get_visible_modfile_item_count(self, only_checked: bool = True) -> int:
@@ -843,4 +695,4 @@ class ModInstanceWidget(QTreeWidget):
             bool: Whether the item is checked.
         """
 
-        return self.__modfile_items[mod][modfile].checkState(0) == Qt.CheckState.Checked
+        return self.__model.is_checked(modfile)
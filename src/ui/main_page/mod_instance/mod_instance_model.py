@@ -0,0 +1,705 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+import time
+from collections.abc import Iterable
+from typing import Any, Optional, TypeAlias, override
+
+from cutleast_core_lib.core.utilities.filter import matches_filter
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    Qt,
+)
+from PySide6.QtGui import QColor, QFont
+
+from core.file_source.bsa_file_source import BsaFileSource
+from core.file_source.file_source import FileSource
+from core.file_source.file_source_factory import FileSourceFactory
+from core.file_types.file_type import FileType
+from core.masterlist.masterlist import Masterlist
+from core.mod_file.mod_file import ModFile
+from core.mod_file.translation_status import TranslationStatus
+from core.mod_instance.mod import Mod
+from core.mod_instance.mod_instance import ModInstance
+
+_ModelIndex: TypeAlias = QModelIndex | QPersistentModelIndex
+
+
+class ModInstanceModel(QAbstractItemModel):
+    """
+    Virtual item model for displaying a modlist in a `QTreeView`.
+
+    Separators are top-level rows with their mods as children. Mods before the first
+    separator are top-level rows as well. The mod files are the children of their mods.
+
+    The model only contains the rows that match the current filters. The status of the
+    mods is aggregated from their mod files and cached, so that state changes of single
+    mod files only update the affected rows.
+    """
+
+    NAME_COLUMN: int = 0
+    VERSION_COLUMN: int = 1
+    PRIORITY_COLUMN: int = 2
+
+    __mod_instance: ModInstance
+    __masterlist: Masterlist
+    __debug_mode: bool
+
+    __keys: dict[int, int]
+    """
+    Mapping of mod ids (`id(mod)`) to their key, which is their index in the modlist
+    plus one. The key of the parent row is used as the internal id of a model index.
+    """
+
+    __parent_keys: dict[int, int]
+    """
+    Mapping of the keys of displayed mods and separators to the key of their parent
+    separator or 0 if they are top-level rows.
+    """
+
+    __top_level: list[int]
+    """Keys of the top-level mods and separators."""
+
+    __children: dict[int, list[int]]
+    """Mapping of separator keys to the keys of their mods."""
+
+    __checked: dict[int, bool]
+    """Mapping of mod file ids (`id(modfile)`) to their check state."""
+
+    __ignored: dict[int, bool]
+    """Mapping of mod file ids (`id(modfile)`) to whether they're ignored."""
+
+    __modfile_keys: dict[int, int]
+    """Mapping of mod file ids (`id(modfile)`) to the key of their mod."""
+
+    __mod_states: dict[int, TranslationStatus]
+    """Cached aggregated status of the mods by their key."""
+
+    __display_names: dict[int, str]
+    """Cached display names of the mod files by their id (`id(modfile)`)."""
+
+    __name_filter: Optional[tuple[str, bool]] = None
+    __state_filter: Optional[list[TranslationStatus]] = None
+    __type_filter: Optional[tuple[type[ModFile], ...]] = None
+
+    __visible_top_level: list[int]
+    __visible_children: dict[int, list[int]]
+    __visible_modfiles: dict[int, list[ModFile]]
+    """Mapping of mod keys to their visible mod files, including hidden mods."""
+
+    __rows: dict[int, int]
+    """Mapping of the keys of visible mods to their row."""
+
+    __modfile_rows: dict[int, int]
+    """Mapping of the ids of visible mod files (`id(modfile)`) to their row."""
+
+    __separator_font: QFont
+
+    log: logging.Logger = logging.getLogger("ModInstanceModel")
+
+    def __init__(
+        self,
+        mod_instance: ModInstance,
+        masterlist: Masterlist,
+        checkstates: dict[ModFile, bool],
+        debug_mode: bool = False,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """
+        Args:
+            mod_instance (ModInstance): The modlist to display.
+            masterlist (Masterlist): The masterlist with the ignored mod files.
+            checkstates (dict[ModFile, bool]): The initial check states of mod files.
+            debug_mode (bool, optional):
+                Whether to show debug tooltips. Defaults to False.
+            parent (Optional[QObject], optional): The parent object. Defaults to None.
+        """
+
+        super().__init__(parent)
+
+        self.__mod_instance = mod_instance
+        self.__masterlist = masterlist
+        self.__debug_mode = debug_mode
+
+        self.__separator_font = QFont()
+        self.__separator_font.setBold(True)
+        self.__separator_font.setItalic(True)
+
+        self.__keys = {}
+        self.__parent_keys = {}
+        self.__top_level = []
+        self.__children = {}
+        self.__checked = {}
+        self.__modfile_keys = {}
+        self.__display_names = {}
+
+        separator_key: int = 0
+        for i, mod in enumerate(mod_instance.mods):
+            key: int = i + 1
+            self.__keys[id(mod)] = key
+
+            if mod.mod_type == Mod.Type.Separator:
+                separator_key = key
+                self.__parent_keys[key] = 0
+                self.__top_level.append(key)
+                self.__children[key] = []
+                continue
+            elif mod.mod_type != Mod.Type.Regular:
+                continue
+
+            self.__parent_keys[key] = separator_key
+            if separator_key:
+                self.__children[separator_key].append(key)
+            else:
+                self.__top_level.append(key)
+
+            for modfile in mod.modfiles:
+                self.__checked[id(modfile)] = checkstates.get(modfile, True)
+                self.__modfile_keys[id(modfile)] = key
+
+        self.__update_states()
+        self.__set_visible_rows(*self.__filter())
+
+    def refresh(self) -> None:
+        """
+        Reevaluates the ignored mod files, the states of all mods and the filters.
+        """
+
+        self.__update_states()
+        self.__apply_filter()
+
+    def update_modfiles(self, modfiles: Iterable[ModFile]) -> None:
+        """
+        Updates the rows of mod files whose states have changed and the rows of their
+        mods. The filters are only reapplied if the visible rows have changed.
+
+        Args:
+            modfiles (Iterable[ModFile]): The changed mod files.
+        """
+
+        mod_keys: set[int] = {
+            self.__modfile_keys[id(modfile)]
+            for modfile in modfiles
+            if id(modfile) in self.__modfile_keys
+        }
+        if not mod_keys:
+            return
+
+        for key in mod_keys:
+            self.__update_mod_state(key)
+
+        for key in mod_keys:
+            mod: Mod = self.__get_mod(key)
+            visible_modfiles: list[ModFile] = [
+                modfile for modfile in mod.modfiles if self.__is_modfile_visible(modfile)
+            ]
+
+            if [id(m) for m in visible_modfiles] != [
+                id(m) for m in self.__visible_modfiles[key]
+            ] or self.__is_mod_visible(mod, visible_modfiles) != (key in self.__rows):
+                self.__apply_filter()
+                return
+
+        for key in mod_keys:
+            mod_index: QModelIndex = self.index_of(self.__get_mod(key))
+            if not mod_index.isValid():
+                continue
+
+            self.dataChanged.emit(
+                mod_index, mod_index.siblingAtColumn(self.VERSION_COLUMN)
+            )
+
+            modfile_count: int = len(self.__visible_modfiles[key])
+            if modfile_count:
+                self.dataChanged.emit(
+                    self.index(0, self.NAME_COLUMN, mod_index),
+                    self.index(modfile_count - 1, self.VERSION_COLUMN, mod_index),
+                )
+
+    def set_name_filter(self, name_filter: Optional[tuple[str, bool]]) -> None:
+        """
+        Sets the name filter.
+
+        Args:
+            name_filter (Optional[tuple[str, bool]]):
+                The name to filter by and case-sensitivity or None to disable the filter.
+        """
+
+        self.__name_filter = name_filter
+        self.__apply_filter()
+
+    def set_state_filter(self, state_filter: Optional[list[TranslationStatus]]) -> None:
+        """
+        Sets the state filter.
+
+        Args:
+            state_filter (Optional[list[TranslationStatus]]):
+                The states to filter by or None to disable the filter.
+        """
+
+        self.__state_filter = state_filter
+        self.__apply_filter()
+
+    def set_type_filter(self, type_filter: Optional[list[FileType]]) -> None:
+        """
+        Sets the file type filter.
+
+        Args:
+            type_filter (Optional[list[FileType]]):
+                The file types to filter by or None to disable the filter.
+        """
+
+        self.__type_filter = (
+            tuple(file_type.get_file_type_cls() for file_type in type_filter)
+            if type_filter is not None
+            else None
+        )
+        self.__apply_filter()
+
+    def get_item(self, index: _ModelIndex) -> Optional[Mod | ModFile]:
+        """
+        Gets the mod or mod file of a row.
+
+        Args:
+            index (QModelIndex | QPersistentModelIndex): The index of the row.
+
+        Returns:
+            Optional[Mod | ModFile]: The mod or mod file or None if the index is invalid.
+        """
+
+        if not index.isValid():
+            return None
+
+        parent_key: int = index.internalId()
+        if parent_key == 0:
+            return self.__get_mod(self.__visible_top_level[index.row()])
+
+        if parent_key in self.__children:
+            return self.__get_mod(self.__visible_children[parent_key][index.row()])
+
+        return self.__visible_modfiles[parent_key][index.row()]
+
+    def index_of(self, item: Mod | ModFile, column: int = 0) -> QModelIndex:
+        """
+        Gets the index of a visible mod or mod file.
+
+        Args:
+            item (Mod | ModFile): The mod or mod file.
+            column (int, optional): The column of the index. Defaults to 0.
+
+        Returns:
+            QModelIndex: The index or an invalid index if the item is not visible.
+        """
+
+        if isinstance(item, ModFile):
+            mod_key: Optional[int] = self.__modfile_keys.get(id(item))
+            row: Optional[int] = self.__modfile_rows.get(id(item))
+            if mod_key is None or row is None or mod_key not in self.__rows:
+                return QModelIndex()
+
+            return self.createIndex(row, column, mod_key)
+
+        key: Optional[int] = self.__keys.get(id(item))
+        if key is None or key not in self.__rows:
+            return QModelIndex()
+
+        return self.createIndex(self.__rows[key], column, self.__parent_keys[key])
+
+    def get_visible_modfiles(self) -> list[ModFile]:
+        """
+        Returns:
+            list[ModFile]: The visible mod files in the order of the modlist.
+        """
+
+        return [
+            modfile
+            for key in self.__iter_visible_mods()
+            for modfile in self.__visible_modfiles.get(key, [])
+        ]
+
+    def is_checked(self, modfile: ModFile) -> bool:
+        """
+        Args:
+            modfile (ModFile): The mod file.
+
+        Returns:
+            bool: Whether the mod file is checked.
+        """
+
+        return self.__checked.get(id(modfile), False)
+
+    def set_checked(self, modfile: ModFile, checked: bool) -> None:
+        """
+        Checks or unchecks a mod file.
+
+        Args:
+            modfile (ModFile): The mod file.
+            checked (bool): Whether the mod file should be checked.
+        """
+
+        if id(modfile) not in self.__checked:
+            return
+
+        self.__checked[id(modfile)] = checked
+
+        index: QModelIndex = self.index_of(modfile)
+        if index.isValid():
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.CheckStateRole])
+
+    @override
+    def index(
+        self, row: int, column: int, parent: Optional[_ModelIndex] = None
+    ) -> QModelIndex:
+        if parent is None or not parent.isValid():
+            parent = QModelIndex()
+
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+
+        parent_item: Optional[Mod | ModFile] = self.get_item(parent)
+        if not isinstance(parent_item, Mod):
+            return QModelIndex()
+
+        return self.createIndex(row, column, self.__keys[id(parent_item)])
+
+    @override
+    def parent(self, index: Optional[_ModelIndex] = None) -> Any:  # type: ignore[override]
+        if index is None:
+            # QObject.parent()
+            return super().parent()
+
+        if not index.isValid() or index.internalId() == 0:
+            return QModelIndex()
+
+        parent_key: int = index.internalId()
+        if parent_key not in self.__rows:
+            return QModelIndex()
+
+        return self.createIndex(
+            self.__rows[parent_key], 0, self.__parent_keys[parent_key]
+        )
+
+    @override
+    def rowCount(self, parent: Optional[_ModelIndex] = None) -> int:
+        if parent is None or not parent.isValid():
+            return len(self.__visible_top_level)
+
+        if parent.column() != 0:
+            return 0
+
+        item: Optional[Mod | ModFile] = self.get_item(parent)
+        if not isinstance(item, Mod):
+            return 0
+
+        key: int = self.__keys[id(item)]
+        if key in self.__children:
+            return len(self.__visible_children[key])
+
+        return len(self.__visible_modfiles[key])
+
+    @override
+    def columnCount(self, parent: Optional[_ModelIndex] = None) -> int:
+        return 3
+
+    @override
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if orientation != Qt.Orientation.Horizontal:
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return [self.tr("Name"), self.tr("Version"), self.tr("Priority")][section]
+
+        return None
+
+    @override
+    def flags(self, index: _ModelIndex) -> Qt.ItemFlag:
+        item: Optional[Mod | ModFile] = self.get_item(index)
+
+        if isinstance(item, ModFile):
+            flags = Qt.ItemFlag.ItemIsUserCheckable | Qt.ItemFlag.ItemIsSelectable
+            if not self.__ignored[id(item)]:
+                flags |= Qt.ItemFlag.ItemIsEnabled
+
+            return flags
+
+        if item is not None:
+            return Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled
+
+        return Qt.ItemFlag.NoItemFlags
+
+    @override
+    def data(self, index: _ModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        item: Optional[Mod | ModFile] = self.get_item(index)
+
+        if isinstance(item, ModFile):
+            return self.__get_modfile_data(item, index.column(), role)
+        elif item is not None:
+            return self.__get_mod_data(item, index.column(), role)
+
+        return None
+
+    @override
+    def setData(
+        self, index: _ModelIndex, value: Any, role: int = Qt.ItemDataRole.EditRole
+    ) -> bool:
+        item: Optional[Mod | ModFile] = self.get_item(index)
+
+        if (
+            not isinstance(item, ModFile)
+            or index.column() != self.NAME_COLUMN
+            or role != Qt.ItemDataRole.CheckStateRole
+        ):
+            return False
+
+        self.set_checked(item, Qt.CheckState(value) == Qt.CheckState.Checked)
+        return True
+
+    def __get_mod_data(self, mod: Mod, column: int, role: int) -> Any:
+        key: int = self.__keys[id(mod)]
+        separator: bool = key in self.__children
+
+        match role:
+            case Qt.ItemDataRole.DisplayRole:
+                if column == self.NAME_COLUMN:
+                    return mod.name
+                elif column == self.VERSION_COLUMN and not separator:
+                    return mod.version
+                elif column == self.PRIORITY_COLUMN:
+                    return str(key)
+
+            case Qt.ItemDataRole.ToolTipRole:
+                if column == self.NAME_COLUMN:
+                    return mod.name
+                elif column == self.VERSION_COLUMN and self.__debug_mode:
+                    return str(mod)
+
+            case Qt.ItemDataRole.TextAlignmentRole:
+                if column != self.NAME_COLUMN or separator:
+                    return Qt.AlignmentFlag.AlignCenter
+
+            case Qt.ItemDataRole.FontRole if separator and column == self.NAME_COLUMN:
+                return self.__separator_font
+
+            case Qt.ItemDataRole.ForegroundRole if column == self.NAME_COLUMN:
+                return ModInstanceModel.__get_color(self.__mod_states[key])
+
+        return None
+
+    def __get_modfile_data(self, modfile: ModFile, column: int, role: int) -> Any:
+        match role:
+            case Qt.ItemDataRole.DisplayRole if column == self.NAME_COLUMN:
+                return self.__get_display_name(modfile)
+
+            case Qt.ItemDataRole.ToolTipRole:
+                if column == self.NAME_COLUMN:
+                    return str(modfile.full_path)
+                elif column == self.VERSION_COLUMN and self.__debug_mode:
+                    return modfile.status.name
+
+            case Qt.ItemDataRole.CheckStateRole if column == self.NAME_COLUMN:
+                return (
+                    Qt.CheckState.Checked
+                    if self.__checked[id(modfile)]
+                    else Qt.CheckState.Unchecked
+                )
+
+            case Qt.ItemDataRole.ForegroundRole if column == self.NAME_COLUMN:
+                return ModInstanceModel.__get_color(modfile.status)
+
+        return None
+
+    def __get_display_name(self, modfile: ModFile) -> str:
+        display_name: Optional[str] = self.__display_names.get(id(modfile))
+
+        if display_name is None:
+            display_name = str(modfile.path).replace("\\", "/")
+            file_source: FileSource = FileSourceFactory.for_file_path(modfile.full_path)
+            if isinstance(file_source, BsaFileSource):
+                display_name = f"{file_source.get_archive_path().name}/{display_name}"
+
+            self.__display_names[id(modfile)] = display_name
+
+        return display_name
+
+    @staticmethod
+    def __get_color(status: TranslationStatus) -> QColor:
+        return TranslationStatus.get_color(status) or QColor(Qt.GlobalColor.white)
+
+    def __get_mod(self, key: int) -> Mod:
+        return self.__mod_instance.mods[key - 1]
+
+    def __update_states(self) -> None:
+        """
+        Reevaluates the ignored mod files and the aggregated states of all mods.
+        """
+
+        self.__ignored = {}
+        self.__mod_states = {}
+
+        not_ignored: set[str] = set(
+            self.__masterlist.filter_ignored(
+                modfile.name
+                for key in self.__parent_keys
+                for modfile in self.__get_mod(key).modfiles
+            )
+        )
+
+        for key in self.__parent_keys:
+            mod: Mod = self.__get_mod(key)
+
+            for modfile in mod.modfiles:
+                ignored: bool = modfile.name not in not_ignored
+                self.__ignored[id(modfile)] = ignored
+                if ignored:
+                    self.__checked[id(modfile)] = False
+
+            self.__update_mod_state(key)
+
+    def __update_mod_state(self, key: int) -> None:
+        self.__mod_states[key] = max(
+            (
+                modfile.status
+                for modfile in self.__get_mod(key).modfiles
+                if not self.__ignored[id(modfile)]
+            ),
+            default=TranslationStatus.NoneStatus,
+        )
+
+    def __is_modfile_visible(self, modfile: ModFile) -> bool:
+        if self.__state_filter is not None and modfile.status not in self.__state_filter:
+            return False
+
+        if self.__type_filter is not None and not isinstance(
+            modfile, self.__type_filter
+        ):
+            return False
+
+        return self.__matches_name_filter(modfile.name)
+
+    def __is_mod_visible(self, mod: Mod, visible_children: list[Any]) -> bool:
+        if visible_children:
+            return True
+
+        return self.__matches_name_filter(mod.name) and (
+            self.__state_filter is None
+            or TranslationStatus.NoneStatus in self.__state_filter
+        )
+
+    def __matches_name_filter(self, name: str) -> bool:
+        if self.__name_filter is None:
+            return True
+
+        return matches_filter(name, self.__name_filter[0], self.__name_filter[1])
+
+    def __filter(
+        self,
+    ) -> tuple[list[int], dict[int, list[int]], dict[int, list[ModFile]]]:
+        """
+        Filters the modlist with the current filters.
+
+        Returns:
+            tuple[list[int], dict[int, list[int]], dict[int, list[ModFile]]]:
+                The keys of the visible top-level rows, the keys of the visible mods
+                by separator and the visible mod files by mod.
+        """
+
+        visible_modfiles: dict[int, list[ModFile]] = {
+            key: [
+                modfile
+                for modfile in self.__get_mod(key).modfiles
+                if self.__is_modfile_visible(modfile)
+            ]
+            for key in self.__parent_keys
+            if key not in self.__children
+        }
+
+        def is_visible(key: int) -> bool:
+            return key in visible_modfiles and self.__is_mod_visible(
+                self.__get_mod(key), visible_modfiles[key]
+            )
+
+        visible_children: dict[int, list[int]] = {
+            separator_key: [key for key in mod_keys if is_visible(key)]
+            for separator_key, mod_keys in self.__children.items()
+        }
+        visible_top_level: list[int] = [
+            key
+            for key in self.__top_level
+            if is_visible(key)
+            or (
+                key in visible_children
+                and self.__is_mod_visible(self.__get_mod(key), visible_children[key])
+            )
+        ]
+
+        return visible_top_level, visible_children, visible_modfiles
+
+    def __set_visible_rows(
+        self,
+        visible_top_level: list[int],
+        visible_children: dict[int, list[int]],
+        visible_modfiles: dict[int, list[ModFile]],
+    ) -> None:
+        self.__visible_top_level = visible_top_level
+        self.__visible_modfiles = visible_modfiles
+        self.__rows = {key: row for row, key in enumerate(visible_top_level)}
+
+        # mods of hidden separators are hidden as well
+        self.__visible_children = {}
+        for separator_key, mod_keys in visible_children.items():
+            if separator_key in self.__rows:
+                self.__visible_children[separator_key] = mod_keys
+                self.__rows.update((key, row) for row, key in enumerate(mod_keys))
+            else:
+                self.__visible_children[separator_key] = []
+
+        self.__modfile_rows = {
+            id(modfile): row
+            for key, modfiles in visible_modfiles.items()
+            if key in self.__rows
+            for row, modfile in enumerate(modfiles)
+        }
+
+    def __iter_visible_mods(self) -> Iterable[int]:
+        for key in self.__visible_top_level:
+            if key in self.__children:
+                yield from self.__visible_children[key]
+            else:
+                yield key
+
+    def __apply_filter(self) -> None:
+        start: float = time.perf_counter()
+        self.layoutAboutToBeChanged.emit()
+
+        old_indexes: list[QModelIndex] = self.persistentIndexList()
+        old_items: list[tuple[Optional[Mod | ModFile], int]] = [
+            (self.get_item(index), index.column()) for index in old_indexes
+        ]
+
+        self.__set_visible_rows(*self.__filter())
+
+        self.changePersistentIndexList(
+            old_indexes,
+            [
+                self.index_of(item, column) if item is not None else QModelIndex()
+                for item, column in old_items
+            ],
+        )
+        self.layoutChanged.emit()
+
+        self.log.debug(
+            f"Filtered modlist in {(time.perf_counter() - start) * 1000:.1f} ms."
+        )
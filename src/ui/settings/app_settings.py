@@ -31,6 +31,8 @@ from PySide6.QtWidgets import (
 )
 
 from core.config.app_config import AppConfig
+from core.translation_provider.provider_api import ProviderApi
+from core.translator.translator import Translator
 from core.utilities.localisation import Language
 
 
@@ -328,6 +330,9 @@ class AppSettings(SettingsPage[AppConfig]):
         behavior_flayout.addRow(self.__double_click_strings)
 
     def __clear_cache(self) -> None:
+        # the translator and web caches keep their database files open
+        Translator.close_cache()
+        ProviderApi.close_web_cache()
         self.__cache.clear_caches()
         self.__clear_cache_button.setText(
             self.tr(
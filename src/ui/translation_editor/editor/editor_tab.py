@@ -176,14 +176,15 @@ class EditorTab(QWidget):
 
     def __init_strings_widget(self) -> None:
         self.__strings_widget = StringsWidget(self.__editor.strings)
-        self.__strings_widget.itemSelectionChanged.connect(
-            lambda: self.__tool_bar.set_edit_actions_enabled(
+        self.__strings_widget.selectionModel().selectionChanged.connect(
+            lambda *_: self.__tool_bar.set_edit_actions_enabled(
                 len(self.__strings_widget.get_selected_strings()) > 0
             ),
         )
         self.__vlayout.addWidget(self.__strings_widget)
-        self.__strings_widget.itemActivated.connect(
-            lambda item, col: self.__edit_string()
+        self.__strings_widget.activated.connect(lambda index: self.__edit_string())
+        self.__strings_widget.visible_strings_changed.connect(
+            lambda: self.__strings_num_label.display(self.get_visible_string_count())
         )
         self.__strings_num_label.setDigitCount(
             max((len(str(self.__strings_widget.get_visible_string_count())), 4))
@@ -394,7 +395,8 @@ class EditorTab(QWidget):
         """
 
         modified_strings: int = self.__editor.apply_database(
-            self.__strings_widget.get_selected_strings()
+            self.__strings_widget.get_selected_strings(),
+            thread_num=self.__app_config.worker_thread_num,
         )
 
         messagebox = QMessageBox(QApplication.activeModalWidget())
@@ -0,0 +1,639 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import logging
+from bisect import bisect_right
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from enum import Enum, auto
+from pathlib import Path
+from typing import Any, Optional, TypeAlias, override
+
+from cutleast_core_lib.core.utilities.filter import matches_filter
+from cutleast_core_lib.core.utilities.truncate import raw_string
+from PySide6.QtCore import (
+    QAbstractItemModel,
+    QModelIndex,
+    QObject,
+    QPersistentModelIndex,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QFont
+
+from core.string.string_status import StringStatus
+from core.string.types import String, StringList
+
+StringGroup: TypeAlias = tuple[Optional[Path], StringList]
+"""
+A group of strings and its name. The name is None if the strings are not grouped.
+"""
+
+_ModelIndex: TypeAlias = QModelIndex | QPersistentModelIndex
+
+
+class StringItemModel(QAbstractItemModel):
+    """
+    Virtual item model for displaying large lists of strings in a `QTreeView`.
+
+    The model doesn't create an item per string. Instead, the displayed text, colors and
+    tooltips of a row are only computed when the view requests them for a visible row.
+    Filtering and sorting are done in a background thread and the result is applied
+    in a single layout change, preserving the selection and the expanded groups.
+
+    If the strings are grouped, the groups are the top-level rows and the strings are
+    their children. Otherwise the strings are the top-level rows.
+    """
+
+    class Column(Enum):
+        """Enum for the available columns."""
+
+        Id = auto()
+        """The display id of a string."""
+
+        Original = auto()
+        """The original text of a string."""
+
+        String = auto()
+        """The translated text of a string or its original text if it has none."""
+
+    StringRole: int = Qt.ItemDataRole.UserRole
+    """Item data role for getting the `String` of a row."""
+
+    filter_applied = Signal()
+    """
+    This signal gets emitted after the filtered and sorted rows have been applied.
+    """
+
+    __result_ready = Signal(int, object)
+    """
+    This signal gets emitted from the filter thread when a filter result is ready.
+
+    Args:
+        int: The generation of the filter request.
+        object: The filtered and sorted groups.
+    """
+
+    __executor: ThreadPoolExecutor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="StringItemModel"
+    )
+    """Executor shared by all models for filtering and sorting their strings."""
+
+    __groups: list[StringGroup]
+    __nested: bool
+    __columns: list[Column]
+    __colored: bool
+    __status_sort: bool
+    __truncate: bool
+    __id_font: Optional[QFont]
+
+    __text_filter: Optional[tuple[str, bool]] = None
+    __state_filter: Optional[list[StringStatus]] = None
+    __sort_column: int = -1
+    __sort_order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+
+    __rows: list[StringGroup]
+    """The visible groups with their visible strings in display order."""
+
+    __offsets: list[int]
+    """The number of visible strings before each visible group."""
+
+    __positions: dict[int, tuple[int, int]]
+    """Mapping of string ids (`id(string)`) to their group row and row."""
+
+    __group_rows: dict[Path, int]
+    """Mapping of group names to their row."""
+
+    __generation: int = 0
+    __pending: Optional[Future] = None
+
+    log: logging.Logger = logging.getLogger("StringItemModel")
+
+    def __init__(
+        self,
+        strings: StringList | dict[Path, StringList],
+        columns: list[Column],
+        colored: bool = True,
+        status_sort: bool = False,
+        truncate: bool = True,
+        id_font: Optional[QFont] = None,
+        sort_column: int = -1,
+        sort_order: Qt.SortOrder = Qt.SortOrder.AscendingOrder,
+        parent: Optional[QObject] = None,
+    ) -> None:
+        """
+        Args:
+            strings (StringList | dict[Path, StringList]):
+                The strings to display, either as a flat list or grouped by a name.
+                The groups are displayed in the order of the dictionary.
+            columns (list[Column]): The columns to display.
+            colored (bool, optional):
+                Whether to color the strings by their status. Defaults to True.
+            status_sort (bool, optional):
+                Whether to sort the strings by their status before the sort column.
+                Defaults to False.
+            truncate (bool, optional):
+                Whether to truncate long texts in the displayed rows. Defaults to True.
+            id_font (Optional[QFont], optional):
+                The font for the id column. Defaults to None.
+            sort_column (int, optional):
+                The initial sort column or -1 to keep the original order. Defaults to
+                -1.
+            sort_order (Qt.SortOrder, optional):
+                The initial sort order. Defaults to Qt.SortOrder.AscendingOrder.
+            parent (Optional[QObject], optional): The parent object. Defaults to None.
+        """
+
+        super().__init__(parent)
+
+        if isinstance(strings, dict):
+            self.__groups = list(strings.items())
+            self.__nested = True
+        else:
+            self.__groups = [(None, strings)]
+            self.__nested = False
+
+        self.__columns = columns
+        self.__colored = colored
+        self.__status_sort = status_sort
+        self.__truncate = truncate
+        self.__id_font = id_font
+        self.__sort_column = sort_column
+        self.__sort_order = sort_order
+
+        # results are always applied by the event loop, even if they are delivered
+        # by the thread of the model
+        self.__result_ready.connect(
+            self.__apply_result, Qt.ConnectionType.QueuedConnection
+        )
+        self.__set_rows(self.__filter_and_sort())
+
+    @property
+    def nested(self) -> bool:
+        """
+        Whether the strings are grouped.
+        """
+
+        return self.__nested
+
+    @property
+    def columns(self) -> list[Column]:
+        """
+        The displayed columns.
+        """
+
+        return self.__columns
+
+    @property
+    def sort_column(self) -> int:
+        """
+        The column the strings are sorted by or -1 if they are not sorted.
+        """
+
+        return self.__sort_column
+
+    @property
+    def sort_order(self) -> Qt.SortOrder:
+        """
+        The order the strings are sorted in.
+        """
+
+        return self.__sort_order
+
+    def set_text_filter(self, text: Optional[str], case_sensitive: bool) -> None:
+        """
+        Sets the text filter and refilters the strings in the background.
+
+        Args:
+            text (Optional[str]): The text to filter by or None to disable the filter.
+            case_sensitive (bool): Case sensitivity.
+        """
+
+        if text is not None and text.strip():
+            self.__text_filter = (text, case_sensitive)
+        else:
+            self.__text_filter = None
+
+        self.refresh()
+
+    def set_state_filter(self, states: Optional[list[StringStatus]]) -> None:
+        """
+        Sets the state filter and refilters the strings in the background.
+
+        Args:
+            states (Optional[list[StringStatus]]):
+                The states to filter by or None to disable the filter.
+        """
+
+        self.__state_filter = states
+        self.refresh()
+
+    def refresh(self) -> None:
+        """
+        Refilters and resorts the strings in the background, for example after their
+        texts or states have changed. Pending refreshes are discarded.
+        """
+
+        self.__generation += 1
+        generation: int = self.__generation
+
+        if self.__pending is not None:
+            self.__pending.cancel()
+
+        future: Future[list[StringGroup]] = StringItemModel.__executor.submit(
+            self.__filter_and_sort
+        )
+        future.add_done_callback(lambda f: self.__deliver_result(generation, f))
+        self.__pending = future
+
+    def get_string(self, index: _ModelIndex) -> Optional[String]:
+        """
+        Gets the string of a row.
+
+        Args:
+            index (QModelIndex | QPersistentModelIndex): The index of the row.
+
+        Returns:
+            Optional[String]: The string or None if the row is a group.
+        """
+
+        if not index.isValid():
+            return None
+
+        if not self.__nested:
+            return self.__rows[0][1][index.row()]
+
+        group_id: int = index.internalId()
+        if group_id == 0:
+            return None
+
+        return self.__rows[group_id - 1][1][index.row()]
+
+    def get_group(self, index: _ModelIndex) -> Optional[Path]:
+        """
+        Gets the group name of a group row.
+
+        Args:
+            index (QModelIndex | QPersistentModelIndex): The index of the row.
+
+        Returns:
+            Optional[Path]: The group name or None if the row is a string.
+        """
+
+        if not index.isValid() or not self.__nested or index.internalId() != 0:
+            return None
+
+        return self.__rows[index.row()][0]
+
+    def index_of_string(self, string: String, column: int = 0) -> QModelIndex:
+        """
+        Gets the index of a visible string.
+
+        Args:
+            string (String): The string.
+            column (int, optional): The column of the index. Defaults to 0.
+
+        Returns:
+            QModelIndex: The index or an invalid index if the string is not visible.
+        """
+
+        position: Optional[tuple[int, int]] = self.__positions.get(id(string))
+        if position is None:
+            return QModelIndex()
+
+        group_row, row = position
+        return self.createIndex(row, column, group_row + 1 if self.__nested else 0)
+
+    def index_of_group(self, group: Path, column: int = 0) -> QModelIndex:
+        """
+        Gets the index of a visible group.
+
+        Args:
+            group (Path): The group name.
+            column (int, optional): The column of the index. Defaults to 0.
+
+        Returns:
+            QModelIndex: The index or an invalid index if the group is not visible.
+        """
+
+        group_row: Optional[int] = self.__group_rows.get(group)
+        if group_row is None:
+            return QModelIndex()
+
+        return self.createIndex(group_row, column, 0)
+
+    def get_groups(self) -> list[Path]:
+        """
+        Returns:
+            list[Path]: The names of all groups, including the filtered ones.
+        """
+
+        return [group for group, _ in self.__groups if group is not None]
+
+    def get_all_strings(self) -> StringList:
+        """
+        Returns:
+            StringList: All strings, including the filtered ones.
+        """
+
+        return [string for _, strings in self.__groups for string in strings]
+
+    def get_visible_strings(self) -> StringList:
+        """
+        Returns:
+            StringList: The visible strings in display order.
+        """
+
+        return [string for _, strings in self.__rows for string in strings]
+
+    def get_visible_string_count(self) -> int:
+        """
+        Returns:
+            int: The number of visible strings.
+        """
+
+        return self.__offsets[-1] if self.__offsets else 0
+
+    def get_visible_position(self, string: String) -> int:
+        """
+        Gets the position of a string within the visible strings.
+
+        Args:
+            string (String): The string.
+
+        Raises:
+            ValueError: when the string is not visible.
+
+        Returns:
+            int: The position.
+        """
+
+        position: Optional[tuple[int, int]] = self.__positions.get(id(string))
+        if position is None:
+            raise ValueError(f"String is not visible: {string}")
+
+        group_row, row = position
+        return self.__offsets[group_row] + row
+
+    def get_visible_string(self, position: int) -> Optional[String]:
+        """
+        Gets a string by its position within the visible strings.
+
+        Args:
+            position (int): The position.
+
+        Returns:
+            Optional[String]: The string or None if there is none at the position.
+        """
+
+        if position < 0 or position >= self.get_visible_string_count():
+            return None
+
+        group_row: int = bisect_right(self.__offsets, position) - 1
+        # skip empty groups with the same offset
+        while len(self.__rows[group_row][1]) <= position - self.__offsets[group_row]:
+            group_row += 1
+
+        return self.__rows[group_row][1][position - self.__offsets[group_row]]
+
+    @override
+    def index(
+        self, row: int, column: int, parent: Optional[_ModelIndex] = None
+    ) -> QModelIndex:
+        if parent is None or not parent.isValid():
+            parent = QModelIndex()
+
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        if not parent.isValid():
+            return self.createIndex(row, column, 0)
+
+        return self.createIndex(row, column, parent.row() + 1)
+
+    @override
+    def parent(self, index: Optional[_ModelIndex] = None) -> Any:  # type: ignore[override]
+        if index is None:
+            # QObject.parent()
+            return super().parent()
+
+        if not index.isValid() or not self.__nested or index.internalId() == 0:
+            return QModelIndex()
+
+        return self.createIndex(index.internalId() - 1, 0, 0)
+
+    @override
+    def rowCount(self, parent: Optional[_ModelIndex] = None) -> int:
+        if parent is None or not parent.isValid():
+            return len(self.__rows) if self.__nested else len(self.__rows[0][1])
+
+        if self.__nested and parent.internalId() == 0 and parent.column() == 0:
+            return len(self.__rows[parent.row()][1])
+
+        return 0
+
+    @override
+    def columnCount(self, parent: Optional[_ModelIndex] = None) -> int:
+        return len(self.__columns)
+
+    @override
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            orientation != Qt.Orientation.Horizontal
+            or role != Qt.ItemDataRole.DisplayRole
+        ):
+            return None
+
+        match self.__columns[section]:
+            case StringItemModel.Column.Id:
+                return self.tr("ID")
+            case StringItemModel.Column.Original:
+                return self.tr("Original")
+            case StringItemModel.Column.String:
+                return self.tr("String")
+
+    @override
+    def data(self, index: _ModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        string: Optional[String] = self.get_string(index)
+        if string is None:
+            if role == Qt.ItemDataRole.DisplayRole and index.column() == 0:
+                return str(self.get_group(index))
+
+            return None
+
+        column: StringItemModel.Column = self.__columns[index.column()]
+        match role:
+            case Qt.ItemDataRole.DisplayRole:
+                if column == StringItemModel.Column.Id:
+                    return string.display_id
+
+                text: str = StringItemModel.__get_text(string, column)
+                if self.__truncate:
+                    return raw_string(text)
+
+                return raw_string(text, max_length=None)
+
+            case Qt.ItemDataRole.ToolTipRole:
+                return StringItemModel.__get_text(string, column)
+
+            case Qt.ItemDataRole.ForegroundRole if self.__colored:
+                return StringStatus.get_color(string.status)
+
+            case Qt.ItemDataRole.FontRole if column == StringItemModel.Column.Id:
+                return self.__id_font
+
+            case StringItemModel.StringRole:
+                return string
+
+        return None
+
+    @override
+    def sort(
+        self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder
+    ) -> None:
+        if column == self.__sort_column and order == self.__sort_order:
+            return
+
+        self.__sort_column = column
+        self.__sort_order = order
+        self.refresh()
+
+    @staticmethod
+    def __get_text(string: String, column: Column) -> str:
+        match column:
+            case StringItemModel.Column.Id:
+                return string.display_id
+            case StringItemModel.Column.Original:
+                return string.original
+            case StringItemModel.Column.String:
+                return string.string if string.string is not None else string.original
+
+    def __filter_and_sort(self) -> list[StringGroup]:
+        """
+        Filters and sorts the strings. This method is thread-safe as long as the
+        strings are not modified in the meantime.
+
+        Returns:
+            list[StringGroup]: The visible groups with their visible strings.
+        """
+
+        text_filter: Optional[tuple[str, bool]] = self.__text_filter
+        state_filter: Optional[list[StringStatus]] = self.__state_filter
+
+        def matches(string: String) -> bool:
+            if state_filter is not None and string.status not in state_filter:
+                return False
+
+            if text_filter is None:
+                return True
+
+            return any(
+                matches_filter(text, text_filter[0], text_filter[1])
+                for text in (
+                    string.display_id,
+                    string.original,
+                    string.string or "",
+                )
+            )
+
+        sort_key: Optional[Callable[[String], Any]] = None
+        if 0 <= self.__sort_column < len(self.__columns):
+            column: StringItemModel.Column = self.__columns[self.__sort_column]
+            status_sort: bool = self.__status_sort
+
+            def sort_key(string: String) -> Any:
+                text: str = StringItemModel.__get_text(string, column)
+
+                # strings with a "higher" status come first
+                return (-string.status.value, text) if status_sort else text
+
+        reverse: bool = self.__sort_order == Qt.SortOrder.DescendingOrder
+
+        rows: list[StringGroup] = []
+        for group, strings in self.__groups:
+            visible_strings: StringList = [s for s in strings if matches(s)]
+            if sort_key is not None:
+                visible_strings.sort(key=sort_key, reverse=reverse)
+
+            # groups matching the text filter stay visible if there is no state filter
+            if (
+                not self.__nested
+                or visible_strings
+                or (
+                    state_filter is None
+                    and (
+                        text_filter is None
+                        or matches_filter(str(group), text_filter[0], text_filter[1])
+                    )
+                )
+            ):
+                rows.append((group, visible_strings))
+
+        return rows
+
+    def __set_rows(self, rows: list[StringGroup]) -> None:
+        self.__rows = rows
+        self.__offsets = [0]
+        self.__positions = {}
+        self.__group_rows = {}
+
+        for group_row, (group, strings) in enumerate(rows):
+            if group is not None:
+                self.__group_rows[group] = group_row
+
+            self.__offsets.append(self.__offsets[-1] + len(strings))
+            for row, string in enumerate(strings):
+                self.__positions[id(string)] = (group_row, row)
+
+    def __deliver_result(self, generation: int, future: Future) -> None:
+        if future.cancelled():
+            return
+
+        exception: Optional[BaseException] = future.exception()
+        if exception is not None:
+            self.log.error(f"Failed to filter strings: {exception}", exc_info=exception)
+            return
+
+        try:
+            self.__result_ready.emit(generation, future.result())
+        except RuntimeError:
+            # the model has been deleted in the meantime
+            pass
+
+    def __apply_result(self, generation: int, rows: list[StringGroup]) -> None:
+        if generation != self.__generation:
+            return
+
+        self.__pending = None
+        self.layoutAboutToBeChanged.emit()
+
+        old_indexes: list[QModelIndex] = self.persistentIndexList()
+        old_items: list[tuple[Optional[String | Path], int]] = [
+            (self.get_string(index) or self.get_group(index), index.column())
+            for index in old_indexes
+        ]
+
+        self.__set_rows(rows)
+
+        new_indexes: list[QModelIndex] = []
+        for item, column in old_items:
+            if isinstance(item, Path):
+                new_indexes.append(self.index_of_group(item, column))
+            elif item is not None:
+                new_indexes.append(self.index_of_string(item, column))
+            else:
+                new_indexes.append(QModelIndex())
+
+        self.changePersistentIndexList(old_indexes, new_indexes)
+        self.layoutChanged.emit()
+
+        self.filter_applied.emit()
@@ -5,32 +5,28 @@ Copyright (c) Cutleast
 from pathlib import Path
 from typing import Optional, TypeAlias
 
-from cutleast_core_lib.core.utilities.reference_dict import ReferenceDict
-from cutleast_core_lib.core.utilities.truncate import raw_string
-from cutleast_core_lib.ui.utilities.tree_widget import apply_text_filter
 from cutleast_core_lib.ui.widgets.lcd_number import LCDNumber
 from cutleast_core_lib.ui.widgets.search_bar import SearchBar
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QColor, QFont, QKeySequence, QShortcut
+from PySide6.QtCore import QModelIndex, Qt
+from PySide6.QtGui import QFont, QKeySequence, QShortcut
 from PySide6.QtWidgets import (
     QApplication,
     QDialog,
     QHBoxLayout,
     QLabel,
     QPlainTextEdit,
-    QTreeWidget,
-    QTreeWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
-from core.string.string_status import StringStatus
 from core.string.types import String, StringList
 from core.utilities.constants import STRING_AUTO_SEARCH_THRESHOLD
 from ui.utilities.theme_manager import ThemeManager
 
+from .string_item_model import StringItemModel
 from .string_list_menu import StringListMenu
 from .string_list_toolbar import StringListToolbar
+from .string_tree_view import StringTreeView
 
 Strings: TypeAlias = StringList | dict[Path, StringList]
 """
@@ -47,17 +43,14 @@ class StringListWidget(QWidget):
     __strings: Strings
     __nested: bool
     __translation_mode: bool
-    __columns: list[str]
-    __string_items: ReferenceDict[String, QTreeWidgetItem]
-
-    __state_filter: Optional[list[StringStatus]] = None
-    __text_filter: Optional[tuple[str, bool]] = None
+    __columns: list[StringItemModel.Column]
 
     __vlayout: QVBoxLayout
     __toolbar: StringListToolbar
     __search_bar: SearchBar
     __strings_num_label: LCDNumber
-    __strings_widget: QTreeWidget
+    __model: StringItemModel
+    __strings_widget: StringTreeView
     __menu: StringListMenu
 
     __copy_shortcut: QShortcut
@@ -77,21 +70,19 @@ class StringListWidget(QWidget):
         self.__translation_mode = translation_mode
         if translation_mode:
             self.__columns = [
-                self.tr("ID"),
-                self.tr("Original"),
-                self.tr("String"),
+                StringItemModel.Column.Id,
+                StringItemModel.Column.Original,
+                StringItemModel.Column.String,
             ]
         else:
-            self.__columns = [
-                self.tr("ID"),
-                self.tr("String"),
-            ]
+            self.__columns = [StringItemModel.Column.Id, StringItemModel.Column.String]
 
         self.__init_ui()
 
-        self.__toolbar.filter_changed.connect(self.__set_state_filter)
-        self.__search_bar.searchChanged.connect(self.__set_text_filter)
-        self.__strings_widget.itemActivated.connect(self.__show_string)
+        self.__toolbar.filter_changed.connect(self.__model.set_state_filter)
+        self.__search_bar.searchChanged.connect(self.__model.set_text_filter)
+        self.__model.filter_applied.connect(self.__update)
+        self.__strings_widget.activated.connect(self.__show_string)
         self.__strings_widget.customContextMenuRequested.connect(
             lambda *_: self.__menu.open(len(self.get_selected_items()))
         )
@@ -130,17 +121,17 @@ class StringListWidget(QWidget):
         hlayout.addWidget(self.__strings_num_label)
 
     def __init_strings_widget(self) -> None:
-        self.__strings_widget = QTreeWidget()
-        self.__strings_widget.setUniformRowHeights(True)
-        self.__strings_widget.setAlternatingRowColors(True)
-        self.__strings_widget.setSortingEnabled(True)
-        self.__strings_widget.sortByColumn(1, Qt.SortOrder.AscendingOrder)
-        self.__strings_widget.header().setFirstSectionMovable(True)
-        if not self.__nested:
-            self.__strings_widget.setIndentation(0)
-        self.__strings_widget.setSelectionMode(
-            QTreeWidget.SelectionMode.ExtendedSelection
+        self.__model = StringItemModel(
+            self.__strings,
+            self.__columns,
+            colored=self.__translation_mode,
+            truncate=False,
+            id_font=QFont(ThemeManager.get().get_theme().monospace_font),
+            sort_column=1,
         )
+
+        self.__strings_widget = StringTreeView(self.__model)
+        self.__strings_widget.header().setFirstSectionMovable(True)
         self.__strings_widget.setVerticalScrollBarPolicy(
             Qt.ScrollBarPolicy.ScrollBarAsNeeded
         )
@@ -149,34 +140,34 @@ class StringListWidget(QWidget):
         )
         self.__vlayout.addWidget(self.__strings_widget)
 
-        self.__strings_widget.setHeaderLabels(self.__columns)
-
     def __init_context_menu(self) -> None:
-        self.__menu = StringListMenu(self.__columns, self.__nested)
+        self.__menu = StringListMenu(
+            [
+                str(self.__model.headerData(c, Qt.Orientation.Horizontal))
+                for c in range(len(self.__columns))
+            ],
+            self.__nested,
+        )
 
         self.__strings_widget.setContextMenuPolicy(
             Qt.ContextMenuPolicy.CustomContextMenu
         )
 
     def __update(self) -> None:
-        apply_text_filter(
-            widget=self.__strings_widget,
-            text=self.__text_filter[0] if self.__text_filter else "",
-            case_sensitive=self.__text_filter[1] if self.__text_filter else False,
-        )
-
         self.__strings_num_label.display(self.get_visible_item_count())
 
-    def __show_string(self, item: QTreeWidgetItem, column_index: int) -> None:
-        column: str = self.__columns[column_index]
+    def __show_string(self, index: QModelIndex) -> None:
+        column: StringItemModel.Column = self.__columns[index.column()]
 
-        if column not in [self.tr("Original"), self.tr("String")]:
+        if column not in [
+            StringItemModel.Column.Original,
+            StringItemModel.Column.String,
+        ]:
             return
 
-        strings: dict[QTreeWidgetItem, String] = {
-            item: string for string, item in self.__string_items.items()
-        }
-        string: String = strings[item]
+        string: Optional[String] = self.__model.get_string(index)
+        if string is None:
+            return
 
         # TODO: Add info box with details about the string
         dialog = QDialog(self)
@@ -188,12 +179,7 @@ class StringListWidget(QWidget):
 
         textbox = QPlainTextEdit()
         textbox.setReadOnly(True)
-        if column == self.tr("Original"):
-            textbox.setPlainText(string.original)
-        else:
-            textbox.setPlainText(
-                string.string if string.string is not None else string.original
-            )
+        textbox.setPlainText(index.data(Qt.ItemDataRole.ToolTipRole))
         textbox.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
         textbox.setCursor(Qt.CursorShape.IBeamCursor)
         textbox.setFocus()
@@ -202,29 +188,7 @@ class StringListWidget(QWidget):
         dialog.exec()
 
     def __init_strings(self) -> None:
-        self.__strings_widget.clear()
-        self.__string_items = ReferenceDict()
-
-        item: QTreeWidgetItem
-        if self.__nested and isinstance(self.__strings, dict):
-            for separator_name, strings in self.__strings.items():
-                separator_item = QTreeWidgetItem([str(separator_name)])
-
-                for string in strings:
-                    item = self.__create_string_item(string)
-                    separator_item.addChild(item)
-                    self.__string_items[string] = item
-
-                self.__strings_widget.addTopLevelItem(separator_item)
-                separator_item.setFirstColumnSpanned(True)
-
-        elif isinstance(self.__strings, list):
-            for string in self.__strings:
-                item = self.__create_string_item(string)
-                self.__string_items[string] = item
-                self.__strings_widget.addTopLevelItem(item)
-
-        self.__strings_widget.expandAll()
+        string_count: int = len(self.__model.get_all_strings())
 
         if self.__translation_mode:
             self.__strings_widget.header().resizeSection(0, 500)
@@ -234,67 +198,26 @@ class StringListWidget(QWidget):
             self.__strings_widget.header().resizeSection(0, 650)
             self.__strings_widget.header().resizeSection(1, 650)
 
-        if self.__nested and self.__strings_widget.topLevelItemCount() > 1:
+        if self.__nested and self.__model.rowCount() > 1:
             self.__strings_widget.collapseAll()
-
-        self.__search_bar.setLiveMode(
-            len(self.__string_items) <= STRING_AUTO_SEARCH_THRESHOLD
-        )
-        self.__strings_num_label.setDigitCount(
-            max((len(str(len(self.__string_items))), 4))
-        )
-        self.__update()
-
-    def __create_string_item(self, string: String) -> QTreeWidgetItem:
-        item = QTreeWidgetItem(
-            [
-                string.display_id,
-                raw_string(string.original, max_length=None),
-                raw_string(
-                    string.string if string.string is not None else string.original,
-                    max_length=None,
-                ),
-            ]
-        )
-
-        item.setToolTip(0, string.display_id)
-        item.setToolTip(1, string.original)
-        item.setToolTip(
-            2, string.string if string.string is not None else string.original
-        )
-
-        if self.__translation_mode:
-            color: Optional[QColor] = StringStatus.get_color(string.status)
-            if color:
-                for c in range(len(self.__columns)):
-                    item.setForeground(c, color)
-
-        item.setFont(0, QFont(ThemeManager.get().get_theme().monospace_font))
-
-        return item
-
-    def __set_text_filter(self, text_filter: str, case_sensitive: bool) -> None:
-        if text_filter.strip():
-            self.__text_filter = (text_filter, case_sensitive)
         else:
-            self.__text_filter = None
-        self.__update()
+            self.__strings_widget.expandAll()
 
-    def __set_state_filter(self, state_filter: list[StringStatus]) -> None:
-        self.__state_filter = state_filter
+        self.__search_bar.setLiveMode(string_count <= STRING_AUTO_SEARCH_THRESHOLD)
+        self.__strings_num_label.setDigitCount(max((len(str(string_count)), 4)))
         self.__update()
 
     def __copy_selected(self, columns: Optional[list[int]] = None) -> None:
-        clipboard_text: str = ""
-        for item in self.__string_items.values():
-            if not item.isSelected():
-                continue
-
-            if columns is None:
-                columns = list(range(len(self.__columns)))
+        if columns is None:
+            columns = list(range(len(self.__columns)))
 
+        clipboard_text: str = ""
+        for string in self.get_selected_items():
             for c in columns:
-                clipboard_text += f"'{item.toolTip(c)}'"[1:-1] + "\t"
+                text: str = self.__model.index_of_string(string, c).data(
+                    Qt.ItemDataRole.ToolTipRole
+                )
+                clipboard_text += text + "\t"
 
             clipboard_text = clipboard_text.removesuffix("\t")
             clipboard_text += "\n"
@@ -307,9 +230,7 @@ class StringListWidget(QWidget):
             int: The number of currently visible strings.
         """
 
-        return len(
-            [item for item in self.__string_items.values() if not item.isHidden()]
-        )
+        return self.__model.get_visible_string_count()
 
     def get_selected_items(self) -> StringList:
         """
@@ -317,6 +238,4 @@ class StringListWidget(QWidget):
             StringList: A list of currently selected strings.
         """
 
-        return [
-            string for string, item in self.__string_items.items() if item.isSelected()
-        ]
+        return self.__strings_widget.get_selected_strings()
@@ -0,0 +1,130 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+from typing import Optional, override
+
+from PySide6.QtCore import QModelIndex
+from PySide6.QtWidgets import QTreeView
+
+from core.string.types import String, StringList
+
+from .string_item_model import StringItemModel
+
+
+class StringTreeView(QTreeView):
+    """
+    Tree view for displaying the strings of a `StringItemModel`.
+
+    Keeps the groups expanded or collapsed and the current string in view when the
+    strings are filtered.
+    """
+
+    __model: StringItemModel
+
+    __collapsed_groups: set[Path]
+    """Groups that have been collapsed by the user."""
+
+    def __init__(self, model: StringItemModel) -> None:
+        """
+        Args:
+            model (StringItemModel): The model to display.
+        """
+
+        super().__init__()
+
+        self.__model = model
+        self.__collapsed_groups = set()
+        model.setParent(self)
+
+        self.setModel(model)
+        self.setUniformRowHeights(True)
+        self.setAlternatingRowColors(True)
+        self.setSelectionMode(QTreeView.SelectionMode.ExtendedSelection)
+        self.setRootIsDecorated(model.nested)
+        if not model.nested:
+            self.setIndentation(0)
+
+        # the model is already sorted, so the indicator is set before enabling sorting
+        self.header().setSortIndicator(model.sort_column, model.sort_order)
+        self.setSortingEnabled(True)
+
+        self.expanded.connect(self.__on_expanded)
+        self.collapsed.connect(self.__on_collapsed)
+        model.filter_applied.connect(self.__on_filter_applied)
+
+        self.__update_groups()
+
+    @property
+    def string_model(self) -> StringItemModel:
+        """
+        The displayed model.
+        """
+
+        return self.__model
+
+    def get_selected_strings(self) -> StringList:
+        """
+        Returns:
+            StringList: The selected strings in display order.
+        """
+
+        selected_ids: set[int] = {
+            id(string)
+            for index in self.selectionModel().selectedRows()
+            if (string := self.__model.get_string(index)) is not None
+        }
+
+        if not selected_ids:
+            return []
+
+        return [
+            string
+            for string in self.__model.get_visible_strings()
+            if id(string) in selected_ids
+        ]
+
+    def get_current_string(self) -> Optional[String]:
+        """
+        Returns:
+            Optional[String]: The current string or None if there is none.
+        """
+
+        return self.__model.get_string(self.currentIndex())
+
+    @override
+    def expandAll(self) -> None:
+        self.__collapsed_groups.clear()
+        super().expandAll()
+
+    @override
+    def collapseAll(self) -> None:
+        self.__collapsed_groups.update(self.__model.get_groups())
+        super().collapseAll()
+
+    def __on_expanded(self, index: QModelIndex) -> None:
+        group: Optional[Path] = self.__model.get_group(index)
+        if group is not None:
+            self.__collapsed_groups.discard(group)
+
+    def __on_collapsed(self, index: QModelIndex) -> None:
+        group: Optional[Path] = self.__model.get_group(index)
+        if group is not None:
+            self.__collapsed_groups.add(group)
+
+    def __update_groups(self) -> None:
+        if not self.__model.nested:
+            return
+
+        for row in range(self.__model.rowCount()):
+            index: QModelIndex = self.__model.index(row, 0)
+            group: Optional[Path] = self.__model.get_group(index)
+            self.setFirstColumnSpanned(row, QModelIndex(), True)
+            self.setExpanded(index, group not in self.__collapsed_groups)
+
+    def __on_filter_applied(self) -> None:
+        self.__update_groups()
+
+        if self.currentIndex().isValid():
+            self.scrollTo(self.currentIndex(), QTreeView.ScrollHint.PositionAtCenter)
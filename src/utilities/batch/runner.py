@@ -111,7 +111,11 @@ class BatchRunner(Singleton):
         self.log.info("Loading user data...")
 
         service: UserDataService = UserDataService.get()
-        user_data: UserData = service.load(self.__app_config.worker_thread_num, pdisplay)
+        user_data: UserData = service.load(
+            self.__app_config.worker_thread_num,
+            pdisplay,
+            self.__app_config.use_packed_translation_format,
+        )
 
         self.log.info("User data loaded.")
         return user_data
@@ -169,12 +173,13 @@ class BatchRunner(Singleton):
         state_service: StateService = self.__component_provider.get_state_service()
         mod_instance: ModInstance = self.__user_data.mod_instance
 
+        not_ignored: set[str] = set(
+            self.__user_data.masterlist.filter_ignored(
+                mf.name for mf in mod_instance.modfiles
+            )
+        )
         items: dict[Mod, list[ModFile]] = {
-            mod: [
-                mf
-                for mf in mod.modfiles
-                if not self.__user_data.masterlist.is_ignored(mf.name)
-            ]
+            mod: [mf for mf in mod.modfiles if mf.name in not_ignored]
             for mod in mod_instance.mods
         }
 
@@ -255,7 +260,7 @@ class BatchRunner(Singleton):
                 translation: Translation = DatabaseService.create_blank_translation(
                     archive_path.stem, strings, database
                 )
-                translation.save()
+                DatabaseService.save_translation(translation, database)
                 DatabaseService.add_translation(translation, database)
                 self.log.info(
                     f"Imported translation '{archive_path.stem}' with strings "
@@ -292,6 +297,7 @@ class BatchRunner(Singleton):
             translations=self.__user_data.database.user_translations,
             user_config=self.__user_data.user_config,
             pdisplay=pdisplay,
+            thread_num=self.__app_config.worker_thread_num,
         )
 
         self.log.info(f"Output mod built at '{output_path}'.")
@@ -4,8 +4,10 @@ Copyright (c) Cutleast
 
 import json
 import logging
+import os
 import sys
 from argparse import ArgumentParser, Namespace, _SubParsersAction  # type: ignore
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, NoReturn, Optional, override
 
@@ -16,7 +18,7 @@ from sse_plugin_interface.plugin_string import PluginString
 
 from core.file_types.plugin.file import PluginFile
 from core.string.base_string import BaseString
-from core.string_table_parser.string_table import StringTable
+from core.string_table_parser.buffered_string_table import BufferedStringTable
 from core.string_table_parser.string_table_parser import StringTableParser
 from core.utilities.constants import BASE_GAME_PLUGINS
 from core.utilities.filesystem import split_path_with_bsa
@@ -37,11 +39,19 @@ class DbGen(Utility):
     )
     LANGUAGE_ARG_NAME: str = "language"
     LANGUAGE_ARG_HELP: str = (
-        'Language of the translated strings files. Must not be "english"!'
+        'Language of the translated strings files. Must not be "english"! Use "*" to '
+        "create databases for all languages."
     )
     OUTPUT_PATH_ARG_ID: str = "output_path"
     OUTPUT_PATH_ARG_NAMES: tuple[str, str] = ("--output-path", "-o")
     OUTPUT_PATH_ARG_HELP: str = "Optional path to output folder"
+    MAX_WORKERS_ARG_ID: str = "max_workers"
+    MAX_WORKERS_ARG_NAMES: tuple[str, str] = ("--max-workers", "-j")
+    MAX_WORKERS_ARG_HELP: str = (
+        "Optional maximum number of worker processes (default: number of CPUs)"
+    )
+    ALL_LANGUAGES: str = "*"
+    """Language name for creating databases for all languages at once."""
     HELP: str = "Creates a translation database from a localized translation."
 
     VANILLA_STRINGS_BSAS: tuple[str, str] = (
@@ -71,6 +81,9 @@ class DbGen(Utility):
         subparser.add_argument(
             *DbGen.OUTPUT_PATH_ARG_NAMES, help=DbGen.OUTPUT_PATH_ARG_HELP
         )
+        subparser.add_argument(
+            *DbGen.MAX_WORKERS_ARG_NAMES, type=int, help=DbGen.MAX_WORKERS_ARG_HELP
+        )
 
     @override
     def run(self, args: Namespace, exit: bool = True) -> None | NoReturn:  # noqa: RUF020
@@ -91,6 +104,7 @@ class DbGen(Utility):
         output_folder_path: Optional[Path] = (
             Path(output_path_name) if output_path_name else None
         )
+        max_workers: Optional[int] = getattr(args, DbGen.MAX_WORKERS_ARG_ID)
 
         input_folder_path: Path
         strings_folder_path: Path
@@ -99,13 +113,16 @@ class DbGen(Utility):
         )
 
         if language_name is None:
-            # TODO: Add support for "*" to generate databases for all languages
             raise ValueError("Language is not specified!")
 
         logging.basicConfig(stream=sys.stdout, level=logging.DEBUG)
 
         self.create_database(
-            input_folder_path, strings_folder_path, language_name, output_folder_path
+            input_folder_path,
+            strings_folder_path,
+            language_name,
+            output_folder_path,
+            max_workers,
         )
 
         if exit:
@@ -117,65 +134,200 @@ class DbGen(Utility):
         strings_folder_path: Path,
         language_name: str,
         output_folder_path: Optional[Path] = None,
+        max_workers: Optional[int] = None,
     ) -> None:
         """
-        Creates a translation database from a localized translation.
+        Creates a translation database from a localized translation. The plugins are
+        processed independently by a pool of worker processes.
 
         Args:
             input_folder_path (Path): Folder with plugins.
             strings_folder_path (Path): Folder with strings files.
-            language_name (str): Name of the language.
+            language_name (str):
+                Name of the language or "*" to create a database for every language
+                found in the strings folder. In the latter case, the databases are
+                written to a subfolder per language.
             output_folder_path (Optional[Path], optional):
                 Path to output folder. Defaults to None.
+            max_workers (Optional[int], optional):
+                Maximum number of worker processes. Defaults to None (number of CPUs).
         """
 
         self.log.info("Creating translation database...")
 
-        original_string_tables: dict[str, dict[int, str]] = self.get_string_tables(
-            input_folder_path, input_folder_path, "english"
+        if output_folder_path is None:
+            output_folder_path = Path("dbgen_output")
+
+        plugin_paths: list[Path] = DbGen.get_plugin_paths(input_folder_path)
+        original_strings_files: dict[Path, list[Path]] = DbGen.map_strings_files(
+            input_folder_path, input_folder_path
         )
-        translated_string_tables: dict[str, dict[int, str]] = self.get_string_tables(
-            input_folder_path, strings_folder_path, language_name
+        translated_strings_files: dict[Path, list[Path]] = DbGen.map_strings_files(
+            input_folder_path, strings_folder_path
+        )
+
+        output_folders: dict[str, Path]
+        if language_name == DbGen.ALL_LANGUAGES:
+            output_folders = {
+                language: output_folder_path / language
+                for language in DbGen.get_languages(translated_strings_files)
+            }
+        else:
+            output_folders = {language_name.lower(): output_folder_path}
+
+        self.log.info(
+            f"Processing {len(plugin_paths)} plugin(s) for {len(output_folders)} "
+            f"language(s) with up to {max_workers or os.cpu_count()} process(es)..."
         )
-        plugin_paths: list[Path] = [
+
+        plugin_counts: dict[str, int] = dict.fromkeys(output_folders, 0)
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures: dict[Future[dict[str, int]], Path] = {
+                executor.submit(
+                    self.create_plugin_database,
+                    plugin_path,
+                    original_strings_files.get(plugin_path, []),
+                    translated_strings_files.get(plugin_path, []),
+                    output_folders,
+                ): plugin_path
+                for plugin_path in plugin_paths
+            }
+
+            for future in as_completed(futures):
+                plugin_path: Path = futures[future]
+
+                try:
+                    string_counts: dict[str, int] = future.result()
+                except Exception as ex:
+                    self.log.error(
+                        f"Failed to process plugin '{plugin_path.name}': {ex}",
+                        exc_info=ex,
+                    )
+                    continue
+
+                for language, string_count in string_counts.items():
+                    if string_count:
+                        plugin_counts[language] += 1
+
+        for language, plugin_count in plugin_counts.items():
+            self.log.info(
+                f"Database generation completed for {plugin_count} plugin(s) in "
+                f"'{language}'."
+            )
+
+    def create_plugin_database(
+        self,
+        plugin_path: Path,
+        original_strings_files: list[Path],
+        translated_strings_files: list[Path],
+        output_folders: dict[str, Path],
+    ) -> dict[str, int]:
+        """
+        Creates the database files of a single plugin for the specified languages.
+        The plugin and its original string tables are only parsed once for all
+        languages.
+
+        Args:
+            plugin_path (Path): Path to the plugin.
+            original_strings_files (list[Path]): Original strings files of the plugin.
+            translated_strings_files (list[Path]):
+                Translated strings files of the plugin.
+            output_folders (dict[str, Path]):
+                Map of language names to the folders to write the database files to.
+
+        Returns:
+            dict[str, int]: Map of language names to the number of written strings.
+        """
+
+        plugin_name: str = plugin_path.name.lower()
+        string_ids: dict[Path, dict[int, BaseString]] = {
+            plugin_path: self.extract_string_ids(plugin_path)
+        }
+        original_string_tables: dict[str, list[BufferedStringTable]] = {}
+        if string_tables := self.extract_string_tables(
+            original_strings_files, "english"
+        ):
+            original_string_tables[plugin_name] = string_tables
+
+        string_counts: dict[str, int] = {}
+        for language, output_folder_path in output_folders.items():
+            translated_string_tables: dict[str, list[BufferedStringTable]] = {}
+            if string_tables := self.extract_string_tables(
+                translated_strings_files, language
+            ):
+                translated_string_tables[plugin_name] = string_tables
+
+            plugin_strings: list[dict[str, str | int | None]] = self.map_string_tables(
+                string_ids, original_string_tables, translated_string_tables
+            ).get(plugin_name, [])
+
+            if plugin_strings:
+                output_folder_path.mkdir(parents=True, exist_ok=True)
+                output_file_path: Path = output_folder_path / f"{plugin_name}.json"
+                self.log.debug(
+                    f"Writing {len(plugin_strings)} string(s) to '{output_file_path}'..."
+                )
+                with output_file_path.open("w", encoding="utf-8") as output_file:
+                    json.dump(plugin_strings, output_file, ensure_ascii=False)
+
+            string_counts[language] = len(plugin_strings)
+
+        return string_counts
+
+    @staticmethod
+    def get_plugin_paths(input_folder_path: Path) -> list[Path]:
+        """
+        Gets the plugins in the specified folder.
+
+        Args:
+            input_folder_path (Path): Path to the folder with the plugins.
+
+        Returns:
+            list[Path]: List of plugin paths
+        """
+
+        return [
             plugin
             for pattern in ["*.esl", "*.esm", "*.esp"]
             for plugin in input_folder_path.glob(pattern)
             if plugin.is_file()
         ]
 
-        self.log.debug("Extracting string ids from plugins...")
-        string_ids: dict[Path, dict[int, BaseString]] = {}
-        for plugin_path in plugin_paths:
-            string_ids[plugin_path] = self.extract_string_ids(plugin_path)
+    @staticmethod
+    def get_languages(strings_files: dict[Path, list[Path]]) -> list[str]:
+        """
+        Gets the languages of the specified strings files, except english.
 
-        if output_folder_path is None:
-            output_folder_path = Path("dbgen_output")
+        Args:
+            strings_files (dict[Path, list[Path]]):
+                Dictionary with plugins as keys and strings files as values
 
-        database: dict[str, list[dict[str, str | int | None]]] = self.map_string_tables(
-            string_ids, original_string_tables, translated_string_tables
-        )
+        Returns:
+            list[str]: Sorted list of language names
+        """
 
-        self.log.info(f"Writing database to '{output_folder_path}'...")
+        languages: set[str] = set()
+        for plugin_path, plugin_strings_files in strings_files.items():
+            prefix: str = plugin_path.stem.lower() + "_"
 
-        output_folder_path.mkdir(parents=True, exist_ok=True)
+            for strings_file in plugin_strings_files:
+                # strings files from BSAs may contain backslashes in their name
+                file_name: str = strings_file.name.replace("\\", "/").rsplit("/", 1)[-1]
+                file_stem: str = file_name.rsplit(".", 1)[0].lower()
 
-        for plugin_name, plugin_strings in database.items():
-            output_file_path: Path = output_folder_path / f"{plugin_name}.json"
-            self.log.debug(
-                f"Writing {len(plugin_strings)} string(s) to '{output_file_path}'..."
-            )
-            with output_file_path.open("w", encoding="utf-8") as output_file:
-                json.dump(plugin_strings, output_file, ensure_ascii=False)
+                if file_stem.startswith(prefix):
+                    languages.add(file_stem.removeprefix(prefix))
 
-        self.log.info(f"Database generation completed for {len(database)} plugin(s).")
+        languages.discard("english")
+
+        return sorted(languages)
 
     def get_string_tables(
         self, plugins_folder_path: Path, strings_folder_path: Path, language_name: str
-    ) -> dict[str, dict[int, str]]:
+    ) -> dict[str, list[BufferedStringTable]]:
         """
         Maps plugins in the specified plugins folder to the strings files
-        in the strings folder and extracts the string tables for the specified language.
+        in the strings folder and loads the string tables for the specified language.
 
         Args:
             plugins_folder_path (Path): Folder with plugins.
@@ -183,8 +335,8 @@ class DbGen(Utility):
             language_name (str): Name of the language.
 
         Returns:
-            dict[str, dict[int, str]]:
-                Dictionary with plugin names, string ids and strings
+            dict[str, list[BufferedStringTable]]:
+                Dictionary with plugin names and their string tables
         """
 
         self.log.debug(
@@ -199,7 +351,7 @@ class DbGen(Utility):
             f"Extracting string tables for {len(strings_files)} "
             f"plugin(s) for language '{language_name}'..."
         )
-        string_tables: dict[str, dict[int, str]] = {}
+        string_tables: dict[str, list[BufferedStringTable]] = {}
         for plugin_path, string_table_paths in strings_files.items():
             string_tables[plugin_path.name.lower()] = self.extract_string_tables(
                 string_table_paths, language_name
@@ -210,8 +362,8 @@ class DbGen(Utility):
     def map_string_tables(
         self,
         string_ids: dict[Path, dict[int, BaseString]],
-        original_string_tables: dict[str, dict[int, str]],
-        translated_string_tables: dict[str, dict[int, str]],
+        original_string_tables: dict[str, list[BufferedStringTable]],
+        translated_string_tables: dict[str, list[BufferedStringTable]],
     ) -> dict[str, list[dict[str, str | int | None]]]:
         """
         Maps string ids to the specified original string tables
@@ -220,10 +372,10 @@ class DbGen(Utility):
         Args:
             string_ids (dict[Path, dict[int, String]]):
                 Dictionary with plugin paths, string ids and strings
-            original_string_tables (dict[str, dict[int, str]]):
-                Dictionary with plugin names, string ids and original strings
-            translated_string_tables (dict[str, dict[int, str]]):
-                Dictionary with plugin names, string ids and translated strings
+            original_string_tables (dict[str, list[BufferedStringTable]]):
+                Dictionary with plugin names and their original string tables
+            translated_string_tables (dict[str, list[BufferedStringTable]]):
+                Dictionary with plugin names and their translated string tables
 
         Returns:
             dict[str, list[dict[str, str | int | None]]]:
@@ -250,21 +402,29 @@ class DbGen(Utility):
                 )
                 continue
 
-            original_string_table: dict[int, str] = original_string_tables[plugin_name]
-            translated_string_table: dict[int, str] = translated_string_tables[
+            original_string_table: list[BufferedStringTable] = original_string_tables[
                 plugin_name
             ]
+            translated_string_table: list[BufferedStringTable] = (
+                translated_string_tables[plugin_name]
+            )
 
             plugin_strings: list[dict[str, str | int | None]] = []
             for string_id, string in strings.items():
-                if string_id not in original_string_table:
+                original: Optional[str] = DbGen.get_string(
+                    original_string_table, string_id
+                )
+                if original is None:
                     self.log.warning(
                         f"String id {string_id} is not in original string table. "
                         "Skipping..."
                     )
                     continue
 
-                if string_id not in translated_string_table:
+                translated: Optional[str] = DbGen.get_string(
+                    translated_string_table, string_id
+                )
+                if translated is None:
                     self.log.warning(
                         f"String id {string_id} is not in translated string table. "
                         "Skipping..."
@@ -274,8 +434,8 @@ class DbGen(Utility):
                 string_data: dict[str, str | int | None] = string.model_dump(
                     mode="json", exclude={"status"}, exclude_defaults=True
                 )
-                string_data["original"] = original_string_table[string_id]
-                string_data["string"] = translated_string_table[string_id]
+                string_data["original"] = original
+                string_data["string"] = translated
                 plugin_strings.append(string_data)
 
             if plugin_strings:
@@ -283,6 +443,30 @@ class DbGen(Utility):
 
         return database
 
+    @staticmethod
+    def get_string(
+        string_tables: list[BufferedStringTable], string_id: int
+    ) -> Optional[str]:
+        """
+        Looks up a string id in the specified string tables. Later tables take
+        precedence over earlier ones and blank strings are ignored.
+
+        Args:
+            string_tables (list[BufferedStringTable]): String tables of a plugin.
+            string_id (int): String id to look up.
+
+        Returns:
+            Optional[str]: The string or None if no table contains a non-blank string.
+        """
+
+        for string_table in reversed(string_tables):
+            string: Optional[str] = string_table.get_string(string_id)
+
+            if string is not None and string.strip():
+                return string
+
+        return None
+
     @staticmethod
     @FunctionCache.cache
     def map_strings_files(
@@ -302,12 +486,7 @@ class DbGen(Utility):
                 Dictionary with plugins as keys and strings files as values
         """
 
-        plugins: list[Path] = [
-            plugin
-            for pattern in ["*.esl", "*.esm", "*.esp"]
-            for plugin in input_folder_path.glob(pattern)
-            if plugin.is_file()
-        ]
+        plugins: list[Path] = DbGen.get_plugin_paths(input_folder_path)
 
         result: dict[Path, list[Path]] = {}
 
@@ -368,20 +547,22 @@ class DbGen(Utility):
     @FunctionCache.cache
     def extract_string_tables(
         self, strings_files: list[Path], language: str
-    ) -> dict[int, str]:
+    ) -> list[BufferedStringTable]:
         """
-        Extracts the string tables from the specified strings files
-        for the specifed plugin stem and language.
+        Loads the string tables from the specified strings files
+        for the specifed plugin stem and language. The strings are only decoded when
+        they are looked up.
 
         Args:
             strings_files (list[Path]): List of strings files for this plugin
             language (str): Language to extract strings for
 
         Returns:
-            dict[int, str]: Dictionary with string ids and strings
+            list[BufferedStringTable]:
+                List of string tables, later tables take precedence
         """
 
-        string_tables: dict[int, str] = {}
+        string_tables: list[BufferedStringTable] = []
 
         for strings_file in filter(
             lambda f: language.lower() in f.name.lower(), strings_files
@@ -393,22 +574,20 @@ class DbGen(Utility):
             if bsa_string_file is None:
                 raise ValueError("Strings file must not be a BSA file!")
 
-            self.log.info(f"Extracting strings from '{strings_file.name}'...")
+            self.log.info(f"Loading string table '{strings_file.name}'...")
             parser = StringTableParser(strings_file)
 
-            string_table: StringTable
+            string_table: BufferedStringTable
             if bsa_path is not None:
                 archive = BSAArchive(bsa_path)
-                string_table = parser.parse(
+                string_table = parser.parse_buffered(
                     archive.get_file_stream(str(bsa_string_file).replace("\\", "/"))
                 )
             else:
-                with strings_file.open("rb") as stream:
-                    string_table = parser.parse(stream)
+                string_table = parser.parse_file()
 
-            additional_strings: dict[int, str] = string_table.extract_strings()
-            string_tables.update(additional_strings)
-            self.log.info(f"Extracted {len(additional_strings)} string(s).")
+            string_tables.append(string_table)
+            self.log.info(f"Loaded string table with {len(string_table)} string(s).")
 
         return string_tables
 
@@ -0,0 +1,99 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+
+from core.database.database import TranslationDatabase
+from core.database.database_service import DatabaseService
+from core.database.translation import Translation
+from core.string.types import StringList
+from core.translation_provider.nm_api.nxm_id import NxmModId
+from core.user_data.user_data import UserData
+
+from ..core_test import CoreTest
+
+
+class TestTranslationDatabase(CoreTest):
+    """
+    Tests `core.database.database.TranslationDatabase`.
+    """
+
+    def test_lookups(self, user_data: UserData) -> None:
+        """
+        Tests the lookup methods of `TranslationDatabase` on the test database.
+        """
+
+        # given
+        database: TranslationDatabase = user_data.database
+
+        # when
+        translation = database.get_translation_by_modfile_path(Path("WetandCold.esp"))
+
+        # then
+        assert translation is not None
+        assert translation.name == "Wet and Cold SE - German"
+        assert database.is_translation_in_database(translation)
+        assert database.get_translation_for_id(translation.id) is translation
+        if translation.mod_id is not None:
+            assert database.get_translation_by_mod_id(translation.mod_id) is translation
+
+    def test_lookups_after_add_and_delete(self, user_data: UserData) -> None:
+        """
+        Tests that the lookups of `TranslationDatabase` are updated when translations are
+        added to or removed from the database.
+        """
+
+        # given
+        database: TranslationDatabase = user_data.database
+        mod_id = NxmModId(mod_id=123456, file_id=789012)
+        translation: Translation = DatabaseService.create_blank_translation(
+            "Test Translation", {Path("Test.esp"): []}, database
+        )
+        translation.mod_id = mod_id
+
+        # then
+        assert not database.is_translation_in_database(translation)
+        assert database.get_translation_by_modfile_path(Path("Test.esp")) is None
+        assert database.get_translation_by_mod_id(mod_id) is None
+
+        # when
+        DatabaseService.add_translation(translation, database, save=False)
+
+        # then
+        assert database.is_translation_in_database(translation)
+        assert database.get_translation_by_modfile_path(Path("Test.esp")) is translation
+        assert database.get_translation_by_mod_id(mod_id) is translation
+        assert database.get_translation_for_id(translation.id) is translation
+
+        # when
+        DatabaseService.delete_translation(translation, database, save=False)
+
+        # then
+        assert not database.is_translation_in_database(translation)
+        assert database.get_translation_by_modfile_path(Path("Test.esp")) is None
+        assert database.get_translation_by_mod_id(mod_id) is None
+
+    def test_strings_cache(self, user_data: UserData) -> None:
+        """
+        Tests that `TranslationDatabase.strings` is cached until the database changes.
+        """
+
+        # given
+        database: TranslationDatabase = user_data.database
+        translation: Translation = DatabaseService.create_blank_translation(
+            "Test Translation", {Path("Test.esp"): []}, database
+        )
+
+        # when
+        strings: StringList = database.strings
+
+        # then
+        assert database.strings is strings
+        assert len(strings) == len(list(database.iter_strings()))
+
+        # when
+        DatabaseService.add_translation(translation, database, save=False)
+
+        # then
+        assert database.strings is not strings
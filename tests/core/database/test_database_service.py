@@ -7,6 +7,7 @@ from pathlib import Path
 from core.database.database import TranslationDatabase
 from core.database.database_service import DatabaseService
 from core.database.translation import Translation
+from core.database.translation_service import TranslationService
 from core.file_types.plugin.string import PluginString
 from core.mod_file.mod_file import ModFile
 from core.mod_file.translation_status import TranslationStatus
@@ -16,6 +17,7 @@ from core.string.string_status import StringStatus
 from core.string.types import StringList
 from core.user_data.user_data import UserData
 from core.utilities.game_language import GameLanguage
+from tests.setup.sync_executor import ExecutorPatcher
 
 from ..core_test import CoreTest
 
@@ -47,6 +49,173 @@ class TestDatabaseService(CoreTest):
             "Wet and Cold SE - German",
         ]
 
+    def test_load_database_lazy(self, res_path: Path, user_data_path: Path) -> None:
+        """
+        Tests `DatabaseService.load_database()` with lazily loaded translations.
+        """
+
+        # given
+        appdb_path: Path = res_path / "app" / "database"
+        userdb_path: Path = user_data_path / "user" / "database"
+        language: GameLanguage = GameLanguage.German
+
+        # when
+        database: TranslationDatabase = DatabaseService.load_database(
+            appdb_path, userdb_path, language, lazy=True
+        )
+
+        # then
+        # translations without a summary in the index are loaded anyway
+        assert all(t.is_loaded for t in database.user_translations)
+        string_counts: dict[str, int] = {
+            t.name: t.string_count for t in database.user_translations
+        }
+
+        # when
+        database = DatabaseService.load_database(
+            appdb_path, userdb_path, language, lazy=True
+        )
+
+        # then
+        assert not any(t.is_loaded for t in database.user_translations)
+        assert {
+            t.name: t.string_count for t in database.user_translations
+        } == string_counts
+        translation: Translation = database.user_translations[0]
+        assert (
+            database.get_translation_by_modfile_path(translation.modfile_paths[0])
+            is translation
+        )
+        assert not translation.is_loaded
+        assert (
+            sum(len(s) for s in translation.strings.values())
+            == string_counts[translation.name]
+        )
+        assert translation.is_loaded
+
+    def test_load_database_packed(self, res_path: Path, user_data_path: Path) -> None:
+        """
+        Tests `DatabaseService.load_database()` and `DatabaseService.save_translation()`
+        with the packed format.
+        """
+
+        # given
+        appdb_path: Path = res_path / "app" / "database"
+        userdb_path: Path = user_data_path / "user" / "database"
+        language: GameLanguage = GameLanguage.German
+
+        # when
+        database: TranslationDatabase = DatabaseService.load_database(
+            appdb_path, userdb_path, language, use_packed_format=True, lazy=True
+        )
+
+        # then
+        assert database.use_packed_format
+        for translation in database.user_translations:
+            assert (translation.path / TranslationService.PACKED_FILE_NAME).is_file()
+            assert not any(translation.path.rglob("*.json"))
+
+        # when
+        translation: Translation = database.user_translations[0]
+        DatabaseService.save_translation(translation, database)
+
+        # then
+        assert not TranslationService.requires_conversion(translation.path, packed=True)
+
+    def test_save_translation(self, res_path: Path, user_data_path: Path) -> None:
+        """
+        Tests that `DatabaseService.save_translation()` refreshes the index of the
+        database.
+        """
+
+        # given
+        appdb_path: Path = res_path / "app" / "database"
+        userdb_path: Path = user_data_path / "user" / "database"
+        language: GameLanguage = GameLanguage.German
+        database: TranslationDatabase = DatabaseService.load_database(
+            appdb_path, userdb_path, language, lazy=True
+        )
+        translation: Translation = database.user_translations[0]
+        modfile_path: Path = translation.modfile_paths[0]
+        new_modfile_path: Path = Path("renamed_" + modfile_path.name)
+
+        # when
+        translation.strings[new_modfile_path] = translation.strings.pop(modfile_path)
+        DatabaseService.save_translation(translation, database)
+
+        # then
+        assert database.get_translation_by_modfile_path(new_modfile_path) is translation
+        assert database.get_translation_by_modfile_path(modfile_path) is not translation
+
+        # when
+        database = DatabaseService.load_database(
+            appdb_path, userdb_path, language, lazy=True
+        )
+        translation = database.user_translations[0]
+
+        # then
+        assert not translation.is_loaded
+        assert new_modfile_path in translation.modfile_paths
+        assert modfile_path not in translation.modfile_paths
+        assert database.get_translation_by_modfile_path(new_modfile_path) is translation
+
+    def test_preload_translations(
+        self, res_path: Path, user_data_path: Path, sync_executor: ExecutorPatcher
+    ) -> None:
+        """
+        Tests `DatabaseService.preload_translations()`.
+        """
+
+        # given
+        sync_executor(DatabaseService)
+        appdb_path: Path = res_path / "app" / "database"
+        userdb_path: Path = user_data_path / "user" / "database"
+        language: GameLanguage = GameLanguage.German
+        DatabaseService.load_database(appdb_path, userdb_path, language, lazy=True)
+        database: TranslationDatabase = DatabaseService.load_database(
+            appdb_path, userdb_path, language, lazy=True
+        )
+        assert not any(t.is_loaded for t in database.user_translations)
+
+        # when
+        DatabaseService.preload_translations(database.user_translations, thread_num=2)
+
+        # then
+        assert all(t.is_loaded for t in database.user_translations)
+        assert all(
+            sum(len(s) for s in t.strings.values()) == t.string_count
+            for t in database.user_translations
+        )
+
+    def test_get_database_stamp(self, user_data: UserData) -> None:
+        """
+        Tests `DatabaseService.get_database_stamp()`.
+        """
+
+        # given
+        database: TranslationDatabase = user_data.database
+        stamp: str = DatabaseService.get_database_stamp(database)
+
+        # then
+        assert DatabaseService.get_database_stamp(database) == stamp
+
+        # when
+        DatabaseService.rename_translation(
+            database.user_translations[0], "Renamed translation", database
+        )
+
+        # then
+        assert DatabaseService.get_database_stamp(database) != stamp
+
+        # given
+        stamp = DatabaseService.get_database_stamp(database)
+
+        # when
+        DatabaseService.save_translation(database.user_translations[0], database)
+
+        # then
+        assert DatabaseService.get_database_stamp(database) != stamp
+
     def test_create_translation_for_mod(self, user_data: UserData) -> None:
         """
         Tests `DatabaseService.create_translation_for_mod()`.
@@ -0,0 +1,163 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+
+from pytest_mock import MockerFixture
+
+from core.database.database_service import DatabaseService
+from core.database.exporter import Exporter
+from core.database.translation import Translation
+from core.file_types.plugin.file import PluginFile
+from core.mod_file.mod_file import ModFile
+from core.string.types import StringList
+from core.user_data.user_data import UserData
+from core.utilities.constants import (
+    OUTPUT_MOD_MANIFEST_FILENAME,
+    OUTPUT_MOD_MARKER_FILENAME,
+)
+from tests.setup.sync_executor import ExecutorPatcher
+
+from ..core_test import CoreTest
+
+
+class TestExporter(CoreTest):
+    """
+    Tests `core.database.exporter.Exporter`.
+    """
+
+    def test_resolve_modfiles(self, user_data: UserData) -> None:
+        """
+        Tests `Exporter.resolve_modfiles()` with translations that contain strings for
+        the same mod files.
+        """
+
+        # given
+        translations: list[Translation] = user_data.database.user_translations
+        duplicate_translation: Translation = translations[0]
+
+        # when
+        modfiles: dict[Path, tuple[ModFile, StringList]] = Exporter.resolve_modfiles(
+            [*translations, duplicate_translation], user_data.mod_instance
+        )
+
+        # then
+        assert modfiles
+        for modfile_path, (modfile, _) in modfiles.items():
+            assert modfile.path == modfile_path
+
+        # the strings of the last translation are used
+        for modfile_path, strings in duplicate_translation.strings.items():
+            if modfile_path in modfiles:
+                assert modfiles[modfile_path][1] is strings
+
+    def test_build_output_mod(
+        self, user_data: UserData, sync_executor: ExecutorPatcher
+    ) -> None:
+        """
+        Tests `Exporter.build_output_mod()`.
+        """
+
+        # given
+        output_path: Path = self.tmp_folder() / "output_mod_test"
+        user_data.user_config.use_dynamic_string_distributor = True
+        exporter = Exporter()
+        sync_executor(exporter)
+        sync_executor(DatabaseService)
+
+        # when
+        exporter.build_output_mod(
+            output_path=output_path,
+            mod_instance=user_data.mod_instance,
+            translations=user_data.database.user_translations,
+            user_config=user_data.user_config,
+            thread_num=1,
+        )
+
+        # then
+        assert (output_path / OUTPUT_MOD_MARKER_FILENAME).is_file()
+        for modfile_path, (modfile, _) in Exporter.resolve_modfiles(
+            user_data.database.user_translations, user_data.mod_instance
+        ).items():
+            if isinstance(modfile, PluginFile):
+                assert (
+                    output_path
+                    / "SKSE"
+                    / "Plugins"
+                    / "DynamicStringDistributor"
+                    / modfile_path
+                    / "SSE-AT_output.json"
+                ).is_file()
+
+    def test_build_output_mod_skips_unchanged_files(
+        self, user_data: UserData, sync_executor: ExecutorPatcher, mocker: MockerFixture
+    ) -> None:
+        """
+        Tests that `Exporter.build_output_mod()` does not dump unchanged files again.
+        """
+
+        # given
+        output_path: Path = self.tmp_folder() / "output_mod_incremental_test"
+        user_data.user_config.use_dynamic_string_distributor = True
+        exporter = Exporter()
+        sync_executor(exporter)
+        sync_executor(DatabaseService)
+        exporter.build_output_mod(
+            output_path=output_path,
+            mod_instance=user_data.mod_instance,
+            translations=user_data.database.user_translations,
+            user_config=user_data.user_config,
+            thread_num=1,
+        )
+        dump_spy = mocker.spy(Exporter, "dump_modfile")
+
+        # when
+        exporter.build_output_mod(
+            output_path=output_path,
+            mod_instance=user_data.mod_instance,
+            translations=user_data.database.user_translations,
+            user_config=user_data.user_config,
+            thread_num=1,
+        )
+
+        # then
+        assert (output_path / OUTPUT_MOD_MANIFEST_FILENAME).is_file()
+        assert dump_spy.call_count == 0
+
+    def test_build_output_mod_removes_stale_files(
+        self, user_data: UserData, sync_executor: ExecutorPatcher
+    ) -> None:
+        """
+        Tests that `Exporter.build_output_mod()` removes files of a previous build that
+        are no longer generated.
+        """
+
+        # given
+        output_path: Path = self.tmp_folder() / "output_mod_stale_test"
+        user_data.user_config.use_dynamic_string_distributor = True
+        exporter = Exporter()
+        sync_executor(exporter)
+        sync_executor(DatabaseService)
+        exporter.build_output_mod(
+            output_path=output_path,
+            mod_instance=user_data.mod_instance,
+            translations=user_data.database.user_translations,
+            user_config=user_data.user_config,
+            thread_num=1,
+        )
+
+        # when
+        exporter.build_output_mod(
+            output_path=output_path,
+            mod_instance=user_data.mod_instance,
+            translations=[],
+            user_config=user_data.user_config,
+            thread_num=1,
+        )
+
+        # then
+        assert {p.name for p in output_path.iterdir()} == {
+            OUTPUT_MOD_MARKER_FILENAME,
+            OUTPUT_MOD_MANIFEST_FILENAME,
+        }
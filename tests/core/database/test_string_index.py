@@ -0,0 +1,65 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+
+from core.database.database import TranslationDatabase
+from core.database.database_service import DatabaseService
+from core.database.string_index import DatabaseStringIndex
+from core.database.translation import Translation
+from core.file_types.plugin.string import PluginString
+from core.string.string_status import StringStatus
+from core.user_data.user_data import UserData
+
+from ..core_test import CoreTest
+
+
+class TestDatabaseStringIndex(CoreTest):
+    """
+    Tests `core.database.string_index.DatabaseStringIndex`.
+    """
+
+    def test_incremental_update(self, user_data: UserData) -> None:
+        """
+        Tests that the index is updated when translations are added to or removed from
+        the database.
+        """
+
+        # given
+        database: TranslationDatabase = user_data.database
+        index = DatabaseStringIndex(database)
+        string = PluginString(
+            form_id="00123456|Test.esp",
+            type="WEAP FULL",
+            original="A very unique test sword",
+            string="Ein sehr einzigartiges Testschwert",
+            status=StringStatus.TranslationComplete,
+        )
+        untranslated_string: PluginString = string.model_copy(
+            update={"original": "Another unique test sword"}
+        )
+        translation: Translation = DatabaseService.create_blank_translation(
+            "Test Translation", {Path("Test.esp"): [string]}, database
+        )
+
+        # when
+        index.build()
+
+        # then
+        assert index.is_built
+        assert not index.covers(string)
+
+        # when
+        DatabaseService.add_translation(translation, database, save=False)
+
+        # then
+        assert index.covers(string)
+        assert index.covers(untranslated_string)  # same id, status and translation
+
+        # when
+        DatabaseService.delete_translation(translation, database, save=False)
+
+        # then
+        assert not index.covers(string)
+        assert not index.covers(untranslated_string)
@@ -55,3 +55,96 @@ class TestTranslationService(CoreTest):
 
         # then
         assert reloaded_strings == strings
+
+    def test_save_translation_strings_packed(self) -> None:
+        """
+        Tests `TranslationService.save_translation_strings()` with the packed format and
+        the conversion of a translation between the formats.
+        """
+
+        # given
+        translation_folder: Path = self.tmp_folder() / "Packed Translation"
+        strings: dict[Path, StringList] = {
+            Path("Obsidian Weathers.esp"): [
+                PluginString(
+                    form_id="04000D65|Obsidian Weathers.esp",
+                    type="SPEL FULL",
+                    original="Options: Obsidian Weathers",
+                    string="Optionen: Obsidian-Wetter",
+                    editor_id="ObsidianSpell",
+                    status=StringStatus.TranslationComplete,
+                )
+            ]
+        }
+
+        # when
+        TranslationService.save_translation_strings(
+            translation_folder, strings, packed=False
+        )
+
+        # then
+        assert (translation_folder / "Obsidian Weathers.esp.json").is_file()
+        assert TranslationService.requires_conversion(translation_folder, packed=True)
+        assert not TranslationService.requires_conversion(
+            translation_folder, packed=False
+        )
+
+        # when
+        TranslationService.save_translation_strings(
+            translation_folder, strings, packed=True
+        )
+
+        # then
+        assert (translation_folder / TranslationService.PACKED_FILE_NAME).is_file()
+        assert not (translation_folder / "Obsidian Weathers.esp.json").exists()
+        assert not TranslationService.requires_conversion(
+            translation_folder, packed=True
+        )
+        assert TranslationService.load_translation_strings(translation_folder) == strings
+
+    def test_save_translation_strings_changed_modfiles(self) -> None:
+        """
+        Tests `TranslationService.save_translation_strings()` with only some changed mod
+        files.
+        """
+
+        # given
+        translation_folder: Path = self.tmp_folder() / "Partial Translation"
+        strings: dict[Path, StringList] = {
+            Path("Obsidian Weathers.esp"): [
+                PluginString(
+                    form_id="04000D65|Obsidian Weathers.esp",
+                    type="SPEL FULL",
+                    original="Options: Obsidian Weathers",
+                    status=StringStatus.TranslationRequired,
+                )
+            ],
+            Path("Skyrim.esm"): [
+                PluginString(
+                    form_id="0001D4EC|Skyrim.esm",
+                    type="LIGH FULL",
+                    original="Torch",
+                    status=StringStatus.TranslationRequired,
+                )
+            ],
+        }
+        TranslationService.save_translation_strings(
+            translation_folder, strings, packed=False
+        )
+        strings[Path("Obsidian Weathers.esp")][0].string = "Optionen: Obsidian-Wetter"
+        strings[Path("Skyrim.esm")][0].string = "Fackel"
+
+        # when
+        TranslationService.save_translation_strings(
+            translation_folder,
+            strings,
+            packed=False,
+            modfiles=[Path("Skyrim.esm")],
+        )
+
+        # then
+        reloaded_strings: dict[Path, StringList] = (
+            TranslationService.load_translation_strings(translation_folder)
+        )
+        assert reloaded_strings[Path("Skyrim.esm")][0].string == "Fackel"
+        assert reloaded_strings[Path("Obsidian Weathers.esp")][0].string is None
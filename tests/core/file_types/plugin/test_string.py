@@ -159,6 +159,37 @@ class TestPluginString:
         # then
         assert real_output == expected_output
 
+    def test_id_cache(self) -> None:
+        """
+        Tests that the cached `PluginString.id` is invalidated when one of its fields
+        changes.
+        """
+
+        # given
+        string: PluginString = PluginString(
+            form_id="00123456|Skyrim.esm",
+            type="BOOK FULL",
+            original="The title of the book",
+            status=StringStatus.TranslationRequired,
+        )
+
+        # then
+        assert string.id == "123456|skyrim.esm###None###BOOK FULL###None"
+
+        # when
+        string.string = "Der Titel des Buchs"
+        string.editor_id = "TestString"
+
+        # then
+        assert string.id == "123456|skyrim.esm###TestString###BOOK FULL###None"
+
+        # when
+        copied_string: PluginString = string.model_copy(update={"index": 1})
+
+        # then
+        assert copied_string.id == "123456|skyrim.esm###TestString###BOOK FULL###1"
+        assert string.id == "123456|skyrim.esm###TestString###BOOK FULL###None"
+
     LOCALIZED_INFO_DATA: list[tuple[PluginString, str]] = [
         (
             PluginString(
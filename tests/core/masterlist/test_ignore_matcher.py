@@ -0,0 +1,49 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from core.masterlist.ignore_matcher import IgnoreMatcher
+
+
+class TestIgnoreMatcher:
+    """
+    Tests `core.masterlist.ignore_matcher.IgnoreMatcher`.
+    """
+
+    def test_matches(self) -> None:
+        """
+        Tests `core.masterlist.ignore_matcher.IgnoreMatcher.matches()`.
+        """
+
+        # given
+        matcher = IgnoreMatcher(
+            ["Skyrim.esm", "cc*.esl", "[patch] mod.esp", "[fix] *.esp"]
+        )
+
+        # then
+        assert matcher.matches("skyrim.esm")
+        assert matcher.matches("SKYRIM.ESM")
+        assert matcher.matches("ccBGSSSE001-Fish.esl")
+        assert matcher.matches("[Patch] Mod.esp")
+        assert matcher.matches("[Fix] Mod.esp")
+        assert not matcher.matches("cc.esp")
+        assert not matcher.matches("p mod.esp")
+        assert not matcher.matches("f Mod.esp")
+        assert not matcher.matches("Update.esm")
+
+    def test_filter(self) -> None:
+        """
+        Tests `core.masterlist.ignore_matcher.IgnoreMatcher.filter()`.
+        """
+
+        # given
+        matcher = IgnoreMatcher(["*.bsa", "dawnguard.esm"])
+
+        # when
+        result: list[str] = matcher.filter(
+            ["Mod.esp", "Dawnguard.esm", "Mod.bsa", "Interface.txt"]
+        )
+
+        # then
+        assert result == ["Mod.esp", "Interface.txt"]
+        assert IgnoreMatcher([]).filter(["Mod.esp"]) == ["Mod.esp"]
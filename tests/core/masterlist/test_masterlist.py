@@ -7,6 +7,7 @@ from typing import Any
 import pytest
 from pydantic import ValidationError
 
+from core.config.user_config import UserConfig
 from core.masterlist.masterlist import Masterlist
 from core.masterlist.masterlist_entry import MasterlistEntry
 from core.translation_provider.source import Source
@@ -69,3 +70,32 @@ class TestMasterlist:
         assert entry.targets[0].source.value == Source.NexusMods.value
         assert entry.targets[0].mod_id == 1
         assert entry.targets[0].file_id == 1
+
+    def test_user_ignore_list(self) -> None:
+        """
+        Tests `core.masterlist.masterlist.Masterlist.add_to_ignore_list()`,
+        `core.masterlist.masterlist.Masterlist.remove_from_ignore_list()` and
+        `core.masterlist.masterlist.Masterlist.filter_ignored()`.
+        """
+
+        # given
+        masterlist: Masterlist = Masterlist.from_data({"test.esp": {"type": "ignore"}})
+        masterlist.set_user_config(UserConfig.model_construct(modfile_ignorelist=[]))
+        file_names: list[str] = ["Test.esp", "Skyrim.esm", "Patch.esp", "Mod.esp"]
+
+        # then
+        assert masterlist.filter_ignored(file_names) == ["Patch.esp", "Mod.esp"]
+
+        # when
+        masterlist.add_to_ignore_list("Patch.esp")
+
+        # then
+        assert masterlist.is_ignored("patch.esp")
+        assert masterlist.filter_ignored(file_names) == ["Mod.esp"]
+
+        # when
+        masterlist.remove_from_ignore_list("PATCH.esp")
+
+        # then
+        assert not masterlist.is_ignored("patch.esp")
+        assert masterlist.filter_ignored(file_names) == ["Patch.esp", "Mod.esp"]
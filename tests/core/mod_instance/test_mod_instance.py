@@ -7,6 +7,7 @@ from typing import Optional
 from core.mod_file.mod_file import ModFile
 from core.mod_file.translation_status import TranslationStatus
 from core.mod_instance.mod import Mod
+from core.mod_instance.mod_instance import ModInstance
 from core.user_data.user_data import UserData
 from tests.core.core_test import CoreTest
 
@@ -125,3 +126,83 @@ class TestModInstance(CoreTest):
 
         # then
         assert actual_modfiles == []
+
+    def test_get_mod_with_modfile(self, user_data: UserData) -> None:
+        """
+        Tests `ModInstance.get_mod_with_modfile()`.
+        """
+
+        # given
+        original_mod: Mod = self.get_mod_by_name(
+            "Wet and Cold SE", user_data.mod_instance
+        )
+        original_modfile: ModFile = self.get_modfile_from_mod(
+            original_mod, "WetandCold.esp"
+        )
+        original_modfile.status = TranslationStatus.TranslationInstalled
+        translated_mod: Mod = self.get_mod_by_name(
+            "Wet and Cold SE - German", user_data.mod_instance
+        )
+        translated_modfile: ModFile = self.get_modfile_from_mod(
+            translated_mod, "WetandCold.esp"
+        )
+        translated_modfile.status = TranslationStatus.IsTranslated
+
+        # when
+        actual_mod: Optional[Mod] = user_data.mod_instance.get_mod_with_modfile(
+            original_modfile.path
+        )
+
+        # then
+        assert actual_mod is translated_mod
+
+        # when
+        actual_mod = user_data.mod_instance.get_mod_with_modfile(
+            original_modfile.path, ignore_mods=[translated_mod]
+        )
+
+        # then
+        assert actual_mod is original_mod
+
+        # when
+        actual_mod = user_data.mod_instance.get_mod_with_modfile(
+            original_modfile.path,
+            ignore_states=[
+                TranslationStatus.IsTranslated,
+                TranslationStatus.TranslationInstalled,
+            ],
+        )
+
+        # then
+        assert actual_mod is None
+
+    def test_mod_lookups(self, user_data: UserData) -> None:
+        """
+        Tests `ModInstance.get_mod()` and `ModInstance.get_mod_of_modfile()`.
+        """
+
+        # given
+        mod_instance: ModInstance = user_data.mod_instance
+        original_mod: Mod = self.get_mod_by_name("Wet and Cold SE", mod_instance)
+        original_modfile: ModFile = self.get_modfile_from_mod(
+            original_mod, "WetandCold.esp"
+        )
+
+        # then
+        assert mod_instance.get_mod_of_modfile(original_modfile) is original_mod
+
+        for mod in mod_instance.mods:
+            if mod.mod_id is None:
+                continue
+
+            # the mod with the highest index is returned for duplicate ids
+            assert (
+                mod_instance.get_mod(mod.mod_id)
+                is [
+                    m
+                    for m in mod_instance.mods
+                    if m.mod_id is not None
+                    and (m.mod_id.mod_id, m.mod_id.file_id)
+                    == (mod.mod_id.mod_id, mod.mod_id.file_id)
+                ][-1]
+            )
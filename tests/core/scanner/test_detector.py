@@ -6,7 +6,9 @@ from typing import Optional
 
 import pytest
 
+from core.file_types.plugin.string import PluginString
 from core.scanner.detector import LangDetector, Language
+from core.string.string_status import StringStatus
 
 
 class TestLangDetector:
@@ -43,3 +45,51 @@ class TestLangDetector:
 
         # then
         assert real_output == expected_output
+
+    def test_get_detection_sample(self) -> None:
+        """
+        Tests `LangDetector.get_detection_sample()`.
+        """
+
+        # given
+        strings: list[PluginString] = [
+            PluginString(
+                form_id=f"{i:08X}|Skyrim.esm",
+                type="BOOK FULL",
+                original=f"Text {i % 3}",
+                status=StringStatus.TranslationRequired,
+            )
+            for i in range(10)
+        ]
+
+        # when
+        sample: str = LangDetector.get_detection_sample(strings, max_string_count=3)
+
+        # then
+        assert sample == "Text 0\nText 1"
+
+    def test_requires_translation_batch(self) -> None:
+        """
+        Tests `LangDetector.requires_translation_batch()`.
+        """
+
+        # given
+        detector: LangDetector = self.setup(Language.GERMAN)
+        samples: dict[str, str] = {
+            "english": "Hello World, how are you?",
+            "german": "Hallo Welt, wie gehts?",
+        }
+
+        # when
+        result: dict[str, bool] = detector.requires_translation_batch(samples)
+
+        # then
+        assert result == {"english": True, "german": False}
+        assert detector.get_cached_result("english") is True
+        assert detector.get_cached_result("unknown") is None
+
+        # when
+        result = detector.requires_translation_batch({"german": ""})
+
+        # then
+        assert result == {"german": False}
@@ -3,6 +3,7 @@ Copyright (c) Cutleast
 """
 
 from core.config.app_config import AppConfig
+from core.config.user_config import UserConfig
 from core.mod_file.mod_file import ModFile
 from core.mod_file.translation_status import TranslationStatus
 from core.mod_instance.mod import Mod
@@ -10,6 +11,7 @@ from core.mod_instance.mod_instance import ModInstance
 from core.scanner.scanner import Scanner
 from core.translation_provider.provider import TranslationProvider
 from core.user_data.user_data import UserData
+from core.utilities.game_language import GameLanguage
 
 from ..core_test import CoreTest
 
@@ -57,7 +59,7 @@ class TestScanner(CoreTest):
 
         # when
         scan_result: dict[Mod, dict[ModFile, TranslationStatus]] = (
-            scanner.run_basic_scan(items)
+            scanner.run_basic_scan(items, incremental=False)
         )
 
         # then
@@ -69,3 +71,38 @@ class TestScanner(CoreTest):
             for modfile, status in modfiles.items():
                 if mod in expected_results and modfile in expected_results[mod]:
                     assert status == expected_results[mod][modfile]
+
+        # when
+        incremental_result: dict[Mod, dict[ModFile, TranslationStatus]] = (
+            scanner.run_basic_scan(items, incremental=True)
+        )
+
+        # then
+        assert incremental_result == scan_result
+
+        # given
+        user_config: UserConfig = user_data.user_config.model_copy(
+            update={"language": GameLanguage.French}
+        )
+        scanner = Scanner(
+            mod_instance,
+            user_data.database,
+            app_config,
+            user_config,
+            TranslationProvider(user_config),
+            user_data.masterlist,
+        )
+        german_mod: Mod = self.get_mod_by_name("Wet and Cold SE - German", mod_instance)
+        german_modfile: ModFile = self.get_modfile_from_mod_name(
+            "Wet and Cold SE - German", "WetandCold.esp", mod_instance
+        )
+
+        # when
+        incremental_result = scanner.run_basic_scan(items, incremental=True)
+
+        # then
+        # the results of the language detection are not reused for another language
+        assert (
+            incremental_result[german_mod][german_modfile]
+            != TranslationStatus.IsTranslated
+        )
@@ -0,0 +1,92 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+
+import pytest
+
+from core.file_types.bestiary.string import BestiaryString
+from core.file_types.interface.string import InterfaceString
+from core.file_types.plugin.string import PluginString
+from core.string.packed_string_store import PackedStringStore
+from core.string.string_status import StringStatus
+from core.string.types import StringList
+
+from ..core_test import CoreTest
+
+
+class TestPackedStringStore(CoreTest):
+    """
+    Tests `core.string.packed_string_store.PackedStringStore`.
+    """
+
+    def test_dump_and_load(self) -> None:
+        """
+        Tests that strings of all types survive a round-trip through a packed file.
+        """
+
+        # given
+        packed_file_path: Path = self.tmp_folder() / "round_trip.pack"
+        strings: dict[Path, StringList] = {
+            Path("Obsidian Weathers.esp"): [
+                PluginString(
+                    form_id="04000D65|Obsidian Weathers.esp",
+                    type="SPEL FULL",
+                    original="Options: Obsidian Weathers",
+                    string="Optionen: Obsidian-Wetter",
+                    editor_id="ObsidianSpell",
+                    status=StringStatus.TranslationComplete,
+                ),
+                PluginString(
+                    form_id="04000D62|Obsidian Weathers.esp",
+                    type="MESG ITXT",
+                    original="Default",
+                    string=None,
+                    index=0,
+                    status=StringStatus.TranslationRequired,
+                ),
+            ],
+            Path("interface") / "translations" / "obsidian_english.txt": [
+                InterfaceString(
+                    mcm_id="$Obsidian_Weathers",
+                    original="Obsidian Weathers",
+                    string="Obsidian-Wetter ✓",
+                    status=StringStatus.TranslationIncomplete,
+                )
+            ],
+            Path("interface") / "creatures" / "dragon.json": [
+                BestiaryString(
+                    bestiary_id="dragon",
+                    original="Dragon",
+                    string="Drache",
+                    status=StringStatus.NoTranslationRequired,
+                )
+            ],
+            Path("Empty.esp"): [],
+        }
+
+        # when
+        PackedStringStore.dump(strings, packed_file_path)
+        loaded_strings: dict[Path, StringList] = PackedStringStore.load(packed_file_path)
+
+        # then
+        assert list(loaded_strings.keys()) == list(strings.keys())
+        for modfile_path, modfile_strings in strings.items():
+            assert [
+                (type(string), string.model_dump())
+                for string in loaded_strings[modfile_path]
+            ] == [(type(string), string.model_dump()) for string in modfile_strings]
+
+    def test_load_invalid_file(self) -> None:
+        """
+        Tests that loading a file that is not a packed file raises a `ValueError`.
+        """
+
+        # given
+        invalid_file_path: Path = self.tmp_folder() / "invalid.pack"
+        invalid_file_path.write_bytes(b"[]")
+
+        # then
+        with pytest.raises(ValueError):
+            PackedStringStore.load(invalid_file_path)
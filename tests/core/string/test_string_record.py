@@ -0,0 +1,113 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from core.file_types.bestiary.string import BestiaryString
+from core.file_types.interface.string import InterfaceString
+from core.file_types.plugin.string import PluginString
+from core.string.string_record import StringRecord, StringRecordList
+from core.string.string_status import StringStatus
+from core.string.types import String, StringList
+
+from ..core_test import CoreTest
+
+
+class TestStringRecord(CoreTest):
+    """
+    Tests `core.string.string_record.StringRecord`.
+    """
+
+    def test_from_and_to_strings(self) -> None:
+        """
+        Tests that strings of all types survive a round-trip through string records.
+        """
+
+        # given
+        strings: StringList = [
+            PluginString(
+                form_id="04000D65|Obsidian Weathers.esp",
+                type="SPEL FULL",
+                original="Options: Obsidian Weathers",
+                string="Optionen: Obsidian-Wetter",
+                editor_id="ObsidianSpell",
+                status=StringStatus.TranslationComplete,
+            ),
+            PluginString(
+                form_id="04000D62|Obsidian Weathers.esp",
+                type="MESG ITXT",
+                index=0,
+                original="Default",
+                status=StringStatus.TranslationRequired,
+            ),
+            InterfaceString(
+                mcm_id="$ObsidianWeathers",
+                original="Obsidian Weathers",
+                status=StringStatus.TranslationIncomplete,
+            ),
+            BestiaryString(
+                bestiary_id="Bear",
+                original="Bear",
+                string="Bär",
+                status=StringStatus.TranslationComplete,
+            ),
+        ]
+
+        # when
+        records: StringRecordList = StringRecord.from_strings(strings)
+        converted_strings: StringList = StringRecord.to_strings(records)
+
+        # then
+        assert [record.id for record in records] == [string.id for string in strings]
+        assert converted_strings == strings
+        assert [type(string) for string in converted_strings] == [
+            PluginString,
+            PluginString,
+            InterfaceString,
+            BestiaryString,
+        ]
+        assert converted_strings[0] is not strings[0]
+
+    def test_to_string(self) -> None:
+        """
+        Tests `StringRecord.to_string()` with a modified record.
+        """
+
+        # given
+        record: StringRecord = StringRecord.from_string(
+            PluginString(
+                form_id="0001D4EC|Skyrim.esm",
+                type="LIGH FULL",
+                editor_id="Torch01",
+                original="Torch",
+            )
+        )
+
+        # when
+        string: String = record._replace(
+            string="Fackel", status=StringStatus.TranslationComplete
+        ).to_string()
+
+        # then
+        assert string == PluginString(
+            form_id="0001D4EC|Skyrim.esm",
+            type="LIGH FULL",
+            editor_id="Torch01",
+            original="Torch",
+            string="Fackel",
+            status=StringStatus.TranslationComplete,
+        )
+        assert string.id == record.id
+
+    def test_get_fields(self) -> None:
+        """
+        Tests `StringRecord.get_fields()`.
+        """
+
+        assert StringRecord.get_fields(PluginString) == (
+            "form_id",
+            "type",
+            "index",
+            "editor_id",
+        )
+        assert StringRecord.get_fields(InterfaceString) == ("mcm_id",)
+        assert StringRecord.get_fields(BestiaryString) == ("bestiary_id",)
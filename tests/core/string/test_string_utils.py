@@ -4,7 +4,10 @@ Copyright (c) Cutleast
 
 import pytest
 
+from core.file_types.interface.string import InterfaceString
 from core.file_types.plugin.string import PluginString
+from core.string.string_change_set import StringChangeSet
+from core.string.string_record import StringRecord, StringRecordList
 from core.string.string_status import StringStatus
 from core.string.string_utils import StringUtils
 from core.string.types import String, StringList
@@ -128,6 +131,144 @@ class TestStringUtils(CoreTest):
             ),
         ]
 
+    def test_map_string_records(self) -> None:
+        """
+        Tests `StringUtils.map_string_records()` against `StringUtils.map_strings()`.
+        """
+
+        # given
+        original_strings: StringList = [
+            PluginString(
+                original="Torch",
+                form_id="0001D4EC|Skyrim.esm",
+                type="LIGH FULL",
+                editor_id="Torch01",
+                status=StringStatus.TranslationRequired,
+            ),
+            PluginString(
+                original="Default",
+                form_id="04000D62|Obsidian Weathers.esp",
+                type="MESG ITXT",
+                index=0,
+                status=StringStatus.TranslationRequired,
+            ),
+            PluginString(
+                original="AnInternalName",
+                form_id="00012345|Skyrim.esm",
+                type="LIGH FULL",
+                status=StringStatus.NoTranslationRequired,
+            ),
+            InterfaceString(
+                original="An Unchanged String",
+                mcm_id="$Unchanged",
+                status=StringStatus.TranslationRequired,
+            ),
+        ]
+        translation_strings: StringList = [
+            PluginString(
+                original="Fackel",
+                form_id="0101D4EC|Skyrim.esm",
+                type="LIGH FULL",
+                editor_id="Torch01",
+            ),
+            InterfaceString(original="An Unchanged String", mcm_id="$Unchanged"),
+        ]
+
+        # when
+        merged_records: StringRecordList = StringUtils.map_string_records(
+            StringRecord.from_strings(original_strings),
+            StringRecord.from_strings(translation_strings),
+        )
+
+        # then
+        assert StringRecord.to_strings(merged_records) == StringUtils.map_strings(
+            original_strings, translation_strings
+        )
+        assert [record.status for record in merged_records] == [
+            StringStatus.TranslationComplete,
+            StringStatus.TranslationRequired,
+            StringStatus.NoTranslationRequired,
+            StringStatus.NoTranslationRequired,
+        ]
+
+    def test_update_string_list(self) -> None:
+        """
+        Tests `StringUtils.update_string_list()`.
+        """
+
+        # given
+        translation_strings: StringList = [
+            PluginString(
+                original="Torch",
+                string="Fackel",
+                form_id="0001D4EC|Skyrim.esm",
+                type="LIGH FULL",
+                status=StringStatus.TranslationComplete,
+            ),
+            PluginString(
+                original="Old Default",
+                string="Alter Standard",
+                form_id="04000D62|Obsidian Weathers.esp",
+                type="MESG ITXT",
+                index=0,
+                status=StringStatus.TranslationComplete,
+            ),
+            PluginString(
+                original="Deleted",
+                string="Gelöscht",
+                form_id="00012345|Skyrim.esm",
+                type="LIGH FULL",
+                status=StringStatus.TranslationComplete,
+            ),
+        ]
+        original_strings: StringList = [
+            PluginString(
+                original="Torch",
+                form_id="0001D4EC|Skyrim.esm",
+                type="LIGH FULL",
+                status=StringStatus.TranslationRequired,
+            ),
+            PluginString(
+                original="Default",
+                form_id="04000D62|Obsidian Weathers.esp",
+                type="MESG ITXT",
+                index=0,
+                status=StringStatus.TranslationRequired,
+            ),
+            PluginString(
+                original="New",
+                form_id="00098765|Skyrim.esm",
+                type="LIGH FULL",
+                status=StringStatus.TranslationRequired,
+            ),
+        ]
+
+        # when
+        changes: StringChangeSet = StringUtils.update_string_list(
+            translation_strings, StringRecord.from_strings(original_strings)
+        )
+
+        # then
+        assert changes.added == [original_strings[2].id]
+        assert changes.changed == [original_strings[1].id]
+        assert changes.removed == ["012345|skyrim.esm###None###LIGH FULL###None"]
+        assert [string.original for string in translation_strings] == [
+            "Torch",
+            "Default",
+            "New",
+        ]
+        assert [string.status for string in translation_strings] == [
+            StringStatus.TranslationComplete,
+            StringStatus.TranslationRequired,
+            StringStatus.TranslationRequired,
+        ]
+
+        # when
+        changes = StringUtils.update_string_list(translation_strings, original_strings)
+
+        # then
+        assert not changes
+
     @staticmethod
     def provide_update_string_data() -> list[
         tuple[PluginString, StringList, PluginString]
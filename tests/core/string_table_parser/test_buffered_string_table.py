@@ -0,0 +1,119 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import struct
+from pathlib import Path
+
+from sse_bsa import BSAArchive
+
+from core.string_table_parser.buffered_string_table import BufferedStringTable
+from core.string_table_parser.string_table_parser import StringTableParser
+
+from ..core_test import CoreTest
+
+
+class TestBufferedStringTable(CoreTest):
+    """
+    Tests `core.string_table_parser.buffered_string_table.BufferedStringTable`.
+    """
+
+    def test_extract_strings(self, data_folder: Path) -> None:
+        """
+        Tests that `BufferedStringTable.extract_strings()` returns the same strings as
+        `StringTable.extract_strings()`.
+        """
+
+        # given
+        bsa_path: Path = data_folder / "db_gen" / "trans" / "_ResourcePack.bsa"
+        archive = BSAArchive(bsa_path)
+        strings_files: list[str] = archive.glob("strings/_resourcepack_*.*strings")
+
+        for strings_file in strings_files:
+            parser = StringTableParser(Path(strings_file))
+
+            # when
+            expected_strings: dict[int, str] = parser.parse(
+                archive.get_file_stream(strings_file.replace("\\", "/"))
+            ).extract_strings()
+            strings: dict[int, str] = parser.parse_buffered(
+                archive.get_file_stream(strings_file.replace("\\", "/"))
+            ).extract_strings()
+
+            # then
+            assert len(strings) > 0
+            assert strings == expected_strings
+
+    def test_get_string(self) -> None:
+        """
+        Tests `BufferedStringTable.get_string()` with zstrings and lstrings.
+        """
+
+        # given
+        raw_strings: list[bytes] = [b"Schwert", "Großes Schild".encode()]
+        zstring_data: bytes = b"".join(s + b"\x00" for s in raw_strings)
+        zstring_table = BufferedStringTable(
+            struct.pack(
+                "<IIIIII", 2, len(zstring_data), 1, 0, 2, len(raw_strings[0]) + 1
+            )
+            + zstring_data,
+            lstring=False,
+        )
+        lstring_data: bytes = b"".join(
+            struct.pack("<I", len(s) + 1) + s + b"\x00" for s in raw_strings
+        )
+        lstring_table = BufferedStringTable(
+            struct.pack(
+                "<IIIIII", 2, len(lstring_data), 1, 0, 2, len(raw_strings[0]) + 5
+            )
+            + lstring_data,
+            lstring=True,
+        )
+
+        for table in (zstring_table, lstring_table):
+            # then
+            assert len(table) == 2
+            assert 1 in table
+            assert table.get_string(1) == "Schwert"
+            assert table.get_string(2) == "Großes Schild"
+            assert table.get_string(3) is None
+
+    def test_unsorted_directory(self) -> None:
+        """
+        Tests that a directory with unsorted and duplicate string ids is handled like
+        in `StringTable`, where later entries overwrite earlier ones.
+        """
+
+        # given
+        string_data: bytes = b"Schwert\x00Schild\x00Bogen\x00"
+        directory: bytes = struct.pack("<IIIIII", 5, 0, 2, 8, 5, 15)
+        table = BufferedStringTable(
+            struct.pack("<II", 3, len(string_data)) + directory + string_data,
+            lstring=False,
+        )
+
+        # then
+        assert len(table) == 2
+        assert list(table) == [2, 5]
+        assert table.get_string(5) == "Bogen"
+        assert table.get_string(2) == "Schild"
+        assert table.extract_strings() == {2: "Schild", 5: "Bogen"}
+
+    def test_from_file(self) -> None:
+        """
+        Tests `BufferedStringTable.from_file()`.
+        """
+
+        # given
+        string_data: bytes = b"Schwert\x00"
+        file_path: Path = self.tmp_folder() / "test_german.strings"
+        file_path.write_bytes(
+            struct.pack("<IIII", 1, len(string_data), 1, 0) + string_data
+        )
+
+        # when
+        table: BufferedStringTable = StringTableParser(file_path).parse_file()
+
+        # then
+        assert len(table) == 1
+        assert table.get_string(1) == "Schwert"
@@ -0,0 +1,78 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from core.translation_provider.request_limiter import RequestLimiter
+
+
+class TestRequestLimiter:
+    """
+    Tests `core.translation_provider.request_limiter.RequestLimiter`.
+    """
+
+    def test_acquire_burst(self) -> None:
+        """
+        Tests that requests within the burst size are not delayed.
+        """
+
+        # given
+        limiter = RequestLimiter(rate=0.5, burst=3)
+
+        # when
+        wait_times: list[float] = [limiter.acquire() for _ in range(3)]
+
+        # then
+        assert sum(wait_times) < 0.5
+
+    def test_acquire_waits_for_refill(self) -> None:
+        """
+        Tests that requests exceeding the burst size wait for the bucket to refill.
+        """
+
+        # given
+        limiter = RequestLimiter(rate=20.0, burst=1)
+        limiter.acquire()
+
+        # when
+        wait_time: float = limiter.acquire()
+
+        # then
+        assert wait_time > 0.02
+
+    def test_update_quota(self) -> None:
+        """
+        Tests that the rate is reduced when the remaining quota is low.
+        """
+
+        # given
+        limiter = RequestLimiter(rate=10.0, burst=10, low_quota=100)
+
+        # when
+        limiter.update_quota(1000)
+
+        # then
+        assert limiter.current_rate == 10.0
+
+        # when
+        limiter.update_quota(50)
+
+        # then
+        assert limiter.current_rate == 5.0
+
+        # when
+        limiter.acquire()
+
+        # then
+        assert limiter.remaining_quota == 49
+
+        # when
+        limiter.acquire(counts_quota=False)
+
+        # then
+        assert limiter.remaining_quota == 49
+
+        # when
+        limiter.update_quota(0)
+
+        # then
+        assert limiter.current_rate == RequestLimiter.MIN_RATE
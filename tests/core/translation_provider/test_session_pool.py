@@ -0,0 +1,33 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import requests as req
+
+from core.translation_provider.session_pool import SessionPool
+
+
+class TestSessionPool:
+    """
+    Tests `core.translation_provider.session_pool.SessionPool`.
+    """
+
+    def test_session(self) -> None:
+        """
+        Tests that idle sessions are reused and that sessions in use are not shared.
+        """
+
+        # given
+        pool = SessionPool()
+
+        # when
+        with pool.session() as first_session, pool.session() as second_session:
+            pass
+
+        with pool.session() as reused_session:
+            pass
+
+        # then
+        assert isinstance(first_session, req.Session)
+        assert first_session is not second_session
+        assert reused_session in (first_session, second_session)
@@ -0,0 +1,102 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import Optional
+
+from pytest_mock import MockerFixture
+
+from core.masterlist.masterlist import Masterlist
+from core.translation_provider.cdt_api.cdt_id import CdtModId
+from core.translation_provider.mod_details import ModDetails
+from core.translation_provider.mod_id import ModId
+from core.translation_provider.nm_api.nxm_id import NxmModId
+from core.translation_provider.provider import TranslationProvider
+from core.translation_provider.source import Source
+from core.translation_provider.translation_candidate import TranslationCandidate
+from core.translation_provider.translation_discovery import TranslationDiscovery
+from tests.base_test import BaseTest
+
+
+class TestTranslationDiscovery(BaseTest):
+    """
+    Tests `core.translation_provider.translation_discovery.TranslationDiscovery`.
+    """
+
+    @staticmethod
+    def create_candidate(
+        mod_id: ModId, file_paths: Optional[tuple[str, ...]]
+    ) -> TranslationCandidate:
+        """
+        Creates a translation candidate with dummy details.
+
+        Args:
+            mod_id (ModId): Mod identifier of the translation.
+            file_paths (Optional[tuple[str, ...]]): Contents of the translation.
+
+        Returns:
+            TranslationCandidate: The translation candidate.
+        """
+
+        return TranslationCandidate(
+            mod_id=mod_id,
+            details=ModDetails(
+                display_name=str(mod_id),
+                file_name="translation.7z",
+                mod_id=mod_id,
+                version="1.0",
+                timestamp=0,
+                author=None,
+                uploader=None,
+                modpage_url="",
+            ),
+            file_paths=file_paths,
+        )
+
+    def test_get_translations(self, mocker: MockerFixture) -> None:
+        """
+        Tests that `TranslationDiscovery.get_translations()` requests the translation
+        candidates of an original mod only once for all of its mod files.
+        """
+
+        # given
+        nm_translation = NxmModId(mod_id=2, file_id=20)
+        cdt_translation = CdtModId(mod_id=3, nm_mod_id=1)
+        provider = mocker.create_autospec(TranslationProvider, instance=True)
+        provider.get_translation_candidates.return_value = {
+            Source.NexusMods: [
+                TestTranslationDiscovery.create_candidate(
+                    nm_translation,
+                    ("skse/plugins/dynamicstringdistributor/test.esp/test.json",),
+                )
+            ],
+            Source.Confrerie: [
+                TestTranslationDiscovery.create_candidate(cdt_translation, None)
+            ],
+        }
+        discovery = TranslationDiscovery(
+            provider,
+            language="german",
+            masterlist=Masterlist(entries={}),
+            author_blacklist=[],
+        )
+        original_mod_id = NxmModId(mod_id=1, file_id=10)
+
+        # when
+        test_translations: dict[Source, list[ModId]] = discovery.get_translations(
+            original_mod_id, "Test.esp"
+        )
+        other_translations: dict[Source, list[ModId]] = discovery.get_translations(
+            original_mod_id, "Other.esp"
+        )
+        details: ModDetails = discovery.get_details(nm_translation, Source.NexusMods)
+
+        # then
+        assert test_translations == {
+            Source.NexusMods: [nm_translation],
+            Source.Confrerie: [cdt_translation],
+        }
+        assert other_translations == {Source.Confrerie: [cdt_translation]}
+        assert details.mod_id == nm_translation
+        provider.get_translation_candidates.assert_called_once()
+        provider.get_details.assert_not_called()
@@ -0,0 +1,216 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import time
+from typing import Optional
+
+from core.translation_provider.web_cache import CachedResponse, WebCache
+
+from ..core_test import CoreTest
+
+
+class TestWebCache(CoreTest):
+    """
+    Tests `core.translation_provider.web_cache.WebCache`.
+    """
+
+    @staticmethod
+    def create_response(
+        url: str,
+        content: bytes = b"content",
+        headers: Optional[dict[str, str]] = None,
+        timestamp: Optional[int] = None,
+    ) -> CachedResponse:
+        """
+        Creates a cached response for the tests.
+
+        Args:
+            url (str): The requested URL.
+            content (bytes, optional): The body. Defaults to b"content".
+            headers (Optional[dict[str, str]], optional):
+                The headers. Defaults to None.
+            timestamp (Optional[int], optional):
+                The timestamp. Defaults to the current time.
+
+        Returns:
+            CachedResponse: The cached response.
+        """
+
+        return CachedResponse(
+            url=url,
+            status_code=200,
+            headers=headers or {},
+            content=content,
+            timestamp=timestamp if timestamp is not None else int(time.time()),
+        )
+
+    def test_get_and_put(self) -> None:
+        """
+        Tests `WebCache.get()` and `WebCache.put()`.
+        """
+
+        # given
+        cache = WebCache(
+            self.tmp_folder() / "test_get_and_put.db",
+            max_age=60,
+            max_stale_age=120,
+            max_size=1024,
+        )
+        response: CachedResponse = CachedResponse.from_response(
+            "https://example.com/a",
+            200,
+            {"Content-Type": "text/html", "ETag": '"abc"', "Set-Cookie": "secret"},
+            b"<html></html>",
+        )
+
+        # when
+        cache.put(response)
+        cached, fresh = cache.get("https://example.com/a")
+        unknown, _ = cache.get("https://example.com/b")
+
+        # then
+        assert cached is not None
+        assert cached == response
+        assert fresh
+        assert "Set-Cookie" not in cached.headers
+        assert cached.to_response().text == "<html></html>"
+        assert unknown is None
+
+    def test_stale_responses(self) -> None:
+        """
+        Tests that stale responses are only returned if they can be revalidated.
+        """
+
+        # given
+        cache = WebCache(
+            self.tmp_folder() / "test_stale_responses.db",
+            max_age=60,
+            max_stale_age=3600,
+            max_size=1024,
+        )
+        timestamp: int = int(time.time()) - 120
+        cache.put(
+            self.create_response(
+                "https://example.com/validatable",
+                headers={"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+                timestamp=timestamp,
+            )
+        )
+        cache.put(self.create_response("https://example.com/plain", timestamp=timestamp))
+
+        # when
+        validatable, validatable_fresh = cache.get("https://example.com/validatable")
+        plain, _ = cache.get("https://example.com/plain")
+
+        # then
+        assert validatable is not None
+        assert not validatable_fresh
+        assert validatable.get_validation_headers() == {
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+        }
+        assert plain is None
+
+        # when
+        cache.refresh("https://example.com/validatable")
+        _, validatable_fresh = cache.get("https://example.com/validatable")
+
+        # then
+        assert validatable_fresh
+
+    def test_evict_expired(self) -> None:
+        """
+        Tests `WebCache.evict_expired()`.
+        """
+
+        # given
+        cache = WebCache(
+            self.tmp_folder() / "test_evict_expired.db",
+            max_age=60,
+            max_stale_age=3600,
+            max_size=1024,
+        )
+        now: int = int(time.time())
+        cache.put(self.create_response("https://example.com/new"))
+        cache.put(self.create_response("https://example.com/stale", timestamp=now - 120))
+        cache.put(
+            self.create_response(
+                "https://example.com/validatable",
+                headers={"ETag": '"abc"'},
+                timestamp=now - 120,
+            )
+        )
+        cache.put(
+            self.create_response(
+                "https://example.com/expired",
+                headers={"ETag": '"abc"'},
+                timestamp=now - 7200,
+            )
+        )
+
+        # when
+        evicted: int = cache.evict_expired()
+        cache.compact()
+
+        # then
+        assert evicted == 2
+        assert cache.get("https://example.com/new")[0] is not None
+        assert cache.get("https://example.com/validatable")[0] is not None
+
+    def test_enforce_size(self) -> None:
+        """
+        Tests `WebCache.enforce_size()`.
+        """
+
+        # given
+        cache = WebCache(
+            self.tmp_folder() / "test_enforce_size.db",
+            max_age=3600,
+            max_stale_age=3600,
+            max_size=250,
+        )
+        now: int = int(time.time())
+        for i in range(5):
+            cache.put(
+                self.create_response(
+                    f"https://example.com/{i}", content=b"x" * 100, timestamp=now - i
+                )
+            )
+
+        # when
+        evicted: int = cache.enforce_size()
+
+        # then
+        assert evicted == 3
+        assert cache.get("https://example.com/0")[0] is not None
+        assert cache.get("https://example.com/1")[0] is not None
+        assert cache.get("https://example.com/2")[0] is None
+
+    def test_close(self) -> None:
+        """
+        Tests that `WebCache` reopens its database file after it was closed and
+        deleted.
+        """
+
+        # given
+        cache = WebCache(
+            self.tmp_folder() / "test_close.db",
+            max_age=60,
+            max_stale_age=120,
+            max_size=1024,
+        )
+        cache.put(self.create_response("https://example.com/a"))
+
+        # when
+        cache.close()
+        cache.path.unlink()
+
+        # then
+        assert cache.get("https://example.com/a")[0] is None
+
+        # when
+        cache.put(self.create_response("https://example.com/a"))
+
+        # then
+        assert cache.path.is_file()
+        assert cache.get("https://example.com/a")[0] is not None
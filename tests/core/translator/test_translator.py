@@ -0,0 +1,183 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from typing import Optional, override
+
+import pytest
+
+from core.config.translator_config import TranslatorConfig
+from core.translator.translator import Translator
+from core.utilities.game_language import GameLanguage
+
+from ..core_test import CoreTest
+
+
+class DummyTranslator(Translator):
+    """
+    Translator that converts texts to upper case and records the requested batches.
+    """
+
+    BATCH_MAX_CHARS = 10
+    BATCH_MAX_TEXTS = 3
+    RETRY_BACKOFF = 0.0
+
+    batches: list[list[str]]
+    cached: dict[str, str]
+    failures: int
+    error: type[Exception]
+    failing_text: Optional[str]
+
+    def __init__(
+        self,
+        config: TranslatorConfig,
+        failures: int = 0,
+        error: type[Exception] = ConnectionError,
+        failing_text: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            config (TranslatorConfig): The translator configuration.
+            failures (int, optional):
+                Number of batch requests that fail before succeeding. Defaults to 0.
+            error (type[Exception], optional):
+                The exception raised by failing batch requests. Defaults to
+                ConnectionError.
+            failing_text (Optional[str], optional):
+                Text whose batch requests always fail. Defaults to None.
+        """
+
+        super().__init__(config)
+
+        self.batches = []
+        self.cached = {}
+        self.failures = failures
+        self.error = error
+        self.failing_text = failing_text
+
+    @override
+    def translate_uncached(self, text: str, dst: GameLanguage) -> str:
+        return text.upper()
+
+    @override
+    def translate_batch_uncached(self, texts: list[str], dst: GameLanguage) -> list[str]:
+        if self.failures > 0 or self.failing_text in texts:
+            self.failures -= 1
+            raise self.error("Simulated error")
+
+        self.batches.append(texts)
+        return super().translate_batch_uncached(texts, dst)
+
+    @override
+    def _add_many_to_cache(
+        self, translations: dict[str, str], dst: GameLanguage
+    ) -> None:
+        self.cached.update(translations)
+
+
+class TestTranslator(CoreTest):
+    """
+    Tests `core.translator.translator.Translator`.
+    """
+
+    def test_split_into_batches(self) -> None:
+        """
+        Tests `Translator.split_into_batches()`.
+        """
+
+        # given
+        texts: list[str] = ["abc", "defg", "hij", "klmnopqrstuvwxyz", "a", "b", "c", "d"]
+
+        # when
+        batches: list[list[str]] = Translator.split_into_batches(
+            texts, max_chars=10, max_texts=3
+        )
+
+        # then
+        assert batches == [
+            ["abc", "defg", "hij"],
+            ["klmnopqrstuvwxyz"],
+            ["a", "b", "c"],
+            ["d"],
+        ]
+
+    def test_mass_translate(self) -> None:
+        """
+        Tests `Translator.mass_translate()`.
+        """
+
+        # given
+        translator = DummyTranslator(TranslatorConfig())
+        texts: list[str] = ["abc", "def", "abc", "ghi", "jkl", "def"]
+
+        # when
+        result: dict[str, str] = translator.mass_translate(texts, GameLanguage.German)
+
+        # then
+        assert result == {"abc": "ABC", "def": "DEF", "ghi": "GHI", "jkl": "JKL"}
+        assert sorted(text for batch in translator.batches for text in batch) == [
+            "abc",
+            "def",
+            "ghi",
+            "jkl",
+        ]
+        assert all(
+            len(batch) <= DummyTranslator.BATCH_MAX_TEXTS for batch in translator.batches
+        )
+
+    def test_mass_translate_retry(self) -> None:
+        """
+        Tests `Translator.mass_translate()` with failing requests.
+        """
+
+        # given
+        translator = DummyTranslator(TranslatorConfig(), failures=2)
+
+        # when
+        result: dict[str, str] = translator.mass_translate(["abc"], GameLanguage.German)
+
+        # then
+        assert result == {"abc": "ABC"}
+
+        # given
+        translator = DummyTranslator(
+            TranslatorConfig(), failures=DummyTranslator.MAX_RETRIES + 1
+        )
+
+        # when/then
+        with pytest.raises(ConnectionError):
+            translator.mass_translate(["abc"], GameLanguage.German)
+
+        # given
+        translator = DummyTranslator(TranslatorConfig(), failures=1, error=ValueError)
+
+        # when/then
+        with pytest.raises(ValueError):
+            translator.mass_translate(["abc"], GameLanguage.German)
+        assert translator.failures == 0
+
+    def test_mass_translate_partial_failure(self) -> None:
+        """
+        Tests that `Translator.mass_translate()` caches the translations of the
+        successful batches if another batch fails.
+        """
+
+        # given
+        translator = DummyTranslator(
+            TranslatorConfig(), error=ValueError, failing_text="fail"
+        )
+        texts: list[str] = ["abc", "def", "ghi", "fail", "jkl", "mno", "pqr"]
+        failing_batch: list[str] = next(
+            batch
+            for batch in Translator.split_into_batches(
+                texts, DummyTranslator.BATCH_MAX_CHARS, DummyTranslator.BATCH_MAX_TEXTS
+            )
+            if "fail" in batch
+        )
+
+        # when/then
+        with pytest.raises(ValueError):
+            translator.mass_translate(texts, GameLanguage.German)
+        assert translator.cached == {
+            text: text.upper() for text in texts if text not in failing_batch
+        }
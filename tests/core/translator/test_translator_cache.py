@@ -0,0 +1,80 @@
+"""
+Copyright (c) Cutleast
+"""
+
+import time
+
+from core.translator.translator_cache import TranslatorCache
+
+from ..core_test import CoreTest
+
+
+class TestTranslatorCache(CoreTest):
+    """
+    Tests `core.translator.translator_cache.TranslatorCache`.
+    """
+
+    def test_get_and_put(self) -> None:
+        """
+        Tests `TranslatorCache.get_many()` and `TranslatorCache.put_many()`.
+        """
+
+        # given
+        cache = TranslatorCache(self.tmp_folder() / "test_get_and_put.db")
+        items: dict[str, str] = {f"key{i}": f"value{i}" for i in range(1200)}
+
+        # when
+        cache.put_many(items)
+        cache.put("key0", "new value")
+
+        # then
+        assert cache.get("key0") == "new value"
+        assert cache.get("unknown") is None
+        result: dict[str, str] = cache.get_many([*items, "unknown"])
+        assert len(result) == len(items)
+        assert result["key1199"] == "value1199"
+
+    def test_evict_expired(self) -> None:
+        """
+        Tests `TranslatorCache.evict_expired()` and `TranslatorCache.compact()`.
+        """
+
+        # given
+        cache = TranslatorCache(self.tmp_folder() / "test_evict.db", max_age=60)
+        cache.put_many({"old": "old value"}, timestamp=int(time.time()) - 120)
+        cache.put_many({"new": "new value"})
+
+        # then
+        assert cache.get_many(["old", "new"]) == {"new": "new value"}
+
+        # when
+        evicted: int = cache.evict_expired()
+        cache.compact()
+
+        # then
+        assert evicted == 1
+        assert cache.get("new") == "new value"
+
+    def test_close(self) -> None:
+        """
+        Tests that `TranslatorCache` reopens its database file after it was closed and
+        deleted.
+        """
+
+        # given
+        cache = TranslatorCache(self.tmp_folder() / "test_close.db")
+        cache.put("key", "value")
+
+        # when
+        cache.close()
+        cache.path.unlink()
+
+        # then
+        assert cache.get("key") is None
+
+        # when
+        cache.put("key", "new value")
+
+        # then
+        assert cache.path.is_file()
+        assert cache.get("key") == "new value"
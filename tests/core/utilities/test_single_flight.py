@@ -0,0 +1,89 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from threading import Event
+
+import pytest
+
+from core.utilities.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """
+    Tests `core.utilities.single_flight.SingleFlight`.
+    """
+
+    def test_get_keeps_results(self) -> None:
+        """
+        Tests that results are kept for later calls with the same key.
+        """
+
+        # given
+        single_flight: SingleFlight[str, int] = SingleFlight()
+        calls: list[str] = []
+
+        def func(key: str) -> int:
+            calls.append(key)
+            return len(key)
+
+        # when
+        results: list[int] = [
+            single_flight.get(key, lambda k=key: func(k)) for key in ["a", "bb", "a"]
+        ]
+
+        # then
+        assert results == [1, 2, 1]
+        assert calls == ["a", "bb"]
+
+    def test_get_deduplicates_concurrent_calls(self) -> None:
+        """
+        Tests that concurrent calls with the same key wait for the first call.
+        """
+
+        # given
+        single_flight: SingleFlight[str, int] = SingleFlight()
+        started = Event()
+        release = Event()
+        calls: list[int] = []
+
+        def func() -> int:
+            calls.append(1)
+            started.set()
+            release.wait(timeout=5)
+            return 42
+
+        # when
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            first: Future[int] = executor.submit(single_flight.get, "key", func)
+            started.wait(timeout=5)
+            others: list[Future[int]] = [
+                executor.submit(single_flight.get, "key", func) for _ in range(3)
+            ]
+            release.set()
+
+            results: list[int] = [first.result(), *(f.result() for f in others)]
+
+        # then
+        assert results == [42] * 4
+        assert len(calls) == 1
+
+    def test_get_does_not_keep_failures(self) -> None:
+        """
+        Tests that failed calls are not kept and run again on the next call.
+        """
+
+        # given
+        single_flight: SingleFlight[str, int] = SingleFlight()
+
+        def fail() -> int:
+            raise ValueError("Test")
+
+        # when
+        with pytest.raises(ValueError):
+            single_flight.get("key", fail)
+        result: int = single_flight.get("key", lambda: 1)
+
+        # then
+        assert result == 1
@@ -6,8 +6,9 @@ from typing import Optional
 
 import pytest
 from cutleast_core_lib.test.utils import Utils
-from PySide6.QtCore import Qt
-from PySide6.QtWidgets import QTreeWidgetItem
+from PySide6.QtCore import QModelIndex, Qt
+from PySide6.QtGui import QColor
+from pytestqt.modeltest import ModelTester
 from pytestqt.qtbot import QtBot
 
 from core.config.app_config import AppConfig
@@ -24,6 +25,7 @@ from core.translation_provider.provider import TranslationProvider
 from core.user_data.user_data import UserData
 from tests.base_test import BaseTest
 from ui.main_page.mod_instance.mod_instance import ModInstanceWidget
+from ui.main_page.mod_instance.mod_instance_model import ModInstanceModel
 
 
 class TestModInstanceWidget(BaseTest):
@@ -34,17 +36,8 @@ class TestModInstanceWidget(BaseTest):
     STATE_SERVICE: tuple[str, type[StateService]] = ("state_service", StateService)
     """Identifier for accessing the private state_service field."""
 
-    MOD_ITEMS: tuple[str, type[dict[Mod, QTreeWidgetItem]]] = (
-        "mod_items",
-        dict[Mod, QTreeWidgetItem],
-    )
-    """Identifier for accessing the private mod_items field."""
-
-    MODFILE_ITEMS: tuple[str, type[dict[Mod, dict[ModFile, QTreeWidgetItem]]]] = (
-        "modfile_items",
-        dict[Mod, dict[ModFile, QTreeWidgetItem]],
-    )
-    """Identifier for accessing the private modfile_items field."""
+    MODEL: tuple[str, type[ModInstanceModel]] = ("model", ModInstanceModel)
+    """Identifier for accessing the private model field."""
 
     NAME_FILTER: tuple[str, type[tuple[str, bool]]] = "name_filter", tuple[str, bool]
     """Identifier for accessing the private name_filter field."""
@@ -74,25 +67,25 @@ class TestModInstanceWidget(BaseTest):
 
         return widget
 
-    def assert_all_items_visible(self, widget: ModInstanceWidget) -> None:
+    def assert_all_items_visible(
+        self, widget: ModInstanceWidget, mod_instance: ModInstance
+    ) -> None:
         """
         Asserts that all items are visible.
         """
 
         # given
-        mod_items: dict[Mod, QTreeWidgetItem] = Utils.get_private_field(
-            widget, *TestModInstanceWidget.MOD_ITEMS
-        )
-        modfile_items: dict[Mod, dict[ModFile, QTreeWidgetItem]] = (
-            Utils.get_private_field(widget, *TestModInstanceWidget.MODFILE_ITEMS)
+        model: ModInstanceModel = Utils.get_private_field(
+            widget, *TestModInstanceWidget.MODEL
         )
 
         # then
-        for item in mod_items.values():
-            assert not item.isHidden(), f"Item '{item.text(0)}' is not visible!"
-        for mod in modfile_items.values():
-            for item in mod.values():
-                assert not item.isHidden(), f"Item '{item.text(0)}' is not visible!"
+        for mod in mod_instance.mods:
+            assert model.index_of(mod).isValid(), f"Item '{mod.name}' is not visible!"
+            for modfile in mod.modfiles:
+                assert model.index_of(modfile).isValid(), (
+                    f"Item '{modfile.name}' is not visible!"
+                )
 
     def assert_initial_state(
         self, widget: ModInstanceWidget, mod_instance: ModInstance
@@ -102,11 +95,8 @@ class TestModInstanceWidget(BaseTest):
         """
 
         # given
-        mod_items: dict[Mod, QTreeWidgetItem] = Utils.get_private_field(
-            widget, *TestModInstanceWidget.MOD_ITEMS
-        )
-        modfile_items: dict[Mod, dict[ModFile, QTreeWidgetItem]] = (
-            Utils.get_private_field(widget, *TestModInstanceWidget.MODFILE_ITEMS)
+        model: ModInstanceModel = Utils.get_private_field(
+            widget, *TestModInstanceWidget.MODEL
         )
         name_filter: Optional[tuple[str, bool]] = Utils.get_private_field_optional(
             widget, *TestModInstanceWidget.NAME_FILTER
@@ -119,23 +109,29 @@ class TestModInstanceWidget(BaseTest):
         )
 
         test_separator: Mod = self.get_mod_by_name("Test Mods", mod_instance)
-        test_separator_item: QTreeWidgetItem = mod_items[test_separator]
         test_mod: Mod = self.get_mod_by_name("Wet and Cold SE", mod_instance)
-        test_mod_item: QTreeWidgetItem = mod_items[test_mod]
         test_modfile: ModFile = self.get_modfile_from_mod(test_mod, "WetandCold.esp")
-        test_modfile_item: QTreeWidgetItem = modfile_items[test_mod][test_modfile]
 
         # then
-        assert len(mod_items) == len(mod_instance.mods)
-        assert all(
-            len(items) == len(mod.modfiles) for mod, items in modfile_items.items()
-        )
-        self.assert_all_items_visible(widget)
+        assert model.get_visible_modfiles() == mod_instance.modfiles
+        self.assert_all_items_visible(widget, mod_instance)
         assert name_filter is None
         assert state_filter is None
         assert type_filter is None
-        assert test_mod_item.parent() is test_separator_item
-        assert test_modfile_item.parent() is test_mod_item
+        assert model.index_of(test_mod).parent() == model.index_of(test_separator)
+        assert model.index_of(test_modfile).parent() == model.index_of(test_mod)
+        assert model.get_item(model.index_of(test_modfile)) is test_modfile
+
+    @staticmethod
+    def get_foreground_color(model: ModInstanceModel, item: Mod | ModFile) -> str:
+        """
+        Gets the name of the foreground color of an item.
+        """
+
+        index: QModelIndex = model.index_of(item)
+        color: QColor = model.data(index, Qt.ItemDataRole.ForegroundRole)
+
+        return color.name()
 
     def test_initial_state(self, widget: ModInstanceWidget, user_data: UserData) -> None:
         """
@@ -144,61 +140,71 @@ class TestModInstanceWidget(BaseTest):
 
         self.assert_initial_state(widget, user_data.mod_instance)
 
+    def test_model(self, widget: ModInstanceWidget, qtmodeltester: ModelTester) -> None:
+        """
+        Tests the structure of the model with the default test modlist.
+        """
+
+        # given
+        model: ModInstanceModel = Utils.get_private_field(
+            widget, *TestModInstanceWidget.MODEL
+        )
+
+        # when
+        widget.set_name_filter("esp", False)
+
+        # then
+        qtmodeltester.check(model)
+
     def test_name_filter(self, widget: ModInstanceWidget, user_data: UserData) -> None:
         """
         Tests the filtering for mod and file names.
         """
 
         # given
-        mod_items: dict[Mod, QTreeWidgetItem] = Utils.get_private_field(
-            widget, *TestModInstanceWidget.MOD_ITEMS
-        )
-        modfile_items: dict[Mod, dict[ModFile, QTreeWidgetItem]] = (
-            Utils.get_private_field(widget, *TestModInstanceWidget.MODFILE_ITEMS)
+        model: ModInstanceModel = Utils.get_private_field(
+            widget, *TestModInstanceWidget.MODEL
         )
 
         test_separator: Mod = self.get_mod_by_name("Test Mods", user_data.mod_instance)
-        test_separator_item: QTreeWidgetItem = mod_items[test_separator]
         test_mod: Mod = self.get_mod_by_name("Wet and Cold SE", user_data.mod_instance)
-        test_mod_item: QTreeWidgetItem = mod_items[test_mod]
         test_modfile: ModFile = self.get_modfile_from_mod(test_mod, "WetandCold.esp")
-        test_modfile_item: QTreeWidgetItem = modfile_items[test_mod][test_modfile]
 
         # when
         widget.set_name_filter("test", False)
 
         # then
-        assert not test_separator_item.isHidden()
-        assert test_mod_item.isHidden()
-        assert test_modfile_item.isHidden()
+        assert model.index_of(test_separator).isValid()
+        assert not model.index_of(test_mod).isValid()
+        assert not model.index_of(test_modfile).isValid()
 
         # when
         widget.set_name_filter("test", True)
 
         # then
-        assert test_separator_item.isHidden()
+        assert not model.index_of(test_separator).isValid()
 
         # when
         widget.set_name_filter("", False)
 
         # then
-        self.assert_all_items_visible(widget)
+        self.assert_all_items_visible(widget, user_data.mod_instance)
 
         # when
         widget.set_name_filter("esp", True)
 
         # then
-        assert not test_separator_item.isHidden()
-        assert not test_mod_item.isHidden()
-        assert not test_modfile_item.isHidden()
+        assert model.index_of(test_separator).isValid()
+        assert model.index_of(test_mod).isValid()
+        assert model.index_of(test_modfile).isValid()
 
         # when
         widget.set_name_filter("SE", True)
 
         # then
-        assert not test_separator_item.isHidden()
-        assert not test_mod_item.isHidden()
-        assert test_modfile_item.isHidden()
+        assert model.index_of(test_separator).isValid()
+        assert model.index_of(test_mod).isValid()
+        assert not model.index_of(test_modfile).isValid()
 
     def test_state_filter(self, widget: ModInstanceWidget, user_data: UserData) -> None:
         """
@@ -206,49 +212,43 @@ class TestModInstanceWidget(BaseTest):
         """
 
         # given
-        mod_items: dict[Mod, QTreeWidgetItem] = Utils.get_private_field(
-            widget, *TestModInstanceWidget.MOD_ITEMS
-        )
-        modfile_items: dict[Mod, dict[ModFile, QTreeWidgetItem]] = (
-            Utils.get_private_field(widget, *TestModInstanceWidget.MODFILE_ITEMS)
+        model: ModInstanceModel = Utils.get_private_field(
+            widget, *TestModInstanceWidget.MODEL
         )
 
         test_separator: Mod = self.get_mod_by_name("Test Mods", user_data.mod_instance)
-        test_separator_item: QTreeWidgetItem = mod_items[test_separator]
         test_mod: Mod = self.get_mod_by_name("Wet and Cold SE", user_data.mod_instance)
-        test_mod_item: QTreeWidgetItem = mod_items[test_mod]
         test_modfile: ModFile = self.get_modfile_from_mod(test_mod, "WetandCold.esp")
         test_modfile.status = TranslationStatus.RequiresTranslation
-        test_modfile_item: QTreeWidgetItem = modfile_items[test_mod][test_modfile]
 
         # when
         widget.set_state_filter([TranslationStatus.RequiresTranslation])
 
         # then
-        assert not test_separator_item.isHidden()
-        assert not test_mod_item.isHidden()
-        assert not test_modfile_item.isHidden()
+        assert model.index_of(test_separator).isValid()
+        assert model.index_of(test_mod).isValid()
+        assert model.index_of(test_modfile).isValid()
 
         # when
         test_modfile.status = TranslationStatus.IsTranslated
         widget.update()
 
         # then
-        assert not test_separator_item.isHidden()
-        assert test_mod_item.isHidden()
-        assert test_modfile_item.isHidden()
+        assert model.index_of(test_separator).isValid()
+        assert not model.index_of(test_mod).isValid()
+        assert not model.index_of(test_modfile).isValid()
 
         # when
         widget.set_state_filter([])
 
         # then
-        self.assert_all_items_visible(widget)
+        self.assert_all_items_visible(widget, user_data.mod_instance)
 
         # when
         widget.set_state_filter([status for status in TranslationStatus])
 
         # then
-        self.assert_all_items_visible(widget)
+        self.assert_all_items_visible(widget, user_data.mod_instance)
 
     def test_type_filter(self, widget: ModInstanceWidget, user_data: UserData) -> None:
         """
@@ -256,58 +256,49 @@ class TestModInstanceWidget(BaseTest):
         """
 
         # given
-        mod_items: dict[Mod, QTreeWidgetItem] = Utils.get_private_field(
-            widget, *TestModInstanceWidget.MOD_ITEMS
-        )
-        modfile_items: dict[Mod, dict[ModFile, QTreeWidgetItem]] = (
-            Utils.get_private_field(widget, *TestModInstanceWidget.MODFILE_ITEMS)
+        model: ModInstanceModel = Utils.get_private_field(
+            widget, *TestModInstanceWidget.MODEL
         )
 
         test_separator: Mod = self.get_mod_by_name("Test Mods", user_data.mod_instance)
-        test_separator_item: QTreeWidgetItem = mod_items[test_separator]
         test_mod: Mod = self.get_mod_by_name("Wet and Cold SE", user_data.mod_instance)
-        test_mod_item: QTreeWidgetItem = mod_items[test_mod]
         test_pluginfile: ModFile = self.get_modfile_from_mod(test_mod, "WetandCold.esp")
-        test_pluginfile_item: QTreeWidgetItem = modfile_items[test_mod][test_pluginfile]
         test_interfacefile: ModFile = self.get_modfile_from_mod(
             test_mod, "wetandcold_german.txt"
         )
-        test_interfacefile_item: QTreeWidgetItem = modfile_items[test_mod][
-            test_interfacefile
-        ]
 
         # then
-        self.assert_all_items_visible(widget)
+        self.assert_all_items_visible(widget, user_data.mod_instance)
 
         # when
         widget.set_type_filter([FileType.PluginFile])
 
         # then
-        assert not test_separator_item.isHidden()
-        assert not test_mod_item.isHidden()
-        assert not test_pluginfile_item.isHidden()
-        assert test_interfacefile_item.isHidden()
+        assert model.index_of(test_separator).isValid()
+        assert model.index_of(test_mod).isValid()
+        assert model.index_of(test_pluginfile).isValid()
+        assert not model.index_of(test_interfacefile).isValid()
 
         # when
         widget.set_type_filter([FileType.InterfaceFile])
 
         # then
-        assert not test_separator_item.isHidden()
-        assert not test_mod_item.isHidden()
-        assert test_pluginfile_item.isHidden()
-        assert not test_interfacefile_item.isHidden()
+        assert model.index_of(test_separator).isValid()
+        assert model.index_of(test_mod).isValid()
+        assert not model.index_of(test_pluginfile).isValid()
+        assert model.index_of(test_interfacefile).isValid()
 
         # when
         widget.set_type_filter([])
 
         # then
-        self.assert_all_items_visible(widget)
+        self.assert_all_items_visible(widget, user_data.mod_instance)
 
         # when
         widget.set_type_filter([file_type for file_type in FileType])
 
         # then
-        self.assert_all_items_visible(widget)
+        self.assert_all_items_visible(widget, user_data.mod_instance)
 
     def test_update(self, widget: ModInstanceWidget, user_data: UserData) -> None:
         """
@@ -315,33 +306,30 @@ class TestModInstanceWidget(BaseTest):
         """
 
         # given
-        modfile_items: dict[Mod, dict[ModFile, QTreeWidgetItem]] = (
-            Utils.get_private_field(widget, *TestModInstanceWidget.MODFILE_ITEMS)
+        model: ModInstanceModel = Utils.get_private_field(
+            widget, *TestModInstanceWidget.MODEL
         )
 
         test_mod: Mod = self.get_mod_by_name("Wet and Cold SE", user_data.mod_instance)
         test_modfile: ModFile = self.get_modfile_from_mod(test_mod, "WetandCold.esp")
-        test_modfile_item: QTreeWidgetItem = modfile_items[test_mod][test_modfile]
 
         # when
         test_modfile.status = TranslationStatus.RequiresTranslation
         widget.update()
 
         # then
-        assert test_modfile_item.foreground(
-            0
-        ).color().name() == TranslationStatus.get_color(
-            TranslationStatus.RequiresTranslation
-        )
+        assert TestModInstanceWidget.get_foreground_color(
+            model, test_modfile
+        ) == TranslationStatus.get_color(TranslationStatus.RequiresTranslation)
 
         # when
         test_modfile.status = TranslationStatus.IsTranslated
         widget.update()
 
         # then
-        assert test_modfile_item.foreground(
-            0
-        ).color().name() == TranslationStatus.get_color(TranslationStatus.IsTranslated)
+        assert TestModInstanceWidget.get_foreground_color(
+            model, test_modfile
+        ) == TranslationStatus.get_color(TranslationStatus.IsTranslated)
 
     def test_get_visible_modfile_item_count(
         self, widget: ModInstanceWidget, user_data: UserData
@@ -351,13 +339,12 @@ class TestModInstanceWidget(BaseTest):
         """
 
         # given
-        modfile_items: dict[Mod, dict[ModFile, QTreeWidgetItem]] = (
-            Utils.get_private_field(widget, *TestModInstanceWidget.MODFILE_ITEMS)
+        model: ModInstanceModel = Utils.get_private_field(
+            widget, *TestModInstanceWidget.MODEL
         )
 
         test_mod: Mod = self.get_mod_by_name("Wet and Cold SE", user_data.mod_instance)
         test_modfile: ModFile = self.get_modfile_from_mod(test_mod, "WetandCold.esp")
-        test_modfile_item: QTreeWidgetItem = modfile_items[test_mod][test_modfile]
 
         # when
         widget.set_name_filter("WetandCold.esp", True)
@@ -366,7 +353,7 @@ class TestModInstanceWidget(BaseTest):
         assert widget.get_visible_modfile_item_count() == 2
 
         # when
-        test_modfile_item.setCheckState(0, Qt.CheckState.Unchecked)
+        model.set_checked(test_modfile, False)
 
         # then
         assert widget.get_visible_modfile_item_count() == 1
@@ -374,7 +361,7 @@ class TestModInstanceWidget(BaseTest):
 
         # when
         widget.set_name_filter("", False)
-        test_modfile_item.setCheckState(0, Qt.CheckState.Checked)
+        model.set_checked(test_modfile, True)
 
         # then
         assert widget.get_visible_modfile_item_count() == len(
@@ -393,16 +380,15 @@ class TestModInstanceWidget(BaseTest):
         state_service: StateService = Utils.get_private_field(
             widget, *TestModInstanceWidget.STATE_SERVICE
         )
-        modfile_items: dict[Mod, dict[ModFile, QTreeWidgetItem]] = (
-            Utils.get_private_field(widget, *TestModInstanceWidget.MODFILE_ITEMS)
+        model: ModInstanceModel = Utils.get_private_field(
+            widget, *TestModInstanceWidget.MODEL
         )
 
         test_mod: Mod = self.get_mod_by_name("Wet and Cold SE", user_data.mod_instance)
         test_modfile: ModFile = self.get_modfile_from_mod(test_mod, "WetandCold.esp")
-        test_modfile_item: QTreeWidgetItem = modfile_items[test_mod][test_modfile]
 
         # then
-        assert test_modfile_item.foreground(0).color().name() == (
+        assert TestModInstanceWidget.get_foreground_color(model, test_modfile) == (
             TranslationStatus.get_color(test_modfile.status) or "#ffffff"
         )
 
@@ -411,10 +397,59 @@ class TestModInstanceWidget(BaseTest):
             state_service.set_modfile_states({test_modfile: status})
 
             # then
-            assert test_modfile_item.foreground(0).color().name() == (
+            assert TestModInstanceWidget.get_foreground_color(model, test_modfile) == (
                 TranslationStatus.get_color(status) or "#ffffff"
             )
 
+    def test_modfile_states_are_filtered(
+        self, widget: ModInstanceWidget, user_data: UserData
+    ) -> None:
+        """
+        Tests that modfile state changes by the state service are filtered and update
+        the aggregated status of their mods.
+        """
+
+        # given
+        state_service: StateService = Utils.get_private_field(
+            widget, *TestModInstanceWidget.STATE_SERVICE
+        )
+        model: ModInstanceModel = Utils.get_private_field(
+            widget, *TestModInstanceWidget.MODEL
+        )
+
+        test_mod: Mod = self.get_mod_by_name("Wet and Cold SE", user_data.mod_instance)
+        test_modfile: ModFile = self.get_modfile_from_mod(test_mod, "WetandCold.esp")
+        state_service.set_modfile_states(
+            {modfile: TranslationStatus.NoStrings for modfile in test_mod.modfiles}
+        )
+        widget.set_state_filter([TranslationStatus.RequiresTranslation])
+
+        # then
+        assert not model.index_of(test_mod).isValid()
+
+        # when
+        state_service.set_modfile_states(
+            {test_modfile: TranslationStatus.RequiresTranslation}
+        )
+
+        # then
+        assert model.index_of(test_modfile).isValid()
+        assert TestModInstanceWidget.get_foreground_color(model, test_mod) == (
+            TranslationStatus.get_color(TranslationStatus.RequiresTranslation)
+        )
+
+        # when
+        state_service.set_modfile_states({test_modfile: TranslationStatus.NoStrings})
+
+        # then
+        assert not model.index_of(test_mod).isValid()
+
+        # when
+        widget.set_state_filter([])
+
+        # then
+        assert TestModInstanceWidget.get_foreground_color(model, test_mod) == "#ffffff"
+
     def test_database_changes_affect_modfile_items(
         self, widget: ModInstanceWidget, user_data: UserData
     ) -> None:
@@ -426,8 +461,8 @@ class TestModInstanceWidget(BaseTest):
 
         # given
         database: TranslationDatabase = user_data.database
-        modfile_items: dict[Mod, dict[ModFile, QTreeWidgetItem]] = (
-            Utils.get_private_field(widget, *TestModInstanceWidget.MODFILE_ITEMS)
+        model: ModInstanceModel = Utils.get_private_field(
+            widget, *TestModInstanceWidget.MODEL
         )
 
         original_mod: Mod = self.get_mod_by_name(
@@ -437,9 +472,6 @@ class TestModInstanceWidget(BaseTest):
             original_mod, "WetandCold.esp"
         )
         original_modfile.status = TranslationStatus.TranslationInstalled
-        original_modfile_item: QTreeWidgetItem = modfile_items[original_mod][
-            original_modfile
-        ]
         translated_mod: Mod = self.get_mod_by_name(
             "Wet and Cold SE - German", user_data.mod_instance
         )
@@ -447,9 +479,6 @@ class TestModInstanceWidget(BaseTest):
             translated_mod, "WetandCold.esp"
         )
         translated_modfile.status = TranslationStatus.IsTranslated
-        translated_modfile_item: QTreeWidgetItem = modfile_items[translated_mod][
-            translated_modfile
-        ]
 
         test_translation: Optional[Translation] = (
             database.get_translation_by_modfile_path(original_modfile.path)
@@ -463,11 +492,11 @@ class TestModInstanceWidget(BaseTest):
 
         # then
         assert original_modfile.status == TranslationStatus.RequiresTranslation
-        assert original_modfile_item.foreground(0).color().name() == (
+        assert TestModInstanceWidget.get_foreground_color(model, original_modfile) == (
             TranslationStatus.get_color(original_modfile.status) or "#ffffff"
         )
         assert translated_modfile.status == TranslationStatus.IsTranslated
-        assert translated_modfile_item.foreground(0).color().name() == (
+        assert TestModInstanceWidget.get_foreground_color(model, translated_modfile) == (
             TranslationStatus.get_color(translated_modfile.status) or "#ffffff"
         )
 
@@ -476,10 +505,10 @@ class TestModInstanceWidget(BaseTest):
 
         # then
         assert original_modfile.status == TranslationStatus.TranslationInstalled
-        assert original_modfile_item.foreground(0).color().name() == (
+        assert TestModInstanceWidget.get_foreground_color(model, original_modfile) == (
             TranslationStatus.get_color(original_modfile.status) or "#ffffff"
         )
         assert translated_modfile.status == TranslationStatus.IsTranslated
-        assert translated_modfile_item.foreground(0).color().name() == (
+        assert TestModInstanceWidget.get_foreground_color(model, translated_modfile) == (
             TranslationStatus.get_color(translated_modfile.status) or "#ffffff"
         )
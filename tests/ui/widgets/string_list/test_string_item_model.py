@@ -0,0 +1,151 @@
+"""
+Copyright (c) Cutleast
+"""
+
+from pathlib import Path
+
+import pytest
+from PySide6.QtCore import QModelIndex, QPersistentModelIndex
+from pytestqt.modeltest import ModelTester
+from pytestqt.qtbot import QtBot
+
+from core.file_types.plugin.string import PluginString
+from core.string.string_status import StringStatus
+from core.string.types import StringList
+from tests.base_test import BaseTest
+from ui.widgets.string_list.string_item_model import StringItemModel
+
+
+class TestStringItemModel(BaseTest):
+    """
+    Tests `ui.widgets.string_list.string_item_model.StringItemModel`.
+    """
+
+    @staticmethod
+    def create_strings(modfile: str, count: int) -> StringList:
+        """
+        Creates strings for a mod file. Every second string is translated.
+
+        Args:
+            modfile (str): The name of the mod file.
+            count (int): The number of strings.
+
+        Returns:
+            StringList: The created strings.
+        """
+
+        return [
+            PluginString(
+                form_id=f"{i:08X}|{modfile}",
+                editor_id=f"EditorId{i}",
+                type="BOOK FULL",
+                original=f"Original text {i}",
+                string=f"Translated text {i}" if i % 2 else None,
+                status=(
+                    StringStatus.TranslationComplete
+                    if i % 2
+                    else StringStatus.TranslationRequired
+                ),
+            )
+            for i in range(count)
+        ]
+
+    @pytest.fixture
+    def strings(self) -> dict[Path, StringList]:
+        """
+        Fixture to create and provide grouped strings for tests.
+        """
+
+        return {
+            Path("Plugin A.esp"): TestStringItemModel.create_strings("a.esp", 6),
+            Path("Plugin B.esp"): TestStringItemModel.create_strings("b.esp", 3),
+        }
+
+    @pytest.fixture
+    def model(self, strings: dict[Path, StringList]) -> StringItemModel:
+        """
+        Fixture to create and provide a StringItemModel instance for tests.
+        """
+
+        return StringItemModel(
+            strings,
+            [
+                StringItemModel.Column.Id,
+                StringItemModel.Column.Original,
+                StringItemModel.Column.String,
+            ],
+            status_sort=True,
+            sort_column=0,
+        )
+
+    def test_structure(
+        self,
+        model: StringItemModel,
+        strings: dict[Path, StringList],
+        qtmodeltester: ModelTester,
+    ) -> None:
+        """
+        Tests the rows of a model with grouped strings.
+        """
+
+        # when
+        qtmodeltester.check(model)
+
+        # then
+        assert model.rowCount() == 2
+        assert model.get_group(model.index(0, 0)) == Path("Plugin A.esp")
+        assert model.rowCount(model.index(0, 0)) == 6
+        assert model.get_visible_string_count() == 9
+
+        # strings that require a translation are sorted first
+        assert [s.status for s in model.get_visible_strings()[:3]] == [
+            StringStatus.TranslationRequired
+        ] * 3
+        for position, string in enumerate(model.get_visible_strings()):
+            assert model.get_visible_position(string) == position
+            assert model.get_visible_string(position) is string
+            assert model.get_string(model.index_of_string(string)) is string
+
+    def test_filter(
+        self, model: StringItemModel, strings: dict[Path, StringList], qtbot: QtBot
+    ) -> None:
+        """
+        Tests `StringItemModel.set_state_filter()` and
+        `StringItemModel.set_text_filter()`.
+        """
+
+        # given
+        string = strings[Path("Plugin B.esp")][1]
+        persistent_index = QPersistentModelIndex(model.index_of_string(string, 2))
+
+        # when
+        with qtbot.waitSignal(model.filter_applied):
+            model.set_state_filter([StringStatus.TranslationComplete])
+
+        # then
+        assert model.get_visible_string_count() == 4
+        assert model.get_string(persistent_index) is string
+        assert persistent_index.column() == 2
+
+        # when
+        with qtbot.waitSignal(model.filter_applied):
+            model.set_text_filter("translated text 5", case_sensitive=False)
+
+        # then
+        assert model.rowCount() == 1
+        assert [s.display_id for s in model.get_visible_strings()] == [
+            strings[Path("Plugin A.esp")][5].display_id
+        ]
+        assert not persistent_index.isValid()
+        assert model.index_of_string(string) == QModelIndex()
+
+        # when
+        with qtbot.waitSignal(model.filter_applied):
+            model.set_state_filter(None)
+            model.set_text_filter("plugin b", case_sensitive=False)
+
+        # then
+        # groups matching the text filter are visible even without visible strings
+        assert model.rowCount() == 1
+        assert model.get_group(model.index(0, 0)) == Path("Plugin B.esp")
+        assert model.get_visible_string_count() == 0
@@ -5,6 +5,7 @@ Copyright (c) Cutleast
 import json
 from pathlib import Path
 
+from core.string_table_parser.buffered_string_table import BufferedStringTable
 from utilities.db_gen.main import DbGen
 
 from ...base_test import BaseTest
@@ -15,6 +16,24 @@ class TestDbGen(BaseTest):
     Tests `utilities.db_gen.main.DbGen`.
     """
 
+    @staticmethod
+    def get_strings(string_tables: list[BufferedStringTable]) -> dict[int, str]:
+        """
+        Extracts the strings of all specified string tables.
+
+        Args:
+            string_tables (list[BufferedStringTable]): The string tables.
+
+        Returns:
+            dict[int, str]: Map of string ids to strings.
+        """
+
+        strings: dict[int, str] = {}
+        for string_table in string_tables:
+            strings.update(string_table.extract_strings())
+
+        return strings
+
     def test_get_string_tables_german(self, data_folder: Path) -> None:
         """
         Tests `utilities.db_gen.main.DbGen.get_string_tables()` with german.
@@ -29,14 +48,21 @@ class TestDbGen(BaseTest):
         plugin_name: str = "_resourcepack.esl"
 
         # when
-        string_tables: dict[str, dict[int, str]] = db_gen.get_string_tables(
+        string_tables: dict[str, list[BufferedStringTable]] = db_gen.get_string_tables(
             input_folder, strings_folder, language
         )
 
         # then
         assert len(string_tables) > 0
         assert plugin_name in string_tables
-        assert len(string_tables[plugin_name]) > 0
+        assert len(self.get_strings(string_tables[plugin_name])) > 0
+        for string_table in string_tables[plugin_name]:
+            strings: dict[int, str] = string_table.extract_strings()
+            assert len(strings) == len(string_table)
+            assert all(
+                string_table.get_string(string_id) == string
+                for string_id, string in strings.items()
+            )
 
     def test_get_string_tables_english(self, data_folder: Path) -> None:
         """
@@ -51,14 +77,21 @@ class TestDbGen(BaseTest):
         plugin_name: str = "_resourcepack.esl"
 
         # when
-        string_tables: dict[str, dict[int, str]] = db_gen.get_string_tables(
+        string_tables: dict[str, list[BufferedStringTable]] = db_gen.get_string_tables(
             input_folder, input_folder, language
         )
 
         # then
         assert len(string_tables) > 0
         assert plugin_name in string_tables
-        assert len(string_tables[plugin_name]) > 0
+        assert len(self.get_strings(string_tables[plugin_name])) > 0
+        for string_table in string_tables[plugin_name]:
+            strings: dict[int, str] = string_table.extract_strings()
+            assert len(strings) == len(string_table)
+            assert all(
+                string_table.get_string(string_id) == string
+                for string_id, string in strings.items()
+            )
 
     def test_create_database(self, data_folder: Path) -> None:
         """
@@ -92,6 +125,47 @@ class TestDbGen(BaseTest):
         assert db_data[0]["string"]
         assert db_data[0]["original"] != db_data[0]["string"]
 
+    def test_create_database_all_languages(self, data_folder: Path) -> None:
+        """
+        Tests `utilities.db_gen.main.DbGen.create_database()` with all languages.
+        """
+
+        # given
+        db_gen = DbGen()
+        data_path: Path = data_folder / "db_gen"
+        tmp_path: Path = self.tmp_folder()
+        input_folder: Path = data_path / "orig"
+        strings_folder: Path = data_path / "trans"
+        output_path: Path = tmp_path / "db_gen_all_test"
+        db_file: Path = output_path / "german" / "_resourcepack.esl.json"
+
+        # when
+        db_gen.create_database(
+            input_folder, strings_folder, DbGen.ALL_LANGUAGES, output_path
+        )
+
+        # then
+        assert db_file.is_file()
+        assert len(json.loads(db_file.read_text("utf8"))) > 0
+
+    def test_get_languages(self, data_folder: Path) -> None:
+        """
+        Tests `utilities.db_gen.main.DbGen.get_languages()`.
+        """
+
+        # given
+        data_path: Path = data_folder / "db_gen"
+        input_folder: Path = data_path / "orig"
+        strings_folder: Path = data_path / "trans"
+
+        # when
+        languages: list[str] = DbGen.get_languages(
+            DbGen.map_strings_files(input_folder, strings_folder)
+        )
+
+        # then
+        assert languages == ["german"]
+
     def test_get_strings_files_from_bsa(self, data_folder: Path) -> None:
         """
         Tests `utilities.db_gen.main.DbGen.get_strings_files_from_bsa()`.